@@ -186,78 +186,79 @@ def build_curve_overlay(
     clamped_count = 0
     cap_reached = False
 
+    targets: List[Tuple[int, int, Sequence[Point]]] = []
     for path_index, path in enumerate(path_values):
         nodes = list(path.get("nodes") or [])
         closed = bool(path.get("closed", True))
         for end_index in outline_geometry_engine.cubic_segment_end_indices(nodes, closed=closed):
             segment = outline_geometry_engine.extract_cubic_segment(nodes, end_index, closed=closed)
-            if not segment.get("ok"):
-                continue
+            if segment.get("ok"):
+                targets.append((path_index, end_index, segment["points"]))
+    # Every cubic of the layer is sampled in one kernel call.
+    sampled = outline_geometry_engine.curvature_comb_samples_batch(
+        [points for _path_index, _end_index, points in targets],
+        sample_count=sample_count,
+    )
 
-            envelope_points: List[Point] = []
-            envelope_sign = ""
-            samples = outline_geometry_engine.curvature_comb_samples(
-                segment["points"],
-                sample_count=sample_count,
-            )
-            for sample in samples:
-                if len(strokes) >= limit:
-                    cap_reached = True
-                    _flush_envelope(envelopes, envelope_points, envelope_sign, end_index)
-                    break
+    for (path_index, end_index, _points), samples in zip(targets, sampled):
+        envelope_points: List[Point] = []
+        envelope_sign = ""
+        for sample in samples:
+            if len(strokes) >= limit:
+                cap_reached = True
+                _flush_envelope(envelopes, envelope_points, envelope_sign, end_index)
+                break
 
-                curvature = sample.get("curvature")
-                derivative = sample.get("derivative")
-                speed = _finite_float(sample.get("speed"), 0.0)
-                if curvature is None or derivative is None or speed <= ZERO_CURVATURE_EPSILON:
-                    degenerate_count += 1
-                    _flush_envelope(envelopes, envelope_points, envelope_sign, end_index)
-                    envelope_sign = ""
-                    continue
+            curvature = sample.get("curvature")
+            derivative = sample.get("derivative")
+            speed = _finite_float(sample.get("speed"), 0.0)
+            if curvature is None or derivative is None or speed <= ZERO_CURVATURE_EPSILON:
+                degenerate_count += 1
+                _flush_envelope(envelopes, envelope_points, envelope_sign, end_index)
+                envelope_sign = ""
+                continue
 
-                curvature_value = _finite_float(curvature, 0.0)
-                if abs(curvature_value) <= ZERO_CURVATURE_EPSILON:
-                    zero_count += 1
-                    _flush_envelope(envelopes, envelope_points, envelope_sign, end_index)
-                    envelope_sign = ""
-                    continue
+            curvature_value = _finite_float(curvature, 0.0)
+            if abs(curvature_value) <= ZERO_CURVATURE_EPSILON:
+                zero_count += 1
+                _flush_envelope(envelopes, envelope_points, envelope_sign, end_index)
+                envelope_sign = ""
+                continue
 
-                raw_length = abs(curvature_value) * upm_value * upm_value * length_factor
-                length = min(maximum_length, raw_length)
-                clamped = not math.isclose(length, raw_length, rel_tol=0.0, abs_tol=1.0e-12)
-                if clamped:
-                    clamped_count += 1
+            raw_length = abs(curvature_value) * upm_value * upm_value * length_factor
+            length = min(maximum_length, raw_length)
+            clamped = not math.isclose(length, raw_length, rel_tol=0.0, abs_tol=1.0e-12)
+            if clamped:
+                clamped_count += 1
 
-                normal = (
-                    float(derivative[1]) / speed,
-                    -float(derivative[0]) / speed,
-                )
-                start = (float(sample["point"][0]), float(sample["point"][1]))
-                end = (
-                    start[0] + normal[0] * length,
-                    start[1] + normal[1] * length,
-                )
-                sign = "positive" if curvature_value > 0.0 else "negative"
-                if envelope_sign and sign != envelope_sign:
-                    _flush_envelope(envelopes, envelope_points, envelope_sign, end_index)
-                envelope_sign = sign
-                envelope_points.append(end)
-                strokes.append(
-                    {
-                        "pathIndex": int(path_index),
-                        "segmentEndNodeIndex": int(end_index),
-                        "t": float(sample.get("t", 0.0)),
-                        "sign": sign,
-                        "start": start,
-                        "end": end,
-                        "curvature": curvature_value,
-                        "clamped": bool(clamped),
-                    }
-                )
+            normal = sample.get("normal") or (
+                float(derivative[1]) / speed,
+                -float(derivative[0]) / speed,
+            )
+            start = (float(sample["point"][0]), float(sample["point"][1]))
+            end = (
+                start[0] + normal[0] * length,
+                start[1] + normal[1] * length,
+            )
+            sign = "positive" if curvature_value > 0.0 else "negative"
+            if envelope_sign and sign != envelope_sign:
+                _flush_envelope(envelopes, envelope_points, envelope_sign, end_index)
+            envelope_sign = sign
+            envelope_points.append(end)
+            strokes.append(
+                {
+                    "pathIndex": int(path_index),
+                    "segmentEndNodeIndex": int(end_index),
+                    "t": float(sample.get("t", 0.0)),
+                    "sign": sign,
+                    "start": start,
+                    "end": end,
+                    "curvature": curvature_value,
+                    "clamped": bool(clamped),
+                }
+            )
 
-            _flush_envelope(envelopes, envelope_points, envelope_sign, end_index)
-            if cap_reached:
-                break
+        _flush_envelope(envelopes, envelope_points, envelope_sign, end_index)
         if cap_reached:
             break
 
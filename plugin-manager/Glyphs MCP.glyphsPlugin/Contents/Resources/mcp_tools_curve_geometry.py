@@ -33,6 +33,13 @@ POSITION_TOLERANCE = 1.0e-5
 GRID_POLICIES = outline_node_patch_engine.GRID_POLICIES
 ANALYSIS_MODES = ("adaptive", "sampled_v1")
 MAX_CROSS_MASTER_COUNT = 32
+MAX_SCAN_TOP_N = 200
+# Total work one font scan may queue; larger scans stop at a glyph boundary.
+MAX_SCAN_PATHS = 4000
+MAX_SCAN_SEGMENTS = 20000
+_BATCH_SCOPE_ERROR = "glyph_names batches whole glyphs; omit glyph_name, path_index, and segment_end_node_indices"
+_START_GLYPH_ERROR = "start_glyph continues a glyph_names batch; pass it with glyph_names"
+_MASTER_SCOPE_ERROR = "Pass master_id or master_ids, not both"
 
 
 def _position_values(node):
@@ -127,6 +134,13 @@ def _normalize_master_ids(value):
     return list(value), None
 
 
+def _layer_path_snapshots(layer):
+    return [
+        {"nodes": _plain_nodes(path), "closed": bool(getattr(path, "closed", True))}
+        for path in _layer_paths(layer)
+    ]
+
+
 def _shape_index(layer, path):
     try:
         for index, shape in enumerate(list(getattr(layer, "shapes", None) or [])):
@@ -286,6 +300,9 @@ async def review_tunni_geometry(
     imbalance_threshold: float = 0.05,
     min_handle_length: float = 1.0,
     grid_policy: str = "font",
+    glyph_names: list = None,
+    master_ids: list = None,
+    start_glyph: str = None,
 ) -> str:
     """Review Tunni geometry for cubic segments in one explicit glyph layer path.
 
@@ -302,6 +319,16 @@ async def review_tunni_geometry(
 
     Use this review before ``apply_tunni_balance``. Eligibility is a geometry
     safety check, not an artistic quality verdict.
+
+    Batch: pass ``glyph_names`` (a list, or ``"all"``) instead of
+    ``glyph_name``/``path_index`` to review every raw path of those glyphs on
+    ``master_ids`` (default: every master) from one snapshot. A glyph is
+    planned only when all selected masters share its path topology, and a
+    segment only when it is eligible in every master. Batches share the font
+    scan budget: capture stops at a glyph boundary and ``scope.budget``
+    reports where; pass ``budget.firstUnscannedGlyph`` as ``start_glyph`` with
+    the same ``glyph_names`` to continue. Paths over the per-path segment
+    limit are not reviewed.
     """
 
     try:
@@ -321,6 +348,25 @@ async def review_tunni_geometry(
         grid_policy_value, grid_error = _normalize_grid_policy(grid_policy)
         if grid_error:
             return _safe_json({"ok": False, "error": grid_error})
+        if glyph_names is None and start_glyph is not None:
+            return _safe_json({"ok": False, "error": _START_GLYPH_ERROR})
+        if glyph_names is not None:
+            if glyph_name is not None or path_index is not None or indices is not None:
+                return _safe_json({"ok": False, "error": _BATCH_SCOPE_ERROR})
+            if master_id is not None and master_ids is not None:
+                return _safe_json({"ok": False, "error": _MASTER_SCOPE_ERROR})
+            return _safe_json(
+                _tunni_batch(
+                    font_index,
+                    glyph_names,
+                    [master_id] if master_id and master_ids is None else master_ids,
+                    imbalance_value,
+                    min_handle_value,
+                    grid_policy_value,
+                    "review",
+                    start_glyph,
+                )
+            )
         target_data, error = _run_on_main_thread(
             lambda: _resolve_target(font_index, glyph_name, master_id, path_index)
         )
@@ -669,6 +715,404 @@ def _confirmed_tunni_transaction(
     )
 
 
+def _capture_tunni_batch(font_index, glyph_names, master_ids, start_glyph=None):
+    captured, error = _capture_scan_jobs(font_index, glyph_names, master_ids, start_glyph=start_glyph)
+    if error:
+        return None, error
+    font, _fonts = _resolve_font_by_index(Glyphs, font_index)
+    grid, grid_error = _font_grid(font)
+    if grid_error:
+        return None, {"ok": False, "error": grid_error}
+    captured["grid"] = grid
+    return captured, None
+
+
+def _batch_record(job, segment, status=None):
+    record = dict(job["target"])
+    if status is None:
+        record.update(
+            {
+                "segmentEndNodeIndex": segment.get("segmentEndNodeIndex"),
+                "relativeImbalance": segment.get("relativeImbalance"),
+                "proposed": segment.get("proposed"),
+            }
+        )
+    else:
+        record.update(_segment_disposition(segment, status))
+    return record
+
+
+def _plan_tunni_batch(captured, reviews):
+    """Plan Tunni edits for every captured layer, glyph by glyph.
+
+    A glyph is planned only when every selected master has the same path
+    count, closure, and node types; a segment is planned only when it is
+    eligible in every master, so interpolating masters keep matching handles.
+    """
+
+    layers = {key: [] for key in captured["links"]}
+    for job, segments in zip(captured["jobs"], reviews):
+        layers[(job["target"]["glyphName"], job["target"]["masterId"])].append((job, segments))
+    glyph_layers = {}
+    for key in layers:
+        glyph_layers.setdefault(key[0], []).append(key)
+
+    planned = {}
+    skipped = []
+    rejected = []
+    incompatible = []
+    for glyph_name, keys in glyph_layers.items():
+        topologies = {
+            tuple((bool(job["closed"]), tuple(node["type"] for node in job["nodes"])) for job, _segments in layers[key])
+            for key in keys
+        }
+        if len(topologies) > 1:
+            incompatible.append(
+                {
+                    "glyphName": glyph_name,
+                    "masterIds": [key[1] for key in keys],
+                    "reason": "incompatible_master_topology",
+                }
+            )
+            for key in keys:
+                for job, segments in layers[key]:
+                    skipped.extend(
+                        _batch_record(job, dict(segment, reason="incompatible_master_topology"), "skipped")
+                        for segment in segments
+                    )
+            continue
+        for path_index, path_reviews in enumerate(zip(*(layers[key] for key in keys))):
+            for segment_reviews in zip(*(segments for _job, segments in path_reviews)):
+                together = all(segment.get("ok") and segment.get("eligible") for segment in segment_reviews)
+                for key, (job, _segments), segment in zip(keys, path_reviews, segment_reviews):
+                    if together:
+                        planned.setdefault(key, {}).setdefault(path_index, []).append((job, segment))
+                    elif not segment.get("ok"):
+                        rejected.append(_batch_record(job, segment, "rejected"))
+                    elif segment.get("eligible"):
+                        skipped.append(
+                            _batch_record(job, dict(segment, reason="not_eligible_in_every_master"), "skipped")
+                        )
+                    else:
+                        skipped.append(_batch_record(job, segment, "skipped"))
+    return {"planned": planned, "skipped": skipped, "rejected": rejected, "incompatibleGlyphs": incompatible}
+
+
+def _layer_tunni_updates(layer_plan):
+    updates = []
+    for path_index, entries in sorted(layer_plan.items()):
+        job = entries[0][0]
+        expected, error = _expected_handle_positions(
+            [segment for _job, segment in entries], {"nodes": job["nodes"]}
+        )
+        if error:
+            return None, error
+        updates.extend(
+            {
+                "pathIndex": int(path_index),
+                "nodeIndex": int(node_index),
+                "expected": {"x": float(job["nodes"][node_index]["x"]), "y": float(job["nodes"][node_index]["y"])},
+                "proposed": {"x": float(position[0]), "y": float(position[1])},
+            }
+            for node_index, position in sorted(expected.items())
+        )
+    return updates, None
+
+
+def _font_undo_manager(font):
+    document = getattr(font, "parent", None)
+    manager = getattr(document, "undoManager", None) if document is not None else None
+    if callable(manager):
+        try:
+            manager = manager()
+        except Exception:
+            manager = None
+    return manager
+
+
+def _batch_failure(error, error_code, **extra):
+    return dict(
+        {
+            "ok": False,
+            "error": str(error),
+            "errorCode": str(error_code),
+            "changedNodeCount": 0,
+            "rollback": {"attempted": False, "succeeded": True, "errors": []},
+            "undoGroup": {"available": False, "began": False, "ended": False},
+        },
+        **extra
+    )
+
+
+def _confirmed_tunni_batch_transaction(font_index, captured, plan):
+    """Apply every planned layer inside one main-thread hop and one undo group.
+
+    Layers are checked against the analyzed snapshot first; any stale layer
+    aborts the batch before a node moves. A failed layer rolls back itself and
+    every layer already applied.
+    """
+
+    font, fonts = _resolve_font_by_index(Glyphs, font_index)
+    if not font:
+        return _font_resolution_error(font_index, fonts, ok_key="ok")
+    jobs_by_layer = {}
+    for job in captured["jobs"]:
+        jobs_by_layer.setdefault((job["target"]["glyphName"], job["target"]["masterId"]), []).append(job)
+    targets = []
+    for key, layer_plan in plan["planned"].items():
+        glyph_name, master_id = key
+        try:
+            layer = font.glyphs[glyph_name].layers[master_id]
+        except Exception:
+            layer = None
+        failure = {"glyphName": glyph_name, "masterId": master_id}
+        if not layer:
+            return _batch_failure("Planned layer is no longer available", "stale_target", failedLayer=failure)
+        paths = list(_layer_paths(layer))
+        jobs = jobs_by_layer.get(key, [])
+        if len(paths) != len(jobs) or any(_plain_nodes(path) != job["nodes"] for path, job in zip(paths, jobs)):
+            return _batch_failure(
+                "Layer changed after it was analyzed; review the batch again",
+                "stale_target",
+                failedLayer=failure,
+            )
+        if not callable(getattr(layer, "beginChanges", None)) or not callable(getattr(layer, "endChanges", None)):
+            return _batch_failure(
+                "Confirmed mutation requires callable layer.beginChanges() and layer.endChanges().",
+                "change_batch_unavailable",
+                failedLayer=failure,
+            )
+        updates, update_error = _layer_tunni_updates(layer_plan)
+        if update_error:
+            return _batch_failure(update_error, "invalid_current_proposal", failedLayer=failure)
+        targets.append(
+            {
+                "key": key,
+                "layer": layer,
+                "paths": paths,
+                "updates": updates,
+                "snapshot": outline_node_transaction.snapshot_layer(
+                    layer, paths, node_type_getter=_normalized_node_type
+                ),
+            }
+        )
+
+    manager = _font_undo_manager(font)
+    undo_group = {
+        "available": manager is not None and callable(getattr(manager, "beginUndoGrouping", None)),
+        "began": False,
+        "ended": False,
+    }
+    applied = []
+    failure = None
+    rollback_errors = []
+    if undo_group["available"]:
+        manager.beginUndoGrouping()
+        undo_group["began"] = True
+    try:
+        for target in targets:
+            outcome = outline_node_transaction.apply_position_updates(
+                target["layer"], target["paths"], target["updates"], node_type_getter=_normalized_node_type
+            )
+            if not outcome.get("ok"):
+                failure = (target, outcome)
+                break
+            applied.append((target, outcome))
+        if failure is not None:
+            rollback_errors.extend(failure[1]["rollback"].get("errors") or [])
+            for target, _outcome in reversed(applied):
+                layer = target["layer"]
+                try:
+                    layer.beginChanges()
+                    try:
+                        rollback_errors.extend(outline_node_transaction.restore_layer(target["snapshot"]))
+                    finally:
+                        layer.endChanges()
+                except Exception as exc:
+                    rollback_errors.append({"message": str(exc)})
+        elif applied and undo_group["began"]:
+            set_name = getattr(manager, "setActionName_", None)
+            if callable(set_name):
+                set_name("Balance Tunni Handles")
+    finally:
+        if undo_group["began"]:
+            manager.endUndoGrouping()
+            undo_group["ended"] = True
+
+    if failure is not None:
+        target, outcome = failure
+        return _batch_failure(
+            outcome.get("error") or "Tunni balance mutation failed",
+            outcome.get("errorCode") or "mutation_failed",
+            failedLayer={"glyphName": target["key"][0], "masterId": target["key"][1]},
+            rollback={
+                "attempted": True,
+                "succeeded": not rollback_errors,
+                "rolledBackLayerCount": len(applied) + 1,
+                "errors": rollback_errors,
+            },
+            undoGroup=undo_group,
+        )
+    return {
+        "ok": True,
+        "appliedLayers": [target["key"] for target, _outcome in applied],
+        "changedNodeCount": sum(
+            int(outcome["verification"]["changedNodeCount"]) for _target, outcome in applied
+        ),
+        "rollback": {"attempted": False, "succeeded": True, "errors": []},
+        "undoGroup": undo_group,
+    }
+
+
+def _bounded(records):
+    return records[:MAX_REVIEW_SEGMENTS]
+
+
+def _tunni_batch(
+    font_index,
+    glyph_names,
+    master_ids,
+    imbalance_threshold,
+    min_handle_length,
+    grid_policy,
+    mode,
+    start_glyph=None,
+):
+    """Review, dry-run, or confirm Tunni balancing across glyphs and masters."""
+
+    names, name_error = _normalize_scan_glyph_names(glyph_names)
+    if name_error:
+        return {"ok": False, "error": name_error}
+    start_glyph, start_error = _normalize_start_glyph(start_glyph)
+    if start_error:
+        return {"ok": False, "error": start_error}
+    if master_ids is not None:
+        master_ids, master_error = _normalize_master_ids(master_ids)
+        if master_error:
+            return {"ok": False, "error": master_error}
+
+    captured, error = _run_on_main_thread(lambda: _capture_tunni_batch(font_index, names, master_ids, start_glyph))
+    if error:
+        return error
+    # Analysis runs on plain snapshots between the two main-thread hops. Worker
+    # processes are not spawned inside Glyphs; the engine accepts an executor
+    # for headless callers. Oversized paths keep their place with no segments,
+    # so planning still compares every master's topology.
+    oversized = [job for job in captured["jobs"] if job.get("segmentLimitExceeded")]
+    analyzed = iter(
+        outline_geometry_engine.analyze_tunni_jobs(
+            [job for job in captured["jobs"] if not job.get("segmentLimitExceeded")],
+            imbalance_threshold=imbalance_threshold,
+            min_handle_length=min_handle_length,
+            grid_step=_grid_step(captured, grid_policy),
+        )
+    )
+    reviews = [[] if job.get("segmentLimitExceeded") else next(analyzed) for job in captured["jobs"]]
+    plan = _plan_tunni_batch(captured, reviews)
+    outcome = None
+    if mode == "confirm" and plan["planned"]:
+        outcome = _run_on_main_thread(lambda: _confirmed_tunni_batch_transaction(font_index, captured, plan))
+
+    planned_records = []
+    layers = []
+    applied_layers = set(tuple(key) for key in (outcome or {}).get("appliedLayers") or [])
+    for key, layer_plan in plan["planned"].items():
+        entries = [entry for _path_index, path_entries in sorted(layer_plan.items()) for entry in path_entries]
+        planned_records.extend(_batch_record(job, segment) for job, segment in entries)
+        layer_id, layer_name = captured["links"][key]
+        layer = {
+            "glyphName": key[0],
+            "masterId": key[1],
+            "layerId": layer_id,
+            "plannedSegmentCount": len(entries),
+            "applied": key in applied_layers,
+        }
+        layer.update(
+            _glyphs_show_layer_link_fields(
+                captured["filePath"],
+                glyph_name=key[0],
+                layer_id=layer_id,
+                label="Open {} {} in Glyphs".format(key[0], layer_name or "layer"),
+            )
+        )
+        layers.append(layer)
+    reasons = {}
+    for record in plan["skipped"] + plan["rejected"]:
+        reasons[record["reason"]] = int(reasons.get(record["reason"], 0)) + 1
+    applied_count = sum(layer["plannedSegmentCount"] for layer in layers if layer["applied"])
+    rejected_paths = {"segment_limit_exceeded": len(oversized)} if oversized else {}
+    budget = captured["budget"]
+    payload = {
+        "ok": True if outcome is None else bool(outcome.get("ok")),
+        "mode": "font_batch",
+        "geometryDataVersion": outline_geometry_engine.GEOMETRY_DATA_VERSION,
+        "params": {
+            "imbalanceThreshold": imbalance_threshold,
+            "minHandleLength": min_handle_length,
+            "upm": float(captured["upm"]),
+            "gridPolicy": grid_policy,
+            "gridLength": float(captured["grid"]["gridLength"]),
+            "gridSubDivision": int(captured["grid"]["gridSubDivision"]),
+        },
+        "scope": {
+            "fontIndex": int(font_index),
+            "glyphCount": captured["glyphCount"],
+            "masterIds": captured["masterIds"],
+            "layerCount": captured["layerCount"],
+            "pathCount": len(captured["jobs"]),
+            "rejectedPaths": rejected_paths,
+            "missingGlyphs": captured["missingGlyphs"],
+            "omittedComponentCount": captured["omittedComponentCount"],
+            "truncated": budget["truncated"],
+            "budget": budget,
+        },
+        "incompatibleGlyphs": plan["incompatibleGlyphs"],
+        "layers": _bounded(layers),
+        "planned": _bounded(planned_records),
+        "skipped": _bounded(plan["skipped"]),
+        "rejected": _bounded(plan["rejected"]),
+        "summary": {
+            "reviewedSegmentCount": sum(len(segments) for segments in reviews),
+            "plannedSegmentCount": len(planned_records),
+            "plannedLayerCount": len(layers),
+            "appliedSegmentCount": applied_count,
+            "appliedLayerCount": len(applied_layers),
+            "skippedSegmentCount": len(plan["skipped"]),
+            "rejectedSegmentCount": len(plan["rejected"]),
+            "reasonCounts": reasons,
+            "truncated": max(len(layers), len(planned_records), len(plan["skipped"]), len(plan["rejected"]))
+            > MAX_REVIEW_SEGMENTS,
+        },
+        "notes": [
+            "A segment is planned only when it is eligible in every selected master of a compatible glyph.",
+            "Record lists are truncated to {} entries; summary counts cover the whole batch.".format(
+                MAX_REVIEW_SEGMENTS
+            ),
+        ],
+    }
+    payload["notes"][1:1] = _scan_budget_note(budget, "batch")
+    if mode == "review":
+        payload["notes"].append("Read-only review; no node, layer, font, or file state was changed.")
+        return payload
+    payload["dryRun"] = mode == "dry_run"
+    if outcome is None:
+        outcome = {
+            "ok": True,
+            "changedNodeCount": 0,
+            "rollback": {"attempted": False, "succeeded": True, "errors": []},
+            "undoGroup": {"available": False, "began": False, "ended": False},
+        }
+    payload["verification"] = {"succeeded": bool(outcome.get("ok")), "changedNodeCount": outcome["changedNodeCount"]}
+    payload["rollback"] = outcome["rollback"]
+    payload["undoGroup"] = outcome["undoGroup"]
+    if not outcome.get("ok"):
+        payload["error"] = outcome["error"]
+        payload["errorCode"] = outcome["errorCode"]
+        payload["failedLayer"] = outcome.get("failedLayer")
+    payload["notes"].append("The font was not saved.")
+    return payload
+
+
 @glyphs_tool()
 async def apply_tunni_balance(
     font_index: int = 0,
@@ -681,6 +1125,9 @@ async def apply_tunni_balance(
     grid_policy: str = "font",
     dry_run: bool = False,
     confirm: bool = False,
+    glyph_names: list = None,
+    master_ids: list = None,
+    start_glyph: str = None,
 ) -> str:
     """Preview or apply conservative Tunni balancing to explicit cubic segments.
 
@@ -698,6 +1145,14 @@ async def apply_tunni_balance(
     include planned, applied, skipped, and rejected records; actual before/after
     handle coordinates; verification; rollback; and change-batch status. The
     tool never saves the font.
+
+    Batch: pass ``glyph_names`` (a list, or ``"all"``) and optional
+    ``master_ids`` instead of a path target to plan every segment that
+    ``review_tunni_geometry`` batch mode plans. A confirmed batch checks that
+    no layer changed since analysis, applies all layers in one main-thread
+    transaction and one undo group, and rolls every layer back if any fails.
+    The font scan budget bounds how many paths one confirmed batch writes;
+    continue a truncated batch with ``start_glyph`` as in the review.
     """
 
     try:
@@ -713,7 +1168,7 @@ async def apply_tunni_balance(
                     "hint": "Use dry_run=true first; use confirm=true only after reviewing the current proposal.",
                 }
             )
-        indices, index_error = _normalize_indices(segment_end_node_indices, required=True)
+        indices, index_error = _normalize_indices(segment_end_node_indices, required=glyph_names is None)
         if index_error:
             return _safe_json({"ok": False, "error": index_error})
         imbalance_value, value_error = _finite_float(imbalance_threshold, "imbalance_threshold")
@@ -729,6 +1184,25 @@ async def apply_tunni_balance(
         grid_policy_value, grid_error = _normalize_grid_policy(grid_policy)
         if grid_error:
             return _safe_json({"ok": False, "error": grid_error})
+        if glyph_names is None and start_glyph is not None:
+            return _safe_json({"ok": False, "error": _START_GLYPH_ERROR})
+        if glyph_names is not None:
+            if glyph_name is not None or path_index is not None or indices is not None:
+                return _safe_json({"ok": False, "error": _BATCH_SCOPE_ERROR})
+            if master_id is not None and master_ids is not None:
+                return _safe_json({"ok": False, "error": _MASTER_SCOPE_ERROR})
+            return _safe_json(
+                _tunni_batch(
+                    font_index,
+                    glyph_names,
+                    [master_id] if master_id and master_ids is None else master_ids,
+                    imbalance_value,
+                    min_handle_value,
+                    grid_policy_value,
+                    "confirm" if confirm else "dry_run",
+                    start_glyph,
+                )
+            )
 
         if confirm:
             payload = _run_on_main_thread(
@@ -785,6 +1259,11 @@ async def review_curve_quality(
     spike_ratio_threshold: float = 4.0,
     include_samples: bool = False,
     analysis_mode: str = "adaptive",
+    include_layer_intersections: bool = False,
+    glyph_names: list = None,
+    master_ids: list = None,
+    top_n: int = 25,
+    start_glyph: str = None,
 ) -> str:
     """Review adaptive cubic geometry and curvature for one explicit raw path.
 
@@ -800,6 +1279,16 @@ async def review_curve_quality(
     continuity, and G0/G1/G2 join measurements. Use ``sampled_v1`` only when a
     reproducible 1.7 sampling baseline is required. The odd sample count is
     clamped to 9–257. Detailed samples are limited to 64 selected segments.
+    ``include_layer_intersections=true`` also reports, for the whole layer,
+    where segments of any raw path cross each other (bounded to 64 hits).
+
+    Font scan: pass ``glyph_names`` (a list, or ``"all"``) instead of
+    ``glyph_name``/``path_index`` to walk every raw path of those glyphs on
+    ``master_ids`` (default: every master). Only the ``top_n`` worst findings
+    per category (spikes, G1/G2 discontinuities, cusps, self-intersections)
+    are returned, ranked, each with a link to its layer in Glyphs. A scan that
+    hits the path/segment budget reports ``budget.firstUnscannedGlyph``; pass
+    it as ``start_glyph`` with the same ``glyph_names`` to continue.
     Results are conservative measurements and warnings, never an artistic score
     or pass/fail verdict. The tool does not mutate or save the font.
     """
@@ -824,9 +1313,36 @@ async def review_curve_quality(
             return _safe_json({"ok": False, "error": "discontinuity_threshold must be non-negative"})
         if spike_value <= 0.0:
             return _safe_json({"ok": False, "error": "spike_ratio_threshold must be greater than zero"})
-        target_data, error = _run_on_main_thread(
-            lambda: _resolve_target(font_index, glyph_name, master_id, path_index)
-        )
+        if glyph_names is None and start_glyph is not None:
+            return _safe_json({"ok": False, "error": _START_GLYPH_ERROR})
+        if glyph_names is not None:
+            if glyph_name is not None or path_index is not None or indices is not None:
+                return _safe_json({"ok": False, "error": _BATCH_SCOPE_ERROR})
+            if include_samples or include_layer_intersections:
+                return _safe_json(
+                    {"ok": False, "error": "include_samples and include_layer_intersections need one explicit path"}
+                )
+            return _safe_json(
+                _curve_quality_scan(
+                    font_index,
+                    glyph_names,
+                    [master_id] if master_id and master_ids is None else master_ids,
+                    top_n,
+                    sample_count_value,
+                    discontinuity_value,
+                    spike_value,
+                    analysis_mode_value,
+                    start_glyph,
+                )
+            )
+
+        def capture_target():
+            target_data, error = _resolve_target(font_index, glyph_name, master_id, path_index)
+            if target_data is not None and include_layer_intersections:
+                target_data["layerPaths"] = _layer_path_snapshots(target_data["layer"])
+            return target_data, error
+
+        target_data, error = _run_on_main_thread(capture_target)
         if error:
             return _safe_json(error)
         indices, limit_error = _bounded_segment_indices(target_data, indices)
@@ -866,6 +1382,7 @@ async def review_curve_quality(
                 "includeSamples": bool(include_samples),
                 "analysisMode": review["analysisMode"],
                 "upm": float(target_data["upm"]),
+                "includeLayerIntersections": bool(include_layer_intersections),
             },
             "segments": review["segments"],
             "joins": review["joins"],
@@ -878,12 +1395,276 @@ async def review_curve_quality(
                 "No node, layer, font, or file state was changed.",
             ],
         }
+        if include_layer_intersections:
+            payload["layerIntersections"] = outline_geometry_engine.layer_intersections(
+                target_data["layerPaths"], upm=target_data["upm"]
+            )
         payload.update(_result_links(target_data))
         return _safe_json(payload)
     except Exception as exc:
         return _safe_json({"ok": False, "error": str(exc), "errorType": type(exc).__name__})
 
 
+def _normalize_scan_glyph_names(value):
+    if value == "all" or value == ["all"]:
+        return "all", None
+    if not isinstance(value, list) or not value:
+        return None, "glyph_names must be \"all\" or a nonempty list of glyph names"
+    if any(not isinstance(name, str) or not name for name in value):
+        return None, "glyph_names must be \"all\" or a nonempty list of glyph names"
+    return list(dict.fromkeys(value)), None
+
+
+def _normalize_start_glyph(value):
+    if value is None:
+        return None, None
+    if not isinstance(value, str) or not value:
+        return None, "start_glyph must be a glyph name"
+    return value, None
+
+
+def _scan_budget_note(budget, noun):
+    """Explain a truncated capture and how to continue it."""
+
+    notes = []
+    if budget["overBudgetGlyph"] is not None:
+        notes.append(
+            "Glyph '{}' alone exceeds the {}-path/{}-segment budget; it was captured whole.".format(
+                budget["overBudgetGlyph"], budget["maxPaths"], budget["maxSegments"]
+            )
+        )
+    if budget["truncated"]:
+        notes.append(
+            "The {} stopped at the budget before glyph '{}'; pass start_glyph='{}' with the same "
+            "glyph_names to continue.".format(noun, budget["firstUnscannedGlyph"], budget["firstUnscannedGlyph"])
+        )
+    return notes
+
+
+def _capture_scan_jobs(font_index, glyph_names, master_ids, max_paths=None, max_segments=None, start_glyph=None):
+    """Snapshot every raw path of the selected glyphs and masters.
+
+    Paths over the per-path segment limit are kept, flagged
+    `segmentLimitExceeded`, and not counted toward the budget. Capture starts
+    at `start_glyph` when given and stops before the first glyph that would
+    take the queued paths or cubic segments over `max_paths`/`max_segments`,
+    so every captured glyph is complete. The first glyph is always captured,
+    even alone over budget, so a follow-up call always moves forward.
+    """
+    max_paths = MAX_SCAN_PATHS if max_paths is None else max_paths
+    max_segments = MAX_SCAN_SEGMENTS if max_segments is None else max_segments
+    font, fonts = _resolve_font_by_index(Glyphs, font_index)
+    if not font:
+        return None, _font_resolution_error(font_index, fonts, ok_key="ok")
+    available_masters = [str(getattr(master, "id", "")) for master in list(getattr(font, "masters", []) or [])]
+    if master_ids is None:
+        masters = [master for master in available_masters if master]
+    else:
+        unknown = [master for master in master_ids if master not in available_masters]
+        if unknown:
+            return None, {"ok": False, "error": "Master ID '{}' not found".format(unknown[0])}
+        masters = list(master_ids)
+    if glyph_names == "all":
+        glyphs = list(font.glyphs or [])
+        scope_names = [str(getattr(glyph, "name", "")) for glyph in glyphs]
+    else:
+        scope_names = list(glyph_names)
+    start = 0
+    if start_glyph is not None:
+        if start_glyph not in scope_names:
+            return None, {"ok": False, "error": "start_glyph '{}' is not in glyph_names".format(start_glyph)}
+        start = scope_names.index(start_glyph)
+    if glyph_names == "all":
+        glyphs = glyphs[start:]
+        missing = []
+    else:
+        glyphs = []
+        missing = []
+        for name in scope_names[start:]:
+            try:
+                glyph = font.glyphs[name]
+            except Exception:
+                glyph = None
+            if glyph:
+                glyphs.append(glyph)
+            else:
+                missing.append(name)
+    upm = _upm(font)
+    file_path = getattr(font, "filepath", None)
+    jobs = []
+    links = {}
+    layer_count = 0
+    omitted_components = 0
+    queued_paths = 0
+    queued_segments = 0
+    captured_glyphs = 0
+    first_unscanned = None
+    over_budget = None
+    for glyph in glyphs:
+        name = str(getattr(glyph, "name", ""))
+        glyph_jobs = []
+        glyph_links = {}
+        glyph_layers = 0
+        glyph_omitted = 0
+        glyph_paths = 0
+        glyph_segments = 0
+        for master in masters:
+            try:
+                layer = glyph.layers[master]
+            except Exception:
+                layer = None
+            if not layer:
+                continue
+            glyph_layers += 1
+            glyph_omitted += _omitted_component_count(layer)
+            layer_id = _get_layer_id(layer)
+            glyph_links[(name, master)] = (layer_id, _layer_display_name(font, layer, master))
+            for path_index, path in enumerate(_layer_paths(layer)):
+                nodes = _plain_nodes(path)
+                closed = bool(getattr(path, "closed", True))
+                segment_count = len(outline_geometry_engine.cubic_segment_end_indices(nodes, closed=closed))
+                job = {
+                    "nodes": nodes,
+                    "closed": closed,
+                    "upm": upm,
+                    "target": {"glyphName": name, "masterId": master, "pathIndex": path_index},
+                }
+                if segment_count > MAX_REVIEW_SEGMENTS:
+                    job["segmentLimitExceeded"] = True
+                else:
+                    glyph_paths += 1
+                    glyph_segments += segment_count
+                glyph_jobs.append(job)
+        if queued_paths + glyph_paths > max_paths or queued_segments + glyph_segments > max_segments:
+            if captured_glyphs:
+                first_unscanned = name
+                break
+            over_budget = name
+        captured_glyphs += 1
+        queued_paths += glyph_paths
+        queued_segments += glyph_segments
+        layer_count += glyph_layers
+        omitted_components += glyph_omitted
+        links.update(glyph_links)
+        jobs.extend(glyph_jobs)
+    return {
+        "jobs": jobs,
+        "links": links,
+        "filePath": file_path,
+        "upm": upm,
+        "glyphCount": captured_glyphs,
+        "layerCount": layer_count,
+        "masterIds": masters,
+        "missingGlyphs": missing,
+        "omittedComponentCount": omitted_components,
+        "budget": {
+            "maxPaths": int(max_paths),
+            "maxSegments": int(max_segments),
+            "maxSegmentsPerPath": MAX_REVIEW_SEGMENTS,
+            "queuedPathCount": queued_paths,
+            "queuedSegmentCount": queued_segments,
+            "startGlyph": start_glyph,
+            "truncated": first_unscanned is not None,
+            "firstUnscannedGlyph": first_unscanned,
+            "overBudgetGlyph": over_budget,
+            "unscannedGlyphCount": len(glyphs) - captured_glyphs,
+        },
+    }, None
+
+
+def _curve_quality_scan(
+    font_index,
+    glyph_names,
+    master_ids,
+    top_n,
+    sample_count,
+    discontinuity_threshold,
+    spike_ratio_threshold,
+    analysis_mode,
+    start_glyph=None,
+):
+    names, name_error = _normalize_scan_glyph_names(glyph_names)
+    if name_error:
+        return {"ok": False, "error": name_error}
+    start_glyph, start_error = _normalize_start_glyph(start_glyph)
+    if start_error:
+        return {"ok": False, "error": start_error}
+    if master_ids is not None:
+        master_ids, master_error = _normalize_master_ids(master_ids)
+        if master_error:
+            return {"ok": False, "error": master_error}
+    if isinstance(top_n, bool) or not isinstance(top_n, int) or not 1 <= top_n <= MAX_SCAN_TOP_N:
+        return {"ok": False, "error": "top_n must be an integer from 1 to {}".format(MAX_SCAN_TOP_N)}
+
+    captured, error = _run_on_main_thread(
+        lambda: _capture_scan_jobs(font_index, names, master_ids, start_glyph=start_glyph)
+    )
+    if error:
+        return error
+    # Analysis runs on plain snapshots after the main-thread hop. Worker
+    # processes are not spawned inside Glyphs; the engine accepts an executor
+    # for headless callers.
+    oversized = [job for job in captured["jobs"] if job.get("segmentLimitExceeded")]
+    scan = outline_geometry_engine.scan_curve_quality(
+        [job for job in captured["jobs"] if not job.get("segmentLimitExceeded")],
+        top_n=top_n,
+        samples_per_curve=sample_count,
+        discontinuity_threshold=discontinuity_threshold,
+        spike_ratio_threshold=spike_ratio_threshold,
+        analysis_mode=analysis_mode,
+    )
+    for findings in scan["findings"].values():
+        for finding in findings:
+            layer_id, layer_name = captured["links"][(finding["glyphName"], finding["masterId"])]
+            finding["layerId"] = layer_id
+            finding.update(
+                _glyphs_show_layer_link_fields(
+                    captured["filePath"],
+                    glyph_name=finding["glyphName"],
+                    layer_id=layer_id,
+                    label="Open {} {} in Glyphs".format(finding["glyphName"], layer_name or "layer"),
+                )
+            )
+    rejected = dict(scan["rejectedPaths"])
+    if oversized:
+        rejected["segment_limit_exceeded"] = len(oversized)
+    notes = [
+        "Findings are ranked worst first and truncated to topN per category; counts cover the whole scan.",
+        "No node, layer, font, or file state was changed.",
+    ]
+    budget = captured["budget"]
+    notes[1:1] = _scan_budget_note(budget, "scan")
+    return {
+        "ok": True,
+        "mode": "font_scan",
+        "geometryDataVersion": outline_geometry_engine.CURVE_QUALITY_DATA_VERSION,
+        "params": {
+            "samplesPerCurve": outline_geometry_engine.clamp_samples_per_curve(sample_count),
+            "discontinuityThreshold": discontinuity_threshold,
+            "spikeRatioThreshold": spike_ratio_threshold,
+            "analysisMode": analysis_mode,
+            "topN": top_n,
+            "upm": float(captured["upm"]),
+        },
+        "scope": {
+            "fontIndex": int(font_index),
+            "glyphCount": captured["glyphCount"],
+            "masterIds": captured["masterIds"],
+            "layerCount": captured["layerCount"],
+            "pathCount": scan["pathCount"],
+            "analyzedSegmentCount": scan["analyzedSegmentCount"],
+            "rejectedPaths": rejected,
+            "missingGlyphs": captured["missingGlyphs"],
+            "omittedComponentCount": captured["omittedComponentCount"],
+            "truncated": budget["truncated"],
+            "budget": budget,
+        },
+        "counts": scan["counts"],
+        "findings": scan["findings"],
+        "notes": notes,
+    }
+
+
 def _cross_master_topology(target_data):
     return {
         "closed": bool(target_data["closed"]),
@@ -84,6 +84,7 @@ def _state_on_main_thread():
         "menuPath": REPORTER_MENU_PATH,
         "lastDraw": snapshot.get("lastDraw"),
         "lastError": snapshot.get("lastError"),
+        "segmentCache": snapshot.get("segmentCache"),
         "overlays": list(snapshot.get("overlays") or overlay_features()),
         "fontChanged": False,
         "fontSaved": False,
@@ -2,6 +2,7 @@
 
 from __future__ import division, print_function, unicode_literals
 
+import hashlib
 import json
 import math
 
@@ -30,6 +31,8 @@ from mcp_tool_helpers import (
     _safe_json,
 )
 
+import kerning_collision_engine
+
 
 def _font_by_index(font_index):
     font, _fonts = _resolve_font_by_index(Glyphs, font_index)
@@ -440,16 +443,123 @@ async def get_glyph_details(font_index: int = 0, glyph_name: str = "A") -> str:
         return json.dumps({"error": str(e)})
 
 
+def _kerning_side_filter(kerning_index, value, left, effective):
+    """Return the glyph names (effective) or explicit keys (raw) a filter matches."""
+
+    if value is None:
+        return None
+    value = str(value)
+    if effective:
+        return set(kerning_index.key_glyphs(value, left=left))
+    if value.startswith("@MMK_"):
+        return {value}
+    keys = set(kerning_index.glyph_keys(value, left=left))
+    keys.add(value)
+    return keys
+
+
+def _kerning_pair_stream(kerning_index, effective, left_filter, right_filter):
+    """Yield `(left, right)` keys (raw) or glyph names (effective), lazily."""
+
+    if effective:
+        for left_name, right_name, _value, _source in kerning_index.iter_effective_pairs(left_filter, right_filter):
+            yield left_name, right_name
+        return
+    for left_key, right_key, _value in kerning_index.items():
+        if left_filter is not None and left_key not in left_filter:
+            continue
+        if right_filter is not None and right_key not in right_filter:
+            continue
+        yield left_key, right_key
+
+
+def _unique_pairs(streams):
+    seen = set()
+    for stream in streams:
+        for pair in stream:
+            if pair not in seen:
+                seen.add(pair)
+                yield pair
+
+
+_KERNING_LISTING_CACHE = None
+
+
+def _kerning_listing_cache():
+    """Return the process-wide compiled kerning listing cache, created on first use."""
+
+    global _KERNING_LISTING_CACHE
+    if _KERNING_LISTING_CACHE is None:
+        _KERNING_LISTING_CACHE = kerning_collision_engine.KerningListingCache()
+    return _KERNING_LISTING_CACHE
+
+
+def _font_cache_key(font):
+    filepath = getattr(font, "filepath", None)
+    return str(filepath) if filepath else "memory:{}".format(id(font))
+
+
+def _parse_kerning_cursor(cursor):
+    """Split a `get_font_kerning` cursor into (offset, listing token); offset -1 if invalid."""
+
+    if cursor in (None, ""):
+        return 0, None
+    text = str(cursor)
+    offset_text, _sep, token = text.partition(":")
+    try:
+        offset = int(offset_text)
+    except (TypeError, ValueError):
+        return -1, None
+    return offset, token or None
+
+
+def _master_kerning(font, master_id):
+    try:
+        return font.kerning.get(master_id, {}) or {}
+    except Exception:
+        return {}
+
+
 @glyphs_tool()
-async def get_font_kerning(font_index: int = 0, master_id: str = None) -> str:
+async def get_font_kerning(
+    font_index: int = 0,
+    master_id: str = None,
+    pairs: list = None,
+    left: str = None,
+    right: str = None,
+    effective: bool = False,
+    all_masters: bool = False,
+    cursor: str = None,
+    limit: int = None,
+) -> str:
     """Get kerning information for a specific font and master.
 
     Args:
         font_index (int): Index of the font (0-based). Defaults to 0.
         master_id (str): Master ID. If None, uses the first master.
+        pairs (list): Optional `[left, right]` glyph-name pairs to resolve to
+            their effective kerning (glyph exceptions before class kerning)
+            in `master_id`.
+        left (str): Only return entries for this left glyph name or
+            `@MMK_L_` class key. A glyph name also matches its class entries.
+        right (str): Same filter for the right side (`@MMK_R_` class keys).
+        effective (bool): Expand class kerning to glyph pairs. Each glyph
+            pair is listed once with its effective value and the winning
+            `leftKey`/`rightKey`.
+        all_masters (bool): Return every master in one columnar payload:
+            `kerningColumns.left`/`right` plus one values array per master id
+            in `kerningColumns.values`. Missing raw entries are null; missing
+            effective values are 0.
+        cursor (str): Opaque `nextCursor` from a previous page. Pages of one
+            listing come from the snapshot compiled for its first page; start
+            again without a cursor to see later edits.
+        limit (int): Page size. When set, `nextCursor` is returned (null on
+            the last page). Defaults to every entry.
 
     Returns:
-        str: JSON-encoded kerning pairs and values.
+        str: JSON-encoded kerning pairs and values; `pairCount` counts the
+        returned page. With `pairs`, adds `resolvedPairs` with each pair's
+        value and winning `leftKey`/`rightKey`.
     """
     try:
         font = _font_by_index(font_index)
@@ -459,21 +569,124 @@ async def get_font_kerning(font_index: int = 0, master_id: str = None) -> str:
         if master_id is None:
             master_id = font.masters[0].id
 
-        kerning_info = []
-        kerning = font.kerning.get(master_id, {})
+        offset, token = _parse_kerning_cursor(cursor)
+        if offset < 0:
+            return json.dumps({"error": "Invalid cursor: {!r}".format(cursor)})
+        page_size = None if limit is None else max(int(limit), 1)
 
-        for left_group, right_dict in kerning.items():
-            for right_group, value in right_dict.items():
-                kerning_info.append(
-                    {"left": left_group, "right": right_group, "value": value}
-                )
+        master_ids = [m.id for m in font.masters] if all_masters else [master_id]
+        indexed_ids = master_ids if master_id in master_ids else master_ids + [master_id]
 
-        return json.dumps(
-            {
+        def _compile(glyph_maps, kerning_masters):
+            indexes = {
+                mid: kerning_collision_engine.KerningIndex(kerning_masters[mid], glyph_maps) for mid in indexed_ids
+            }
+            # Filters resolve the same way in every master (glyph maps are shared).
+            left_filter = _kerning_side_filter(indexes[master_id], left, True, effective)
+            right_filter = _kerning_side_filter(indexes[master_id], right, False, effective)
+            stream = _unique_pairs(
+                _kerning_pair_stream(indexes[mid], effective, left_filter, right_filter) for mid in master_ids
+            )
+            return kerning_collision_engine.KerningListing(indexes, stream)
+
+        def _current():
+            glyph_maps = kerning_collision_engine.build_glyph_maps(font.glyphs)
+            return glyph_maps, {mid: _master_kerning(font, mid) for mid in indexed_ids}
+
+        if page_size is None and not offset:
+            listing = _compile(*_current())
+        else:
+            # A cursor carries the fingerprint of the listing it pages through,
+            # so later pages reuse the lazily expanded listing without reading
+            # the kerning again; only a first (or expired) page fingerprints it.
+            cache = _kerning_listing_cache()
+            listing_key = (_font_cache_key(font), tuple(indexed_ids), master_id, bool(effective), left, right)
+            listing = cache.get(listing_key, token) if token else None
+            if listing is None:
+                glyph_maps, kerning_masters = _current()
+                token = hashlib.sha1(
+                    "|".join(
+                        kerning_collision_engine.kerning_fingerprint(kerning_masters[mid], glyph_maps)
+                        for mid in indexed_ids
+                    ).encode("utf-8")
+                ).hexdigest()[:16]
+                listing = cache.listing(listing_key, token, lambda: _compile(glyph_maps, kerning_masters))
+        indexes = listing.indexes
+        kerning_index = indexes[master_id]
+        stop = None if page_size is None else offset + page_size + 1
+        page = listing.page(offset, stop)
+        next_cursor = None
+        if page_size is not None and len(page) > page_size:
+            page = page[:page_size]
+            next_cursor = "{}:{}".format(offset + page_size, token)
+
+        def _value(index, left_key, right_key):
+            if effective:
+                return index.resolve(left_key, right_key)[0]
+            return index.kerning.get(left_key, {}).get(right_key)
+
+        if all_masters:
+            payload = {
+                "masterIds": master_ids,
+                "effective": bool(effective),
+                "kerningColumns": {
+                    "left": [pair[0] for pair in page],
+                    "right": [pair[1] for pair in page],
+                    "values": {
+                        mid: [_value(indexes[mid], left_key, right_key) for left_key, right_key in page]
+                        for mid in master_ids
+                    },
+                },
+                "pairCount": len(page),
+            }
+        else:
+            kerning_info = []
+            for left_key, right_key in page:
+                if effective:
+                    value, source = kerning_index.resolve(left_key, right_key)
+                    kerning_info.append(
+                        {
+                            "left": left_key,
+                            "right": right_key,
+                            "value": value,
+                            "leftKey": source.left_key,
+                            "rightKey": source.right_key,
+                        }
+                    )
+                else:
+                    kerning_info.append(
+                        {
+                            "left": left_key,
+                            "right": right_key,
+                            "value": _value(kerning_index, left_key, right_key),
+                        }
+                    )
+            payload = {
                 "masterId": master_id,
                 "kerningPairs": kerning_info,
                 "pairCount": len(kerning_info),
             }
-        )
+        if page_size is not None:
+            payload["nextCursor"] = next_cursor
+        if pairs:
+            requested = [
+                (str(item[0]), str(item[1]))
+                for item in pairs
+                if isinstance(item, (list, tuple)) and len(item) == 2
+            ]
+            resolved = []
+            for (left_name, right_name), (value, source) in zip(requested, kerning_index.resolve_many(requested)):
+                resolved.append(
+                    {
+                        "left": left_name,
+                        "right": right_name,
+                        "value": value,
+                        "leftKey": source.left_key,
+                        "rightKey": source.right_key,
+                    }
+                )
+            payload["resolvedPairs"] = resolved
+
+        return json.dumps(payload)
     except Exception as e:
         return json.dumps({"error": str(e)})
@@ -31,6 +31,37 @@ except Exception:  # pragma: no cover - only relevant outside Glyphs
     NSPoint = None
 
 
+_SPACING_RESULT_CACHE = None
+
+
+def _spacing_result_cache():
+    """Return the process-wide spacing result cache, created on first use."""
+
+    global _SPACING_RESULT_CACHE
+    if _SPACING_RESULT_CACHE is None:
+        _SPACING_RESULT_CACHE = spacing_engine.SpacingResultCache()
+    return _SPACING_RESULT_CACHE
+
+
+def _font_cache_key(font):
+    filepath = getattr(font, "filepath", None)
+    return str(filepath) if filepath else "memory:{}".format(id(font))
+
+
+def _spacing_dependents(font, changed, masters, rules, defaults, batch):
+    """Return the font-wide spacing dependency graph and the glyphs `changed` affects.
+
+    Building the graph resolves references and metrics keys without measuring
+    any outline, so dependents anywhere in the font are found cheaply.
+    """
+
+    glyphs = [glyph for glyph in list(font.glyphs or []) if getattr(glyph, "name", None)]
+    graph = spacing_engine.SpacingDependencyGraph.build(
+        font=font, glyphs=glyphs, masters=masters, rules=rules, defaults=defaults, batch=batch
+    )
+    return graph, graph.affected_by([str(name) for name in changed])
+
+
 def _merge_spacing_defaults(user_defaults=None, debug=None):
     merged = dict(spacing_engine.DEFAULTS)
     if isinstance(user_defaults, dict):
@@ -431,6 +462,7 @@ async def set_spacing_guides(
         added_count = 0
         removed_count = 0
         skipped_count = 0
+        batch = spacing_engine.SpacingBatch(font)
 
         for glyph_name in names:
             glyph = font.glyphs[glyph_name] if glyph_name else None
@@ -494,6 +526,7 @@ async def set_spacing_guides(
                     rules=[],
                     defaults=guide_defaults,
                     master_params=eff,
+                    batch=batch,
                 )
                 resolved_ref_name = model.get("resolvedReferenceGlyph") or ref_name
                 resolved_use_self = resolved_ref_name in ("*", getattr(glyph, "name", None))
@@ -793,12 +826,18 @@ async def review_spacing(
     defaults: dict = None,
     guards: dict = None,
     debug: dict = None,
+    affected_by: list = None,
 ) -> str:
     """Review spacing and suggest sidebearings/width using a clean-room area-based model.
 
     Automatic references resolve by glyph class. ``guards`` accepts normalized
     negative-bearing thresholds, exemptions, and current-metric trust. The
     result includes raw proposals, provenance, assessments, and no mutation.
+    ``affected_by`` lists edited glyphs. The review keeps ``glyph_names`` (or
+    just the edited glyphs when omitted) and adds every glyph in the font whose
+    spacing reads an edited one (through references, metrics keys, or tabular
+    width evidence). Those dependents are recomputed; the rest reuse results
+    cached by earlier ``affected_by`` reviews when their inputs are unchanged.
     """
     try:
         font, error = _resolve_font_payload(font_index)
@@ -811,6 +850,9 @@ async def review_spacing(
 
         if glyph_names:
             names = list(glyph_names)
+        elif affected_by:
+            # Dependents are added once the masters are known.
+            names = [str(name) for name in affected_by]
         else:
             # Prefer selection, but only when the referenced font is active.
             if not _is_active_font(Glyphs, font):
@@ -850,14 +892,46 @@ async def review_spacing(
         else:
             masters = list(font.masters or [])
 
+        # Review master by master so reference bounds, classifications and
+        # tabular evidence are read once per master, then report in the
+        # usual glyph-major order.
+        batch = spacing_engine.SpacingBatch(font)
+        # Only incremental reviews pay for the dependency graph and digests.
+        result_cache = None
+        graph = None
+        affected = None
+        if affected_by:
+            result_cache = _spacing_result_cache()
+            graph, affected = _spacing_dependents(font, affected_by, masters, rules, merged_defaults, batch)
+            names = names + [name for name in affected if name not in names]
+
+        named_glyphs = [(name, font.glyphs[name]) for name in names]
+        glyphs = [glyph for _name, glyph in named_glyphs if glyph]
+        per_glyph = [[] for _glyph in glyphs]
+        for _master, master_results in spacing_engine.iter_master_suggestions(
+            font=font,
+            glyphs=glyphs,
+            masters=masters,
+            rules=rules,
+            defaults=merged_defaults,
+            master_params=lambda m: _effective_master_params_for_spacing(font, m, merged_defaults, explicit_defaults),
+            guards=guards,
+            batch=batch,
+            result_cache=result_cache,
+            font_key=_font_cache_key(font),
+            graph=graph,
+            recompute=set(affected) if affected is not None else None,
+        ):
+            for index, r in enumerate(master_results):
+                per_glyph[index].append(r)
+
         results = []
         ok_count = 0
         skipped_count = 0
         error_count = 0
         layer_count = 0
-
-        for name in names:
-            glyph = font.glyphs[name]
+        found = iter(per_glyph)
+        for name, glyph in named_glyphs:
             if not glyph:
                 results.append(
                     {
@@ -869,53 +943,8 @@ async def review_spacing(
                 error_count += 1
                 continue
 
-            for master in masters:
+            for r in next(found):
                 layer_count += 1
-                mid = getattr(master, "id", None)
-                try:
-                    layer = glyph.layers[mid]
-                except Exception:
-                    layer = None
-
-                if not layer:
-                    results.append(
-                        {
-                            "glyphName": glyph.name,
-                            "masterId": mid,
-                            "masterName": getattr(master, "name", ""),
-                            "status": "skipped",
-                            "reason": "layer_missing",
-                        }
-                    )
-                    skipped_count += 1
-                    continue
-
-                master_params = _effective_master_params_for_spacing(font, master, merged_defaults, explicit_defaults)
-                try:
-                    r = spacing_engine.compute_suggestion_for_layer(
-                        font=font,
-                        glyph=glyph,
-                        layer=layer,
-                        master=master,
-                        rules=rules,
-                        defaults=merged_defaults,
-                        master_params=master_params,
-                        guards=guards,
-                    )
-                except Exception as exc:
-                    results.append(
-                        {
-                            "glyphName": glyph.name,
-                            "masterId": mid,
-                            "masterName": getattr(master, "name", ""),
-                            "status": "error",
-                            "reason": "exception",
-                            "error": str(exc),
-                        }
-                    )
-                    error_count += 1
-                    continue
-
                 results.append(r)
                 if r.get("status") == "ok":
                     ok_count += 1
@@ -924,6 +953,16 @@ async def review_spacing(
                 else:
                     error_count += 1
 
+        summary_extra = {}
+        if affected is not None:
+            summary_extra["incremental"] = {
+                "changed": [str(name) for name in affected_by],
+                "affected": affected,
+                "recomputed": sum(1 for r in results if r.get("reused") is False),
+                "reused": sum(1 for r in results if r.get("reused") is True),
+            }
+            summary_extra["resultCache"] = result_cache.stats()
+
         return _safe_json(
             {
                 "ok": True,
@@ -944,6 +983,8 @@ async def review_spacing(
                         "tabularMode": merged_defaults.get("tabularMode"),
                     },
                     "guards": spacing_engine.normalize_guards(guards),
+                    "batchCache": batch.stats(),
+                    **summary_extra,
                 },
                 "results": results,
             }
@@ -964,6 +1005,7 @@ async def apply_spacing(
     overrides: dict = None,
     confirm: bool = False,
     dry_run: bool = False,
+    affected_by: list = None,
 ) -> str:
     """Apply suggested spacing (sidebearings/width) computed by review_spacing.
 
@@ -972,6 +1014,9 @@ async def apply_spacing(
     - Use dry_run=true to preview.
     - Guard-blocked and low-confidence results require named ``overrides``.
     - ``clamp`` is a compatibility-only absolute font-unit constraint.
+
+    ``affected_by`` limits the run to the edited glyphs and their spacing
+    dependents (within ``glyph_names`` when given), in dependency order.
     """
     try:
         if not confirm and not dry_run:
@@ -996,6 +1041,8 @@ async def apply_spacing(
 
         if glyph_names:
             names = list(glyph_names)
+        elif affected_by:
+            names = [str(name) for name in affected_by]
         else:
             if not _is_active_font(Glyphs, font):
                 return _safe_json(
@@ -1037,6 +1084,25 @@ async def apply_spacing(
         override_count = 0
         refused_count = 0
         used_overrides = []
+        batch = spacing_engine.SpacingBatch(font)
+        params_by_master = {}
+
+        affected = None
+        if affected_by:
+            # Dependencies first, so glyphs keyed to an edited glyph see its new metrics.
+            if glyph_names:
+                graph = spacing_engine.SpacingDependencyGraph.build(
+                    font=font,
+                    glyphs=[glyph for glyph in (font.glyphs[name] for name in names) if glyph],
+                    masters=masters,
+                    rules=rules,
+                    defaults=merged_defaults,
+                    batch=batch,
+                )
+                affected = graph.affected_by([str(name) for name in affected_by])
+            else:
+                _graph, affected = _spacing_dependents(font, affected_by, masters, rules, merged_defaults, batch)
+            names = affected
 
         for name in names:
             glyph = font.glyphs[name]
@@ -1065,7 +1131,8 @@ async def apply_spacing(
                     skipped_count += 1
                     continue
 
-                master_params = _effective_master_params_for_spacing(font, master, merged_defaults, explicit_defaults)
+                if mid not in params_by_master:
+                    params_by_master[mid] = _effective_master_params_for_spacing(font, master, merged_defaults, explicit_defaults)
                 try:
                     r = spacing_engine.compute_suggestion_for_layer(
                         font=font,
@@ -1074,8 +1141,9 @@ async def apply_spacing(
                         master=master,
                         rules=rules,
                         defaults=merged_defaults,
-                        master_params=master_params,
+                        master_params=params_by_master[mid],
                         guards=guards,
+                        batch=batch,
                     )
                 except Exception as exc:
                     results.append(
@@ -1272,6 +1340,7 @@ async def apply_spacing(
                     "overrideCount": override_count,
                     "refusedCount": refused_count,
                     "dryRun": bool(dry_run),
+                    **({"affected": affected} if affected is not None else {}),
                 },
                 "results": results,
                 "applied": applied,
@@ -1296,6 +1365,7 @@ async def set_spacing_params(
     params: dict = None,
     use_legacy_keys: bool = False,
     dry_run: bool = False,
+    fit: dict = None,
 ) -> str:
     """Set spacing parameters as font/master Custom Parameters (no auto-save).
 
@@ -1309,6 +1379,11 @@ async def set_spacing_params(
         use_legacy_keys: If true, use paramArea/paramDepth/paramOver/paramFreq.
                          Otherwise use cx.ap.spacingArea/Depth/Over/Freq.
         dry_run: If true, report changes without mutating.
+        fit: Instead of ``params``, fit area/depth/over per master to the
+             current sidebearings of control glyphs and set the best values.
+             Keys: glyphNames (default: the spacing guide glyphs), area,
+             depth, over (number, list, or {min, max, step}), rules,
+             defaults, top. Use with dry_run to only report the fit.
 
     Returns:
         JSON payload with change list and read-back values.
@@ -1321,6 +1396,12 @@ async def set_spacing_params(
         if not isinstance(params, dict):
             return _safe_json({"ok": False, "error": "params must be an object/dict"})
 
+        if fit is not None:
+            if not isinstance(fit, dict):
+                return _safe_json({"ok": False, "error": "fit must be an object/dict"})
+            if params:
+                return _safe_json({"ok": False, "error": "Pass either params or fit, not both"})
+
         scope_norm = (scope or "auto").strip().lower()
         if scope_norm not in ("auto", "font", "master", "all_masters"):
             return _safe_json(
@@ -1330,6 +1411,14 @@ async def set_spacing_params(
                     "hint": "Use one of: auto, font, master, all_masters",
                 }
             )
+        if fit is not None and scope_norm == "font":
+            return _safe_json(
+                {
+                    "ok": False,
+                    "error": "fit sets per-master values",
+                    "hint": "Use scope master or all_masters",
+                }
+            )
 
         # Resolve targets
         targets = []
@@ -1337,6 +1426,8 @@ async def set_spacing_params(
         if scope_norm == "auto":
             if master_id:
                 scope_applied = "master"
+            elif fit is not None:
+                scope_applied = "all_masters"
             else:
                 scope_applied = "font"
 
@@ -1360,6 +1451,64 @@ async def set_spacing_params(
 
         key_map = spacing_engine.SPACING_PARAM_KEYS_PARAM_LEGACY if use_legacy_keys else spacing_engine.SPACING_PARAM_KEYS_CANONICAL
 
+        fit_reports = []
+        params_by_target = {}
+        missing_fit_glyphs = []
+        if fit is not None:
+            try:
+                grid = {
+                    field: spacing_engine.fit_grid_values(fit.get(field), field)
+                    for field in ("area", "depth", "over")
+                }
+            except ValueError as exc:
+                return _safe_json({"ok": False, "error": str(exc)})
+            combinations = len(grid["area"]) * len(grid["depth"]) * len(grid["over"])
+            if combinations > spacing_engine.MAX_FIT_COMBINATIONS:
+                return _safe_json(
+                    {
+                        "ok": False,
+                        "error": "fit grid has {} combinations (limit {})".format(
+                            combinations, spacing_engine.MAX_FIT_COMBINATIONS
+                        ),
+                        "hint": "Narrow the area/depth/over ranges or use larger steps.",
+                    }
+                )
+            fit_defaults = fit.get("defaults") if isinstance(fit.get("defaults"), dict) else {}
+            merged_fit_defaults = _merge_spacing_defaults(fit_defaults)
+            control_glyphs = []
+            for name in list(fit.get("glyphNames") or DEFAULT_SPACING_GUIDE_GLYPHS):
+                glyph = font.glyphs[name]
+                if glyph:
+                    control_glyphs.append(glyph)
+                else:
+                    missing_fit_glyphs.append(name)
+            batch = spacing_engine.SpacingBatch(font)
+            for _kind, tid, obj in targets:
+                fitter = spacing_engine.SpacingParamFit(
+                    font=font,
+                    glyphs=control_glyphs,
+                    master=obj,
+                    master_params=_effective_master_params_for_spacing(font, obj, merged_fit_defaults, fit_defaults),
+                    defaults=merged_fit_defaults,
+                    overs=grid["over"],
+                    rules=fit.get("rules"),
+                    batch=batch,
+                )
+                try:
+                    report = fitter.search(
+                        areas=grid["area"],
+                        depths=grid["depth"],
+                        overs=grid["over"],
+                        top=int(fit.get("top") or 5),
+                    )
+                except ValueError as exc:
+                    return _safe_json({"ok": False, "error": str(exc)})
+                fit_reports.append(report)
+                best = report.get("best")
+                params_by_target[tid] = (
+                    {field: best[field] for field in ("area", "depth", "over")} if best else {}
+                )
+
         changed = []
         effective_readback = []
 
@@ -1381,16 +1530,18 @@ async def set_spacing_params(
                 target_label["masterId"] = tid
                 target_label["masterName"] = getattr(obj, "name", None)
 
+            target_params = params_by_target.get(tid, {}) if fit is not None else params
+
             # Apply changes field-by-field
             for field in spacing_engine.SPACING_PARAM_FIELDS:
-                if field not in params:
+                if field not in target_params:
                     continue
                 key = key_map.get(field)
                 if not key:
                     continue
 
                 before = _custom_parameter(obj, key, None)
-                requested = params.get(field)
+                requested = target_params.get(field)
 
                 if requested is None:
                     action = "delete"
@@ -1440,16 +1591,18 @@ async def set_spacing_params(
                 }
             effective_readback.append(rb)
 
-        return _safe_json(
-            {
-                "ok": True,
-                "scopeApplied": scope_applied,
-                "dryRun": bool(dry_run),
-                "useLegacyKeys": bool(use_legacy_keys),
-                "targets": [{"type": k, "masterId": tid} for k, tid, _obj in targets],
-                "changed": changed,
-                "effectiveReadback": effective_readback,
-            }
-        )
+        payload = {
+            "ok": True,
+            "scopeApplied": scope_applied,
+            "dryRun": bool(dry_run),
+            "useLegacyKeys": bool(use_legacy_keys),
+            "targets": [{"type": k, "masterId": tid} for k, tid, _obj in targets],
+            "changed": changed,
+            "effectiveReadback": effective_readback,
+        }
+        if fit is not None:
+            payload["fit"] = fit_reports
+            payload["missingGlyphs"] = missing_fit_glyphs
+        return _safe_json(payload)
     except Exception as e:
         return _safe_json({"ok": False, "error": str(e)})
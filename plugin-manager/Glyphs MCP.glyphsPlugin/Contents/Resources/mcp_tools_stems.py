@@ -73,6 +73,24 @@ def _review_master_stem_metrics_impl(
         master_reports = []
         ready_count = 0
 
+        # Every target master is measured in one pass over the reference
+        # glyphs; runs are shared with the italic and tuning tools.
+        run_cache = stem_metrics_helpers.stem_run_cache()
+        measured = {}
+        if include_measurements:
+            measured = stem_metrics_helpers.estimate_font_stems(
+                font=font,
+                masters=target_masters,
+                orientations=["vertical", "horizontal"],
+                reference_glyphs=reference_glyphs,
+                samples=samples,
+                band=band,
+                min_width=min_width,
+                max_width=max_width,
+                include_components=include_components,
+                cache=run_cache,
+            )
+
         for master in target_masters:
             entries = stem_metrics_helpers.master_stem_report(font, master)
             vertical_ok = _usable_stems(entries, "vertical")
@@ -83,30 +101,7 @@ def _review_master_stem_metrics_impl(
             if not horizontal_ok:
                 missing_orientations.append("horizontal")
 
-            estimates = {}
-            if include_measurements:
-                estimates["vertical"] = stem_metrics_helpers.estimate_master_stem(
-                    font=font,
-                    master=master,
-                    orientation="vertical",
-                    reference_glyphs=reference_glyphs,
-                    samples=samples,
-                    band=band,
-                    min_width=min_width,
-                    max_width=max_width,
-                    include_components=include_components,
-                )
-                estimates["horizontal"] = stem_metrics_helpers.estimate_master_stem(
-                    font=font,
-                    master=master,
-                    orientation="horizontal",
-                    reference_glyphs=reference_glyphs,
-                    samples=samples,
-                    band=band,
-                    min_width=min_width,
-                    max_width=max_width,
-                    include_components=include_components,
-                )
+            estimates = dict(measured.get(getattr(master, "id", None)) or {})
 
             ready = len(missing_orientations) == 0
             if ready:
@@ -140,6 +135,7 @@ def _review_master_stem_metrics_impl(
                 "masterCount": len(master_reports),
                 "readyCount": ready_count,
                 "definitionCount": len(definitions),
+                "runCache": run_cache.stats(),
             },
             "definitions": [
                 {
@@ -0,0 +1,440 @@
+# encoding: utf-8
+
+"""Pure-Python scanline intersections for glyph layers.
+
+This module is intentionally GlyphsApp-free at import time so it can be unit
+tested (and used headless) outside of Glyphs. Spacing, kerning and stem
+measurement call into it with real GSLayer objects.
+
+Core ideas:
+  - Read a layer's closed paths once (components decomposed through
+    `componentLayer` and their transforms) and flatten curves into line edges
+    within `DEFAULT_FLATNESS` font units of the true outline.
+  - Store the edges in an edge table sorted by their lower end, and answer a
+    whole batch of horizontal (or vertical) scanlines with one active-edge
+    sweep, instead of one `layer.intersectionsBetweenPoints` bridge call per
+    scanline.
+  - Edges are half-open in the scan direction, so a scanline through a vertex
+    counts it once and a scanline along a flat edge does not count it.
+
+`EdgeTable.from_layer` returns None when the layer's geometry cannot be read
+as plain closed nodes; callers then fall back to `intersectionsBetweenPoints`.
+The attribute readers and curve flattening here are shared with
+`kerning_collision_engine` and the headless UFO adapter.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, List, Optional, Sequence, Tuple
+
+
+DEFAULT_FLATNESS = 0.05
+MAX_CURVE_SEGMENTS = 64
+MAX_COMPONENT_DEPTH = 8
+
+Point = Tuple[float, float]
+Polygon = List[Point]
+
+
+def _safe_attr(obj: Any, name: str, default: Any = None) -> Any:
+    try:
+        value = getattr(obj, name)
+        return value() if callable(value) else value
+    except Exception:
+        return default
+
+
+def _coerce_float(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        if callable(value):
+            value = value()
+    except Exception:
+        return None
+    try:
+        f = float(value)
+    except Exception:
+        return None
+    if math.isnan(f) or math.isinf(f):
+        return None
+    return f
+
+
+def _node_xy(node: Any) -> Optional[Point]:
+    position = _safe_attr(node, "position")
+    if position is not None:
+        x = _coerce_float(_safe_attr(position, "x"))
+        y = _coerce_float(_safe_attr(position, "y"))
+        if x is not None and y is not None:
+            return (x, y)
+        try:
+            return (float(position[0]), float(position[1]))
+        except Exception:
+            pass
+    x = _coerce_float(_safe_attr(node, "x"))
+    y = _coerce_float(_safe_attr(node, "y"))
+    if x is None or y is None:
+        return None
+    return (x, y)
+
+
+def _layer_shapes(layer: Any) -> Optional[List[Any]]:
+    """Return paths and components, preferring Glyphs 3 mixed `shapes`.
+
+    Returns None when the layer exposes neither collection.
+    """
+
+    found = False
+    for attr in ("shapes", "paths"):
+        raw = _safe_attr(layer, attr)
+        if raw is None:
+            continue
+        found = True
+        try:
+            values = list(raw)
+        except Exception:
+            return None
+        if values:
+            if attr == "paths":
+                try:
+                    values.extend(list(_safe_attr(layer, "components") or []))
+                except Exception:
+                    pass
+            return values
+    raw = _safe_attr(layer, "components")
+    if raw is None:
+        return [] if found else None
+    try:
+        return list(raw)
+    except Exception:
+        return None
+
+
+def _transform(values: Any) -> Optional[Tuple[float, float, float, float, float, float]]:
+    try:
+        m = [float(v) for v in list(values)]
+    except Exception:
+        return None
+    if len(m) != 6:
+        return None
+    return (m[0], m[1], m[2], m[3], m[4], m[5])
+
+
+def _curve_segments(deviation: float, scale: float, flatness: float) -> int:
+    if deviation <= 0:
+        return 1
+    n = int(math.ceil(math.sqrt(scale * deviation / max(flatness, 1e-6))))
+    return max(1, min(MAX_CURVE_SEGMENTS, n))
+
+
+def _append_cubic(out: Polygon, p1: Point, p2: Point, p3: Point, flatness: float) -> None:
+    p0 = out[-1]
+    deviation = max(
+        math.hypot(p0[0] - 2.0 * p1[0] + p2[0], p0[1] - 2.0 * p1[1] + p2[1]),
+        math.hypot(p1[0] - 2.0 * p2[0] + p3[0], p1[1] - 2.0 * p2[1] + p3[1]),
+    )
+    # Uniform subdivision error is at most 3/4 * deviation / n^2.
+    n = _curve_segments(deviation, 0.75, flatness)
+    for i in range(1, n):
+        t = i / n
+        u = 1.0 - t
+        a, b, c, d = u * u * u, 3.0 * u * u * t, 3.0 * u * t * t, t * t * t
+        out.append(
+            (
+                a * p0[0] + b * p1[0] + c * p2[0] + d * p3[0],
+                a * p0[1] + b * p1[1] + c * p2[1] + d * p3[1],
+            )
+        )
+    out.append(p3)
+
+
+def _append_quadratic(out: Polygon, p1: Point, p2: Point, flatness: float) -> None:
+    p0 = out[-1]
+    deviation = math.hypot(p0[0] - 2.0 * p1[0] + p2[0], p0[1] - 2.0 * p1[1] + p2[1])
+    # Uniform subdivision error is at most 1/4 * deviation / n^2.
+    n = _curve_segments(deviation, 0.25, flatness)
+    for i in range(1, n):
+        t = i / n
+        u = 1.0 - t
+        a, b, c = u * u, 2.0 * u * t, t * t
+        out.append((a * p0[0] + b * p1[0] + c * p2[0], a * p0[1] + b * p1[1] + c * p2[1]))
+    out.append(p2)
+
+
+def _midpoint(a: Point, b: Point) -> Point:
+    return ((a[0] + b[0]) / 2.0, (a[1] + b[1]) / 2.0)
+
+
+def _path_nodes(path: Any) -> Optional[List[Tuple[Point, str]]]:
+    """Return a path's nodes as (point, lowercase type), or None when unreadable."""
+
+    raw = _safe_attr(path, "nodes")
+    if raw is None:
+        return None
+    try:
+        raw_nodes = list(raw)
+    except Exception:
+        return None
+    nodes: List[Tuple[Point, str]] = []
+    for node in raw_nodes:
+        xy = _node_xy(node)
+        if xy is None:
+            return None
+        nodes.append((xy, str(_safe_attr(node, "type", "") or "offcurve").lower()))
+    return nodes
+
+
+def flatten_path(path: Any, flatness: float = DEFAULT_FLATNESS) -> Optional[Polygon]:
+    """Flatten one closed path into a polygon.
+
+    Node types follow Glyphs/UFO: each on-curve node's type describes the
+    segment that ends at it. Open paths flatten to an empty polygon; shapes
+    without readable nodes return None.
+    """
+
+    if _safe_attr(path, "nodes") is None:
+        return None
+    if not _safe_attr(path, "closed", True):
+        return []
+    nodes = _path_nodes(path)
+    if nodes is None:
+        return None
+    return _flatten_nodes(nodes, flatness)
+
+
+def _flatten_nodes(nodes: List[Tuple[Point, str]], flatness: float) -> Polygon:
+    if not nodes:
+        return []
+
+    start = next((i for i, (_xy, kind) in enumerate(nodes) if kind != "offcurve"), None)
+    if start is None:
+        # All-offcurve quadratic contour: every on-curve point is implied.
+        controls = [xy for xy, _kind in nodes]
+        polygon: Polygon = [_midpoint(controls[-1], controls[0])]
+        for i, control in enumerate(controls):
+            _append_quadratic(polygon, control, _midpoint(control, controls[(i + 1) % len(controls)]), flatness)
+        return polygon
+
+    nodes = nodes[start:] + nodes[:start]
+    polygon = [nodes[0][0]]
+    controls: List[Point] = []
+    for xy, kind in nodes[1:] + nodes[:1]:
+        if kind == "offcurve":
+            controls.append(xy)
+            continue
+        if kind == "curve" and len(controls) == 2:
+            _append_cubic(polygon, controls[0], controls[1], xy, flatness)
+        elif controls:
+            # qcurve (or an irregular curve) with implied on-curve midpoints.
+            for i, control in enumerate(controls):
+                end = _midpoint(control, controls[i + 1]) if i + 1 < len(controls) else xy
+                _append_quadratic(polygon, control, end, flatness)
+        else:
+            polygon.append(xy)
+        controls = []
+    return polygon
+
+
+def layer_polygons(
+    layer: Any,
+    *,
+    include_components: bool = True,
+    flatness: float = DEFAULT_FLATNESS,
+    _depth: int = 0,
+) -> Optional[List[Polygon]]:
+    """Return the layer's closed contours as polygons, components decomposed.
+
+    Returns None when the layer has no shapes, has an open path, or any shape
+    cannot be read as plain nodes (including a component without a readable
+    `componentLayer` or transform). Open strokes have no inside, but Glyphs'
+    intersections still cross them, so such layers keep that path.
+    """
+
+    shapes = _layer_shapes(layer)
+    if shapes is None or (not shapes and _depth == 0):
+        return None
+    polygons: List[Polygon] = []
+    for shape in shapes:
+        if _safe_attr(shape, "componentName") is not None:
+            if not include_components:
+                continue
+            if _depth >= MAX_COMPONENT_DEPTH:
+                return None
+            base = _safe_attr(shape, "componentLayer")
+            matrix = _transform(_safe_attr(shape, "transform"))
+            if base is None or matrix is None:
+                return None
+            base_polygons = layer_polygons(base, include_components=True, flatness=flatness, _depth=_depth + 1)
+            if base_polygons is None:
+                return None
+            xx, xy, yx, yy, dx, dy = matrix
+            for polygon in base_polygons:
+                polygons.append([(xx * x + yx * y + dx, xy * x + yy * y + dy) for x, y in polygon])
+            continue
+        if not _safe_attr(shape, "closed", True):
+            return None
+        polygon = flatten_path(shape, flatness)
+        if polygon is None:
+            return None
+        if len(polygon) >= 3:
+            polygons.append(polygon)
+    return polygons
+
+
+def interpolated_layer_polygons(
+    layer_a: Any,
+    layer_b: Any,
+    t: float,
+    *,
+    include_components: bool = True,
+    flatness: float = DEFAULT_FLATNESS,
+    _depth: int = 0,
+) -> Optional[List[Polygon]]:
+    """Return the closed contours of the outline interpolated at `t` (0 = a, 1 = b).
+
+    Nodes and component transforms are blended before flattening, so the
+    polygons follow the interpolated instance rather than a blend of the two
+    masters' flattened edges. Returns None when the layers are not
+    interpolation-compatible (shape order, node count or node types differ)
+    or either layer fails the `layer_polygons` readability rules.
+    """
+
+    shapes_a = _layer_shapes(layer_a)
+    shapes_b = _layer_shapes(layer_b)
+    if shapes_a is None or shapes_b is None or len(shapes_a) != len(shapes_b):
+        return None
+    if not shapes_a and _depth == 0:
+        return None
+    t = float(t)
+
+    def _lerp(p: float, q: float) -> float:
+        return p + (q - p) * t
+
+    polygons: List[Polygon] = []
+    for shape_a, shape_b in zip(shapes_a, shapes_b):
+        component = _safe_attr(shape_a, "componentName")
+        if component is not None or _safe_attr(shape_b, "componentName") is not None:
+            if component != _safe_attr(shape_b, "componentName"):
+                return None
+            if not include_components:
+                continue
+            if _depth >= MAX_COMPONENT_DEPTH:
+                return None
+            matrix_a = _transform(_safe_attr(shape_a, "transform"))
+            matrix_b = _transform(_safe_attr(shape_b, "transform"))
+            if matrix_a is None or matrix_b is None:
+                return None
+            base_polygons = interpolated_layer_polygons(
+                _safe_attr(shape_a, "componentLayer"),
+                _safe_attr(shape_b, "componentLayer"),
+                t,
+                include_components=True,
+                flatness=flatness,
+                _depth=_depth + 1,
+            )
+            if base_polygons is None:
+                return None
+            xx, xy, yx, yy, dx, dy = (_lerp(p, q) for p, q in zip(matrix_a, matrix_b))
+            for polygon in base_polygons:
+                polygons.append([(xx * x + yx * y + dx, xy * x + yy * y + dy) for x, y in polygon])
+            continue
+        if not _safe_attr(shape_a, "closed", True) or not _safe_attr(shape_b, "closed", True):
+            return None
+        nodes_a = _path_nodes(shape_a)
+        nodes_b = _path_nodes(shape_b)
+        if nodes_a is None or nodes_b is None or len(nodes_a) != len(nodes_b):
+            return None
+        if any(kind_a != kind_b for (_p, kind_a), (_q, kind_b) in zip(nodes_a, nodes_b)):
+            return None
+        nodes = [((_lerp(p[0], q[0]), _lerp(p[1], q[1])), kind) for (p, kind), (q, _kind) in zip(nodes_a, nodes_b)]
+        polygon = _flatten_nodes(nodes, flatness)
+        if len(polygon) >= 3:
+            polygons.append(polygon)
+    return polygons
+
+
+class EdgeTable(object):
+    """Line edges of flattened contours, sorted for active-edge sweeps.
+
+    With `vertical=False` scanlines are horizontal (`y = position`) and
+    crossings are x values; with `vertical=True` scanlines are vertical and
+    crossings are y values.
+    """
+
+    def __init__(self, polygons: Sequence[Polygon], *, vertical: bool = False) -> None:
+        self.vertical = bool(vertical)
+        edges: List[Tuple[float, float, float, float]] = []
+        for polygon in polygons:
+            if not polygon:
+                continue
+            prev = polygon[-1]
+            for point in polygon:
+                # (scan, cross) coordinates: scan runs along the sweep.
+                if self.vertical:
+                    s0, c0, s1, c1 = prev[0], prev[1], point[0], point[1]
+                else:
+                    s0, c0, s1, c1 = prev[1], prev[0], point[1], point[0]
+                prev = point
+                if s0 == s1:
+                    continue
+                if s0 > s1:
+                    s0, c0, s1, c1 = s1, c1, s0, c0
+                edges.append((s0, s1, c0, (c1 - c0) / (s1 - s0)))
+        edges.sort()
+        self._edges = edges
+
+    @classmethod
+    def from_layer(
+        cls,
+        layer: Any,
+        *,
+        include_components: bool = True,
+        vertical: bool = False,
+        flatness: float = DEFAULT_FLATNESS,
+    ) -> Optional["EdgeTable"]:
+        """Build the table for a layer, or None when its geometry is unreadable."""
+
+        polygons = layer_polygons(layer, include_components=include_components, flatness=flatness)
+        if polygons is None:
+            return None
+        return cls(polygons, vertical=vertical)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._edges)
+
+    def crossings(self, position: float) -> List[float]:
+        """Return the sorted crossings of one scanline."""
+
+        return self.sweep([position])[0]
+
+    def sweep(self, positions: Sequence[float]) -> List[List[float]]:
+        """Return sorted crossings for every scanline, in input order.
+
+        Scanlines are visited in increasing order; edges enter the active
+        list at their lower end and leave at their upper end.
+        """
+
+        out: List[List[float]] = [[] for _ in positions]
+        edges = self._edges
+        count = len(edges)
+        next_edge = 0
+        active: List[Tuple[float, float, float, float]] = []
+        for index in sorted(range(len(positions)), key=lambda i: float(positions[i])):
+            s = float(positions[index])
+            while next_edge < count and edges[next_edge][0] <= s:
+                active.append(edges[next_edge])
+                next_edge += 1
+            active = [edge for edge in active if edge[1] > s]
+            out[index] = sorted(c0 + (s - s0) * slope for s0, _s1, c0, slope in active)
+        return out
+
+
+def outer_edges(crossings: Sequence[float]) -> Tuple[Optional[float], Optional[float]]:
+    """Return (first, last) crossing, or (None, None) with fewer than two."""
+
+    if len(crossings) < 2:
+        return (None, None)
+    return (float(crossings[0]), float(crossings[-1]))
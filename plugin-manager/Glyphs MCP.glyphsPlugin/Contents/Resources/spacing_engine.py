@@ -9,12 +9,25 @@ Glyphs, passing real GSFont/GSGlyph/GSLayer objects.
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import json
 import math
 import re
 import statistics
+import threading
 import unicodedata
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import kerning_collision_engine
+import scanline_engine
+
+try:  # Optional accelerator for the area model; pure Python is the fallback.
+    import numpy as np  # type: ignore[import-not-found]
+except Exception:  # pragma: no cover - depends on the selected Python runtime
+    np = None
 
 
 DEFAULTS: Dict[str, Any] = {
@@ -67,6 +80,9 @@ DEFAULT_FIGURE_NAMES: Tuple[str, ...] = (
     "nine",
 )
 
+# Widths read by the fixed-pitch check in `assess_tabular_mode`.
+REPRESENTATIVE_WIDTH_NAMES: Tuple[str, ...] = DEFAULT_FIGURE_NAMES + ("H", "O", "n", "o", "space")
+
 NARROW_PUNCTUATION_NAMES = frozenset(
     {
         "period",
@@ -347,6 +363,45 @@ def _font_glyph(font: Any, name: str) -> Any:
         return None
 
 
+class SpacingBatch(object):
+    """Per-call memo shared by every layer reviewed in one font.
+
+    Most glyphs in a master resolve to the same few references, and glyph
+    classes and tabular evidence do not change between layers. A batch keeps
+    glyph lookups, classifications, reference layer bounds, and per-master
+    figure widths so a font-wide review reads each of them once. Create a new
+    batch per tool call; it does not watch the font for edits.
+    """
+
+    def __init__(self, font: Any) -> None:
+        self.font = font
+        self._values: Dict[Tuple[Any, ...], Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def memo(self, key: Tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        try:
+            value = self._values[key]
+        except KeyError:
+            self.misses += 1
+            value = self._values[key] = compute()
+            return value
+        self.hits += 1
+        return value
+
+    def glyph(self, name: str) -> Any:
+        return self.memo(("glyph", name), lambda: _font_glyph(self.font, name))
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._values), "hits": self.hits, "misses": self.misses}
+
+
+def _glyph_lookup(font: Any, name: str, batch: Optional[SpacingBatch]) -> Any:
+    if batch is not None:
+        return batch.glyph(name)
+    return _font_glyph(font, name)
+
+
 def _glyph_unicode_character(glyph: Any) -> Optional[str]:
     raw = _safe_attr(glyph, "unicode", "")
     if not raw:
@@ -455,6 +510,20 @@ def classify_glyph(glyph: Any, layer: Any = None) -> Dict[str, Any]:
     }
 
 
+def classify_layer(glyph: Any, layer: Any = None, batch: Optional[SpacingBatch] = None) -> Dict[str, Any]:
+    """`classify_glyph`, memoized per glyph name when a batch is given.
+
+    The layer only matters through its zero-width check, which is part of the
+    key.
+    """
+    if batch is None:
+        return classify_glyph(glyph, layer)
+    width = _coerce_float(_safe_attr(layer, "width")) if layer is not None else None
+    zero_width = width is not None and abs(width) <= 1e-6
+    key = ("class", str(_safe_attr(glyph, "name", "") or ""), zero_width)
+    return dict(batch.memo(key, lambda: classify_glyph(glyph, layer)))
+
+
 def resolve_reference(
     *,
     font: Any,
@@ -463,9 +532,10 @@ def resolve_reference(
     rule: Dict[str, Any],
     defaults: Dict[str, Any],
     classification: Optional[Dict[str, Any]] = None,
+    batch: Optional[SpacingBatch] = None,
 ) -> Dict[str, Any]:
     """Resolve requested and effective spacing references with provenance."""
-    classification = classification or classify_glyph(glyph, layer)
+    classification = classification or classify_layer(glyph, layer, batch)
     glyph_class = classification.get("glyphClass") or "unclassified"
 
     if "referenceGlyph" in rule or "reference" in rule:
@@ -483,7 +553,7 @@ def resolve_reference(
                 "referenceFallback": None,
                 "referenceGlyph": glyph,
             }
-        explicit = _font_glyph(font, requested)
+        explicit = _glyph_lookup(font, requested, batch)
         return {
             "referenceMode": "explicit",
             "requestedReferenceGlyph": requested,
@@ -513,7 +583,7 @@ def resolve_reference(
             ref_glyph = glyph
         else:
             resolved_name = candidate
-            ref_glyph = _font_glyph(font, candidate)
+            ref_glyph = _glyph_lookup(font, candidate, batch)
         if ref_glyph:
             fallback = None
             if candidate != preferred:
@@ -629,13 +699,11 @@ class Measurement:
     right_xs: List[Optional[float]]
 
 
-def measure_layer_edges(
+def _layer_edges(
     layer: Any,
-    y_min: float,
-    y_max: float,
-    step: float,
+    ys: Sequence[float],
     include_components: bool,
-) -> Optional[Measurement]:
+) -> Optional[List[Tuple[Optional[float], Optional[float]]]]:
     bounds = _bounds_tuple(layer)
     if not bounds:
         return None
@@ -643,16 +711,65 @@ def measure_layer_edges(
     start_x = min_x - 1.0
     end_x = max_x + 1.0
 
+    # One edge-table sweep answers every scanline; Glyphs' intersections are
+    # only used when the layer's geometry cannot be read as plain nodes.
+    table = scanline_engine.EdgeTable.from_layer(layer, include_components=include_components)
+    if table is not None:
+        return [scanline_engine.outer_edges(xs) for xs in table.sweep(ys)]
+    return [
+        _measure_edges_at_y(layer, y, include_components=include_components, start_x=start_x, end_x=end_x)
+        for y in ys
+    ]
+
+
+def measure_layer_edges(
+    layer: Any,
+    y_min: float,
+    y_max: float,
+    step: float,
+    include_components: bool,
+) -> Optional[Measurement]:
     ys = _frange(y_min, y_max, step=step)
-    left_xs: List[Optional[float]] = []
-    right_xs: List[Optional[float]] = []
-    for y in ys:
-        l, r = _measure_edges_at_y(layer, y, include_components=include_components, start_x=start_x, end_x=end_x)
-        left_xs.append(l)
-        right_xs.append(r)
+    edges = _layer_edges(layer, ys, include_components)
+    if edges is None:
+        return None
+    left_xs: List[Optional[float]] = [l for l, _r in edges]
+    right_xs: List[Optional[float]] = [r for _l, r in edges]
     return Measurement(ys=ys, left_xs=left_xs, right_xs=right_xs)
 
 
+def measure_layer_edge_views(
+    layer: Any,
+    *,
+    full_range: Tuple[float, float],
+    zone_range: Tuple[float, float],
+    step: float,
+    include_components: bool,
+) -> Optional[Tuple[Measurement, Measurement]]:
+    """Measure the full-bounds and reference-zone grids from one edge table.
+
+    Both grids keep their own start row, so the views equal two
+    `measure_layer_edges` calls. The grids rarely share rows, so the saving is
+    one edge-table build per layer; every row of both grids is still swept.
+    """
+    full_ys = _frange(full_range[0], full_range[1], step=step)
+    zone_ys = _frange(zone_range[0], zone_range[1], step=step)
+    rows = sorted(set(full_ys).union(zone_ys))
+    edges = _layer_edges(layer, rows, include_components)
+    if edges is None:
+        return None
+    by_y = dict(zip(rows, edges))
+
+    def _view(ys: List[float]) -> Measurement:
+        return Measurement(
+            ys=ys,
+            left_xs=[by_y[y][0] for y in ys],
+            right_xs=[by_y[y][1] for y in ys],
+        )
+
+    return (_view(full_ys), _view(zone_ys))
+
+
 def _diagonize_left(xs: List[float], step: float) -> List[float]:
     if not xs:
         return xs
@@ -687,6 +804,151 @@ def _trapezoid_area(ys: List[float], indents: List[float]) -> float:
     return area
 
 
+def numpy_available() -> bool:
+    return np is not None
+
+
+def _deslant_xs(
+    xs: List[Optional[float]],
+    ys: List[float],
+    *,
+    x_height: float,
+    italic_angle: float,
+    use_numpy: Optional[bool] = None,
+) -> List[Optional[float]]:
+    """Apply `_deslant_x` to every sampled edge; missing edges stay None."""
+    if use_numpy is None:
+        use_numpy = np is not None
+    if not use_numpy or np is None or not xs:
+        return [
+            None if x is None else _deslant_x(float(x), float(y), x_height=x_height, italic_angle=italic_angle)
+            for x, y in zip(xs, ys)
+        ]
+    values = np.array([np.nan if x is None else float(x) for x in xs], dtype=float)
+    shift = math.tan(math.radians(italic_angle)) * (np.asarray(ys, dtype=float) - x_height / 2.0)
+    shifted = values + shift
+    return [None if x is None else float(v) for x, v in zip(xs, shifted.tolist())]
+
+
+@dataclass(frozen=True)
+class ZoneAreas:
+    left_xs: List[float]
+    right_xs: List[float]
+    clamped_left: int
+    clamped_right: int
+    area_left: float
+    area_right: float
+
+
+def _zone_areas(
+    ys: List[float],
+    zone_left: List[Optional[float]],
+    zone_right: List[Optional[float]],
+    *,
+    l_extreme: float,
+    r_extreme: float,
+    depth_units: float,
+    step: float,
+    use_numpy: Optional[bool] = None,
+) -> ZoneAreas:
+    """Clamp edges to the depth limit, diagonize them, and integrate the white area.
+
+    The NumPy path computes the same model with array operations; results
+    match the pure-Python path up to float rounding.
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy and np is not None and len(ys) >= 2:
+        return _zone_areas_numpy(ys, zone_left, zone_right, l_extreme, r_extreme, depth_units, step)
+
+    max_depth_l = l_extreme + depth_units
+    min_depth_r = r_extreme - depth_units
+
+    left_xs: List[float] = []
+    right_xs: List[float] = []
+    clamped_left = 0
+    clamped_right = 0
+
+    for x in zone_left:
+        if x is None:
+            xi = max_depth_l
+            clamped_left += 1
+        else:
+            xi = max(l_extreme, min(float(x), max_depth_l))
+            if xi != float(x):
+                clamped_left += 1
+        left_xs.append(xi)
+
+    for x in zone_right:
+        if x is None:
+            xi = min_depth_r
+            clamped_right += 1
+        else:
+            xi = min(r_extreme, max(float(x), min_depth_r))
+            if xi != float(x):
+                clamped_right += 1
+        right_xs.append(xi)
+
+    left_xs = _diagonize_left(left_xs, step=step)
+    right_xs = _diagonize_right(right_xs, step=step)
+
+    left_indents = [max(0.0, x - l_extreme) for x in left_xs]
+    right_indents = [max(0.0, r_extreme - x) for x in right_xs]
+
+    return ZoneAreas(
+        left_xs=left_xs,
+        right_xs=right_xs,
+        clamped_left=clamped_left,
+        clamped_right=clamped_right,
+        area_left=_trapezoid_area(ys, left_indents),
+        area_right=_trapezoid_area(ys, right_indents),
+    )
+
+
+def _zone_areas_numpy(
+    ys: List[float],
+    zone_left: List[Optional[float]],
+    zone_right: List[Optional[float]],
+    l_extreme: float,
+    r_extreme: float,
+    depth_units: float,
+    step: float,
+) -> ZoneAreas:
+    y = np.asarray(ys, dtype=float)
+    left = np.array([np.nan if x is None else float(x) for x in zone_left], dtype=float)
+    right = np.array([np.nan if x is None else float(x) for x in zone_right], dtype=float)
+    max_depth_l = l_extreme + depth_units
+    min_depth_r = r_extreme - depth_units
+
+    missing_l = np.isnan(left)
+    missing_r = np.isnan(right)
+    clipped_l = np.maximum(l_extreme, np.minimum(left, max_depth_l))
+    clipped_r = np.minimum(r_extreme, np.maximum(right, min_depth_r))
+    clamped_left = int(np.count_nonzero(missing_l | (clipped_l != left)))
+    clamped_right = int(np.count_nonzero(missing_r | (clipped_r != right)))
+    left = np.where(missing_l, max_depth_l, clipped_l)
+    right = np.where(missing_r, min_depth_r, clipped_r)
+
+    # The two-pass slope limit is a running min/max of x -/+ row * step.
+    ramp = np.arange(len(left), dtype=float) * float(step)
+    left = np.minimum.accumulate(left - ramp) + ramp
+    left = np.minimum.accumulate((left + ramp)[::-1])[::-1] - ramp
+    right = np.maximum.accumulate(right + ramp) - ramp
+    right = np.maximum.accumulate((right - ramp)[::-1])[::-1] + ramp
+
+    left_indents = np.maximum(0.0, left - l_extreme)
+    right_indents = np.maximum(0.0, r_extreme - right)
+    dy = np.diff(y)
+    return ZoneAreas(
+        left_xs=left.tolist(),
+        right_xs=right.tolist(),
+        clamped_left=clamped_left,
+        clamped_right=clamped_right,
+        area_left=float(np.sum((left_indents[:-1] + left_indents[1:]) * 0.5 * dy)),
+        area_right=float(np.sum((right_indents[:-1] + right_indents[1:]) * 0.5 * dy)),
+    )
+
+
 def _first_last_non_none(values: List[Optional[float]]) -> Tuple[Optional[float], Optional[float]]:
     first = None
     last = None
@@ -765,6 +1027,7 @@ def assess_tabular_mode(
     master: Any,
     defaults: Dict[str, Any],
     classification: Dict[str, Any],
+    batch: Optional[SpacingBatch] = None,
 ) -> Dict[str, Any]:
     """Determine whether a width should be preserved and why."""
     mode = defaults.get("tabularMode", "auto")
@@ -818,43 +1081,31 @@ def assess_tabular_mode(
         result.update(detected=current_width is not None, reason="tabular_glyph_name", preservedWidth=current_width)
         return result
 
-    fixed_pitch = _custom_parameter_value(font, "isFixedPitch")
-    if fixed_pitch is None:
-        fixed_pitch = _safe_attr(font, "isFixedPitch")
-    if bool(fixed_pitch):
-        representative_widths: List[int] = []
-        for candidate_name in DEFAULT_FIGURE_NAMES + ("H", "O", "n", "o", "space"):
-            candidate = _font_glyph(font, candidate_name)
-            candidate_layer = _master_layer(candidate, master_id)
-            value = _units_int(_safe_attr(candidate_layer, "width"))
-            if value is not None and value > 0:
-                representative_widths.append(value)
-        target = _round_half_away_from_zero(statistics.median(representative_widths)) if representative_widths else current_width
+    if batch is not None:
+        fixed_pitch = batch.memo(("fixedPitch",), lambda: _font_fixed_pitch(font))
+    else:
+        fixed_pitch = _font_fixed_pitch(font)
+    if fixed_pitch:
+        if batch is not None:
+            median_width = batch.memo(
+                ("representativeWidth", master_id),
+                lambda: _representative_median_width(font, master_id, batch),
+            )
+        else:
+            median_width = _representative_median_width(font, master_id, None)
+        target = median_width if median_width is not None else current_width
         result.update(detected=target is not None, reason="font_fixed_pitch_metadata", preservedWidth=target)
         return result
 
     if classification.get("glyphClass") != "decimalFigure":
         return result
 
-    figure_widths: List[int] = []
-    width_keys: List[str] = []
-    all_figures_present = True
-    for candidate_name in DEFAULT_FIGURE_NAMES:
-        candidate = _font_glyph(font, candidate_name)
-        candidate_layer = _master_layer(candidate, master_id)
-        if candidate is None or candidate_layer is None:
-            all_figures_present = False
-            break
-        value = _units_int(_safe_attr(candidate_layer, "width"))
-        if value is None:
-            all_figures_present = False
-            break
-        figure_widths.append(value)
-        key = _layer_width_metrics_key(candidate, candidate_layer)
-        if key:
-            width_keys.append(key)
-
-    if all_figures_present and len(figure_widths) == len(DEFAULT_FIGURE_NAMES):
+    if batch is not None:
+        evidence = batch.memo(("figureWidths", master_id), lambda: _default_figure_evidence(font, master_id, batch))
+    else:
+        evidence = _default_figure_evidence(font, master_id, None)
+    if evidence is not None:
+        figure_widths, width_keys = list(evidence[0]), list(evidence[1])
         median_width = _round_half_away_from_zero(statistics.median(figure_widths))
         if max(figure_widths) - min(figure_widths) <= tolerance_units:
             result.update(
@@ -875,6 +1126,49 @@ def assess_tabular_mode(
     return result
 
 
+def _font_fixed_pitch(font: Any) -> bool:
+    fixed_pitch = _custom_parameter_value(font, "isFixedPitch")
+    if fixed_pitch is None:
+        fixed_pitch = _safe_attr(font, "isFixedPitch")
+    return bool(fixed_pitch)
+
+
+def _representative_median_width(font: Any, master_id: str, batch: Optional[SpacingBatch]) -> Optional[int]:
+    representative_widths: List[int] = []
+    for candidate_name in REPRESENTATIVE_WIDTH_NAMES:
+        candidate = _glyph_lookup(font, candidate_name, batch)
+        candidate_layer = _master_layer(candidate, master_id)
+        value = _units_int(_safe_attr(candidate_layer, "width"))
+        if value is not None and value > 0:
+            representative_widths.append(value)
+    if not representative_widths:
+        return None
+    return _round_half_away_from_zero(statistics.median(representative_widths))
+
+
+def _default_figure_evidence(
+    font: Any,
+    master_id: str,
+    batch: Optional[SpacingBatch],
+) -> Optional[Tuple[Tuple[int, ...], Tuple[str, ...]]]:
+    """Return (widths, width metrics keys) of the default figures, or None if any is missing."""
+    figure_widths: List[int] = []
+    width_keys: List[str] = []
+    for candidate_name in DEFAULT_FIGURE_NAMES:
+        candidate = _glyph_lookup(font, candidate_name, batch)
+        candidate_layer = _master_layer(candidate, master_id)
+        if candidate is None or candidate_layer is None:
+            return None
+        value = _units_int(_safe_attr(candidate_layer, "width"))
+        if value is None:
+            return None
+        figure_widths.append(value)
+        key = _layer_width_metrics_key(candidate, candidate_layer)
+        if key:
+            width_keys.append(key)
+    return (tuple(figure_widths), tuple(width_keys))
+
+
 def normalize_guards(guards: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     out = dict(DEFAULT_GUARDS)
     if isinstance(guards, dict):
@@ -1179,6 +1473,13 @@ def _effective_default_reference(glyph: Any, font: Any) -> str:
     return "x"
 
 
+def _reference_layer_bounds(ref_glyph: Any, master_id: str) -> Tuple[Any, Optional[Tuple[float, float, float, float]]]:
+    ref_layer = _master_layer(ref_glyph, master_id)
+    if not ref_layer:
+        return (None, None)
+    return (ref_layer, _bounds_tuple(ref_layer))
+
+
 def compute_suggestion_for_layer(
     *,
     font: Any,
@@ -1189,6 +1490,7 @@ def compute_suggestion_for_layer(
     defaults: Dict[str, Any],
     master_params: Dict[str, Any],
     guards: Optional[Dict[str, Any]] = None,
+    batch: Optional[SpacingBatch] = None,
 ) -> Dict[str, Any]:
     glyph_name = str(_safe_attr(glyph, "name", "") or "")
     master_id = str(_safe_attr(master, "id", "") or "")
@@ -1199,7 +1501,7 @@ def compute_suggestion_for_layer(
 
     width, lsb, rsb = _get_layer_metrics(layer)
     current = {"width": _units_int(width), "lsb": _units_int(lsb), "rsb": _units_int(rsb)}
-    classification = classify_glyph(glyph, layer)
+    classification = classify_layer(glyph, layer, batch)
     glyph_class = classification.get("glyphClass") or "unclassified"
     upm = float(_safe_attr(font, "upm", 1000) or 1000)
     italic_angle_early = float(master_params.get("italicAngle", _safe_attr(master, "italicAngle", 0.0) or 0.0))
@@ -1314,6 +1616,7 @@ def compute_suggestion_for_layer(
         rule=rule,
         defaults=defaults,
         classification=classification,
+        batch=batch,
     )
     ref_glyph = reference_resolution.get("referenceGlyph")
     ref_name = reference_resolution.get("resolvedReferenceGlyph")
@@ -1354,10 +1657,13 @@ def compute_suggestion_for_layer(
             "warnings": warnings,
         }
 
-    try:
-        ref_layer = ref_glyph.layers[master_id]
-    except Exception:
-        ref_layer = None
+    if batch is not None:
+        ref_layer, ref_bounds = batch.memo(
+            ("referenceLayer", ref_name, master_id),
+            lambda: _reference_layer_bounds(ref_glyph, master_id),
+        )
+    else:
+        ref_layer, ref_bounds = _reference_layer_bounds(ref_glyph, master_id)
 
     if not ref_layer:
         return {
@@ -1372,7 +1678,6 @@ def compute_suggestion_for_layer(
             "warnings": warnings,
         }
 
-    ref_bounds = _bounds_tuple(ref_layer)
     if not ref_bounds:
         return {
             "glyphName": glyph_name,
@@ -1438,10 +1743,14 @@ def compute_suggestion_for_layer(
         italic_mode = "deslant"
 
     # Measure edges in full range for overshoot compensation.
-    full_bounds = bounds
-    full_measure = measure_layer_edges(layer, y_min=full_bounds[2], y_max=full_bounds[3], step=freq, include_components=include_components)
-    zone_measure = measure_layer_edges(layer, y_min=y_min_ref, y_max=y_max_ref, step=freq, include_components=include_components)
-    if not full_measure or not zone_measure:
+    views = measure_layer_edge_views(
+        layer,
+        full_range=(bounds[2], bounds[3]),
+        zone_range=(y_min_ref, y_max_ref),
+        step=freq,
+        include_components=include_components,
+    )
+    if not views:
         return {
             "glyphName": glyph_name,
             "masterId": master_id,
@@ -1454,17 +1763,13 @@ def compute_suggestion_for_layer(
             "warnings": warnings,
         }
 
+    full_measure, zone_measure = views
+
     # Deslant if requested.
     def _maybe_deslant(xs: List[Optional[float]], ys: List[float]) -> List[Optional[float]]:
         if italic_mode != "deslant" or abs(italic_angle) < 1e-6:
             return xs
-        out: List[Optional[float]] = []
-        for x, y in zip(xs, ys):
-            if x is None:
-                out.append(None)
-            else:
-                out.append(_deslant_x(float(x), float(y), x_height=x_height, italic_angle=italic_angle))
-        return out
+        return _deslant_xs(xs, ys, x_height=x_height, italic_angle=italic_angle)
 
     full_left = _maybe_deslant(full_measure.left_xs, full_measure.ys)
     full_right = _maybe_deslant(full_measure.right_xs, full_measure.ys)
@@ -1511,42 +1816,21 @@ def compute_suggestion_for_layer(
     distance_l = float(math.ceil(l_extreme - l_full_extreme))
     distance_r = float(math.ceil(r_full_extreme - r_extreme))
 
-    max_depth_l = l_extreme + depth_units
-    min_depth_r = r_extreme - depth_units
-
-    left_xs: List[float] = []
-    right_xs: List[float] = []
-    clamped_left = 0
-    clamped_right = 0
-
-    for x in zone_left:
-        if x is None:
-            xi = max_depth_l
-            clamped_left += 1
-        else:
-            xi = max(l_extreme, min(float(x), max_depth_l))
-            if xi != float(x):
-                clamped_left += 1
-        left_xs.append(xi)
-
-    for x in zone_right:
-        if x is None:
-            xi = min_depth_r
-            clamped_right += 1
-        else:
-            xi = min(r_extreme, max(float(x), min_depth_r))
-            if xi != float(x):
-                clamped_right += 1
-        right_xs.append(xi)
-
-    left_xs = _diagonize_left(left_xs, step=freq)
-    right_xs = _diagonize_right(right_xs, step=freq)
-
-    left_indents = [max(0.0, x - l_extreme) for x in left_xs]
-    right_indents = [max(0.0, r_extreme - x) for x in right_xs]
-
-    area_left = _trapezoid_area(zone_measure.ys, left_indents)
-    area_right = _trapezoid_area(zone_measure.ys, right_indents)
+    zone_areas = _zone_areas(
+        zone_measure.ys,
+        zone_left,
+        zone_right,
+        l_extreme=l_extreme,
+        r_extreme=r_extreme,
+        depth_units=depth_units,
+        step=freq,
+    )
+    left_xs = zone_areas.left_xs
+    right_xs = zone_areas.right_xs
+    clamped_left = zone_areas.clamped_left
+    clamped_right = zone_areas.clamped_right
+    area_left = zone_areas.area_left
+    area_right = zone_areas.area_right
 
     white_area = _scale_params(upm=upm, x_height=x_height, area=area, factor=factor)
     target_area = height * white_area / x_height
@@ -1568,6 +1852,7 @@ def compute_suggestion_for_layer(
         master=master,
         defaults=defaults,
         classification=classification,
+        batch=batch,
     )
     tabular_width = tabular_assessment.get("preservedWidth")
     if tabular_assessment.get("detected") and tabular_width is not None:
@@ -1709,6 +1994,684 @@ def compute_suggestion_for_layer(
     return result
 
 
+_METRICS_KEY_GLYPH = re.compile(r"[A-Za-z_][A-Za-z0-9_.]*(?:-[A-Za-z][A-Za-z0-9_.]*)*")
+
+
+def metrics_key_glyph_names(key: Any) -> List[str]:
+    """Return the glyph names a metrics key refers to, e.g. "=|n+10" -> ["n"]."""
+    text = str(key or "").strip()
+    if not text.startswith("="):
+        return []
+    names: List[str] = []
+    for match in _METRICS_KEY_GLYPH.finditer(text.lstrip("=").lstrip("|")):
+        if match.group(0) not in names:
+            names.append(match.group(0))
+    return names
+
+
+def layer_spacing_fingerprint(glyph: Any, layer: Any) -> str:
+    """Digest of everything a layer's own spacing suggestion reads.
+
+    The outline fingerprint plus current sidebearings, metrics keys, the
+    auto-alignment flag, and the glyph's classification inputs.
+    """
+    _width, lsb, rsb = _get_layer_metrics(layer)
+    parts = [
+        kerning_collision_engine.layer_outline_fingerprint(layer),
+        "S{},{}".format(lsb, rsb),
+        "A{}".format(_layer_is_auto_aligned(layer)),
+    ]
+    for obj in (glyph, layer):
+        for attr in ("leftMetricsKey", "rightMetricsKey", "widthMetricsKey"):
+            parts.append(str(_safe_attr(obj, attr, "") or ""))
+    for attr in ("name", "category", "subCategory", "unicode"):
+        parts.append(str(_safe_attr(glyph, attr, "") or ""))
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _tabular_evidence_dependencies(
+    font: Any,
+    glyph: Any,
+    defaults: Dict[str, Any],
+    classification: Dict[str, Any],
+    batch: Optional[SpacingBatch],
+) -> List[Tuple[str, str]]:
+    """Return `(glyph name, kind)` pairs whose widths `assess_tabular_mode` may read."""
+    mode = defaults.get("tabularMode", "auto")
+    if isinstance(mode, str):
+        mode = mode.strip().lower() or "auto"
+    if mode != "auto" or _units_int(defaults.get("tabularWidth")) is not None:
+        return []
+    if _is_tabular_name(str(_safe_attr(glyph, "name", "") or "")):
+        return []
+    if batch is not None:
+        fixed_pitch = batch.memo(("fixedPitch",), lambda: _font_fixed_pitch(font))
+    else:
+        fixed_pitch = _font_fixed_pitch(font)
+    if fixed_pitch:
+        return [(name, "fixedPitchWidth") for name in REPRESENTATIVE_WIDTH_NAMES]
+    if classification.get("glyphClass") == "decimalFigure":
+        return [(name, "tabularFigures") for name in DEFAULT_FIGURE_NAMES]
+    return []
+
+
+class SpacingDependencyGraph(object):
+    """Which glyphs' spacing reads which other glyphs.
+
+    A glyph depends on its resolved reference glyph (bounds of the
+    measurement band), on every glyph named in its glyph- or layer-level
+    metrics keys, and on the figure or representative widths that automatic
+    tabular detection compares, across the reviewed masters. Edges may point
+    at glyphs outside the reviewed set, so editing any glyph finds its
+    dependents.
+    """
+
+    def __init__(self, names: Sequence[str]) -> None:
+        self.names: List[str] = [str(name) for name in names]
+        self._deps: Dict[str, Dict[str, Set[str]]] = {name: {} for name in self.names}
+        self._dependents: Dict[str, Set[str]] = {}
+
+    def add(self, name: str, dependency: str, kind: str) -> None:
+        if not dependency or dependency == name:
+            return
+        self._deps.setdefault(name, {}).setdefault(dependency, set()).add(kind)
+        self._dependents.setdefault(dependency, set()).add(name)
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        font: Any,
+        glyphs: Sequence[Any],
+        masters: Sequence[Any],
+        rules: Optional[Sequence[Dict[str, Any]]],
+        defaults: Dict[str, Any],
+        batch: Optional[SpacingBatch] = None,
+    ) -> "SpacingDependencyGraph":
+        graph = cls([str(_safe_attr(glyph, "name", "") or "") for glyph in glyphs])
+        for glyph, name in zip(glyphs, graph.names):
+            for attr in ("leftMetricsKey", "rightMetricsKey", "widthMetricsKey"):
+                for target in metrics_key_glyph_names(_safe_attr(glyph, attr)):
+                    graph.add(name, target, "metricsKey")
+            rule = select_rule(glyph, rules)
+            for master in masters:
+                layer = _master_layer(glyph, _safe_attr(master, "id"))
+                if not layer:
+                    continue
+                for attr in ("leftMetricsKey", "rightMetricsKey", "widthMetricsKey"):
+                    for target in metrics_key_glyph_names(_safe_attr(layer, attr)):
+                        graph.add(name, target, "metricsKey")
+                classification = classify_layer(glyph, layer, batch)
+                resolution = resolve_reference(
+                    font=font,
+                    glyph=glyph,
+                    layer=layer,
+                    rule=rule,
+                    defaults=defaults,
+                    classification=classification,
+                    batch=batch,
+                )
+                reference = resolution.get("resolvedReferenceGlyph")
+                if reference and resolution.get("referenceGlyph") is not glyph:
+                    graph.add(name, str(reference), "reference")
+                for target, kind in _tabular_evidence_dependencies(font, glyph, defaults, classification, batch):
+                    graph.add(name, target, kind)
+        return graph
+
+    def dependencies(self, name: str) -> List[str]:
+        return sorted(self._deps.get(name, {}))
+
+    def edges(self) -> List[Dict[str, Any]]:
+        return [
+            {"glyphName": name, "dependsOn": dependency, "kinds": sorted(kinds)}
+            for name in self.names
+            for dependency, kinds in sorted(self._deps.get(name, {}).items())
+        ]
+
+    def affected_by(self, changed: Iterable[str]) -> List[str]:
+        """Reviewed glyphs that read any changed glyph, dependencies first.
+
+        Includes the changed glyphs themselves when they are reviewed. Order is
+        topological (a glyph follows everything it depends on), ties keep the
+        reviewed order; members of a cycle keep the reviewed order too.
+        """
+        affected: Set[str] = set()
+        queue = [str(name) for name in changed]
+        while queue:
+            name = queue.pop()
+            if name in affected:
+                continue
+            affected.add(name)
+            queue.extend(self._dependents.get(name, ()))
+        scoped = [name for name in self.names if name in affected]
+        remaining = {name: {dep for dep in self._deps.get(name, {}) if dep in affected and dep != name} for name in scoped}
+        ordered: List[str] = []
+        while remaining:
+            ready = [name for name in scoped if name in remaining and not remaining[name]]
+            if not ready:
+                ready = [name for name in scoped if name in remaining]
+            for name in ready:
+                del remaining[name]
+                ordered.append(name)
+                for deps in remaining.values():
+                    deps.discard(name)
+        return ordered
+
+
+class SpacingResultCache(object):
+    """Bounded, thread-safe LRU of spacing suggestions.
+
+    Keys carry a digest of everything a suggestion reads: the layer's
+    spacing fingerprint, the fingerprints of the glyphs it depends on in the
+    same master (including tabular width evidence), the font's fixed-pitch
+    flag, and the effective parameters. An edit to a glyph or to its
+    reference therefore misses the cache instead of returning stale values.
+    """
+
+    def __init__(self, max_entries: int = 32768) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(cached)
+
+    def put(self, key: Tuple[Any, ...], result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = dict(result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": int(self.hits), "misses": int(self.misses)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _spacing_input_key(
+    *,
+    font: Any,
+    font_key: Any,
+    glyph: Any,
+    layer: Any,
+    master_id: Any,
+    graph: SpacingDependencyGraph,
+    signature: str,
+    batch: SpacingBatch,
+) -> Tuple[Any, ...]:
+    name = str(_safe_attr(glyph, "name", "") or "")
+    parts = [
+        batch.memo(("fingerprint", name, master_id), lambda: layer_spacing_fingerprint(glyph, layer)),
+        "P{}".format(batch.memo(("fixedPitch",), lambda: _font_fixed_pitch(font))),
+    ]
+    for dependency in graph.dependencies(name):
+        dep_glyph = batch.glyph(dependency)
+        dep_layer = _master_layer(dep_glyph, master_id)
+        parts.append(dependency)
+        if dep_layer:
+            parts.append(
+                batch.memo(
+                    ("fingerprint", dependency, master_id),
+                    lambda: layer_spacing_fingerprint(dep_glyph, dep_layer),
+                )
+            )
+    digest = hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+    return (font_key, name, str(master_id), signature, digest)
+
+
+def iter_master_suggestions(
+    *,
+    font: Any,
+    glyphs: Sequence[Any],
+    masters: Sequence[Any],
+    rules: Optional[Sequence[Dict[str, Any]]],
+    defaults: Dict[str, Any],
+    master_params: Callable[[Any], Dict[str, Any]],
+    guards: Optional[Dict[str, Any]] = None,
+    batch: Optional[SpacingBatch] = None,
+    result_cache: Optional[SpacingResultCache] = None,
+    font_key: Any = None,
+    graph: Optional[SpacingDependencyGraph] = None,
+    recompute: Optional[Set[str]] = None,
+) -> Iterable[Tuple[Any, List[Dict[str, Any]]]]:
+    """Review every glyph one master at a time.
+
+    Yields `(master, results)` with one result per entry of `glyphs`, in the
+    same order. Layers of a master share the batch's reference bounds,
+    classifications, and tabular evidence, so each is read once per master
+    rather than once per layer. Per-layer exceptions become `error` records.
+
+    With a `result_cache`, every computed result is stored under its input
+    digest. When `recompute` is also given, glyphs outside it are served from
+    the cache if their digest still matches and marked `reused`.
+    """
+    batch = batch if batch is not None else SpacingBatch(font)
+    if result_cache is not None and graph is None:
+        graph = SpacingDependencyGraph.build(
+            font=font, glyphs=glyphs, masters=masters, rules=rules, defaults=defaults, batch=batch
+        )
+    for master in masters:
+        master_id = _safe_attr(master, "id")
+        master_name = _safe_attr(master, "name", "")
+        params = master_params(master)
+        signature = ""
+        if result_cache is not None:
+            signature = json.dumps([rules, defaults, guards, params], sort_keys=True, default=str)
+        results: List[Dict[str, Any]] = []
+        for glyph in glyphs:
+            glyph_name = _safe_attr(glyph, "name")
+            layer = _master_layer(glyph, master_id)
+            if not layer:
+                results.append(
+                    {
+                        "glyphName": glyph_name,
+                        "masterId": master_id,
+                        "masterName": master_name,
+                        "status": "skipped",
+                        "reason": "layer_missing",
+                    }
+                )
+                continue
+            key = None
+            if result_cache is not None and graph is not None:
+                key = _spacing_input_key(
+                    font=font,
+                    font_key=font_key,
+                    glyph=glyph,
+                    layer=layer,
+                    master_id=master_id,
+                    graph=graph,
+                    signature=signature,
+                    batch=batch,
+                )
+                if recompute is not None and glyph_name not in recompute:
+                    cached = result_cache.get(key)
+                    if cached is not None:
+                        cached["reused"] = True
+                        results.append(cached)
+                        continue
+            try:
+                result = compute_suggestion_for_layer(
+                    font=font,
+                    glyph=glyph,
+                    layer=layer,
+                    master=master,
+                    rules=rules,
+                    defaults=defaults,
+                    master_params=params,
+                    guards=guards,
+                    batch=batch,
+                )
+                if key is not None:
+                    result_cache.put(key, result)
+                if recompute is not None:
+                    result = dict(result, reused=False)
+                results.append(result)
+            except Exception as exc:
+                results.append(
+                    {
+                        "glyphName": glyph_name,
+                        "masterId": master_id,
+                        "masterName": master_name,
+                        "status": "error",
+                        "reason": "exception",
+                        "error": str(exc),
+                    }
+                )
+        yield master, results
+
+
+SPACING_FIT_GRID: Dict[str, Tuple[float, float, float]] = {
+    # (min, max, step) searched by SpacingParamFit when a field is not given.
+    "area": (200.0, 600.0, 10.0),
+    "depth": (5.0, 25.0, 1.0),
+    "over": (0.0, 5.0, 1.0),
+}
+MAX_FIT_COMBINATIONS = 50000
+
+
+def fit_grid_values(spec: Any, field: str) -> List[float]:
+    """Expand a fit grid spec: a number, a list of numbers, or {min, max, step}."""
+    if spec is None:
+        lo, hi, step = SPACING_FIT_GRID[field]
+        return _frange(lo, hi, step)
+    if isinstance(spec, dict):
+        lo = _coerce_float(spec.get("min"))
+        hi = _coerce_float(spec.get("max"))
+        step = _coerce_float(spec.get("step"))
+        if lo is None or hi is None or hi < lo:
+            raise ValueError("{} grid needs numeric min <= max".format(field))
+        if step is None or step <= 0:
+            step = SPACING_FIT_GRID[field][2]
+        return _frange(lo, hi, step)
+    raw = spec if isinstance(spec, (list, tuple)) else [spec]
+    values: List[float] = []
+    for item in raw:
+        value = _coerce_float(item)
+        if value is None:
+            raise ValueError("{} grid values must be numbers".format(field))
+        values.append(value)
+    if not values:
+        raise ValueError("{} grid is empty".format(field))
+    return sorted(set(values))
+
+
+def _fit_error_stats(residuals: List[float]) -> Dict[str, float]:
+    count = len(residuals)
+    return {
+        "meanAbsError": sum(abs(r) for r in residuals) / count,
+        "rmsError": math.sqrt(sum(r * r for r in residuals) / count),
+        "maxAbsError": max(abs(r) for r in residuals),
+    }
+
+
+class SpacingParamFit(object):
+    """Fit `area`, `depth`, and `over` for one master to its current sidebearings.
+
+    Each control layer's edges are read once, over every row any candidate
+    `over` can need, and kept deslanted in memory. Candidates are then
+    scored from those cached rows with the same area model as
+    `compute_suggestion_for_layer`. The white-area target is linear in
+    `area`, so each (depth, over) pair integrates the zones once and every
+    `area` value costs a few operations per glyph. `frequency` stays at the
+    master's effective value. Auto-aligned layers are skipped when
+    `skipAutoAligned` is set, and with `respectMetricsKeys` a side that has
+    a metrics key is left out of the error (a glyph is skipped only when both
+    sides are keyed). Layers whose width tabular detection preserves still
+    count: the parameters set their sidebearings before the width is
+    restored, so a fixed-pitch font can still be fitted.
+    """
+
+    def __init__(
+        self,
+        *,
+        font: Any,
+        glyphs: Sequence[Any],
+        master: Any,
+        master_params: Dict[str, Any],
+        defaults: Dict[str, Any],
+        overs: Sequence[float],
+        rules: Optional[Sequence[Dict[str, Any]]] = None,
+        batch: Optional[SpacingBatch] = None,
+    ) -> None:
+        self.master_id = str(_safe_attr(master, "id", "") or "")
+        self.master_name = str(_safe_attr(master, "name", "") or "")
+        self.upm = float(_safe_attr(font, "upm", 1000) or 1000)
+        self.frequency = float(master_params.get("frequency", defaults.get("frequency", DEFAULTS["frequency"])))
+        self.current_params = {
+            field: _coerce_float(master_params.get(field, defaults.get(field, DEFAULTS[field])))
+            for field in ("area", "depth", "over")
+        }
+        self.samples: List[Dict[str, Any]] = []
+        self.skipped: List[Dict[str, Any]] = []
+        self._terms: Dict[Tuple[float, float], Optional[List[Tuple[float, float, float, float, float]]]] = {}
+
+        batch = batch if batch is not None else SpacingBatch(font)
+        italic_angle = float(master_params.get("italicAngle", _safe_attr(master, "italicAngle", 0.0) or 0.0))
+        italic_mode = str(defaults.get("italicMode", DEFAULTS["italicMode"]) or "deslant").lower()
+        deslant = italic_mode in ("deslant", "ht_approx", "tan") and abs(italic_angle) >= 1e-6
+        include_components = bool(defaults.get("includeComponents", DEFAULTS["includeComponents"]))
+        min_coverage = float(defaults.get("minCoverageRatio", DEFAULTS["minCoverageRatio"]))
+        master_x_height = _coerce_float(master_params.get("xHeight"))
+        if master_x_height is None:
+            master_x_height = _coerce_float(_safe_attr(master, "xHeight"))
+        overs = list(overs)
+        if self.current_params["over"] is not None:
+            # Also cache the rows of the master's current setting for comparison.
+            overs.append(self.current_params["over"])
+        self.overs = frozenset(float(over) for over in overs)
+
+        for glyph in glyphs:
+            name = str(_safe_attr(glyph, "name", "") or "")
+            layer = _master_layer(glyph, self.master_id)
+
+            def _skip(reason: str) -> None:
+                self.skipped.append({"glyphName": name, "reason": reason})
+
+            if not layer:
+                _skip("layer_missing")
+                continue
+            classification = classify_layer(glyph, layer, batch)
+            if classification.get("glyphClass") in ("mark", "zeroWidth"):
+                _skip("mark_or_zero_width")
+                continue
+            bounds = _bounds_tuple(layer)
+            if not bounds:
+                _skip("bounds_missing")
+                continue
+            if defaults.get("skipAutoAligned") and _layer_is_auto_aligned(layer):
+                _skip("auto_aligned_components")
+                continue
+            sides = (True, True)
+            if defaults.get("respectMetricsKeys"):
+                left_key, right_key = _layer_has_metrics_keys(glyph, layer)
+                sides = (not left_key, not right_key)
+            if not any(sides):
+                _skip("metrics_keys")
+                continue
+            _width, lsb, rsb = _get_layer_metrics(layer)
+            if lsb is None or rsb is None:
+                _skip("current_metrics_missing")
+                continue
+            rule = select_rule(glyph, rules)
+            resolution = resolve_reference(
+                font=font,
+                glyph=glyph,
+                layer=layer,
+                rule=rule,
+                defaults=defaults,
+                classification=classification,
+                batch=batch,
+            )
+            ref_glyph = resolution.get("referenceGlyph")
+            ref_name = resolution.get("resolvedReferenceGlyph")
+            if not ref_glyph:
+                _skip("reference_glyph_missing")
+                continue
+            _ref_layer, ref_bounds = batch.memo(
+                ("referenceLayer", ref_name, self.master_id),
+                lambda: _reference_layer_bounds(ref_glyph, self.master_id),
+            )
+            if not ref_bounds:
+                _skip("reference_bounds_missing")
+                continue
+            x_height = master_x_height
+            if x_height is None or x_height <= 0:
+                x_height = float(ref_bounds[3] - ref_bounds[2]) or 1.0
+
+            rows = set(_frange(bounds[2], bounds[3], step=self.frequency))
+            full_ys = sorted(rows)
+            covered = True
+            for over in overs:
+                overshoot = x_height * (float(over) / 100.0)
+                y_min_ref = float(ref_bounds[2] - overshoot)
+                y_max_ref = float(ref_bounds[3] + overshoot)
+                if y_max_ref - y_min_ref <= 0 or _coverage_ratio(bounds, y_min_ref, y_max_ref) < min_coverage:
+                    covered = False
+                    break
+                rows.update(_frange(y_min_ref, y_max_ref, step=self.frequency))
+            if not covered:
+                _skip("insufficient_vertical_coverage")
+                continue
+            ordered = sorted(rows)
+            edges = _layer_edges(layer, ordered, include_components)
+            if edges is None:
+                _skip("measurement_failed")
+                continue
+            left = [l for l, _r in edges]
+            right = [r for _l, r in edges]
+            if deslant:
+                left = _deslant_xs(left, ordered, x_height=x_height, italic_angle=italic_angle)
+                right = _deslant_xs(right, ordered, x_height=x_height, italic_angle=italic_angle)
+            by_y = {y: (l, r) for y, l, r in zip(ordered, left, right)}
+            full_left_min, _ = _min_max_non_none([by_y[y][0] for y in full_ys])
+            _, full_right_max = _min_max_non_none([by_y[y][1] for y in full_ys])
+            if full_left_min is None or full_right_max is None:
+                _skip("no_intersections_full_bounds")
+                continue
+            self.samples.append(
+                {
+                    "glyphName": name,
+                    "current": (float(lsb), float(rsb)),
+                    "sides": sides,
+                    "factor": resolve_factor(rule, defaults),
+                    "xHeight": float(x_height),
+                    "refBounds": ref_bounds,
+                    "fullExtremes": (float(full_left_min), float(full_right_max)),
+                    "edges": by_y,
+                }
+            )
+
+    def _zone_terms(self, over: float, depth: float) -> Optional[List[Tuple[float, float, float, float, float]]]:
+        """Per sample (height, leftArea, rightArea, distanceLeft, distanceRight)."""
+        key = (float(over), float(depth))
+        if key in self._terms:
+            return self._terms[key]
+        if float(over) not in self.overs:
+            raise ValueError(
+                "over={} was not measured; include it in the overs passed to SpacingParamFit".format(over)
+            )
+        terms: Optional[List[Tuple[float, float, float, float, float]]] = []
+        for sample in self.samples:
+            x_height = sample["xHeight"]
+            ref_bounds = sample["refBounds"]
+            overshoot = x_height * (float(over) / 100.0)
+            y_min_ref = float(ref_bounds[2] - overshoot)
+            y_max_ref = float(ref_bounds[3] + overshoot)
+            zone_ys = _frange(y_min_ref, y_max_ref, step=self.frequency)
+            edges = sample["edges"]
+            zone_left = [edges[y][0] for y in zone_ys]
+            zone_right = [edges[y][1] for y in zone_ys]
+            z_left_min, _ = _min_max_non_none(zone_left)
+            _, z_right_max = _min_max_non_none(zone_right)
+            if z_left_min is None or z_right_max is None:
+                terms = None
+                break
+            l_full, r_full = sample["fullExtremes"]
+            areas = _zone_areas(
+                zone_ys,
+                zone_left,
+                zone_right,
+                l_extreme=float(z_left_min),
+                r_extreme=float(z_right_max),
+                depth_units=x_height * (float(depth) / 100.0),
+                step=self.frequency,
+            )
+            terms.append(
+                (
+                    float(y_max_ref - y_min_ref),
+                    areas.area_left,
+                    areas.area_right,
+                    float(math.ceil(float(z_left_min) - l_full)),
+                    float(math.ceil(r_full - float(z_right_max))),
+                )
+            )
+        self._terms[key] = terms
+        return terms
+
+    def _fitted(self, area: float, terms: List[Tuple[float, float, float, float, float]]) -> List[Tuple[float, float]]:
+        out: List[Tuple[float, float]] = []
+        for sample, (height, area_left, area_right, distance_l, distance_r) in zip(self.samples, terms):
+            x_height = sample["xHeight"]
+            white_area = _scale_params(upm=self.upm, x_height=x_height, area=area, factor=sample["factor"])
+            target_area = height * white_area / x_height
+            out.append(
+                (
+                    float(math.ceil(0.0 - distance_l + (target_area - area_left) / height)),
+                    float(math.ceil(0.0 - distance_r + (target_area - area_right) / height)),
+                )
+            )
+        return out
+
+    def evaluate(self, area: float, depth: float, over: float) -> Optional[Dict[str, Any]]:
+        """Score one parameter set, or None when a control glyph has no zone edges.
+
+        Raises ValueError when `over` was not among the `overs` the fit measured.
+        """
+        if not self.samples:
+            return None
+        terms = self._zone_terms(over, depth)
+        if terms is None:
+            return None
+        residuals: List[float] = []
+        for sample, fitted in zip(self.samples, self._fitted(area, terms)):
+            for side in (0, 1):
+                if sample["sides"][side]:
+                    residuals.append(fitted[side] - sample["current"][side])
+        return {"area": float(area), "depth": float(depth), "over": float(over), **_fit_error_stats(residuals)}
+
+    def search(
+        self,
+        *,
+        areas: Sequence[float],
+        depths: Sequence[float],
+        overs: Sequence[float],
+        top: int = 5,
+    ) -> Dict[str, Any]:
+        """Score the full grid and return the best fits with error statistics."""
+        evaluated = 0
+        ranked: List[Tuple[float, float, int, Dict[str, Any]]] = []
+        for over in overs:
+            for depth in depths:
+                if self._zone_terms(over, depth) is None:
+                    continue
+                for area in areas:
+                    scored = self.evaluate(area, depth, over)
+                    if scored is None:
+                        continue
+                    ranked.append((scored["meanAbsError"], scored["rmsError"], evaluated, scored))
+                    evaluated += 1
+        best = [entry[3] for entry in heapq.nsmallest(max(1, int(top)), ranked)]
+
+        current = None
+        if None not in self.current_params.values():
+            current = self.evaluate(
+                self.current_params["area"], self.current_params["depth"], self.current_params["over"]
+            )
+        glyphs: List[Dict[str, Any]] = []
+        if best:
+            terms = self._zone_terms(best[0]["over"], best[0]["depth"]) or []
+            for sample, (lsb, rsb) in zip(self.samples, self._fitted(best[0]["area"], terms)):
+                glyphs.append(
+                    {
+                        "glyphName": sample["glyphName"],
+                        "current": {"lsb": _units_int(sample["current"][0]), "rsb": _units_int(sample["current"][1])},
+                        # A side kept by its metrics key is not fitted.
+                        "fitted": {
+                            "lsb": _units_int(lsb) if sample["sides"][0] else None,
+                            "rsb": _units_int(rsb) if sample["sides"][1] else None,
+                        },
+                    }
+                )
+        return {
+            "masterId": self.master_id,
+            "masterName": self.master_name,
+            "frequency": self.frequency,
+            "glyphCount": len(self.samples),
+            "skipped": list(self.skipped),
+            "evaluated": evaluated,
+            "best": best[0] if best else None,
+            "top": best,
+            "current": current,
+            "glyphs": glyphs,
+        }
+
+
 def clamp_suggestion(
     *,
     current: Dict[str, Any],
@@ -8,9 +8,14 @@ The functions in this module avoid importing GlyphsApp so they can be used by
 normal unit tests with lightweight fake Glyphs objects.
 """
 
+import threading
+from collections import OrderedDict
+
 from mcp_tool_helpers import _coerce_numeric, _safe_attr
 
 import compensated_tuning_engine
+import kerning_collision_engine
+import scanline_engine
 
 
 DEFAULT_REFERENCE_GLYPHS = ["H", "n", "I", "o", "E"]
@@ -254,27 +259,150 @@ def _center_height_for_name(master, font, name):
     return float(upm) * 0.5
 
 
-def estimate_master_stem(
+class StemRunCache(object):
+    """Bounded, thread-safe LRU of black runs measured on layer scanlines.
+
+    Keys are (outline fingerprint, orientation, sample positions, components),
+    so masters, tools, and repeated calls that scan the same geometry at the
+    same positions share one measurement. Layers that cannot be read as plain
+    nodes are measured through `intersectionsBetweenPoints` and never cached.
+    """
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached
+
+    def put(self, key, runs):
+        with self._lock:
+            self._entries[key] = tuple(tuple(line) for line in runs)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "hits": int(self.hits), "misses": int(self.misses)}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_STEM_RUN_CACHE = None
+
+
+def stem_run_cache():
+    """Return the process-wide run cache shared by the stem, italic, and tuning tools."""
+    global _STEM_RUN_CACHE
+    if _STEM_RUN_CACHE is None:
+        _STEM_RUN_CACHE = StemRunCache()
+    return _STEM_RUN_CACHE
+
+
+def _intersection_scanlines(layer, orientation, positions, start, end, include_components):
+    scanlines = []
+    for position in positions:
+        if orientation == "vertical":
+            line = ((start, position), (end, position))
+            read = point_x
+        else:
+            line = ((position, start), (position, end))
+            read = point_y
+        try:
+            pts = layer.intersectionsBetweenPoints(line[0], line[1], components=include_components)
+        except Exception:
+            continue
+        values = [read(pt) for pt in list(pts or [])[1:-1]]
+        values = [value for value in values if value is not None]
+        if values:
+            scanlines.append(values)
+    return scanlines
+
+
+def _layer_stem_runs(layer, *, orientation, positions, span, include_components, cache=None):
+    """Return the black runs of every non-empty scanline through `layer`.
+
+    Vertical stems are crossed by horizontal scanlines and vice versa; one
+    edge-table sweep answers every sample position.
+    """
+    key = None
+    if cache is not None:
+        key = (
+            kerning_collision_engine.layer_outline_fingerprint(layer),
+            orientation,
+            tuple(round(float(p), 6) for p in positions),
+            bool(include_components),
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    table = scanline_engine.EdgeTable.from_layer(
+        layer,
+        include_components=include_components,
+        vertical=orientation != "vertical",
+    )
+    if table is None:
+        scanlines = _intersection_scanlines(layer, orientation, positions, span[0], span[1], include_components)
+        return compensated_tuning_engine.black_runs_for_scanlines(scanlines)
+    runs = compensated_tuning_engine.black_runs_for_scanlines(xs for xs in table.sweep(positions) if xs)
+    if key is not None:
+        cache.put(key, runs)
+    return runs
+
+
+def estimate_font_stems(
     *,
     font,
-    master,
-    orientation,
+    masters,
+    orientations=("vertical", "horizontal"),
     reference_glyphs=None,
     samples=9,
     band=0.2,
     min_width=5.0,
     max_width=None,
     include_components=True,
+    cache=None,
 ):
-    orientation = "horizontal" if str(orientation or "").lower().startswith("h") else "vertical"
+    """Estimate stems for several masters and orientations in one pass.
+
+    Each reference glyph is looked up once and its master layers are scanned
+    in turn. Returns `{master id: {orientation: estimate}}`, each estimate
+    shaped like `estimate_master_stem`.
+    """
+    orientation_list = []
+    for orientation in orientations or ("vertical",):
+        norm = "horizontal" if str(orientation or "").lower().startswith("h") else "vertical"
+        if norm not in orientation_list:
+            orientation_list.append(norm)
     upm = _coerce_numeric(getattr(font, "upm", None)) or 1000.0
+    margin = max(50.0, float(upm) * 0.1)
     glyph_names = list(reference_glyphs or DEFAULT_REFERENCE_GLYPHS)
     if not glyph_names:
         glyph_names = list(DEFAULT_REFERENCE_GLYPHS)
 
-    values = []
-    used_glyphs = []
-    scanline_count = 0
+    master_list = []
+    for master in list(masters or []):
+        if all(getattr(m, "id", None) != getattr(master, "id", None) for m in master_list):
+            master_list.append(master)
+    acc = {}
+    for master in master_list:
+        for orientation in orientation_list:
+            acc[(getattr(master, "id", None), orientation)] = {"values": [], "usedGlyphs": [], "sampleCount": 0}
 
     for glyph_name in glyph_names:
         try:
@@ -284,72 +412,96 @@ def estimate_master_stem(
         if not glyph:
             continue
 
-        try:
-            layer = glyph.layers[getattr(master, "id", None)]
-        except Exception:
-            layer = None
-        if not layer:
-            continue
-
-        bounds = bounds_tuple_for_layer(layer)
-        if not bounds:
-            continue
-
-        min_x, max_x, min_y, max_y = bounds
-        margin = max(50.0, float(upm) * 0.1)
-        scanlines = []
-
-        if orientation == "vertical":
-            height = _center_height_for_name(master, font, str(glyph_name))
-            extent = max(1.0, float(height) * float(band))
-            positions = sample_positions(center=float(height) * 0.5, extent=extent, samples=samples)
-            start = float(min_x) - margin
-            end = float(max_x) + margin
-            for y in positions:
-                try:
-                    pts = layer.intersectionsBetweenPoints((start, y), (end, y), components=include_components)
-                except Exception:
+        for master in master_list:
+            master_id = getattr(master, "id", None)
+            try:
+                layer = glyph.layers[master_id]
+            except Exception:
+                layer = None
+            if not layer:
+                continue
+
+            bounds = bounds_tuple_for_layer(layer)
+            if not bounds:
+                continue
+            min_x, max_x, min_y, max_y = bounds
+
+            for orientation in orientation_list:
+                if orientation == "vertical":
+                    height = _center_height_for_name(master, font, str(glyph_name))
+                    extent = max(1.0, float(height) * float(band))
+                    positions = sample_positions(center=float(height) * 0.5, extent=extent, samples=samples)
+                    span = (float(min_x) - margin, float(max_x) + margin)
+                else:
+                    width = max(1.0, float(max_x) - float(min_x))
+                    extent = max(1.0, width * float(band))
+                    positions = sample_positions(center=(float(min_x) + float(max_x)) * 0.5, extent=extent, samples=samples)
+                    span = (float(min_y) - margin, float(max_y) + margin)
+                runs = _layer_stem_runs(
+                    layer,
+                    orientation=orientation,
+                    positions=positions,
+                    span=span,
+                    include_components=include_components,
+                    cache=cache,
+                )
+                entry = acc[(master_id, orientation)]
+                entry["sampleCount"] += len(runs)
+                stem = compensated_tuning_engine.stem_thickness_from_runs(
+                    runs_per_scanline=runs,
+                    min_width=min_width,
+                    max_width=max_width,
+                )
+                if stem is None or stem <= 0:
                     continue
-                xs = [point_x(pt) for pt in list(pts or [])[1:-1]]
-                xs = [x for x in xs if x is not None]
-                if xs:
-                    scanlines.append(xs)
-        else:
-            width = max(1.0, float(max_x) - float(min_x))
-            extent = max(1.0, width * float(band))
-            positions = sample_positions(center=(float(min_x) + float(max_x)) * 0.5, extent=extent, samples=samples)
-            start = float(min_y) - margin
-            end = float(max_y) + margin
-            for x in positions:
-                try:
-                    pts = layer.intersectionsBetweenPoints((x, start), (x, end), components=include_components)
-                except Exception:
-                    continue
-                ys = [point_y(pt) for pt in list(pts or [])[1:-1]]
-                ys = [y for y in ys if y is not None]
-                if ys:
-                    scanlines.append(ys)
-
-        scanline_count += len(scanlines)
-        stem = compensated_tuning_engine.stem_thickness_from_scanlines(
-            scanlines_xs=scanlines,
-            min_width=min_width,
-            max_width=max_width,
-        )
-        if stem is None or stem <= 0:
-            continue
-        values.append(float(stem))
-        used_glyphs.append(str(glyph_name))
+                entry["values"].append(float(stem))
+                entry["usedGlyphs"].append(str(glyph_name))
+
+    out = {}
+    for master in master_list:
+        master_id = getattr(master, "id", None)
+        by_orientation = out.setdefault(master_id, {})
+        for orientation in orientation_list:
+            entry = acc[(master_id, orientation)]
+            value = compensated_tuning_engine._median(entry["values"])  # type: ignore[attr-defined]
+            by_orientation[orientation] = {
+                "ok": value is not None and float(value) > 0.0,
+                "orientation": orientation,
+                "value": value,
+                "usedGlyphs": entry["usedGlyphs"],
+                "sampleCount": entry["sampleCount"],
+                "dispersion": compensated_tuning_engine.iqr_ratio(entry["values"]),
+            }
+    return out
 
-    value = compensated_tuning_engine._median(values)  # type: ignore[attr-defined]
-    return {
-        "ok": value is not None and float(value) > 0.0,
-        "orientation": orientation,
-        "value": value,
-        "usedGlyphs": used_glyphs,
-        "sampleCount": scanline_count,
-        "dispersion": compensated_tuning_engine.iqr_ratio(values),
-    }
+
+def estimate_master_stem(
+    *,
+    font,
+    master,
+    orientation,
+    reference_glyphs=None,
+    samples=9,
+    band=0.2,
+    min_width=5.0,
+    max_width=None,
+    include_components=True,
+    cache=None,
+):
+    orientation = "horizontal" if str(orientation or "").lower().startswith("h") else "vertical"
+    estimates = estimate_font_stems(
+        font=font,
+        masters=[master],
+        orientations=[orientation],
+        reference_glyphs=reference_glyphs,
+        samples=samples,
+        band=band,
+        min_width=min_width,
+        max_width=max_width,
+        include_components=include_components,
+        cache=cache,
+    )
+    return estimates[getattr(master, "id", None)][orientation]
 
 
 def stem_ratio_payload(
@@ -365,6 +517,7 @@ def stem_ratio_payload(
     include_components,
     stem_source,
     mismatch_tolerance,
+    cache=None,
 ):
     stem_definition = None
     vertical_definitions = stem_definitions_for_orientation(font, "vertical")
@@ -377,28 +530,20 @@ def stem_ratio_payload(
     if base_stem_font and ref_stem_font and base_stem_font > 0:
         ratio_font = float(ref_stem_font) / float(base_stem_font)
 
-    base_estimate = estimate_master_stem(
-        font=font,
-        master=base_master,
-        orientation="vertical",
-        reference_glyphs=reference_glyphs,
-        samples=samples,
-        band=band,
-        min_width=min_width,
-        max_width=max_width,
-        include_components=include_components,
-    )
-    ref_estimate = estimate_master_stem(
+    estimates = estimate_font_stems(
         font=font,
-        master=ref_master,
-        orientation="vertical",
+        masters=[base_master, ref_master],
+        orientations=["vertical"],
         reference_glyphs=reference_glyphs,
         samples=samples,
         band=band,
         min_width=min_width,
         max_width=max_width,
         include_components=include_components,
+        cache=cache,
     )
+    base_estimate = estimates[getattr(base_master, "id", None)]["vertical"]
+    ref_estimate = estimates[getattr(ref_master, "id", None)]["vertical"]
 
     stem_base_measured = base_estimate.get("value")
     stem_ref_measured = ref_estimate.get("value")
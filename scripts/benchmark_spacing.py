@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""Headless spacing regression and throughput benchmark over UFO masters.
+
+Each UFO is loaded through `benchmark_ufo_adapter` and every glyph is run
+through `spacing_engine.compute_suggestion_for_layer`, the same path
+`review_spacing` takes inside Glyphs.  Without UFO arguments the pinned IBM
+Plex Sans Regular and Italic masters from the italic benchmark cache are used.
+
+The JSON report has, per master: layers/second (best of `--repeat` timed
+passes), outline intersection calls and edge-table builds per layer, peak
+traced memory, and how far the suggested sidebearings deviate from the
+shipped ones.  With `--baseline` the report is compared against an earlier
+one and the exit status is 1 when a gate fails, which makes the runner usable
+as a CI gate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parent.parent
+
+
+RESOURCES = (
+    _repo_root()
+    / "src"
+    / "glyphs-mcp"
+    / "Glyphs MCP.glyphsPlugin"
+    / "Contents"
+    / "Resources"
+)
+if str(RESOURCES) not in sys.path:
+    sys.path.insert(0, str(RESOURCES))
+
+import benchmark_ufo_adapter as ufo_adapter  # noqa: E402
+import scanline_engine  # noqa: E402
+import spacing_engine as engine  # noqa: E402
+
+
+# Same pinned checkout as benchmark_italic_sans_broad.
+PLEX_COMMIT = "71d012bccb31a2e282cc46de63b387ff7f676287"
+PINNED_UFOS = (
+    "sources/masters/IBM Plex Sans-Regular.ufo",
+    "sources/masters/IBM Plex Sans-Italic.ufo",
+)
+DEFAULT_REPEAT = 3
+DEFAULT_TOP = 20
+# Baseline gates.
+DEFAULT_MAX_SLOWDOWN = 0.25
+DEFAULT_MAX_MEMORY_GROWTH = 0.25
+DEFAULT_SUGGESTION_TOLERANCE = 0
+DEFAULT_MAX_DEVIATION_DRIFT = 0.5
+
+
+def default_ufo_paths(plex_root: Path) -> list[Path]:
+    return [Path(plex_root) / relative for relative in PINNED_UFOS]
+
+
+class CallCounter:
+    """Count outline reads made by the engine while it is installed.
+
+    `intersections` counts per-scanline `intersectionsBetweenPoints` calls
+    (the Glyphs bridge path); `edgeTables` counts `EdgeTable.from_layer`
+    builds, each of which answers every scanline of one layer.
+    """
+
+    def __init__(self) -> None:
+        self.intersections = 0
+        self.edge_tables = 0
+
+    @contextlib.contextmanager
+    def installed(self) -> Iterator["CallCounter"]:
+        layer_cls = ufo_adapter._Layer
+        original_intersections = layer_cls.intersectionsBetweenPoints
+        original_from_layer = scanline_engine.EdgeTable.__dict__["from_layer"]
+        counter = self
+
+        def intersections(layer: Any, *args: Any, **kwargs: Any) -> Any:
+            counter.intersections += 1
+            return original_intersections(layer, *args, **kwargs)
+
+        def from_layer(cls: Any, *args: Any, **kwargs: Any) -> Any:
+            counter.edge_tables += 1
+            return original_from_layer.__func__(cls, *args, **kwargs)
+
+        layer_cls.intersectionsBetweenPoints = intersections
+        scanline_engine.EdgeTable.from_layer = classmethod(from_layer)
+        try:
+            yield self
+        finally:
+            layer_cls.intersectionsBetweenPoints = original_intersections
+            scanline_engine.EdgeTable.from_layer = original_from_layer
+
+
+def master_params(master: Any, defaults: dict[str, Any]) -> dict[str, Any]:
+    """Mirror `_effective_master_params_for_spacing` for a UFO master."""
+
+    return {
+        "xHeight": getattr(master, "xHeight", None),
+        "italicAngle": getattr(master, "italicAngle", 0.0),
+        "area": defaults.get("area"),
+        "depth": defaults.get("depth"),
+        "over": defaults.get("over"),
+        "frequency": defaults.get("frequency"),
+    }
+
+
+def _review(
+    font: ufo_adapter.UFOFont,
+    glyphs: Sequence[Any],
+    defaults: dict[str, Any],
+) -> list[dict[str, Any]]:
+    master = font.masters[0]
+    params = master_params(master, defaults)
+    results: list[dict[str, Any]] = []
+    for _master, master_results in engine.iter_master_suggestions(
+        font=font,
+        glyphs=glyphs,
+        masters=[master],
+        rules=None,
+        defaults=defaults,
+        master_params=lambda _m: params,
+    ):
+        results.extend(master_results)
+    return results
+
+
+def _percentile(values: Sequence[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(math.ceil(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+def deviation_summary(
+    results: Sequence[dict[str, Any]],
+    *,
+    top: int = DEFAULT_TOP,
+) -> tuple[dict[str, Any], list[dict[str, Any]], dict[str, list[int]]]:
+    """Return (summary, largest deviations, suggestions by glyph name).
+
+    Only `ok` results with both shipped and suggested sidebearings count; the
+    deviation of a glyph is the larger of its |ΔLSB| and |ΔRSB|.
+    """
+
+    rows = []
+    suggestions: dict[str, list[int]] = {}
+    for result in results:
+        if result.get("status") != "ok":
+            continue
+        current = result.get("current") or {}
+        proposed = result.get("proposed") or {}
+        if None in (
+            current.get("lsb"),
+            current.get("rsb"),
+            proposed.get("lsb"),
+            proposed.get("rsb"),
+        ):
+            continue
+        name = str(result.get("glyphName"))
+        suggestions[name] = [int(proposed["lsb"]), int(proposed["rsb"])]
+        delta_lsb = int(proposed["lsb"]) - int(current["lsb"])
+        delta_rsb = int(proposed["rsb"]) - int(current["rsb"])
+        rows.append(
+            {
+                "glyphName": name,
+                "glyphClass": result.get("glyphClass"),
+                "current": [int(current["lsb"]), int(current["rsb"])],
+                "suggested": suggestions[name],
+                "delta": [delta_lsb, delta_rsb],
+                "deviation": max(abs(delta_lsb), abs(delta_rsb)),
+            }
+        )
+    deviations = [float(row["deviation"]) for row in rows]
+    sides = [float(abs(value)) for row in rows for value in row["delta"]]
+    summary: dict[str, Any] = {"glyphs": len(rows)}
+    if rows:
+        summary.update(
+            {
+                "meanAbsSide": statistics.fmean(sides),
+                "median": statistics.median(deviations),
+                "p95": _percentile(deviations, 0.95),
+                "max": max(deviations),
+                "unchanged": sum(1 for value in deviations if value == 0),
+            }
+        )
+    rows.sort(key=lambda row: (-row["deviation"], row["glyphName"]))
+    return summary, rows[: max(int(top), 0)], suggestions
+
+
+def measure_ufo(
+    path: Path,
+    *,
+    glyph_names: Sequence[str] | None = None,
+    defaults: dict[str, Any] | None = None,
+    repeat: int = DEFAULT_REPEAT,
+    top: int = DEFAULT_TOP,
+) -> dict[str, Any]:
+    """Benchmark one UFO master and return its report entry."""
+
+    ufo_path = Path(path)
+    font = ufo_adapter.load_ufo(
+        ufo_path,
+        master_id=ufo_path.stem,
+        master_name=ufo_path.stem,
+    )
+    merged = dict(engine.DEFAULTS)
+    merged.update(defaults or {})
+    if glyph_names:
+        glyphs = [font.glyphs[name] for name in glyph_names if font.glyphs[name]]
+    else:
+        glyphs = list(font.glyphs)
+    layers = len(glyphs)
+
+    # Timed passes run untraced; tracemalloc would dominate the timing.
+    timings = []
+    results: list[dict[str, Any]] = []
+    for _ in range(max(int(repeat), 1)):
+        started = time.perf_counter()
+        results = _review(font, glyphs, merged)
+        timings.append(time.perf_counter() - started)
+
+    counter = CallCounter()
+    tracemalloc.start()
+    try:
+        with counter.installed():
+            _review(font, glyphs, merged)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    statuses: dict[str, int] = {}
+    for result in results:
+        status = str(result.get("status"))
+        statuses[status] = statuses.get(status, 0) + 1
+    summary, largest, suggestions = deviation_summary(results, top=top)
+    seconds = min(timings)
+    return {
+        "ufo": str(ufo_path.resolve()),
+        "name": ufo_path.stem,
+        "masterId": font.masters[0].id,
+        "layers": layers,
+        "statuses": dict(sorted(statuses.items())),
+        "seconds": seconds,
+        "layersPerSecond": layers / seconds if seconds > 0 else None,
+        "intersectionCalls": counter.intersections,
+        "edgeTableBuilds": counter.edge_tables,
+        "intersectionCallsPerLayer": counter.intersections / layers if layers else 0.0,
+        "edgeTableBuildsPerLayer": counter.edge_tables / layers if layers else 0.0,
+        "peakMemoryBytes": int(peak),
+        "deviation": summary,
+        "largestDeviations": largest,
+        "suggestions": suggestions,
+    }
+
+
+def compare_to_baseline(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    max_slowdown: float = DEFAULT_MAX_SLOWDOWN,
+    max_memory_growth: float = DEFAULT_MAX_MEMORY_GROWTH,
+    suggestion_tolerance: int = DEFAULT_SUGGESTION_TOLERANCE,
+    max_deviation_drift: float = DEFAULT_MAX_DEVIATION_DRIFT,
+) -> dict[str, Any]:
+    """Compare two reports master by master (matched on UFO name).
+
+    Fails when throughput drops by more than `max_slowdown`, intersection
+    calls per layer rise, peak memory grows by more than `max_memory_growth`,
+    any suggested sidebearing moves by more than `suggestion_tolerance`, or
+    the mean per-side deviation from shipped metrics drifts by more than
+    `max_deviation_drift` units.  A negative ratio disables that gate.
+    """
+
+    failures: list[dict[str, Any]] = []
+    masters = []
+    previous_by_name = {entry["name"]: entry for entry in baseline.get("masters") or []}
+    for entry in report["masters"]:
+        previous = previous_by_name.get(entry["name"])
+        if previous is None:
+            masters.append({"name": entry["name"], "status": "no_baseline"})
+            continue
+        comparison: dict[str, Any] = {"name": entry["name"], "status": "compared"}
+
+        def fail(metric: str, current: Any, expected: Any) -> None:
+            failures.append(
+                {
+                    "name": entry["name"],
+                    "metric": metric,
+                    "current": current,
+                    "baseline": expected,
+                }
+            )
+
+        speed, old_speed = entry.get("layersPerSecond"), previous.get("layersPerSecond")
+        if speed and old_speed:
+            comparison["speedRatio"] = speed / old_speed
+            if max_slowdown >= 0 and speed < old_speed * (1.0 - max_slowdown):
+                fail("layersPerSecond", speed, old_speed)
+
+        calls = entry["intersectionCallsPerLayer"]
+        old_calls = float(previous.get("intersectionCallsPerLayer") or 0.0)
+        if calls > old_calls + 1e-9:
+            fail("intersectionCallsPerLayer", calls, old_calls)
+
+        peak, old_peak = entry["peakMemoryBytes"], previous.get("peakMemoryBytes")
+        if old_peak:
+            comparison["memoryRatio"] = peak / old_peak
+            if max_memory_growth >= 0 and peak > old_peak * (1.0 + max_memory_growth):
+                fail("peakMemoryBytes", peak, old_peak)
+
+        changed = []
+        old_suggestions = previous.get("suggestions") or {}
+        for name, suggested in sorted(entry["suggestions"].items()):
+            old = old_suggestions.get(name)
+            if old is None:
+                continue
+            if max(abs(a - b) for a, b in zip(suggested, old)) > suggestion_tolerance:
+                changed.append({"glyphName": name, "suggested": suggested, "baseline": old})
+        comparison["suggestionsChanged"] = len(changed)
+        if changed:
+            fail("suggestions", changed[:DEFAULT_TOP], len(changed))
+
+        mean = entry["deviation"].get("meanAbsSide")
+        old_mean = (previous.get("deviation") or {}).get("meanAbsSide")
+        if mean is not None and old_mean is not None:
+            comparison["deviationDrift"] = mean - old_mean
+            if abs(mean - old_mean) > max_deviation_drift:
+                fail("meanAbsSide", mean, old_mean)
+        masters.append(comparison)
+    return {"passed": not failures, "masters": masters, "failures": failures}
+
+
+def run(
+    ufo_paths: Sequence[Path],
+    *,
+    glyph_names: Sequence[str] | None = None,
+    defaults: dict[str, Any] | None = None,
+    repeat: int = DEFAULT_REPEAT,
+    top: int = DEFAULT_TOP,
+) -> dict[str, Any]:
+    masters = [
+        measure_ufo(
+            path,
+            glyph_names=glyph_names,
+            defaults=defaults,
+            repeat=repeat,
+            top=top,
+        )
+        for path in ufo_paths
+    ]
+    return {
+        "params": {
+            "defaults": dict(defaults or {}),
+            "glyphNames": list(glyph_names or []),
+            "repeat": max(int(repeat), 1),
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": engine.numpy_available(),
+            "machine": platform.machine(),
+        },
+        "masters": masters,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "ufos",
+        type=Path,
+        nargs="*",
+        help="UFO masters to benchmark (default: the pinned Plex masters).",
+    )
+    parser.add_argument(
+        "--plex-root",
+        type=Path,
+        default=_repo_root()
+        / ".cache"
+        / "italic-benchmark"
+        / "plex-{}".format(PLEX_COMMIT),
+    )
+    parser.add_argument("--glyph-names", nargs="*")
+    parser.add_argument(
+        "--defaults",
+        type=json.loads,
+        help="JSON object of spacing defaults, as in review_spacing.",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--max-slowdown", type=float, default=DEFAULT_MAX_SLOWDOWN)
+    parser.add_argument(
+        "--max-memory-growth",
+        type=float,
+        default=DEFAULT_MAX_MEMORY_GROWTH,
+    )
+    parser.add_argument(
+        "--suggestion-tolerance",
+        type=int,
+        default=DEFAULT_SUGGESTION_TOLERANCE,
+    )
+    parser.add_argument(
+        "--max-deviation-drift",
+        type=float,
+        default=DEFAULT_MAX_DEVIATION_DRIFT,
+    )
+    args = parser.parse_args()
+    ufo_paths = args.ufos or default_ufo_paths(args.plex_root)
+    try:
+        result = run(
+            ufo_paths,
+            glyph_names=args.glyph_names,
+            defaults=args.defaults,
+            repeat=args.repeat,
+            top=args.top,
+        )
+        if args.baseline:
+            baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+            result["baseline"] = compare_to_baseline(
+                result,
+                baseline,
+                max_slowdown=args.max_slowdown,
+                max_memory_growth=args.max_memory_growth,
+                suggestion_tolerance=args.suggestion_tolerance,
+                max_deviation_drift=args.max_deviation_drift,
+            )
+    except (OSError, RuntimeError, ValueError) as exc:
+        parser.error(str(exc))
+    text = json.dumps(result, indent=2, sort_keys=True) + "\n"
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+    if args.baseline and not result["baseline"]["passed"]:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,19 +1,44 @@
-"""Small read-only UFO adapter for the italic benchmark.
+"""Small read-only UFO adapter for the italic benchmark and headless audits.
 
 The benchmark's geometry helpers use the subset of the Glyphs object model
 listed below.  Keeping the adapter here lets the same deterministic engine run
 against pinned UFO sources without converting or modifying those sources.
+
+Layers also provide `bounds`, read-only `LSB`/`RSB`, and a pure-Python
+horizontal `intersectionsBetweenPoints`, which is all `kerning_collision_engine`
+and `spacing_engine` need to scan outlines without Glyphs.  Contours are
+flattened by `scanline_engine`, the same polygons the plugin's edge tables
+sweep, so edges stay within `scanline_engine.DEFAULT_FLATNESS` units of
+Glyphs' exact intersections.
 """
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any
+from typing import Any, Callable
 
 from defcon import Font as DefconFont
 
+RESOURCES = (
+    Path(__file__).resolve().parent.parent
+    / "src"
+    / "glyphs-mcp"
+    / "Glyphs MCP.glyphsPlugin"
+    / "Contents"
+    / "Resources"
+)
+if str(RESOURCES) not in sys.path:
+    sys.path.insert(0, str(RESOURCES))
+
+import scanline_engine  # noqa: E402
+
+
+MAX_COMPONENT_DEPTH = 8
+GROUP_PREFIXES = (("public.kern1.", "@MMK_L_"), ("public.kern2.", "@MMK_R_"))
+
 
 @dataclass(frozen=True)
 class _Position:
@@ -41,27 +66,163 @@ class _Anchor:
 
 
 class _Component:
-    def __init__(self, component: Any) -> None:
+    def __init__(
+        self,
+        component: Any,
+        resolver: Callable[[str], "_Layer | None"] | None = None,
+    ) -> None:
         self.componentName = str(component.baseGlyph)
         self.name = self.componentName
         self.transform = tuple(float(value) for value in component.transformation)
+        self._resolver = resolver
+
+    @property
+    def componentLayer(self) -> "_Layer | None":
+        if self._resolver is None:
+            return None
+        return self._resolver(self.componentName)
+
+
+def _transform_point(
+    transform: tuple[float, ...],
+    point: tuple[float, float],
+) -> tuple[float, float]:
+    xx, xy, yx, yy, dx, dy = transform
+    x, y = point
+    return (xx * x + yx * y + dx, xy * x + yy * y + dy)
 
 
 class _Layer:
-    def __init__(self, glyph: Any) -> None:
+    def __init__(
+        self,
+        glyph: Any,
+        resolver: Callable[[str], "_Layer | None"] | None = None,
+    ) -> None:
         self.paths = [_Path(contour) for contour in glyph]
         self.anchors = [_Anchor(anchor) for anchor in glyph.anchors]
         self.components = [
-            _Component(component) for component in glyph.components
+            _Component(component, resolver) for component in glyph.components
         ]
         self.width = float(glyph.width or 0.0)
+        self._polygons: dict[bool, list[list[tuple[float, float]]]] = {}
+
+    def polygons(
+        self,
+        components: bool = True,
+        _depth: int = 0,
+    ) -> list[list[tuple[float, float]]]:
+        """Return flattened closed contours, including resolved components."""
+
+        cached = self._polygons.get(bool(components))
+        if cached is not None:
+            return cached
+        polygons = [
+            polygon
+            for polygon in (
+                scanline_engine.flatten_path(path) for path in self.paths if path.closed
+            )
+            if polygon and len(polygon) >= 3
+        ]
+        if components and _depth < MAX_COMPONENT_DEPTH:
+            for component in self.components:
+                base = component.componentLayer
+                if base is None:
+                    continue
+                for polygon in base.polygons(True, _depth + 1):
+                    polygons.append(
+                        [
+                            _transform_point(component.transform, point)
+                            for point in polygon
+                        ]
+                    )
+        self._polygons[bool(components)] = polygons
+        return polygons
+
+    @property
+    def bounds(self) -> SimpleNamespace | None:
+        points = [point for polygon in self.polygons() for point in polygon]
+        if not points:
+            return None
+        xs = [point[0] for point in points]
+        ys = [point[1] for point in points]
+        return SimpleNamespace(
+            origin=SimpleNamespace(x=min(xs), y=min(ys)),
+            size=SimpleNamespace(
+                width=max(xs) - min(xs),
+                height=max(ys) - min(ys),
+            ),
+        )
+
+    @property
+    def LSB(self) -> float | None:
+        bounds = self.bounds
+        return None if bounds is None else bounds.origin.x
+
+    @property
+    def RSB(self) -> float | None:
+        bounds = self.bounds
+        if bounds is None:
+            return None
+        return self.width - (bounds.origin.x + bounds.size.width)
+
+    def intersectionsBetweenPoints(
+        self,
+        start: Any,
+        end: Any,
+        components: bool = True,
+    ) -> list[_Position]:
+        """Intersect a horizontal line with the outline, Glyphs-style.
+
+        Returns `[start, crossings..., end]` with crossings ordered from
+        `start` to `end`.  Edges are half-open in y, so a line through a
+        vertex counts it once.
+        """
+
+        x1, y = float(start[0]), float(start[1])
+        x2 = float(end[0])
+        if float(end[1]) != y:
+            raise ValueError("Only horizontal intersection lines are supported.")
+        lo, hi = min(x1, x2), max(x1, x2)
+        crossings = []
+        for polygon in self.polygons(components):
+            previous = polygon[-1]
+            for point in polygon:
+                (ax, ay), (bx, by) = previous, point
+                previous = point
+                if ay == by or not (min(ay, by) <= y < max(ay, by)):
+                    continue
+                x = ax + (y - ay) * (bx - ax) / (by - ay)
+                if lo <= x <= hi:
+                    crossings.append(x)
+        crossings.sort(reverse=x1 > x2)
+        return (
+            [_Position(x1, y)]
+            + [_Position(x, y) for x in crossings]
+            + [_Position(x2, y)]
+        )
 
 
 class _Glyph:
-    def __init__(self, glyph: Any, master_id: str) -> None:
+    def __init__(
+        self,
+        glyph: Any,
+        master_id: str,
+        resolver: Callable[[str], _Layer | None] | None = None,
+        kerning_groups: dict[str, str] | None = None,
+        export: bool = True,
+    ) -> None:
         self.name = str(glyph.name)
         self.unicodes = tuple(int(value) for value in glyph.unicodes)
-        self.layers = {master_id: _Layer(glyph)}
+        self.unicode = (
+            "{:04X}".format(self.unicodes[0]) if self.unicodes else None
+        )
+        self.export = bool(export)
+        groups = kerning_groups or {}
+        # Glyphs names a glyph's classes by the side they kern on:
+        # UFO kern1 (left of a pair) is its rightKerningGroup.
+        self.rightKerningGroup = groups.get("@MMK_L_")
+        self.leftKerningGroup = groups.get("@MMK_R_")
+        self.layers = {master_id: _Layer(glyph, resolver)}
 
 
 class _GlyphProxy:
@@ -124,12 +285,45 @@ class UFOFont:
             weight=weight,
         )
         self.masters = [master]
-        self.glyphs = _GlyphProxy(
-            {
-                str(glyph_name): _Glyph(source[glyph_name], master.id)
-                for glyph_name in source.keys()
-            }
-        )
+        group_keys: dict[str, str] = {}
+        kerning_groups: dict[str, dict[str, str]] = {}
+        for group_name, members in source.groups.items():
+            for prefix, class_prefix in GROUP_PREFIXES:
+                if not str(group_name).startswith(prefix):
+                    continue
+                class_name = str(group_name)[len(prefix):]
+                group_keys[str(group_name)] = class_prefix + class_name
+                for member in members:
+                    kerning_groups.setdefault(str(member), {}).setdefault(
+                        class_prefix,
+                        class_name,
+                    )
+        mapping: dict[str, _Glyph] = {}
+
+        def resolve_layer(glyph_name: str) -> _Layer | None:
+            glyph = mapping.get(str(glyph_name))
+            return glyph.layers.get(master.id) if glyph is not None else None
+
+        skip_export = {
+            str(name) for name in source.lib.get("public.skipExportGlyphs", [])
+        }
+        for glyph_name in source.keys():
+            mapping[str(glyph_name)] = _Glyph(
+                source[glyph_name],
+                master.id,
+                resolve_layer,
+                kerning_groups.get(str(glyph_name)),
+                export=str(glyph_name) not in skip_export,
+            )
+        self.glyphs = _GlyphProxy(mapping)
+        # Glyphs-shaped kerning, {master id: {left key: {right key: value}}},
+        # with UFO kerning groups renamed to @MMK_L_/@MMK_R_ class keys.
+        master_kerning: dict[str, dict[str, float]] = {}
+        for (left, right), value in source.kerning.items():
+            left_key = group_keys.get(str(left), str(left))
+            right_key = group_keys.get(str(right), str(right))
+            master_kerning.setdefault(left_key, {})[right_key] = float(value)
+        self.kerning = {master.id: master_kerning}
 
 
 def load_ufo(
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""Headless compensated tuning over a base/reference pair of UFO masters.
+
+Both UFOs are loaded through `benchmark_ufo_adapter`. Each glyph's layer pair
+is copied to the plain-data snapshot `compensated_tuning_engine` works on,
+incompatible pairs are rejected by their node-type signatures, and the rest
+are tuned across a process pool, so generating small caps or superiors for a
+full glyph set scales with core count.
+
+The stem ratio `b` is measured from both masters unless `--b` or both `--q-x`
+and `--q-y` are given. `--output-ufo` writes the tuned outlines into a copy
+of the base UFO, optionally under new names with `--suffix`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Sequence
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parent.parent
+
+
+RESOURCES = (
+    _repo_root()
+    / "src"
+    / "glyphs-mcp"
+    / "Glyphs MCP.glyphsPlugin"
+    / "Contents"
+    / "Resources"
+)
+if str(RESOURCES) not in sys.path:
+    sys.path.insert(0, str(RESOURCES))
+
+import benchmark_ufo_adapter as ufo_adapter  # noqa: E402
+import compensated_tuning_engine as engine  # noqa: E402
+import stem_metrics_helpers  # noqa: E402
+
+
+# Defaults mirror preview_compensated_tuning_candidate.
+DEFAULT_KEEP_STROKE = 0.9
+DEFAULT_EXTRAPOLATION = "clamp"
+DEFAULT_CHUNK_SIZE = 64
+
+
+def snapshot_layer(layer: Any) -> dict[str, Any]:
+    """Copy an adapter layer into the engine's plain-data snapshot."""
+
+    return {
+        "width": float(layer.width or 0.0),
+        "paths": [
+            {
+                "closed": bool(path.closed),
+                "nodes": [
+                    [node.position.x, node.position.y, node.type, node.smooth]
+                    for node in path.nodes
+                ],
+            }
+            for path in layer.paths
+        ],
+    }
+
+
+def measure_b(
+    base: ufo_adapter.UFOFont,
+    ref: ufo_adapter.UFOFont,
+    reference_glyphs: Sequence[str] | None = None,
+) -> dict[str, Any]:
+    """Return the vertical stem ratio ref/base measured from outlines."""
+
+    estimates = [
+        stem_metrics_helpers.estimate_master_stem(
+            font=font,
+            master=font.masters[0],
+            orientation="vertical",
+            reference_glyphs=reference_glyphs,
+        )
+        for font in (base, ref)
+    ]
+    stem_base, stem_ref = (estimate.get("value") for estimate in estimates)
+    if not stem_base or not stem_ref:
+        raise RuntimeError(
+            "Unable to measure stems; pass --b or --q-x/--q-y explicitly."
+        )
+    return {
+        "stemBase": stem_base,
+        "stemRef": stem_ref,
+        "b": float(stem_ref) / float(stem_base),
+        "usedGlyphs": estimates[0].get("usedGlyphs"),
+    }
+
+
+def build_jobs(
+    base: ufo_adapter.UFOFont,
+    ref: ufo_adapter.UFOFont,
+    glyph_names: Sequence[str] | None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Return (jobs, skipped records); skipped glyphs never reach the pool."""
+
+    base_id, ref_id = base.masters[0].id, ref.masters[0].id
+    names = list(glyph_names or [glyph.name for glyph in base.glyphs])
+    jobs = []
+    skipped = []
+    for name in names:
+        base_glyph, ref_glyph = base.glyphs[name], ref.glyphs[name]
+        if base_glyph is None or ref_glyph is None:
+            skipped.append({"glyphName": name, "reason": "glyph_missing"})
+            continue
+        base_layer = base_glyph.layers[base_id]
+        ref_layer = ref_glyph.layers[ref_id]
+        if base_layer.components or ref_layer.components:
+            skipped.append({"glyphName": name, "reason": "components"})
+            continue
+        base_snapshot = snapshot_layer(base_layer)
+        ref_snapshot = snapshot_layer(ref_layer)
+        if engine.outline_signature(base_snapshot) != engine.outline_signature(ref_snapshot):
+            _ok, details = engine.snapshot_compatibility(base_snapshot, ref_snapshot)
+            skipped.append({"glyphName": name, "reason": "incompatible", "details": details})
+            continue
+        jobs.append({"glyphName": name, "base": base_snapshot, "ref": ref_snapshot})
+    return jobs, skipped
+
+
+def write_ufo(
+    base_path: Path,
+    output_path: Path,
+    tuned: Sequence[dict[str, Any]],
+    suffix: str = "",
+) -> None:
+    from defcon import Font as DefconFont
+
+    font = DefconFont(str(base_path))
+    for result in tuned:
+        name = result["glyphName"] + suffix
+        glyph = font[name] if name in font else font.newGlyph(name)
+        glyph.clearContours()
+        pen = glyph.getPointPen()
+        for path in result["paths"]:
+            pen.beginPath()
+            for node in path["nodes"]:
+                segment_type = None if node["type"] == "offcurve" else node["type"]
+                pen.addPoint(
+                    (node["x"], node["y"]),
+                    segmentType=segment_type,
+                    smooth=bool(node["smooth"]),
+                )
+            pen.endPath()
+        glyph.width = result["width"]
+    font.save(str(output_path))
+
+
+def run(
+    base_path: Path,
+    ref_path: Path,
+    *,
+    glyph_names: Sequence[str] | None = None,
+    sx: float = 1.0,
+    sy: float = 1.0,
+    keep_stroke: float = DEFAULT_KEEP_STROKE,
+    q_x: float | None = None,
+    q_y: float | None = None,
+    b: float | None = None,
+    reference_glyphs: Sequence[str] | None = None,
+    italic_angle: float | None = None,
+    translate_x: float = 0.0,
+    translate_y: float = 0.0,
+    extrapolation: str = DEFAULT_EXTRAPOLATION,
+    round_units: bool = True,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict[str, Any]:
+    """Tune every compatible glyph and return the results in glyph order.
+
+    With `workers` of 1 the jobs run in this process; otherwise they are
+    spread across a `ProcessPoolExecutor` (default: one worker per core).
+    """
+
+    base = ufo_adapter.load_ufo(Path(base_path), master_id="base", master_name="Base")
+    ref = ufo_adapter.load_ufo(Path(ref_path), master_id="ref", master_name="Reference")
+    stem = None
+    if b is None and (q_x is None or q_y is None):
+        stem = measure_b(base, ref, reference_glyphs)
+        b = stem["b"]
+    if italic_angle is None:
+        italic_angle = base.masters[0].italicAngle
+    params, warnings = engine.resolve_tuning_params(
+        sx=float(sx),
+        sy=float(sy),
+        a=engine.keep_stroke_to_exponent_a(float(keep_stroke)),
+        q_x=q_x,
+        q_y=q_y,
+        b=b,
+        italic_angle=float(italic_angle),
+        translate_x=translate_x,
+        translate_y=translate_y,
+        extrapolation=extrapolation,
+        round_units=round_units,
+    )
+    jobs, skipped = build_jobs(base, ref, glyph_names)
+    for job in jobs:
+        job["params"] = params
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if int(workers) <= 1 or len(jobs) <= int(chunk_size):
+        tuned = list(engine.iter_tuned_jobs(jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=int(workers)) as executor:
+            tuned = list(
+                engine.iter_tuned_jobs(jobs, executor=executor, chunk_size=chunk_size)
+            )
+
+    return {
+        "params": dict(params, b=b, italicAngle=float(italic_angle)),
+        "stem": stem,
+        "warnings": warnings,
+        "workers": int(workers),
+        "tunedCount": len(tuned),
+        "skipped": skipped,
+        "glyphs": tuned,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("base", type=Path)
+    parser.add_argument("ref", type=Path)
+    parser.add_argument("--glyph-names", nargs="*")
+    parser.add_argument("--sx", type=float, default=1.0)
+    parser.add_argument("--sy", type=float, default=1.0)
+    parser.add_argument("--keep-stroke", type=float, default=DEFAULT_KEEP_STROKE)
+    parser.add_argument("--q-x", type=float)
+    parser.add_argument("--q-y", type=float)
+    parser.add_argument("--b", type=float, help="Stem ratio ref/base.")
+    parser.add_argument("--reference-glyphs", nargs="*")
+    parser.add_argument("--italic-angle", type=float)
+    parser.add_argument("--translate-x", type=float, default=0.0)
+    parser.add_argument("--translate-y", type=float, default=0.0)
+    parser.add_argument(
+        "--extrapolation",
+        choices=("clamp", "allow", "error"),
+        default=DEFAULT_EXTRAPOLATION,
+    )
+    parser.add_argument("--no-round", action="store_true")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--output-ufo", type=Path)
+    parser.add_argument("--suffix", default="")
+    args = parser.parse_args()
+    try:
+        result = run(
+            args.base,
+            args.ref,
+            glyph_names=args.glyph_names,
+            sx=args.sx,
+            sy=args.sy,
+            keep_stroke=args.keep_stroke,
+            q_x=args.q_x,
+            q_y=args.q_y,
+            b=args.b,
+            reference_glyphs=args.reference_glyphs,
+            italic_angle=args.italic_angle,
+            translate_x=args.translate_x,
+            translate_y=args.translate_y,
+            extrapolation=args.extrapolation,
+            round_units=not args.no_round,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+        )
+    except (RuntimeError, ValueError) as exc:
+        parser.error(str(exc))
+    if args.output_ufo:
+        write_ufo(args.base, args.output_ufo, result["glyphs"], args.suffix)
+    text = json.dumps(result, indent=2, sort_keys=True) + "\n"
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Headless font-wide curve quality scan over UFO masters.
+
+Every contour of every glyph is copied to the plain node dictionaries used by
+`outline_geometry_engine`, analyzed across a process pool, and reduced to the
+`--top-n` worst findings per category (spikes, G1/G2 discontinuities, cusps,
+self-intersections). This is the pre-release counterpart of
+`review_curve_quality(glyph_names="all")` for sources outside Glyphs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parent.parent
+
+
+RESOURCES = (
+    _repo_root()
+    / "src"
+    / "glyphs-mcp"
+    / "Glyphs MCP.glyphsPlugin"
+    / "Contents"
+    / "Resources"
+)
+if str(RESOURCES) not in sys.path:
+    sys.path.insert(0, str(RESOURCES))
+
+import benchmark_ufo_adapter as ufo_adapter  # noqa: E402
+import outline_geometry_engine as engine  # noqa: E402
+
+
+DEFAULT_CHUNK_SIZE = 32
+
+
+def iter_path_jobs(
+    font: ufo_adapter.UFOFont,
+    source: str,
+    glyph_names: Sequence[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield one scan job per contour of the font's single master."""
+
+    master_id = font.masters[0].id
+    glyphs = (
+        [font.glyphs[name] for name in glyph_names if font.glyphs[name] is not None]
+        if glyph_names
+        else list(font.glyphs)
+    )
+    for glyph in glyphs:
+        layer = glyph.layers[master_id]
+        for path_index, path in enumerate(layer.paths):
+            yield {
+                "nodes": [
+                    {
+                        "x": node.position.x,
+                        "y": node.position.y,
+                        "type": node.type,
+                        "smooth": node.smooth,
+                    }
+                    for node in path.nodes
+                ],
+                "closed": path.closed,
+                "upm": font.upm,
+                "target": {"source": source, "glyphName": glyph.name, "pathIndex": path_index},
+            }
+
+
+def run(
+    ufo_paths: Sequence[Path],
+    *,
+    glyph_names: Sequence[str] | None = None,
+    top_n: int = engine.DEFAULT_SCAN_TOP_N,
+    samples_per_curve: int = engine.DEFAULT_SAMPLES_PER_CURVE,
+    discontinuity_threshold: float = 0.25,
+    spike_ratio_threshold: float = 4.0,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict[str, Any]:
+    """Scan every UFO and return one ranked report across all of them.
+
+    With `workers` of 1 the paths are analyzed in this process; otherwise a
+    `ProcessPoolExecutor` is used (default: one worker per core).
+    """
+
+    jobs: list[dict[str, Any]] = []
+    for path in ufo_paths:
+        font = ufo_adapter.load_ufo(Path(path), master_id="m", master_name=Path(path).stem)
+        jobs.extend(iter_path_jobs(font, Path(path).name, glyph_names))
+    options = {
+        "top_n": top_n,
+        "samples_per_curve": samples_per_curve,
+        "discontinuity_threshold": discontinuity_threshold,
+        "spike_ratio_threshold": spike_ratio_threshold,
+        "chunk_size": chunk_size,
+    }
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if int(workers) <= 1 or len(jobs) <= int(chunk_size):
+        report = engine.scan_curve_quality(jobs, **options)
+    else:
+        with ProcessPoolExecutor(max_workers=int(workers)) as executor:
+            report = engine.scan_curve_quality(jobs, executor=executor, **options)
+    report["sources"] = [str(path) for path in ufo_paths]
+    report["workers"] = int(workers)
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("ufos", nargs="+", type=Path)
+    parser.add_argument("--glyph-names", nargs="*")
+    parser.add_argument("--top-n", type=int, default=engine.DEFAULT_SCAN_TOP_N)
+    parser.add_argument("--samples-per-curve", type=int, default=engine.DEFAULT_SAMPLES_PER_CURVE)
+    parser.add_argument("--discontinuity-threshold", type=float, default=0.25)
+    parser.add_argument("--spike-ratio-threshold", type=float, default=4.0)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+    report = run(
+        args.ufos,
+        glyph_names=args.glyph_names,
+        top_n=args.top_n,
+        samples_per_curve=args.samples_per_curve,
+        discontinuity_threshold=args.discontinuity_threshold,
+        spike_ratio_threshold=args.spike_ratio_threshold,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+    text = json.dumps(report, indent=2, sort_keys=True) + "\n"
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
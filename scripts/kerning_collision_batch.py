@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""Headless kerning collision audit over UFO masters.
+
+Each UFO is loaded through `benchmark_ufo_adapter`, which gives its layers a
+pure-Python `intersectionsBetweenPoints`, so `kerning_collision_engine` runs
+without Glyphs.  The pair list is built the way `review_kerning_bumper` builds
+it, split into chunks, and measured across a process pool.  Collision and
+safe-gap records have the same shape as `_kerning_bumper_analyze` records.
+
+The exit status is 1 with `--fail-on-collision` when any pair is below
+`--min-gap`, which makes the runner usable as a CI gate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parent.parent
+
+
+RESOURCES = (
+    _repo_root()
+    / "src"
+    / "glyphs-mcp"
+    / "Glyphs MCP.glyphsPlugin"
+    / "Contents"
+    / "Resources"
+)
+if str(RESOURCES) not in sys.path:
+    sys.path.insert(0, str(RESOURCES))
+
+import benchmark_ufo_adapter as ufo_adapter  # noqa: E402
+import kerning_collision_engine as engine  # noqa: E402
+import mcp_tool_helpers  # noqa: E402
+
+
+# Defaults mirror review_kerning_bumper.
+DEFAULT_RELEVANT_LIMIT = 2000
+DEFAULT_PAIR_LIMIT = 3000
+DEFAULT_MIN_GAP = 5.0
+DEFAULT_SCAN_MODE = "two_pass"
+DEFAULT_DENSE_STEP = 10.0
+DEFAULT_BANDS = 8
+DEFAULT_MAX_DELTA = 10**9
+DEFAULT_CHUNK_SIZE = 500
+
+# Per-process state for pool workers: each UFO is loaded once per process
+# and its edge profiles are reused across every chunk that process measures.
+_FONTS: dict[str, ufo_adapter.UFOFont] = {}
+_INDEXES: dict[str, engine.KerningIndex] = {}
+_PROFILE_CACHE = engine.GlyphEdgeProfileCache()
+
+
+def master_id_for(path: Path) -> str:
+    return Path(path).stem
+
+
+def _font(path: str) -> ufo_adapter.UFOFont:
+    font = _FONTS.get(path)
+    if font is None:
+        ufo_path = Path(path)
+        font = ufo_adapter.load_ufo(
+            ufo_path,
+            master_id=master_id_for(ufo_path),
+            master_name=master_id_for(ufo_path),
+        )
+        _FONTS[path] = font
+    return font
+
+
+def _kerning_index(path: str) -> engine.KerningIndex:
+    index = _INDEXES.get(path)
+    if index is None:
+        font = _font(path)
+        index = engine.KerningIndex.from_font(
+            font,
+            font.masters[0].id,
+            engine.build_glyph_maps(font.glyphs),
+        )
+        _INDEXES[path] = index
+    return index
+
+
+def load_pairs_file(path: Path) -> list[tuple[str, str]]:
+    """Read `[[left, right], ...]` glyph-name pairs from a JSON file."""
+
+    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(raw, list):
+        raise ValueError("Pairs file must hold a JSON list of [left, right] pairs.")
+    pairs = []
+    seen = set()
+    for item in raw:
+        if not isinstance(item, (list, tuple)) or len(item) != 2:
+            continue
+        pair = (str(item[0]), str(item[1]))
+        if not pair[0] or not pair[1] or pair in seen:
+            continue
+        seen.add(pair)
+        pairs.append(pair)
+    return pairs
+
+
+def build_pairs(
+    font: ufo_adapter.UFOFont,
+    *,
+    dataset_pairs: Sequence[tuple[str, str]],
+    relevant_limit: int = DEFAULT_RELEVANT_LIMIT,
+    include_existing: bool = True,
+    pair_limit: int = DEFAULT_PAIR_LIMIT,
+    glyph_names: Sequence[str] | None = None,
+    all_pairs: bool = False,
+    explicit_pairs: Sequence[tuple[str, str]] | None = None,
+) -> tuple[list[tuple[str, str]], dict[str, int], list[str]]:
+    """Return (pairs, counts, warnings) selected like `_kerning_bumper_analyze`."""
+
+    warnings: list[str] = []
+    master_id = font.masters[0].id
+    glyph_maps = engine.build_glyph_maps(font.glyphs)
+    name_set = glyph_maps["nameSet"]
+    focus = set(glyph_names or []) or None
+    counts = {"pairsCandidate": 0, "pairsSkippedNoGlyph": 0}
+
+    if explicit_pairs is not None:
+        pairs = list(explicit_pairs)
+    elif all_pairs:
+        if focus:
+            space = [name for name in (glyph_names or []) if name in name_set]
+        else:
+            space = [
+                glyph.name
+                for glyph in font.glyphs
+                if glyph.name in glyph_maps["glyphnameToUnicode"]
+                and getattr(glyph, "export", True)
+            ]
+        pairs, space_counts = engine.build_all_glyph_pairs(
+            glyph_names=space,
+            pair_limit=pair_limit,
+        )
+        if space_counts["pairsAllPairsSpace"] > len(pairs):
+            warnings.append(
+                "all_pairs space has {} pairs; measured the first {} (raise pair_limit to cover more).".format(
+                    space_counts["pairsAllPairsSpace"], len(pairs)
+                )
+            )
+    else:
+        pairs, candidate_counts = engine.build_candidate_pairs(
+            dataset_pairs=dataset_pairs,
+            unicode_to_glyphname=glyph_maps["unicodeToGlyphname"],
+            relevant_limit=relevant_limit,
+            include_existing=include_existing,
+            kerning_master=font.kerning.get(master_id, {}),
+            name_set=name_set,
+            id_to_name=glyph_maps["idToName"],
+            left_key_group_rep=glyph_maps["leftKeyGroupRep"],
+            right_key_group_rep=glyph_maps["rightKeyGroupRep"],
+            focus=focus,
+            pair_limit=pair_limit,
+        )
+        counts["pairsSkippedNoGlyph"] += int(
+            candidate_counts.get("pairsSkippedNoGlyph") or 0
+        )
+    counts["pairsCandidate"] = len(pairs)
+    return pairs, counts, warnings
+
+
+def chunked(
+    items: Sequence[Any],
+    size: int,
+) -> Iterable[Sequence[Any]]:
+    size = max(int(size or 0), 1)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def measure_chunk(task: dict[str, Any]) -> dict[str, Any]:
+    """Measure one chunk of pairs for one UFO; runs inside a pool worker."""
+
+    path = task["ufo"]
+    font = _font(path)
+    master_id = font.masters[0].id
+    kerning_index = _kerning_index(path)
+    step = float(task["denseStep"])
+    target_gap = float(task["targetGap"])
+    counts = {
+        "pairsMeasured": 0,
+        "pairsSkippedNoGlyph": 0,
+        "pairsSkippedNoOverlap": 0,
+        "pairsSkippedNoBounds": 0,
+    }
+
+    profiles: dict[str, engine.GlyphEdgeProfile | None] = {}
+    side_profiles: list[engine.GlyphEdgeProfile] = []
+    side_index: dict[str, int] = {}
+
+    def _index(glyph_name: str) -> int:
+        if glyph_name not in side_index:
+            side_index[glyph_name] = len(side_profiles)
+            side_profiles.append(profiles[glyph_name])
+        return side_index[glyph_name]
+
+    jobs = []
+    job_indexes = []
+    job_kerning = []
+    for left_name, right_name in task["pairs"]:
+        left_glyph = font.glyphs[left_name]
+        right_glyph = font.glyphs[right_name]
+        if not left_glyph or not right_glyph:
+            counts["pairsSkippedNoGlyph"] += 1
+            continue
+        for name, glyph in ((left_name, left_glyph), (right_name, right_glyph)):
+            if name not in profiles:
+                profiles[name] = _PROFILE_CACHE.profile(
+                    glyph.layers[master_id],
+                    glyph_name=name,
+                    master_id=master_id,
+                    step=step,
+                    include_components=True,
+                    font_key=path,
+                )
+        left_profile = profiles[left_name]
+        right_profile = profiles[right_name]
+        if left_profile is None or right_profile is None:
+            counts["pairsSkippedNoBounds"] += 1
+            continue
+        if not engine.overlap_y_range(left_profile.bounds, right_profile.bounds):
+            counts["pairsSkippedNoOverlap"] += 1
+            continue
+        kerning_value, source = kerning_index.resolve(left_name, right_name)
+        jobs.append((left_name, right_name, float(kerning_value), source))
+        job_indexes.append((_index(left_name), _index(right_name)))
+        job_kerning.append(float(kerning_value))
+
+    measurements = engine.measure_profile_pairs(
+        left_profiles=side_profiles,
+        right_profiles=side_profiles,
+        pairs=job_indexes,
+        kerning_values=job_kerning,
+        scan_mode=task["scanMode"],
+        scan_heights=task["scanHeights"],
+        bands=int(task["bands"]),
+        target_gap=target_gap,
+    )
+
+    collisions = []
+    safe_gaps = []
+    for (left_name, right_name, kerning_value, source), measured in zip(
+        jobs, measurements
+    ):
+        if measured is None:
+            counts["pairsSkippedNoBounds"] += 1
+            continue
+        counts["pairsMeasured"] += 1
+        record = engine.pair_gap_record(
+            left_name=left_name,
+            right_name=right_name,
+            kerning_value=kerning_value,
+            source=source,
+            measured=measured,
+            target_gap=target_gap,
+            max_delta=int(task["maxDelta"]),
+        )
+        # Every batch measurement is fresh.
+        record["reused"] = False
+        if float(measured.min_gap) < target_gap:
+            collisions.append(record)
+        else:
+            safe = {key: record[key] for key in engine.SAFE_GAP_KEYS}
+            safe["reused"] = False
+            safe_gaps.append(safe)
+    return {
+        "ufo": path,
+        "counts": counts,
+        "collisions": collisions,
+        "safeGaps": safe_gaps,
+    }
+
+
+def run(
+    ufo_paths: Sequence[Path],
+    *,
+    pairs_file: Path | None = None,
+    all_pairs: bool = False,
+    glyph_names: Sequence[str] | None = None,
+    relevant_limit: int = DEFAULT_RELEVANT_LIMIT,
+    include_existing: bool = True,
+    pair_limit: int = DEFAULT_PAIR_LIMIT,
+    min_gap: float = DEFAULT_MIN_GAP,
+    scan_mode: str = DEFAULT_SCAN_MODE,
+    scan_heights: Sequence[float] | None = None,
+    dense_step: float = DEFAULT_DENSE_STEP,
+    bands: int = DEFAULT_BANDS,
+    max_delta: int = DEFAULT_MAX_DELTA,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict[str, Any]:
+    """Audit every UFO and return one result per master.
+
+    With `workers` of 1 the chunks run in this process; otherwise they are
+    spread across a `ProcessPoolExecutor` (default: one worker per core).
+    """
+
+    if dense_step <= 0:
+        raise ValueError("dense_step must be > 0.")
+    if bands <= 0:
+        raise ValueError("bands must be > 0.")
+    scan_mode_norm, params_warnings = engine.normalize_scan_mode(scan_mode)
+    scan_heights_norm, heights_warnings = engine.normalize_scan_heights(scan_heights)
+    params_warnings.extend(heights_warnings)
+    explicit_pairs = load_pairs_file(pairs_file) if pairs_file else None
+
+    dataset_meta: dict[str, Any] = {}
+    dataset_pairs: Sequence[tuple[str, str]] = []
+    if explicit_pairs is None and not all_pairs:
+        dataset_meta, dataset_pairs, dataset_warnings = (
+            mcp_tool_helpers._load_andre_fuchs_relevant_pairs()
+        )
+        params_warnings.extend(dataset_warnings)
+
+    params = {
+        "scanMode": scan_mode_norm,
+        "scanHeights": scan_heights_norm,
+        "denseStep": float(dense_step),
+        "bands": int(bands),
+        "minGap": float(min_gap),
+        "targetGap": float(min_gap),
+        "maxDelta": int(max_delta),
+    }
+
+    results = []
+    tasks = []
+    for ufo_path in ufo_paths:
+        path = str(Path(ufo_path).resolve())
+        font = _font(path)
+        pairs, counts, warnings = build_pairs(
+            font,
+            dataset_pairs=dataset_pairs,
+            relevant_limit=relevant_limit,
+            include_existing=include_existing,
+            pair_limit=pair_limit,
+            glyph_names=glyph_names,
+            all_pairs=all_pairs,
+            explicit_pairs=explicit_pairs,
+        )
+        results.append(
+            {
+                "ufo": path,
+                "masterId": font.masters[0].id,
+                "usedTopN": min(max(int(relevant_limit), 0), len(dataset_pairs)),
+                "counts": dict(
+                    counts,
+                    pairsMeasured=0,
+                    pairsSkippedNoOverlap=0,
+                    pairsSkippedNoBounds=0,
+                ),
+                "collisions": [],
+                "safeGaps": [],
+                "warnings": list(params_warnings) + warnings,
+            }
+        )
+        for chunk in chunked(pairs, chunk_size):
+            tasks.append(dict(params, ufo=path, pairs=list(chunk)))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if int(workers) <= 1 or len(tasks) <= 1:
+        chunk_results = [measure_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=int(workers)) as executor:
+            chunk_results = list(executor.map(measure_chunk, tasks))
+
+    by_path = {result["ufo"]: result for result in results}
+    for chunk_result in chunk_results:
+        result = by_path[chunk_result["ufo"]]
+        for key, value in chunk_result["counts"].items():
+            result["counts"][key] += value
+        result["collisions"].extend(chunk_result["collisions"])
+        result["safeGaps"].extend(chunk_result["safeGaps"])
+    for result in results:
+        result["collisions"].sort(key=lambda record: float(record["minGap"]))
+        result["safeGaps"].sort(
+            key=lambda record: float(record["minGap"]),
+            reverse=True,
+        )
+
+    return {
+        "params": params,
+        "dataset": dataset_meta,
+        "workers": int(workers),
+        "masters": results,
+        "collisionCount": sum(len(result["collisions"]) for result in results),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("ufos", type=Path, nargs="+")
+    parser.add_argument(
+        "--pairs-file",
+        type=Path,
+        help="JSON list of [left, right] glyph names to measure instead.",
+    )
+    parser.add_argument("--all-pairs", action="store_true")
+    parser.add_argument("--glyph-names", nargs="*")
+    parser.add_argument(
+        "--relevant-limit",
+        type=int,
+        default=DEFAULT_RELEVANT_LIMIT,
+    )
+    parser.add_argument("--no-include-existing", action="store_true")
+    parser.add_argument("--pair-limit", type=int, default=DEFAULT_PAIR_LIMIT)
+    parser.add_argument("--min-gap", type=float, default=DEFAULT_MIN_GAP)
+    parser.add_argument("--scan-mode", default=DEFAULT_SCAN_MODE)
+    parser.add_argument("--scan-heights", type=float, nargs="*")
+    parser.add_argument("--dense-step", type=float, default=DEFAULT_DENSE_STEP)
+    parser.add_argument("--bands", type=int, default=DEFAULT_BANDS)
+    parser.add_argument("--max-delta", type=int, default=DEFAULT_MAX_DELTA)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--fail-on-collision", action="store_true")
+    args = parser.parse_args()
+    try:
+        result = run(
+            args.ufos,
+            pairs_file=args.pairs_file,
+            all_pairs=args.all_pairs,
+            glyph_names=args.glyph_names,
+            relevant_limit=args.relevant_limit,
+            include_existing=not args.no_include_existing,
+            pair_limit=args.pair_limit,
+            min_gap=args.min_gap,
+            scan_mode=args.scan_mode,
+            scan_heights=args.scan_heights,
+            dense_step=args.dense_step,
+            bands=args.bands,
+            max_delta=args.max_delta,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+        )
+    except (RuntimeError, ValueError) as exc:
+        parser.error(str(exc))
+    text = json.dumps(result, indent=2, sort_keys=True) + "\n"
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+    if args.fail_on_collision and result["collisionCount"]:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -14,7 +14,13 @@ real layer/path/node data extracted from GS* objects.
 from __future__ import annotations
 
 import math
-from typing import Iterable, List, Optional, Sequence, Tuple
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:  # Optional accelerator for transform_points; pure Python is the fallback.
+    import numpy as np  # type: ignore[import-not-found]
+except Exception:  # pragma: no cover - depends on the selected Python runtime
+    np = None
 
 
 def clamp(value: float, lo: float, hi: float) -> float:
@@ -81,6 +87,92 @@ def italic_shear(italic_angle_degrees: float) -> float:
     return math.tan(math.radians(float(italic_angle_degrees)))
 
 
+class ExtrapolationError(ValueError):
+    """A compensation factor fell outside [0, 1] with extrapolation="error"."""
+
+    def __init__(self, axis: str, value: float) -> None:
+        super().__init__("q{} out of range and extrapolation=error".format(axis))
+        self.axis = axis
+        self.value = value
+
+
+def normalize_extrapolation(mode: Optional[str]) -> str:
+    """Return "clamp", "allow" or "error"; unknown modes clamp."""
+    value = str(mode or "clamp").strip().lower()
+    return value if value in ("clamp", "allow", "error") else "clamp"
+
+
+def resolve_tuning_params(
+    *,
+    sx: float,
+    sy: float,
+    a: float,
+    b: Optional[float] = None,
+    q_x: Optional[float] = None,
+    q_y: Optional[float] = None,
+    same_master: bool = False,
+    extrapolation: str = "clamp",
+    italic_angle: float = 0.0,
+    translate_x: float = 0.0,
+    translate_y: float = 0.0,
+    round_units: bool = True,
+) -> Tuple[Dict[str, Any], List[str]]:
+    """Resolve the `tune_job` params shared by every glyph of a tuning run.
+
+    Missing q factors come from `compute_q` with the stem ratio `b` (or are
+    1.0, geometric scaling, when base and reference are the same master).
+    `extrapolation` goes through `normalize_extrapolation`.
+
+    Returns (params, warnings). Raises ValueError for a non-positive scale,
+    a missing `b`, or a q outside 0..1 with extrapolation="error".
+    """
+    sx_f = float(sx)
+    sy_f = float(sy)
+    if sx_f <= 0.0 or sy_f <= 0.0:
+        raise ValueError("sx and sy must be > 0")
+    af = clamp(float(a), 0.0, 1.0)
+    warnings: List[str] = []
+
+    def _q(value: Optional[float], scale: float, axis: str) -> float:
+        if value is not None:
+            return float(value)
+        if same_master:
+            warnings.append("base_and_ref_same_using_geometric_q{}".format(axis))
+            return 1.0
+        if b is None:
+            raise ValueError("stem ratio b is required when q_{} is not given".format(axis))
+        return compute_q(scale=scale, b=float(b), a=af)
+
+    qx = _q(q_x, sx_f, "x")
+    qy = _q(q_y, sy_f, "y")
+
+    mode = normalize_extrapolation(extrapolation)
+    if mode == "clamp":
+        qx0, qy0 = qx, qy
+        qx = clamp_q(qx)
+        qy = clamp_q(qy)
+        if abs(qx0 - qx) > 1e-9:
+            warnings.append("clamped_qx")
+        if abs(qy0 - qy) > 1e-9:
+            warnings.append("clamped_qy")
+    elif mode == "error":
+        for axis, q in (("x", qx), ("y", qy)):
+            if not (0.0 <= q <= 1.0):
+                raise ExtrapolationError(axis, q)
+
+    params = {
+        "sx": sx_f,
+        "sy": sy_f,
+        "qx": qx,
+        "qy": qy,
+        "shear": italic_shear(float(italic_angle)),
+        "tx": float(translate_x),
+        "ty": float(translate_y),
+        "round_units": bool(round_units),
+    }
+    return params, warnings
+
+
 def transform_point(
     *,
     xr: float,
@@ -112,23 +204,205 @@ def interpolate_metric(*, mr: float, mb: float, s: float, q: float) -> float:
     return float(s) * (float(q) * float(mr) + (1.0 - float(q)) * float(mb))
 
 
+def numpy_available() -> bool:
+    return np is not None
+
+
+def transform_points(
+    base_xy: Sequence[Sequence[float]],
+    ref_xy: Sequence[Sequence[float]],
+    *,
+    sx: float,
+    sy: float,
+    qx: float,
+    qy: float,
+    shear: float = 0.0,
+    tx: float = 0.0,
+    ty: float = 0.0,
+    round_units: bool = True,
+    use_numpy: Optional[bool] = None,
+) -> List[Tuple[float | int, float | int]]:
+    """Transform packed `(x, y)` pairs from both masters in one step.
+
+    The NumPy kernel evaluates `transform_point` with the same float64 operation
+    order and rounds like `round_half_away_from_zero`, so both paths return
+    identical values.
+    """
+    if len(base_xy) != len(ref_xy):
+        raise ValueError("base_xy and ref_xy must have the same length")
+    if use_numpy is None:
+        use_numpy = np is not None
+    if not use_numpy or np is None or not len(base_xy):
+        points = []
+        for (xr, yr), (xb, yb) in zip(base_xy, ref_xy):
+            x, y = transform_point(xr=xr, yr=yr, xb=xb, yb=yb, sx=sx, sy=sy, qx=qx, qy=qy, shear=shear, tx=tx, ty=ty)
+            points.append((units(x, round_units=round_units), units(y, round_units=round_units)))
+        return points
+
+    base = np.asarray(base_xy, dtype=np.float64).reshape(-1, 2)
+    ref = np.asarray(ref_xy, dtype=np.float64).reshape(-1, 2)
+    xr, yr = base[:, 0], base[:, 1]
+    xb, yb = ref[:, 0], ref[:, 1]
+    sx, sy, qx, qy = float(sx), float(sy), float(qx), float(qy)
+    shear = float(shear)
+    y = sy * (qy * yr + (1.0 - qy) * yb)
+    ur = xr - yr * shear
+    ub = xb - yb * shear
+    x = sx * (qx * ur + (1.0 - qx) * ub) + y * shear
+    x = x + float(tx)
+    y = y + float(ty)
+    if not round_units:
+        return list(zip(x.tolist(), y.tolist()))
+    return list(zip(_round_half_away_from_zero_array(x), _round_half_away_from_zero_array(y)))
+
+
+def _round_half_away_from_zero_array(values: Any) -> List[int]:
+    if not np.all(np.isfinite(values)):
+        # Let the scalar path raise the same error for NaN/inf.
+        return [round_half_away_from_zero(value) for value in values.tolist()]
+    rounded = np.where(values >= 0.0, np.floor(values + 0.5), -np.floor(np.abs(values) + 0.5))
+    return [int(value) for value in rounded.tolist()]
+
+
+# Layer snapshots are plain data so tuning jobs can cross process boundaries:
+#   {"width": float, "paths": [{"closed": bool, "nodes": [[x, y, type, smooth], ...]}]}
+
+
+def outline_signature(snapshot: Dict[str, Any]) -> Tuple[Tuple[Any, ...], ...]:
+    """Return the node types of every path; equal signatures are tunable pairs."""
+    return tuple(tuple(node[2] for node in path["nodes"]) for path in snapshot.get("paths") or [])
+
+
+def snapshot_compatibility(
+    base: Dict[str, Any],
+    ref: Dict[str, Any],
+) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """Check two layer snapshots for matching path count, node counts, and node types."""
+    paths_r = base.get("paths") or []
+    paths_b = ref.get("paths") or []
+    if len(paths_r) != len(paths_b):
+        return False, {"reason": "path_count_mismatch", "pathsBase": len(paths_r), "pathsRef": len(paths_b)}
+    for p_i, (pr, pb) in enumerate(zip(paths_r, paths_b)):
+        nodes_r = pr["nodes"]
+        nodes_b = pb["nodes"]
+        if len(nodes_r) != len(nodes_b):
+            return False, {"reason": "node_count_mismatch", "pathIndex": p_i, "nodesBase": len(nodes_r), "nodesRef": len(nodes_b)}
+        for n_i, (nr, nb) in enumerate(zip(nodes_r, nodes_b)):
+            if nr[2] != nb[2]:
+                return False, {"reason": "node_type_mismatch", "pathIndex": p_i, "nodeIndex": n_i, "typeBase": nr[2], "typeRef": nb[2]}
+    return True, None
+
+
+def tune_snapshot(
+    base: Dict[str, Any],
+    ref: Dict[str, Any],
+    *,
+    sx: float,
+    sy: float,
+    qx: float,
+    qy: float,
+    shear: float = 0.0,
+    tx: float = 0.0,
+    ty: float = 0.0,
+    round_units: bool = True,
+    use_numpy: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """Tune a compatible snapshot pair into `set_glyph_paths`-style paths and width."""
+    path_pairs = list(zip(base.get("paths") or [], ref.get("paths") or []))
+    # Every node of the glyph goes through one transform_points call.
+    points = iter(
+        transform_points(
+            [(nr[0], nr[1]) for pr, pb in path_pairs for nr in pr["nodes"][: len(pb["nodes"])]],
+            [(nb[0], nb[1]) for pr, pb in path_pairs for nb in pb["nodes"][: len(pr["nodes"])]],
+            sx=sx,
+            sy=sy,
+            qx=qx,
+            qy=qy,
+            shear=shear,
+            tx=tx,
+            ty=ty,
+            round_units=round_units,
+            use_numpy=use_numpy,
+        )
+    )
+    paths_out = []
+    for pr, pb in path_pairs:
+        nodes_out = []
+        for nr, _nb in zip(pr["nodes"], pb["nodes"]):
+            x, y = next(points)
+            nodes_out.append(
+                {
+                    "x": x,
+                    "y": y,
+                    "type": "line" if nr[2] is None else nr[2],
+                    "smooth": bool(nr[3]),
+                }
+            )
+        paths_out.append({"nodes": nodes_out, "closed": bool(pr.get("closed", True))})
+    width = interpolate_metric(mr=base.get("width") or 0.0, mb=ref.get("width") or 0.0, s=sx, q=qx)
+    return {"paths": paths_out, "width": units(width, round_units=round_units)}
+
+
+def tune_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Tune one `{"glyphName", "base", "ref", "params"}` job; safe to run in a worker process."""
+    ok, details = snapshot_compatibility(job["base"], job["ref"])
+    if not ok:
+        return {"glyphName": job.get("glyphName"), "ok": False, "error": "Incompatible outlines between masters", "details": details}
+    tuned = tune_snapshot(job["base"], job["ref"], **job["params"])
+    tuned["glyphName"] = job.get("glyphName")
+    tuned["ok"] = True
+    return tuned
+
+
+def _tune_chunk(jobs: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [tune_job(job) for job in jobs]
+
+
+def iter_tuned_jobs(
+    jobs: Iterable[Dict[str, Any]],
+    *,
+    executor: Any = None,
+    chunk_size: int = 64,
+) -> Iterator[Dict[str, Any]]:
+    """Yield `tune_job` results in job order.
+
+    Without an `executor` the jobs run in this process. With one (for example a
+    `concurrent.futures.ProcessPoolExecutor`), chunks of `chunk_size` jobs are
+    mapped across its workers and results stream back as chunks complete.
+    """
+    if executor is None:
+        for job in jobs:
+            yield tune_job(job)
+        return
+    size = max(int(chunk_size or 0), 1)
+    iterator = iter(jobs)
+    chunks = iter(lambda: list(islice(iterator, size)), [])
+    for chunk_results in executor.map(_tune_chunk, chunks):
+        for result in chunk_results:
+            yield result
+
+
 def black_runs_from_intersections(xs: Sequence[float]) -> List[float]:
     """Return black-run widths given sorted intersection x-values (excluding start/end points).
 
     Assumes the scan starts outside the outline on the left, so black regions are
     between (xs[0], xs[1]), (xs[2], xs[3]) ...
     """
+    # Pair entry/exit crossings by stride; an odd tail has no exit and is ignored.
+    limit = len(xs) - (len(xs) % 2)
     out: List[float] = []
-    n = len(xs)
-    # Ignore odd tail.
-    limit = n - (n % 2)
-    for i in range(0, limit, 2):
-        w = float(xs[i + 1]) - float(xs[i])
+    for start, end in zip(xs[0:limit:2], xs[1:limit:2]):
+        w = float(end) - float(start)
         if w > 0:
             out.append(w)
     return out
 
 
+def black_runs_for_scanlines(scanlines_xs: Iterable[Sequence[float]]) -> List[List[float]]:
+    """Return the black runs of every scanline, in scanline order."""
+    return [black_runs_from_intersections(xs) for xs in scanlines_xs]
+
+
 def _median(values: Sequence[float]) -> Optional[float]:
     if not values:
         return None
@@ -140,6 +414,25 @@ def _median(values: Sequence[float]) -> Optional[float]:
     return 0.5 * (items[mid - 1] + items[mid])
 
 
+def stem_thickness_from_runs(
+    *,
+    runs_per_scanline: Iterable[Sequence[float]],
+    min_width: float = 5.0,
+    max_width: Optional[float] = None,
+) -> Optional[float]:
+    """Median of per-scanline median run widths, ignoring runs outside the width limits."""
+    per_line: List[float] = []
+    min_w = float(min_width)
+    max_w = float(max_width) if max_width is not None else None
+    for runs in runs_per_scanline:
+        kept = [w for w in runs if w >= min_w and (max_w is None or w <= max_w)]
+        med = _median(kept)
+        if med is None:
+            continue
+        per_line.append(float(med))
+    return _median(per_line)
+
+
 def stem_thickness_from_scanlines(
     *,
     scanlines_xs: Sequence[Sequence[float]],
@@ -151,16 +444,11 @@ def stem_thickness_from_scanlines(
     For each scanline, compute black runs and take the median run width.
     Across scanlines, take the median of those per-scanline medians.
     """
-    per_line: List[float] = []
-    max_w = float(max_width) if max_width is not None else None
-    for xs in scanlines_xs:
-        runs = black_runs_from_intersections(xs)
-        runs = [w for w in runs if w >= float(min_width) and (max_w is None or w <= max_w)]
-        med = _median(runs)
-        if med is None:
-            continue
-        per_line.append(float(med))
-    return _median(per_line)
+    return stem_thickness_from_runs(
+        runs_per_scanline=black_runs_for_scanlines(scanlines_xs),
+        min_width=min_width,
+        max_width=max_width,
+    )
 
 
 def iqr_ratio(values: Sequence[float]) -> Optional[float]:
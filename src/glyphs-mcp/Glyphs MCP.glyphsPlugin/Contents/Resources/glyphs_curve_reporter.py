@@ -13,6 +13,7 @@ from GlyphsApp import Glyphs  # type: ignore[import-not-found]
 from GlyphsApp.plugins import ReporterPlugin  # type: ignore[import-not-found]
 
 import curve_overlay_model
+import outline_geometry_engine
 from mcp_tool_helpers import (
     _get_layer_id,
     _layer_components,
@@ -380,6 +381,7 @@ class GlyphsMCPCurvatureReporter(ReporterPlugin):
             "overlays": list(overlay_features()),
             "lastDraw": dict(self._last_draw) if self._last_draw else None,
             "lastError": dict(self._last_error) if self._last_error else None,
+            "segmentCache": outline_geometry_engine.segment_analysis_cache().stats(),
         }
 
     @objc.python_method
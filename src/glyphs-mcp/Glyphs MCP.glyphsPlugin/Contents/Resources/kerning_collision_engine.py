@@ -13,38 +13,35 @@ Core ideas:
     optional dense refinement pass when near the target threshold.
   - Provide deterministic "bumper" recommendations: the minimal kerning
     loosening required to satisfy a minimum gap constraint.
+  - Cache per-glyph edge profiles on a baseline-aligned scanline grid so a
+    pair measurement is a lookup plus a subtraction instead of two fresh
+    intersection calls per scan height.
+  - Read edges from a `scanline_engine` edge table (one sweep per layer) and
+    fall back to `layer.intersectionsBetweenPoints` only when the layer's
+    geometry cannot be read as plain nodes.
 """
 
 from __future__ import annotations
 
+import hashlib
+import heapq
 import math
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+import scanline_engine
+from scanline_engine import _coerce_float, _layer_shapes, _node_xy, _safe_attr
 
-DEFAULT_SCAN_HEIGHTS: Tuple[float, ...] = (0.05, 0.15, 0.35, 0.65, 0.75)
-
-
-def _safe_attr(obj: Any, name: str, default: Any = None) -> Any:
-    try:
-        value = getattr(obj, name)
-        return value() if callable(value) else value
-    except Exception:
-        return default
+try:  # Optional accelerator; every batch path has a pure-Python fallback.
+    import numpy as np  # type: ignore[import-not-found]
+except Exception:  # pragma: no cover - depends on the selected Python runtime
+    np = None
 
 
-def _coerce_float(value: Any) -> Optional[float]:
-    if value is None:
-        return None
-    try:
-        if callable(value):
-            value = value()
-    except Exception:
-        return None
-    try:
-        return float(value)
-    except Exception:
-        return None
+DEFAULT_SCAN_HEIGHTS: Tuple[float, ...] = (0.05, 0.15, 0.35, 0.65, 0.75)
 
 
 def _round_half_away_from_zero(x: float) -> int:
@@ -196,6 +193,31 @@ def _measure_edges_at_y(
     return (left, right)
 
 
+def _layer_edge_reader(
+    layer: Any,
+    include_components: bool,
+    start_x: float,
+    end_x: float,
+    tables: Optional[Dict[Tuple[int, bool], Any]] = None,
+) -> Callable[[Sequence[float]], List[Tuple[Optional[float], Optional[float]]]]:
+    """Return a batch reader of (left_edge_x, right_edge_x) per scanline y.
+
+    `tables` memoizes each layer's edge table (or None for the
+    `intersectionsBetweenPoints` fallback) by layer identity.
+    """
+
+    key = (id(layer), bool(include_components))
+    if tables is not None and key in tables:
+        table = tables[key]
+    else:
+        table = scanline_engine.EdgeTable.from_layer(layer, include_components=include_components)
+        if tables is not None:
+            tables[key] = table
+    if table is None:
+        return lambda ys: [_measure_edges_at_y(layer, y, include_components, start_x, end_x) for y in ys]
+    return lambda ys: [scanline_engine.outer_edges(xs) for xs in table.sweep(ys)]
+
+
 def _scanline_setup(bounds: Tuple[float, float, float, float]) -> Tuple[float, float]:
     min_x, max_x, _, _ = bounds
     return (float(min_x) - 1.0, float(max_x) + 1.0)
@@ -312,6 +334,315 @@ def resolve_explicit_kerning_value(
     return 0.0, KerningSource(left_key=None, right_key=None)
 
 
+class KerningIndex(object):
+    """Compiled explicit-kerning lookup for one master.
+
+    Built once from the master's kerning dict and the glyph maps returned by
+    `build_glyph_maps`. Each glyph's candidate keys (glyph id, glyph name and
+    class key) are resolved up front, so a pair lookup is a fixed number of
+    dict probes with the same precedence as `resolve_explicit_kerning_value`.
+    """
+
+    def __init__(self, kerning_master: Any, glyph_maps: Optional[Dict[str, Any]] = None) -> None:
+        self.kerning = _string_keys_kerning(kerning_master)
+        maps = glyph_maps or {}
+        self._name_to_id: Dict[str, str] = dict(maps.get("nameToId") or {})
+        self._left_class_key: Dict[str, str] = dict(maps.get("leftClassKeyByName") or {})
+        self._right_class_key: Dict[str, str] = dict(maps.get("rightClassKeyByName") or {})
+        self._name_set: set[str] = set(maps.get("nameSet") or ())
+        self._id_to_name: Dict[str, str] = dict(maps.get("idToName") or {})
+        self._class_members: Optional[Dict[str, Tuple[str, ...]]] = None
+
+        # Every explicit key pair (coverage) and the numeric subset (values).
+        # The per-side key sets let `covers` reject a pair without probing
+        # pair keys when neither side has any explicit kerning.
+        self._keys: set[Tuple[str, str]] = set()
+        self._left_keys: set[str] = set()
+        self._right_keys: set[str] = set()
+        self._values: Dict[Tuple[str, str], float] = {}
+        for lk, right_dict in self.kerning.items():
+            if right_dict:
+                self._left_keys.add(lk)
+            for rk, v in right_dict.items():
+                self._keys.add((lk, rk))
+                self._right_keys.add(rk)
+                vf = _coerce_float(v)
+                if vf is not None:
+                    self._values[(lk, rk)] = float(vf)
+
+        self._glyph_keys: Dict[str, Tuple[str, ...]] = {}
+
+    @classmethod
+    def from_font(
+        cls,
+        font: Any,
+        master_id: str,
+        glyph_maps: Optional[Dict[str, Any]] = None,
+    ) -> "KerningIndex":
+        """Build the index for `font.kerning[master_id]`."""
+
+        if glyph_maps is None:
+            glyph_maps = build_glyph_maps(_safe_attr(font, "glyphs", []) or [])
+        try:
+            kerning_master = font.kerning.get(master_id, {}) or {}
+        except Exception:
+            kerning_master = {}
+        return cls(kerning_master, glyph_maps)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _keys_for_glyph(self, glyph_name: str) -> Tuple[str, ...]:
+        keys = self._glyph_keys.get(glyph_name)
+        if keys is None:
+            gid = self._name_to_id.get(glyph_name)
+            keys = tuple(k for k in (gid, glyph_name) if isinstance(k, str) and k)
+            self._glyph_keys[glyph_name] = keys
+        return keys
+
+    def _candidates(self, left_name: str, right_name: str) -> Iterable[Tuple[str, str]]:
+        left_keys = self._keys_for_glyph(left_name)
+        right_keys = self._keys_for_glyph(right_name)
+        left_class = self._left_class_key.get(left_name)
+        right_class = self._right_class_key.get(right_name)
+
+        # 1) glyph–glyph
+        for lk in left_keys:
+            for rk in right_keys:
+                yield lk, rk
+        # 2) glyph–rightClass
+        if right_class:
+            for lk in left_keys:
+                yield lk, right_class
+        # 3) leftClass–glyph
+        if left_class:
+            for rk in right_keys:
+                yield left_class, rk
+        # 4) leftClass–rightClass
+        if left_class and right_class:
+            yield left_class, right_class
+
+    def resolve(self, left_name: str, right_name: str) -> Tuple[float, KerningSource]:
+        """Return the effective kerning value and the explicit keys that won."""
+
+        values = self._values
+        for key in self._candidates(left_name, right_name):
+            value = values.get(key)
+            if value is not None:
+                return value, KerningSource(left_key=key[0], right_key=key[1])
+        return 0.0, KerningSource(left_key=None, right_key=None)
+
+    def resolve_many(self, pairs: Iterable[Tuple[str, str]]) -> List[Tuple[float, KerningSource]]:
+        """Resolve a batch of glyph-name pairs."""
+
+        resolve = self.resolve
+        return [resolve(left_name, right_name) for left_name, right_name in pairs]
+
+    def _side_has_keys(self, side_keys: set[str], class_key: Optional[str], glyph_name: str) -> bool:
+        if class_key is not None and class_key in side_keys:
+            return True
+        return any(k in side_keys for k in self._keys_for_glyph(glyph_name))
+
+    def covers(self, left_name: str, right_name: str) -> bool:
+        """Return True when any explicit glyph or class key applies to the pair."""
+
+        if not self._side_has_keys(self._left_keys, self._left_class_key.get(left_name), left_name):
+            return False
+        if not self._side_has_keys(self._right_keys, self._right_class_key.get(right_name), right_name):
+            return False
+        keys = self._keys
+        for key in self._candidates(left_name, right_name):
+            if key in keys:
+                return True
+        return False
+
+    def glyph_keys(self, glyph_name: str, *, left: bool) -> Tuple[str, ...]:
+        """Return every explicit key that can apply to `glyph_name` on one side."""
+
+        class_key = (self._left_class_key if left else self._right_class_key).get(glyph_name)
+        return self._keys_for_glyph(glyph_name) + ((class_key,) if class_key else ())
+
+    def key_glyphs(self, key: str, *, left: bool) -> Tuple[str, ...]:
+        """Return the glyph names a kerning key stands for on one side.
+
+        Class keys expand to their members (in glyph order); glyph ids and
+        names map to the glyph itself. Class keys for the other side, and
+        unknown keys, expand to nothing.
+        """
+
+        if key.startswith("@MMK_"):
+            if not key.startswith("@MMK_L_" if left else "@MMK_R_"):
+                return ()
+            if self._class_members is None:
+                members: Dict[str, List[str]] = {}
+                for class_keys in (self._left_class_key, self._right_class_key):
+                    for name, class_key in class_keys.items():
+                        members.setdefault(class_key, []).append(name)
+                self._class_members = {k: tuple(v) for k, v in members.items()}
+            return self._class_members.get(key, ())
+        name = self._id_to_name.get(key, key)
+        return (name,) if name in self._name_set else ()
+
+    def iter_effective_pairs(
+        self,
+        left_names: Optional[set[str]] = None,
+        right_names: Optional[set[str]] = None,
+    ) -> Iterator[Tuple[str, str, float, KerningSource]]:
+        """Lazily expand numeric entries into `(left, right, value, source)` glyph pairs.
+
+        Each glyph pair is yielded once, at the entry that wins `resolve` for
+        it, so class kerning overridden by an exception is not repeated.
+        Optional name sets restrict either side.
+        """
+
+        for (lk, rk), value in self._values.items():
+            lefts = self.key_glyphs(lk, left=True)
+            if left_names is not None:
+                lefts = tuple(name for name in lefts if name in left_names)
+            if not lefts:
+                continue
+            rights = self.key_glyphs(rk, left=False)
+            if right_names is not None:
+                rights = tuple(name for name in rights if name in right_names)
+            for left_name in lefts:
+                for right_name in rights:
+                    _value, source = self.resolve(left_name, right_name)
+                    if source.left_key == lk and source.right_key == rk:
+                        yield left_name, right_name, value, source
+
+    def items(self) -> Iterable[Tuple[str, str, Any]]:
+        """Yield `(left_key, right_key, raw_value)` for every explicit entry."""
+
+        for lk, right_dict in self.kerning.items():
+            for rk, v in right_dict.items():
+                yield lk, rk, v
+
+    def numeric_items(self) -> List[Tuple[str, str, float]]:
+        """Return `(left_key, right_key, value)` for entries with numeric values."""
+
+        return [(lk, rk, v) for (lk, rk), v in self._values.items()]
+
+    def extremes(self, limit: int) -> Tuple[List[Tuple[str, str, float]], List[Tuple[str, str, float]]]:
+        """Return the `limit` tightest and widest numeric entries.
+
+        Same order as sorting `numeric_items()` by value (ties keep entry
+        order), but only a bounded heap of `limit` entries is kept.
+        """
+
+        cap = max(int(limit or 0), 0)
+        if cap <= 0:
+            return [], []
+
+        def _entries() -> Iterable[Tuple[str, str, float]]:
+            return ((lk, rk, v) for (lk, rk), v in self._values.items())
+
+        def _value(item: Tuple[str, str, float]) -> float:
+            return item[2]
+
+        return heapq.nsmallest(cap, _entries(), key=_value), heapq.nlargest(cap, _entries(), key=_value)
+
+
+def kerning_fingerprint(kerning_master: Any, glyph_maps: Optional[Dict[str, Any]] = None) -> str:
+    """Return a digest of one master's explicit kerning and the glyph maps that expand it.
+
+    Walks the raw entries once without building a `KerningIndex`; any edited
+    value, added or removed entry, or changed class membership gives a new digest.
+    """
+
+    digest = hashlib.sha1()
+    for lk, right_dict in _string_keys_kerning(kerning_master).items():
+        for rk, v in right_dict.items():
+            digest.update("{}\x00{}\x00{}\x01".format(lk, rk, v).encode("utf-8"))
+    maps = glyph_maps or {}
+    for field in ("nameToId", "leftClassKeyByName", "rightClassKeyByName"):
+        digest.update("\x02{}".format(field).encode("utf-8"))
+        for name, key in (maps.get(field) or {}).items():
+            digest.update("{}\x00{}\x01".format(name, key).encode("utf-8"))
+    digest.update("\x02{}".format("\x00".join(sorted(maps.get("nameSet") or ()))).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class KerningListing(object):
+    """Lazily expanded pair list of one kerning listing query.
+
+    `pairs` is pulled only as far as a page needs and what it produced is
+    kept, so a page costs the pairs up to its end instead of the whole
+    listing, and going back to an earlier page is a slice.
+    """
+
+    def __init__(self, indexes: Dict[str, "KerningIndex"], pairs: Iterable[Tuple[str, str]]) -> None:
+        self.indexes = indexes
+        self._source: Optional[Iterator[Tuple[str, str]]] = iter(pairs)
+        self._produced: List[Tuple[str, str]] = []
+        self._lock = threading.RLock()
+
+    def page(self, start: int, stop: Optional[int] = None) -> List[Tuple[str, str]]:
+        with self._lock:
+            if self._source is not None and (stop is None or stop > len(self._produced)):
+                wanted = None if stop is None else stop - len(self._produced)
+                self._produced.extend(islice(self._source, wanted))
+                if stop is None or len(self._produced) < stop:
+                    self._source = None
+            return self._produced[start:stop]
+
+    @property
+    def produced_count(self) -> int:
+        with self._lock:
+            return len(self._produced)
+
+
+class KerningListingCache(object):
+    """Bounded, thread-safe LRU of compiled kerning listings.
+
+    Each entry holds whatever a listing query compiled (a `KerningListing`)
+    under the query key, tagged with the kerning fingerprint it was compiled
+    from. A page cursor carries that fingerprint, so later pages find their
+    listing with `get` without fingerprinting the kerning again.
+    """
+
+    def __init__(self, max_entries: int = 8) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[Any, ...], fingerprint: str) -> Any:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None or cached[0] != fingerprint:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached[1]
+
+    def listing(self, key: Tuple[Any, ...], fingerprint: str, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+        value = compute()
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (fingerprint, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": int(self.hits), "misses": int(self.misses)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
 @dataclass(frozen=True)
 class PairGapResult:
     min_gap: float
@@ -332,9 +663,14 @@ def measure_pair_min_gap(
     bands: int,
     include_components: bool = True,
     target_gap: float = 0.0,
+    edge_tables: Optional[Dict[Tuple[int, bool], Any]] = None,
 ) -> Optional[PairGapResult]:
     """Measure min gap across y-overlap for a given kerning value.
 
+    Pass one `edge_tables` dict across the calls of a scan so each layer's
+    edge table is built once instead of twice per pair; it is keyed by layer
+    identity, so keep the layers alive and start a new dict after edits.
+
     Returns None when measurement is impossible (no bounds/overlap/samples).
     """
 
@@ -361,6 +697,8 @@ def measure_pair_min_gap(
 
     heights, _ = normalize_scan_heights(scan_heights)
     quick_ys = [y_min + h * (y_max - y_min) for h in heights]
+    read_left = _layer_edge_reader(left_layer, include_components, l_start_x, l_end_x, edge_tables)
+    read_right = _layer_edge_reader(right_layer, include_components, r_start_x, r_end_x, edge_tables)
 
     def _band_index(y: float) -> int:
         if y_max <= y_min:
@@ -375,22 +713,8 @@ def measure_pair_min_gap(
         band_mins: List[float | None] = [None for _ in range(bands)]
         samples = 0
 
-        for y in ys:
-            l_left, l_right = _measure_edges_at_y(
-                left_layer,
-                float(y),
-                include_components=include_components,
-                start_x=l_start_x,
-                end_x=l_end_x,
-            )
-            r_left, r_right = _measure_edges_at_y(
-                right_layer,
-                float(y),
-                include_components=include_components,
-                start_x=r_start_x,
-                end_x=r_end_x,
-            )
-
+        ys = [float(y) for y in ys]
+        for y, (_l_left, l_right), (r_left, _r_right) in zip(ys, read_left(ys), read_right(ys)):
             if l_right is None or r_left is None:
                 continue
 
@@ -461,6 +785,829 @@ def measure_pair_min_gap(
     )
 
 
+def _outline_signature(layer: Any, depth: int, parts: List[str]) -> None:
+    for shape in _layer_shapes(layer) or []:
+        component_name = _safe_attr(shape, "componentName")
+        if component_name is not None:
+            transform = _safe_attr(shape, "transform")
+            try:
+                values = ",".join("{:.4f}".format(float(v)) for v in list(transform or []))
+            except Exception:
+                values = ""
+            parts.append("C{}[{}]".format(component_name, values))
+            base = _safe_attr(shape, "componentLayer")
+            if base is not None and depth < 4:
+                parts.append("(")
+                _outline_signature(base, depth + 1, parts)
+                parts.append(")")
+            continue
+        nodes = _safe_attr(shape, "nodes")
+        if nodes is None:
+            continue
+        parts.append("P{}".format(1 if _safe_attr(shape, "closed", True) else 0))
+        for node in list(nodes or []):
+            x, y = _node_xy(node) or (0.0, 0.0)
+            parts.append("{:.4f},{:.4f},{}".format(x, y, _safe_attr(node, "type", "")))
+
+
+def layer_outline_fingerprint(layer: Any) -> str:
+    """Return a stable digest of the layer geometry that edge scans depend on.
+
+    Covers width, bounds, every path node, and component names/transforms
+    (recursing into component base layers when the host exposes them).
+    """
+
+    parts: List[str] = ["W{}".format(_coerce_float(_safe_attr(layer, "width")))]
+    parts.append("B{}".format(bounds_tuple(layer)))
+    _outline_signature(layer, 0, parts)
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def scan_grid_rows(y_min: float, y_max: float, step: float) -> range:
+    """Return baseline-aligned row indexes `k` with `k * step` inside [y_min, y_max].
+
+    A range thinner than one step that holds no such row gets the single row
+    nearest its midpoint; `scan_row_y` clamps that row back into the range,
+    so hairlines are still measured.
+    """
+
+    first = int(math.ceil(float(y_min) / float(step) - 1e-9))
+    last = int(math.floor(float(y_max) / float(step) + 1e-9))
+    if last < first:
+        first = last = int(math.floor((float(y_min) + float(y_max)) / 2.0 / float(step) + 0.5))
+    return range(first, last + 1)
+
+
+def scan_row_y(row: int, step: float, y_min: float, y_max: float) -> float:
+    """Height at which grid row `row` is measured inside [y_min, y_max]."""
+
+    return min(max(float(row) * float(step), float(y_min)), float(y_max))
+
+
+@dataclass(frozen=True)
+class GlyphEdgeProfile:
+    """Left/right outline edges of one layer sampled on a shared scanline grid.
+
+    Row `i` sits at `y = (first_row + i) * step`; rows without a measurable
+    edge hold None. Profiles on the same step are aligned by row index, so any
+    two can be compared without re-intersecting either outline.
+    """
+
+    step: float
+    first_row: int
+    left_edges: Tuple[Optional[float], ...]
+    right_edges: Tuple[Optional[float], ...]
+    bounds: Tuple[float, float, float, float]
+    width: float
+
+    @property
+    def last_row(self) -> int:
+        return self.first_row + len(self.left_edges) - 1
+
+    @property
+    def scanline_count(self) -> int:
+        return len(self.left_edges)
+
+    def row_y(self, row: int) -> float:
+        return float(row) * self.step
+
+
+def build_glyph_edge_profile(
+    layer: Any,
+    *,
+    step: float,
+    include_components: bool = True,
+) -> Optional[GlyphEdgeProfile]:
+    """Intersect `layer` once per grid row inside its bounds.
+
+    Every row is answered by one edge-table sweep when the layer's geometry
+    is readable. Returns None when the layer has no usable bounds.
+    """
+
+    bounds = bounds_tuple(layer)
+    if not bounds:
+        return None
+    step_f = float(step) if step and float(step) > 0 else 10.0
+    start_x, end_x = _scanline_setup(bounds)
+    rows = scan_grid_rows(bounds[2], bounds[3], step_f)
+    read_edges = _layer_edge_reader(layer, include_components, start_x, end_x)
+    edges = read_edges([scan_row_y(row, step_f, bounds[2], bounds[3]) for row in rows])
+    left_edges = [left for left, _right in edges]
+    right_edges = [right for _left, right in edges]
+    return GlyphEdgeProfile(
+        step=step_f,
+        first_row=rows.start,
+        left_edges=tuple(left_edges),
+        right_edges=tuple(right_edges),
+        bounds=bounds,
+        width=float(_coerce_float(_safe_attr(layer, "width")) or 0.0),
+    )
+
+
+class GlyphEdgeProfileCache(object):
+    """Bounded, thread-safe LRU of edge profiles.
+
+    Entries are keyed by (font key, glyph name, master id, step, components)
+    and validated against the layer's outline fingerprint, so an edited
+    outline replaces its stale profile instead of accumulating beside it.
+    """
+
+    def __init__(self, max_entries: int = 8192) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[str, Optional[GlyphEdgeProfile]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.scanlines = 0
+
+    def profile(
+        self,
+        layer: Any,
+        *,
+        glyph_name: str,
+        master_id: Any,
+        step: float,
+        include_components: bool = True,
+        font_key: Any = None,
+        fingerprint: Optional[str] = None,
+    ) -> Optional[GlyphEdgeProfile]:
+        key = (font_key, str(glyph_name), str(master_id), float(step), bool(include_components))
+        digest = fingerprint if fingerprint is not None else layer_outline_fingerprint(layer)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == digest:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+        profile = build_glyph_edge_profile(layer, step=step, include_components=include_components)
+        with self._lock:
+            self.misses += 1
+            self.scanlines += profile.scanline_count if profile is not None else 0
+            self._entries[key] = (digest, profile)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return profile
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": int(self.hits),
+                "misses": int(self.misses),
+                "scanlines": int(self.scanlines),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.scanlines = 0
+
+
+class PairGapCache(object):
+    """Bounded, thread-safe LRU of pair measurements.
+
+    A result is keyed by everything that determines it: the pair, both
+    layers' outline fingerprints, the effective kerning value and the scan
+    parameters. After an edit only pairs whose outlines or kerning changed
+    miss the cache; untouched pairs reuse their previous measurement.
+    """
+
+    def __init__(self, max_entries: int = 65536) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Tuple[Any, ...], Optional[PairGapResult]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(
+        *,
+        font_key: Any,
+        master_id: Any,
+        left_name: str,
+        right_name: str,
+        left_fingerprint: str,
+        right_fingerprint: str,
+        kerning_value: float,
+        scan_params: Tuple[Any, ...],
+    ) -> Tuple[Any, ...]:
+        return (
+            font_key,
+            str(master_id),
+            str(left_name),
+            str(right_name),
+            left_fingerprint,
+            right_fingerprint,
+            float(kerning_value),
+            scan_params,
+        )
+
+    def get(self, key: Tuple[Any, ...]) -> Tuple[bool, Optional[PairGapResult]]:
+        """Return `(found, result)`; a cached None means "no measurable overlap"."""
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Tuple[Any, ...], result: Optional[PairGapResult]) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": int(self.hits), "misses": int(self.misses)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def interpolated_edge_profile(
+    layer_a: Any,
+    layer_b: Any,
+    t: float,
+    *,
+    step: float,
+    include_components: bool = True,
+) -> Optional[GlyphEdgeProfile]:
+    """Intersect the outline interpolated at `t` between two master layers of one glyph.
+
+    Nodes are blended before the outline is flattened and swept, so a feature
+    that moves vertically between masters is measured where the instance
+    actually puts it; the instance can come closer to its neighbour than
+    either master. Bounds come from the flattened outline. Returns None when
+    the layers are not interpolation-compatible or have no readable outline.
+    """
+
+    polygons = scanline_engine.interpolated_layer_polygons(
+        layer_a, layer_b, t, include_components=include_components
+    )
+    if not polygons:
+        return None
+    xs = [x for polygon in polygons for x, _y in polygon]
+    ys = [y for polygon in polygons for _x, y in polygon]
+    bounds = (min(xs), max(xs), min(ys), max(ys))
+    step_f = float(step) if step and float(step) > 0 else 10.0
+    rows = scan_grid_rows(bounds[2], bounds[3], step_f)
+    table = scanline_engine.EdgeTable(polygons)
+    edges = [
+        scanline_engine.outer_edges(crossings)
+        for crossings in table.sweep([scan_row_y(row, step_f, bounds[2], bounds[3]) for row in rows])
+    ]
+    width_a = float(_coerce_float(_safe_attr(layer_a, "width")) or 0.0)
+    width_b = float(_coerce_float(_safe_attr(layer_b, "width")) or 0.0)
+    return GlyphEdgeProfile(
+        step=step_f,
+        first_row=rows.start,
+        left_edges=tuple(left for left, _right in edges),
+        right_edges=tuple(right for _left, right in edges),
+        bounds=bounds,
+        width=width_a + (width_b - width_a) * float(t),
+    )
+
+
+def interpolation_segment(
+    location: Sequence[float],
+    master_locations: Sequence[Sequence[float]],
+    tolerance: float = 1e-6,
+) -> Optional[Tuple[int, int, float]]:
+    """Place a design-space location on the segment between two masters.
+
+    Returns `(i, j, t)` so that `location == master[i] + t * (master[j] - master[i])`,
+    preferring the shortest such segment, or `(i, i, 0.0)` on a master. Returns
+    None when the location is not on any master-to-master segment (interior
+    points of multi-axis designs need a full variation model).
+    """
+
+    loc = [float(v) for v in location]
+    masters = [[float(v) for v in m] for m in master_locations]
+    for i, m in enumerate(masters):
+        if len(m) == len(loc) and all(abs(p - q) <= tolerance for p, q in zip(m, loc)):
+            return i, i, 0.0
+
+    best: Optional[Tuple[float, int, int, float]] = None
+    for i, mi in enumerate(masters):
+        if len(mi) != len(loc):
+            continue
+        for j in range(i + 1, len(masters)):
+            mj = masters[j]
+            if len(mj) != len(loc):
+                continue
+            d = [q - p for p, q in zip(mi, mj)]
+            dd = sum(v * v for v in d)
+            if dd <= 0.0:
+                continue
+            t = sum((l - p) * v for l, p, v in zip(loc, mi, d)) / dd
+            if t < -tolerance or t > 1.0 + tolerance:
+                continue
+            off = max(abs(p + t * v - l) for p, v, l in zip(mi, d, loc))
+            if off > tolerance * max(1.0, math.sqrt(dd)):
+                continue
+            if best is None or dd < best[0]:
+                best = (dd, i, j, min(max(t, 0.0), 1.0))
+    if best is None:
+        return None
+    return best[1], best[2], best[3]
+
+
+def measure_profile_pair_min_gap(
+    *,
+    left_profile: GlyphEdgeProfile,
+    right_profile: GlyphEdgeProfile,
+    kerning_value: float,
+    scan_mode: str,
+    scan_heights: Sequence[float],
+    bands: int,
+    target_gap: float = 0.0,
+) -> Optional[PairGapResult]:
+    """Profile-based equivalent of `measure_pair_min_gap`.
+
+    Samples are the shared grid rows inside the pair's y-overlap. The quick
+    pass samples each normalized scan height exactly, interpolating the gap
+    between the two rows around it; the dense pass uses every row, so
+    `dense_step` is the profiles' grid step.
+    """
+
+    if abs(float(left_profile.step) - float(right_profile.step)) > 1e-9:
+        raise ValueError("Edge profiles must share one scanline grid step.")
+
+    mode, _ = normalize_scan_mode(scan_mode)
+    overlap = overlap_y_range(left_profile.bounds, right_profile.bounds)
+    if not overlap:
+        return None
+    y_min, y_max = overlap
+    step = float(left_profile.step)
+
+    grid = scan_grid_rows(y_min, y_max, step)
+    first = max(grid.start, left_profile.first_row, right_profile.first_row)
+    last = min(grid.stop - 1, left_profile.last_row, right_profile.last_row)
+    if last < first:
+        return None
+
+    if bands <= 0:
+        bands = 8
+
+    shift = float(left_profile.width) + float(kerning_value)
+    l_right = left_profile.right_edges
+    l_first = left_profile.first_row
+    r_left = right_profile.left_edges
+    r_first = right_profile.first_row
+
+    def _band_index(y: float) -> int:
+        t = (float(y) - float(y_min)) / (float(y_max) - float(y_min))
+        idx = int(math.floor(t * bands))
+        return max(0, min(bands - 1, idx))
+
+    def _measure(rows: Iterable[int]) -> Tuple[Optional[float], Optional[float], List[float | None], int]:
+        min_gap = None
+        worst_y = None
+        band_mins: List[float | None] = [None for _ in range(bands)]
+        samples = 0
+        for row in rows:
+            lr = l_right[row - l_first]
+            rl = r_left[row - r_first]
+            if lr is None or rl is None:
+                continue
+            gap = shift + float(rl) - float(lr)
+            y = scan_row_y(row, step, y_min, y_max)
+            samples += 1
+            b = _band_index(y)
+            if band_mins[b] is None or gap < float(band_mins[b]):  # type: ignore[arg-type]
+                band_mins[b] = float(gap)
+            if min_gap is None or gap < float(min_gap):
+                min_gap = float(gap)
+                worst_y = y
+        return min_gap, worst_y, band_mins, samples
+
+    def _result(measured, refined: bool) -> Optional[PairGapResult]:
+        m_min, m_worst, m_bands, m_samples = measured
+        if m_min is None:
+            return None
+        return PairGapResult(
+            min_gap=float(m_min),
+            worst_y=m_worst,
+            band_min_gaps=m_bands,
+            sample_count=int(m_samples),
+            refined=refined,
+        )
+
+    dense_rows = range(first, last + 1)
+    if mode == "dense_only":
+        return _result(_measure(dense_rows), True)
+
+    def _row_gap(row: int) -> Optional[float]:
+        lr = l_right[row - l_first]
+        rl = r_left[row - r_first]
+        if lr is None or rl is None:
+            return None
+        return shift + float(rl) - float(lr)
+
+    def _measure_heights(fractions: Sequence[float]) -> Tuple[Optional[float], Optional[float], List[float | None], int]:
+        min_gap = None
+        worst_y = None
+        band_mins: List[float | None] = [None for _ in range(bands)]
+        samples = 0
+        for h in fractions:
+            y = y_min + h * (y_max - y_min)
+            pos = y / step
+            below = math.floor(pos)
+            lo = max(first, min(last, int(below)))
+            hi = max(first, min(last, int(below) + 1))
+            g_lo = _row_gap(lo)
+            g_hi = _row_gap(hi)
+            if lo == hi or g_hi is None:
+                gap = g_lo
+            elif g_lo is None:
+                gap = g_hi
+            else:
+                gap = g_lo + (pos - below) * (g_hi - g_lo)
+            if gap is None:
+                continue
+            samples += 1
+            b = _band_index(y)
+            if band_mins[b] is None or gap < float(band_mins[b]):  # type: ignore[arg-type]
+                band_mins[b] = float(gap)
+            if min_gap is None or gap < float(min_gap):
+                min_gap = float(gap)
+                worst_y = y
+        return min_gap, worst_y, band_mins, samples
+
+    heights, _ = normalize_scan_heights(scan_heights)
+    quick = _measure_heights(heights)
+    if mode == "heights_only":
+        return _result(quick, False)
+
+    if should_refine_two_pass(quick_min_gap=quick[0], target_gap=float(target_gap), dense_step=step):
+        return _result(_measure(dense_rows), True)
+    return _result(quick, False)
+
+
+BATCH_CHUNK_PAIRS = 2048
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+def measure_profile_pairs(
+    *,
+    left_profiles: Sequence[GlyphEdgeProfile],
+    right_profiles: Sequence[GlyphEdgeProfile],
+    pairs: Sequence[Tuple[int, int]],
+    kerning_values: Sequence[float],
+    scan_mode: str,
+    scan_heights: Sequence[float],
+    bands: int,
+    target_gap: float = 0.0,
+    use_numpy: Optional[bool] = None,
+    chunk_size: int = BATCH_CHUNK_PAIRS,
+) -> List[Optional[PairGapResult]]:
+    """Measure many profile pairs at once.
+
+    `pairs` holds (left index, right index) into `left_profiles` and
+    `right_profiles`; `kerning_values` is parallel to `pairs`. Results match
+    `measure_profile_pair_min_gap` for every pair. With NumPy the whole pair
+    list is broadcast over the shared row grid in bounded chunks; without it
+    (or with `use_numpy=False`) pairs are measured one at a time.
+    """
+
+    if len(kerning_values) != len(pairs):
+        raise ValueError("kerning_values must be parallel to pairs.")
+    if not pairs:
+        return []
+    if use_numpy is None:
+        use_numpy = np is not None
+    if not use_numpy or np is None:
+        return [
+            measure_profile_pair_min_gap(
+                left_profile=left_profiles[li],
+                right_profile=right_profiles[ri],
+                kerning_value=float(kv),
+                scan_mode=scan_mode,
+                scan_heights=scan_heights,
+                bands=bands,
+                target_gap=target_gap,
+            )
+            for (li, ri), kv in zip(pairs, kerning_values)
+        ]
+    return _measure_profile_pairs_numpy(
+        left_profiles=left_profiles,
+        right_profiles=right_profiles,
+        pairs=pairs,
+        kerning_values=kerning_values,
+        scan_mode=scan_mode,
+        scan_heights=scan_heights,
+        bands=bands,
+        target_gap=target_gap,
+        chunk_size=chunk_size,
+    )
+
+
+def _profile_matrix(profiles: Sequence[GlyphEdgeProfile], side: str, row0: int, width: int) -> Any:
+    matrix = np.full((len(profiles), width), np.nan, dtype=np.float64)
+    for index, profile in enumerate(profiles):
+        edges = profile.right_edges if side == "right" else profile.left_edges
+        offset = profile.first_row - row0
+        matrix[index, offset : offset + len(edges)] = [np.nan if v is None else float(v) for v in edges]
+    return matrix
+
+
+def _measure_profile_pairs_numpy(
+    *,
+    left_profiles: Sequence[GlyphEdgeProfile],
+    right_profiles: Sequence[GlyphEdgeProfile],
+    pairs: Sequence[Tuple[int, int]],
+    kerning_values: Sequence[float],
+    scan_mode: str,
+    scan_heights: Sequence[float],
+    bands: int,
+    target_gap: float,
+    chunk_size: int,
+) -> List[Optional[PairGapResult]]:
+    steps = {float(p.step) for p in list(left_profiles) + list(right_profiles)}
+    if max(steps) - min(steps) > 1e-9:
+        raise ValueError("Edge profiles must share one scanline grid step.")
+    step = float(left_profiles[0].step if left_profiles else right_profiles[0].step)
+    mode, _ = normalize_scan_mode(scan_mode)
+    heights, _ = normalize_scan_heights(scan_heights)
+    if bands <= 0:
+        bands = 8
+    margin = max(10.0, step)
+
+    everything = list(left_profiles) + list(right_profiles)
+    row0 = min(p.first_row for p in everything)
+    # Keep one column even when every profile is empty (thinner than a step).
+    width = max(max(p.last_row for p in everything) - row0 + 1, 1)
+    left_right_edges = _profile_matrix(left_profiles, "right", row0, width)
+    right_left_edges = _profile_matrix(right_profiles, "left", row0, width)
+
+    def _side_arrays(profiles: Sequence[GlyphEdgeProfile]) -> Tuple[Any, Any, Any, Any, Any]:
+        return (
+            np.array([p.bounds[2] for p in profiles], dtype=np.float64),
+            np.array([p.bounds[3] for p in profiles], dtype=np.float64),
+            np.array([p.first_row for p in profiles], dtype=np.int64),
+            np.array([p.last_row for p in profiles], dtype=np.int64),
+            np.array([p.width for p in profiles], dtype=np.float64),
+        )
+
+    l_ymin, l_ymax, l_first, l_last, l_width = _side_arrays(left_profiles)
+    r_ymin, r_ymax, r_first, r_last, _ = _side_arrays(right_profiles)
+    rows = np.arange(row0, row0 + width, dtype=np.int64)
+    row_ys = rows.astype(np.float64) * step
+    heights_arr = np.array(heights, dtype=np.float64)
+
+    pair_arr = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    kv_arr = np.asarray(kerning_values, dtype=np.float64)
+    out: List[Optional[PairGapResult]] = []
+    chunk = max(1, int(chunk_size))
+
+    for start in range(0, len(pair_arr), chunk):
+        li = pair_arr[start : start + chunk, 0]
+        ri = pair_arr[start : start + chunk, 1]
+        n = len(li)
+        y_min = np.maximum(l_ymin[li], r_ymin[ri])
+        y_max = np.minimum(l_ymax[li], r_ymax[ri])
+        has_overlap = y_max > y_min
+        span = np.where(has_overlap, y_max - y_min, 1.0)
+        grid_first = np.ceil(y_min / step - 1e-9).astype(np.int64)
+        grid_last = np.floor(y_max / step + 1e-9).astype(np.int64)
+        # Same single-row fallback as `scan_grid_rows` for hairline overlaps.
+        thin = grid_last < grid_first
+        if thin.any():
+            mid_row = np.floor((y_min + y_max) / 2.0 / step + 0.5).astype(np.int64)
+            grid_first = np.where(thin, mid_row, grid_first)
+            grid_last = np.where(thin, mid_row, grid_last)
+        first = np.maximum.reduce([grid_first, l_first[li], r_first[ri]])
+        last = np.minimum.reduce([grid_last, l_last[li], r_last[ri]])
+        usable = has_overlap & (last >= first)
+
+        shift = l_width[li] + kv_arr[start : start + n]
+        gaps = shift[:, None] + right_left_edges[ri] - left_right_edges[li]
+        finite = ~np.isnan(gaps)
+        dense = (rows[None, :] >= first[:, None]) & (rows[None, :] <= last[:, None]) & finite
+
+        band = np.floor((row_ys[None, :] - y_min[:, None]) / span[:, None] * bands).astype(np.int64)
+        band = np.clip(band, 0, bands - 1)
+
+        def _reduce_values(values: Any, mask: Any, ys: Any, value_band: Any) -> Tuple[Any, Any, Any, Any]:
+            masked = np.where(mask, values, np.inf)
+            worst = np.argmin(masked, axis=1)
+            mins = masked[np.arange(n), worst]
+            counts = mask.sum(axis=1)
+            band_mins = np.stack(
+                [np.where(mask & (value_band == b), values, np.inf).min(axis=1) for b in range(bands)],
+                axis=1,
+            )
+            return mins, ys[np.arange(n), worst], band_mins, counts
+
+        def _reduce(mask: Any) -> Tuple[Any, Any, Any, Any]:
+            ys = np.clip(np.broadcast_to(row_ys[None, :], mask.shape), y_min[:, None], y_max[:, None])
+            return _reduce_values(gaps, mask, ys, band)
+
+        def _reduce_heights() -> Tuple[Any, Any, Any, Any]:
+            # Exact scan heights, interpolating the gap between the rows around each.
+            hy = y_min[:, None] + heights_arr[None, :] * (y_max - y_min)[:, None]
+            pos = hy / step
+            below = np.floor(pos)
+            top = np.maximum(first, last)[:, None]
+            lo = np.clip(below.astype(np.int64), first[:, None], top)
+            hi = np.clip(below.astype(np.int64) + 1, first[:, None], top)
+            # Unusable pairs may fall outside the row span; they are masked below.
+            pick = np.arange(n)[:, None]
+            g_lo = gaps[pick, np.clip(lo - row0, 0, width - 1)]
+            g_hi = gaps[pick, np.clip(hi - row0, 0, width - 1)]
+            lo_nan = np.isnan(g_lo)
+            hi_nan = np.isnan(g_hi)
+            values = np.where(
+                (lo == hi) | hi_nan,
+                g_lo,
+                np.where(lo_nan, g_hi, g_lo + (pos - below) * (g_hi - g_lo)),
+            )
+            mask = ~np.isnan(values) & usable[:, None]
+            height_band = np.floor((hy - y_min[:, None]) / span[:, None] * bands).astype(np.int64)
+            return _reduce_values(values, mask, hy, np.clip(height_band, 0, bands - 1))
+
+        if mode == "dense_only":
+            refine = np.ones(n, dtype=bool)
+            selected = _reduce(dense)
+        else:
+            q = _reduce_heights()
+            if mode == "heights_only":
+                refine = np.zeros(n, dtype=bool)
+                selected = q
+            else:
+                q_has = q[3] > 0
+                refine = ~q_has | (q[0] <= float(target_gap) + margin)
+                d = _reduce(dense)
+                selected = tuple(
+                    np.where(refine[:, None] if qp.ndim == 2 else refine, dp, qp) for dp, qp in zip(d, q)
+                )
+
+        mins, worst_ys, band_mins, counts = selected
+        for i in range(n):
+            if not usable[i] or counts[i] <= 0:
+                out.append(None)
+                continue
+            out.append(
+                PairGapResult(
+                    min_gap=float(mins[i]),
+                    worst_y=float(worst_ys[i]),
+                    band_min_gaps=[None if math.isinf(v) else float(v) for v in band_mins[i].tolist()],
+                    sample_count=int(counts[i]),
+                    refined=bool(refine[i]),
+                )
+            )
+    return out
+
+
+def build_class_envelope(profiles: Sequence[GlyphEdgeProfile], *, side: str) -> Optional[GlyphEdgeProfile]:
+    """Union edge envelope for the members of one kerning class.
+
+    `side="left"` describes a class on the left of a pair: per row it keeps the
+    largest right edge measured from each member's advance (`right - width`),
+    with width 0. `side="right"` keeps the smallest left edge per row. Any
+    member pair's gap at a row is therefore >= the envelope gap at that row.
+    """
+
+    members = [p for p in profiles if p is not None]
+    if not members:
+        return None
+    if side not in ("left", "right"):
+        raise ValueError("side must be 'left' or 'right'.")
+    step = float(members[0].step)
+    if any(abs(float(p.step) - step) > 1e-9 for p in members):
+        raise ValueError("Edge profiles must share one scanline grid step.")
+
+    first = min(p.first_row for p in members)
+    last = max(p.last_row for p in members)
+    edges: List[Optional[float]] = [None] * (last - first + 1)
+    for p in members:
+        source = p.right_edges if side == "left" else p.left_edges
+        offset = p.first_row - first
+        for i, value in enumerate(source):
+            if value is None:
+                continue
+            v = float(value) - float(p.width) if side == "left" else float(value)
+            current = edges[offset + i]
+            if current is None or (v > current if side == "left" else v < current):
+                edges[offset + i] = v
+
+    empty: Tuple[Optional[float], ...] = tuple(None for _ in edges)
+    return GlyphEdgeProfile(
+        step=step,
+        first_row=first,
+        left_edges=empty if side == "left" else tuple(edges),
+        right_edges=tuple(edges) if side == "left" else empty,
+        bounds=(
+            min(p.bounds[0] for p in members),
+            max(p.bounds[1] for p in members),
+            min(p.bounds[2] for p in members),
+            max(p.bounds[3] for p in members),
+        ),
+        width=0.0,
+    )
+
+
+@dataclass(frozen=True)
+class ClassPairScreen:
+    left_class: str
+    right_class: str
+    pair_indexes: Tuple[int, ...]
+    kerning_floor: float
+    lower_bound_gap: float | None
+    worst_y: float | None
+    band_min_gaps: List[float | None]
+    drilled: bool
+
+
+def screen_class_pairs(
+    *,
+    left_profiles: Sequence[GlyphEdgeProfile],
+    right_profiles: Sequence[GlyphEdgeProfile],
+    pairs: Sequence[Tuple[int, int]],
+    kerning_values: Sequence[float],
+    left_classes: Sequence[Optional[str]],
+    right_classes: Sequence[Optional[str]],
+    target_gap: float,
+    bands: int,
+) -> Tuple[List[int], List[ClassPairScreen]]:
+    """Screen class × class groups before member pairs are measured.
+
+    Pairs whose left and right glyphs both carry a class key are grouped by
+    (left class, right class). Each group is measured once from the class
+    envelopes with its lowest member kerning value, which bounds every member
+    gap from below. Groups whose bound stays at or above `target_gap` are
+    skipped; all other pairs are returned for member measurement.
+
+    Returns (pair indexes to measure, one ClassPairScreen per class pair).
+    """
+
+    measure: List[int] = []
+    groups: "OrderedDict[Tuple[str, str], List[int]]" = OrderedDict()
+    for index, (lc, rc) in enumerate(zip(left_classes, right_classes)):
+        if lc and rc:
+            groups.setdefault((str(lc), str(rc)), []).append(index)
+        else:
+            measure.append(index)
+
+    left_members: Dict[str, Dict[int, GlyphEdgeProfile]] = {}
+    right_members: Dict[str, Dict[int, GlyphEdgeProfile]] = {}
+    for (lc, rc), indexes in groups.items():
+        for index in indexes:
+            li, ri = pairs[index]
+            left_members.setdefault(lc, {})[li] = left_profiles[li]
+            right_members.setdefault(rc, {})[ri] = right_profiles[ri]
+
+    left_envelopes = {key: build_class_envelope(list(v.values()), side="left") for key, v in left_members.items()}
+    right_envelopes = {key: build_class_envelope(list(v.values()), side="right") for key, v in right_members.items()}
+
+    screens: List[ClassPairScreen] = []
+    for (lc, rc), indexes in groups.items():
+        floor = min(float(kerning_values[i]) for i in indexes)
+        left_env = left_envelopes.get(lc)
+        right_env = right_envelopes.get(rc)
+        bound = None
+        if left_env is not None and right_env is not None:
+            bound = measure_profile_pair_min_gap(
+                left_profile=left_env,
+                right_profile=right_env,
+                kerning_value=floor,
+                scan_mode="dense_only",
+                scan_heights=(),
+                bands=bands,
+            )
+        drilled = bound is None or float(bound.min_gap) < float(target_gap)
+        if drilled:
+            measure.extend(indexes)
+        screens.append(
+            ClassPairScreen(
+                left_class=lc,
+                right_class=rc,
+                pair_indexes=tuple(indexes),
+                kerning_floor=floor,
+                lower_bound_gap=float(bound.min_gap) if bound is not None else None,
+                worst_y=bound.worst_y if bound is not None else None,
+                band_min_gaps=list(bound.band_min_gaps) if bound is not None else [],
+                drilled=drilled,
+            )
+        )
+
+    measure.sort()
+    return measure, screens
+
+
 @dataclass(frozen=True)
 class BumperSuggestion:
     bumper_delta: float
@@ -494,6 +1641,45 @@ def compute_bumper_suggestion(
     )
 
 
+SAFE_GAP_KEYS: Tuple[str, ...] = ("left", "right", "kerningValue", "minGap", "worstY")
+
+
+def pair_gap_record(
+    *,
+    left_name: str,
+    right_name: str,
+    kerning_value: float,
+    source: KerningSource,
+    measured: PairGapResult,
+    target_gap: float,
+    max_delta: int,
+) -> Dict[str, Any]:
+    """Return the JSON record the bumper tools report for one measured pair.
+
+    Safe pairs are reported with the `SAFE_GAP_KEYS` subset of this record.
+    """
+
+    suggestion = compute_bumper_suggestion(
+        kerning_value=float(kerning_value),
+        measured_min_gap=float(measured.min_gap),
+        target_gap=float(target_gap),
+        max_delta=int(max_delta),
+    )
+    return {
+        "left": left_name,
+        "right": right_name,
+        "kerningValue": float(kerning_value),
+        "kerningSource": {"leftKey": source.left_key, "rightKey": source.right_key},
+        "minGap": float(measured.min_gap),
+        "worstY": float(measured.worst_y) if measured.worst_y is not None else None,
+        "bandMinGaps": list(measured.band_min_gaps or []),
+        "bumperDelta": float(suggestion.bumper_delta),
+        "recommendedException": int(suggestion.recommended_exception),
+        "refined": bool(measured.refined),
+        "sampleCount": int(measured.sample_count),
+    }
+
+
 def glyph_unicode_char(glyph: Any) -> Optional[str]:
     """Return the single Unicode character for a glyph, if available."""
 
@@ -517,6 +1703,8 @@ def build_glyph_maps(glyphs: Iterable[Any]) -> Dict[str, Any]:
 
     left_key_group_rep: Dict[str, str] = {}  # rightKerningGroup -> representative glyph name (@MMK_L_*)
     right_key_group_rep: Dict[str, str] = {}  # leftKerningGroup -> representative glyph name (@MMK_R_*)
+    left_class_key_by_name: Dict[str, str] = {}  # glyph name -> @MMK_L_<rightKerningGroup>
+    right_class_key_by_name: Dict[str, str] = {}  # glyph name -> @MMK_R_<leftKerningGroup>
 
     name_set: set[str] = set()
 
@@ -544,17 +1732,21 @@ def build_glyph_maps(glyphs: Iterable[Any]) -> Dict[str, Any]:
             if ch not in unicode_to_glyphname_fallback:
                 unicode_to_glyphname_fallback[ch] = name
 
-        # Group representatives.
+        # Group representatives and per-glyph class keys.
         rgrp = _safe_attr(glyph, "rightKerningGroup", None)
         lgrp = _safe_attr(glyph, "leftKerningGroup", None)
         if rgrp:
             rgrp_s = str(rgrp)
             if rgrp_s and rgrp_s not in left_key_group_rep:
                 left_key_group_rep[rgrp_s] = name
+            if rgrp_s:
+                left_class_key_by_name[name] = "@MMK_L_" + rgrp_s
         if lgrp:
             lgrp_s = str(lgrp)
             if lgrp_s and lgrp_s not in right_key_group_rep:
                 right_key_group_rep[lgrp_s] = name
+            if lgrp_s:
+                right_class_key_by_name[name] = "@MMK_R_" + lgrp_s
 
     # Fallback for unicode mapping: use any glyph if no exported glyph was found.
     for ch, name in unicode_to_glyphname_fallback.items():
@@ -569,6 +1761,8 @@ def build_glyph_maps(glyphs: Iterable[Any]) -> Dict[str, Any]:
         "unicodeToGlyphname": unicode_to_glyphname,
         "leftKeyGroupRep": left_key_group_rep,
         "rightKeyGroupRep": right_key_group_rep,
+        "leftClassKeyByName": left_class_key_by_name,
+        "rightClassKeyByName": right_class_key_by_name,
     }
 
 
@@ -607,6 +1801,102 @@ def kerning_key_to_glyph_name(
     return key if key in name_set else None
 
 
+def unicode_map_fingerprint(unicode_to_glyphname: Dict[str, str]) -> str:
+    """Stable digest of a character -> glyph-name map."""
+
+    h = hashlib.sha1()
+    for ch, name in sorted((str(k), str(v)) for k, v in (unicode_to_glyphname or {}).items()):
+        h.update(ch.encode("utf-8", "surrogatepass"))
+        h.update(b"\x00")
+        h.update(name.encode("utf-8", "surrogatepass"))
+        h.update(b"\x01")
+    return h.hexdigest()
+
+
+def resolve_dataset_pairs(
+    dataset_pairs: Sequence[Tuple[str, str]],
+    unicode_to_glyphname: Dict[str, str],
+) -> Tuple[Optional[Tuple[str, str]], ...]:
+    """Map character pairs to glyph-name pairs; None where a character has no glyph."""
+
+    out: List[Optional[Tuple[str, str]]] = []
+    lookup = unicode_to_glyphname.get
+    for left_ch, right_ch in dataset_pairs or []:
+        left_name = lookup(left_ch)
+        right_name = lookup(right_ch)
+        out.append((left_name, right_name) if left_name and right_name else None)
+    return tuple(out)
+
+
+class DatasetPairResolutionCache(object):
+    """Bounded, thread-safe cache of dataset pairs resolved to glyph names.
+
+    Entries are keyed by (font key, unicode-map fingerprint) and remember the
+    dataset object they were resolved from, so a reloaded dataset or a changed
+    character map resolves again while repeated calls reuse the tuple. The
+    fingerprint is remembered per font for the map object it was computed
+    from, so passing the same `build_glyph_maps` result again (one per master
+    in a sweep) skips re-sorting and hashing it; maps are not expected to be
+    edited in place once built.
+    """
+
+    def __init__(self, max_entries: int = 32) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Tuple[Any, str], Tuple[Any, Tuple[Optional[Tuple[str, str]], ...]]]" = OrderedDict()
+        self._fingerprints: "OrderedDict[Any, Tuple[Dict[str, str], int, str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _fingerprint(self, font_key: Any, unicode_to_glyphname: Dict[str, str]) -> str:
+        with self._lock:
+            known = self._fingerprints.get(font_key)
+            if known is not None and known[0] is unicode_to_glyphname and known[1] == len(unicode_to_glyphname):
+                self._fingerprints.move_to_end(font_key)
+                return known[2]
+        fingerprint = unicode_map_fingerprint(unicode_to_glyphname)
+        with self._lock:
+            self._fingerprints[font_key] = (unicode_to_glyphname, len(unicode_to_glyphname), fingerprint)
+            self._fingerprints.move_to_end(font_key)
+            while len(self._fingerprints) > self.max_entries:
+                self._fingerprints.popitem(last=False)
+        return fingerprint
+
+    def resolve(
+        self,
+        dataset_pairs: Sequence[Tuple[str, str]],
+        unicode_to_glyphname: Dict[str, str],
+        *,
+        font_key: Any = None,
+    ) -> Tuple[Optional[Tuple[str, str]], ...]:
+        key = (font_key, self._fingerprint(font_key, unicode_to_glyphname or {}))
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] is dataset_pairs:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+        resolved = resolve_dataset_pairs(dataset_pairs, unicode_to_glyphname)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (dataset_pairs, resolved)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return resolved
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": int(self.hits), "misses": int(self.misses)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._fingerprints.clear()
+            self.hits = 0
+            self.misses = 0
+
+
 def build_candidate_pairs(
     *,
     dataset_pairs: Sequence[Tuple[str, str]],
@@ -620,8 +1910,13 @@ def build_candidate_pairs(
     right_key_group_rep: Dict[str, str],
     focus: Optional[set[str]] = None,
     pair_limit: int = 3000,
+    resolved_pairs: Optional[Sequence[Optional[Tuple[str, str]]]] = None,
 ) -> Tuple[List[Tuple[str, str]], Dict[str, int]]:
-    """Build an ordered, deduped list of glyph-name pairs to analyze."""
+    """Build an ordered, deduped list of glyph-name pairs to analyze.
+
+    `resolved_pairs` is an optional precomputed `resolve_dataset_pairs` result
+    for `dataset_pairs` (e.g. from `DatasetPairResolutionCache`).
+    """
 
     focus = focus if focus else None
     cap = max(int(pair_limit or 0), 0) or 3000
@@ -638,15 +1933,15 @@ def build_candidate_pairs(
     }
 
     # 1) Relevant (Andre-Fuchs) pairs.
-    for left_ch, right_ch in (dataset_pairs or [])[:relevant_cap]:
-        left_name = unicode_to_glyphname.get(left_ch)
-        right_name = unicode_to_glyphname.get(right_ch)
-        if not left_name or not right_name:
+    if resolved_pairs is None:
+        resolved_pairs = resolve_dataset_pairs((dataset_pairs or [])[:relevant_cap], unicode_to_glyphname)
+    for pair in islice(resolved_pairs, relevant_cap):
+        if pair is None:
             counts["pairsSkippedNoGlyph"] += 1
             continue
+        left_name, right_name = pair
         if focus is not None and left_name not in focus and right_name not in focus:
             continue
-        pair = (left_name, right_name)
         if pair in seen:
             continue
         out.append(pair)
@@ -695,3 +1990,31 @@ def build_candidate_pairs(
 
     counts["pairsCandidate"] = len(out)
     return out, counts
+
+
+def build_all_glyph_pairs(
+    *,
+    glyph_names: Sequence[str],
+    pair_limit: int = 3000,
+) -> Tuple[List[Tuple[str, str]], Dict[str, int]]:
+    """Return the ordered left × right product of `glyph_names`, capped at `pair_limit`."""
+
+    names: List[str] = []
+    seen: set[str] = set()
+    for name in glyph_names or []:
+        if name and name not in seen:
+            seen.add(name)
+            names.append(name)
+
+    cap = max(int(pair_limit or 0), 0) or 3000
+    out: List[Tuple[str, str]] = []
+    for left_name in names:
+        for right_name in names:
+            if len(out) >= cap:
+                break
+            out.append((left_name, right_name))
+    counts = {
+        "pairsCandidate": len(out),
+        "pairsAllPairsSpace": len(names) * len(names),
+    }
+    return out, counts
@@ -11,6 +11,7 @@ normal Python environments.
 import json
 import math
 import re
+import threading
 from pathlib import Path
 from urllib.parse import parse_qsl, urlencode, urlsplit
 
@@ -2596,34 +2597,56 @@ def _glyph_unicode_char(glyph):
         return None
 
 
-def _load_andre_fuchs_relevant_pairs():
-    """Load the bundled Andre Fuchs relevant-pairs dataset.
+class _CharPairArray(object):
+    """Read-only sequence of (left_char, right_char) backed by two strings.
 
-    Returns (dataset_meta, pairs, warnings) where pairs is a list of (left_char, right_char).
+    Stores a dataset of N single-character pairs as two N-character strings
+    instead of N tuples; indexing returns a tuple and slicing stays compact.
     """
-    warnings = []
-    dataset_path = (
+
+    __slots__ = ("_left", "_right")
+
+    def __init__(self, left, right):
+        self._left = left
+        self._right = right
+
+    def __len__(self):
+        return len(self._left)
+
+    def __iter__(self):
+        return zip(self._left, self._right)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _CharPairArray(self._left[index], self._right[index])
+        return (self._left[index], self._right[index])
+
+    def __repr__(self):
+        return "_CharPairArray({} pairs)".format(len(self))
+
+
+_ANDRE_FUCHS_DATASET_LOCK = threading.Lock()
+_ANDRE_FUCHS_DATASET_CACHE = {}
+
+
+def _andre_fuchs_dataset_path():
+    return (
         Path(__file__).resolve().parent
         / "kerning_data"
         / "andre_fuchs"
         / "relevant_pairs.v1.json"
     )
 
-    if not dataset_path.exists():
-        warnings.append("Andre-Fuchs dataset not found at {}".format(dataset_path))
-        return (
-            {"id": "andre_fuchs_relevant_pairs", "pairCount": 0},
-            [],
-            warnings,
-        )
 
+def _parse_andre_fuchs_relevant_pairs(dataset_path):
+    warnings = []
     try:
         raw = json.loads(dataset_path.read_text(encoding="utf-8", errors="replace"))
     except Exception as exc:
         warnings.append("Failed to parse Andre-Fuchs dataset: {}".format(exc))
         return (
             {"id": "andre_fuchs_relevant_pairs", "pairCount": 0},
-            [],
+            _CharPairArray("", ""),
             warnings,
         )
 
@@ -2631,7 +2654,8 @@ def _load_andre_fuchs_relevant_pairs():
     if not isinstance(dataset_id, str) or not dataset_id.strip():
         dataset_id = "andre_fuchs_relevant_pairs"
 
-    pairs = []
+    lefts = []
+    rights = []
     raw_pairs = raw.get("pairs") if isinstance(raw, dict) else None
     if not isinstance(raw_pairs, list):
         warnings.append("Andre-Fuchs dataset has no 'pairs' list.")
@@ -2648,8 +2672,10 @@ def _load_andre_fuchs_relevant_pairs():
         right = right.strip()
         if len(left) != 1 or len(right) != 1:
             continue
-        pairs.append((left, right))
+        lefts.append(left)
+        rights.append(right)
 
+    pairs = _CharPairArray("".join(lefts), "".join(rights))
     meta = {"id": dataset_id, "pairCount": len(pairs)}
     if len(pairs) < 200:
         warnings.append(
@@ -2660,6 +2686,37 @@ def _load_andre_fuchs_relevant_pairs():
     return meta, pairs, warnings
 
 
+def _load_andre_fuchs_relevant_pairs():
+    """Load the bundled Andre Fuchs relevant-pairs dataset.
+
+    Returns (dataset_meta, pairs, warnings) where pairs is a sequence of (left_char, right_char).
+    The parsed dataset is cached for the process and re-read only when the
+    file's mtime or size changes; the same `pairs` object is returned while it
+    is unchanged, so callers can key derived caches on its identity.
+    """
+    dataset_path = _andre_fuchs_dataset_path()
+    try:
+        stat = dataset_path.stat()
+    except Exception:
+        return (
+            {"id": "andre_fuchs_relevant_pairs", "pairCount": 0},
+            _CharPairArray("", ""),
+            ["Andre-Fuchs dataset not found at {}".format(dataset_path)],
+        )
+
+    stamp = (getattr(stat, "st_mtime_ns", stat.st_mtime), stat.st_size)
+    key = str(dataset_path)
+    with _ANDRE_FUCHS_DATASET_LOCK:
+        cached = _ANDRE_FUCHS_DATASET_CACHE.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp,) + _parse_andre_fuchs_relevant_pairs(dataset_path)
+            _ANDRE_FUCHS_DATASET_CACHE[key] = cached
+
+    _stamp, meta, pairs, warnings = cached
+    # Callers extend the meta/warnings they receive; hand out copies.
+    return dict(meta), pairs, list(warnings)
+
+
 def _selected_glyph_names_for_font(font):
     if not font:
         return []
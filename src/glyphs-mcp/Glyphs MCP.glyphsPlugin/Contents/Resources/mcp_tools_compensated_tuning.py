@@ -53,6 +53,7 @@ def _stem_ratio_payload(
         include_components=include_components,
         stem_source=stem_source,
         mismatch_tolerance=mismatch_tolerance,
+        cache=stem_metrics_helpers.stem_run_cache(),
     )
 
 
@@ -138,27 +139,28 @@ def _layer_has_components(layer) -> bool:
     return bool(comps)
 
 
-def _layers_compatible_for_tuning(layer_r, layer_b):
-    paths_r = list(getattr(layer_r, "paths", []) or [])
-    paths_b = list(getattr(layer_b, "paths", []) or [])
-    if len(paths_r) != len(paths_b):
-        return False, {"reason": "path_count_mismatch", "pathsBase": len(paths_r), "pathsRef": len(paths_b)}
-    for p_i, (pr, pb) in enumerate(zip(paths_r, paths_b)):
-        nodes_r = list(getattr(pr, "nodes", []) or [])
-        nodes_b = list(getattr(pb, "nodes", []) or [])
-        if len(nodes_r) != len(nodes_b):
-            return False, {"reason": "node_count_mismatch", "pathIndex": p_i, "nodesBase": len(nodes_r), "nodesRef": len(nodes_b)}
-        for n_i, (nr, nb) in enumerate(zip(nodes_r, nodes_b)):
-            tr = getattr(nr, "type", None)
-            tb = getattr(nb, "type", None)
-            if tr != tb:
-                return False, {"reason": "node_type_mismatch", "pathIndex": p_i, "nodeIndex": n_i, "typeBase": tr, "typeRef": tb}
-    return True, None
+def _tuning_layer_snapshot(layer):
+    """Copy a layer's paths and width into the engine's plain-data snapshot."""
+    paths = []
+    for path in list(getattr(layer, "paths", []) or []):
+        nodes = []
+        for node in list(getattr(path, "nodes", []) or []):
+            position = getattr(node, "position", None)
+            nodes.append(
+                [
+                    _coerce_numeric(getattr(position, "x", None)) or 0.0,
+                    _coerce_numeric(getattr(position, "y", None)) or 0.0,
+                    getattr(node, "type", None),
+                    bool(getattr(node, "smooth", False)),
+                ]
+            )
+        paths.append({"closed": bool(getattr(path, "closed", True)), "nodes": nodes})
+    return {"width": _coerce_numeric(getattr(layer, "width", None)) or 0.0, "paths": paths}
 
 
-def _review_compensated_tuning_impl(
+def _review_compensated_tuning_batch_impl(
     font_index: int = 0,
-    glyph_name: str = None,
+    glyph_names: list = None,
     base_master_id: str = None,
     ref_master_id: str = None,
     sx: float = 1.0,
@@ -174,49 +176,29 @@ def _review_compensated_tuning_impl(
     round_units: bool = True,
     stem_ratio_b: float = None,
     stem_measure: dict = None,
-) -> str:
-    """Preview compensated tuning for one glyph (no mutation).
-
-    This computes tuned outlines for `glyph_name` by combining corresponding
-    nodes from `base_master_id` (R) and `ref_master_id` (B), using a
-    compensated interpolation model.
-
-    Safety:
-      - Read-only (no mutation, no auto-save).
-      - Refuses glyph layers that contain components (requires decomposed outlines).
-
-    Units:
-      - All geometric inputs/outputs are in font units.
-      - `sx`/`sy` are unitless scale factors.
-      - `q_x`/`q_y` are unitless compensation factors in the range [0..1] (may be clamped).
+    executor=None,
+):
+    """Preview compensated tuning for many glyphs at once (no mutation).
 
-    Args:
-      - extrapolation:
-          - "clamp" (default): clamp q to [0..1] and emit warnings
-          - "allow": allow q outside [0..1]
-          - "error": fail if q is outside [0..1]
-      - stem_ratio_b / stem_measure:
-          - If `q_x`/`q_y` are not provided (and masters differ), `b` may be measured automatically.
+    Masters, the stem ratio `b`, and the compensation factors are resolved
+    once for the whole list. Each glyph's base/reference layers are copied to
+    plain data in one pass, incompatible pairs are rejected by comparing
+    their node-type signatures, and the remaining pairs are tuned by the pure
+    engine (across `executor` when one is given).
 
-    Returns:
-      JSON in `set_glyph_paths` format (`paths`, `width`) plus a `gmcp` block with
-      inputs, computed parameters, and warnings.
+    Returns `{"ok": True, "results": [(glyph_name, review), ...], "stem": ...}`
+    where each review has the `_review_compensated_tuning_impl` shape, or an
+    error payload when the request itself is invalid.
     """
     try:
         font, error = _resolve_font_payload(font_index)
         if error:
             return error
-        if not glyph_name:
-            return {"ok": False, "error": "glyph_name is required"}
         if not base_master_id:
             return {"ok": False, "error": "base_master_id is required"}
         if not ref_master_id:
             return {"ok": False, "error": "ref_master_id is required"}
 
-        glyph = font.glyphs[glyph_name]
-        if not glyph:
-            return {"ok": False, "error": "Glyph not found", "glyph_name": glyph_name}
-
         base_master = next((m for m in (font.masters or []) if str(getattr(m, "id", "")) == str(base_master_id)), None)
         ref_master = next((m for m in (font.masters or []) if str(getattr(m, "id", "")) == str(ref_master_id)), None)
         if not base_master:
@@ -225,171 +207,223 @@ def _review_compensated_tuning_impl(
             return {"ok": False, "error": "Ref master not found", "ref_master_id": ref_master_id}
 
         same_master = str(base_master_id) == str(ref_master_id)
-
-        layer_r = glyph.layers[str(base_master_id)]
-        layer_b = glyph.layers[str(ref_master_id)]
-        if not layer_r or not layer_b:
-            return {"ok": False, "error": "Missing master layer(s) for glyph"}
-
-        if _layer_has_components(layer_r) or _layer_has_components(layer_b):
-            return {
-                "ok": False,
-                "error": "Glyph layers contain components; compensated tuning currently requires decomposed outlines.",
-                "hint": "Decompose components before tuning, or tune base glyphs and rebuild components after.",
-            }
-
-        compat_ok, compat_info = _layers_compatible_for_tuning(layer_r, layer_b)
-        if not compat_ok:
-            return {"ok": False, "error": "Incompatible outlines between masters", "details": compat_info}
-
+        names = [str(name) for name in list(glyph_names or [])]
         sx_f = float(sx)
         sy_f = float(sy)
         if sx_f <= 0.0 or sy_f <= 0.0:
             return {"ok": False, "error": "sx and sy must be > 0"}
 
-        warnings = []
-
-        if stroke_exponent_a is None:
-            a = compensated_tuning_engine.keep_stroke_to_exponent_a(float(keep_stroke))
-        else:
-            a = float(stroke_exponent_a)
-        a = compensated_tuning_engine.clamp(a, 0.0, 1.0)
+        reviews = {}
+        jobs = []
+        for glyph_name in names:
+            if glyph_name in reviews:
+                continue
+            try:
+                glyph = font.glyphs[glyph_name]
+            except Exception:
+                glyph = None
+            if not glyph:
+                reviews[glyph_name] = {"ok": False, "error": "Glyph not found", "glyph_name": glyph_name}
+                continue
+            try:
+                layer_r = glyph.layers[str(base_master_id)]
+                layer_b = glyph.layers[str(ref_master_id)]
+            except Exception:
+                layer_r = layer_b = None
+            if not layer_r or not layer_b:
+                reviews[glyph_name] = {"ok": False, "error": "Missing master layer(s) for glyph"}
+                continue
+            if _layer_has_components(layer_r) or _layer_has_components(layer_b):
+                reviews[glyph_name] = {
+                    "ok": False,
+                    "error": "Glyph layers contain components; compensated tuning currently requires decomposed outlines.",
+                    "hint": "Decompose components before tuning, or tune base glyphs and rebuild components after.",
+                }
+                continue
+            base = _tuning_layer_snapshot(layer_r)
+            ref = _tuning_layer_snapshot(layer_b)
+            # Equal node-type signatures are compatible; only mismatches pay
+            # for the detailed report.
+            if compensated_tuning_engine.outline_signature(base) != compensated_tuning_engine.outline_signature(ref):
+                _compat_ok, compat_info = compensated_tuning_engine.snapshot_compatibility(base, ref)
+                reviews[glyph_name] = {"ok": False, "error": "Incompatible outlines between masters", "details": compat_info}
+                continue
+            reviews[glyph_name] = None
+            jobs.append({"glyphName": glyph_name, "base": base, "ref": ref})
 
-        b = None
         stem_info = None
-        if stem_ratio_b is not None:
-            b = float(stem_ratio_b)
-        elif (q_x is None or q_y is None) and (not same_master):
-            sm = stem_measure if isinstance(stem_measure, dict) else {}
-            stem_info = _stem_ratio_payload(
-                font=font,
-                base_master=base_master,
-                ref_master=ref_master,
-                reference_glyphs=sm.get("reference_glyphs"),
-                samples=sm.get("samples", 9),
-                band=sm.get("band", 0.2),
-                min_width=sm.get("min_width", 5.0),
-                max_width=sm.get("max_width"),
-                include_components=bool(sm.get("include_components", True)),
-                stem_source=sm.get("stem_source", "auto"),
-                mismatch_tolerance=sm.get("mismatch_tolerance", 0.2),
-            )
-            if not stem_info.get("ok"):
-                return {"ok": False, "error": "Unable to measure stem ratio b", "stem": stem_info}
-            b = float(stem_info.get("b"))
-
-        if q_x is None:
-            if same_master:
-                qx = 1.0
-                warnings.append("base_and_ref_same_using_geometric_qx")
-            else:
-                qx = compensated_tuning_engine.compute_q(scale=sx_f, b=float(b), a=a)
-        else:
-            qx = float(q_x)
-        if q_y is None:
-            if same_master:
-                qy = 1.0
-                warnings.append("base_and_ref_same_using_geometric_qy")
+        if jobs:
+            if stroke_exponent_a is None:
+                a = compensated_tuning_engine.keep_stroke_to_exponent_a(float(keep_stroke))
             else:
-                qy = compensated_tuning_engine.compute_q(scale=sy_f, b=float(b), a=a)
-        else:
-            qy = float(q_y)
-
-        mode = str(extrapolation or "clamp").strip().lower()
-        if mode not in ("clamp", "allow", "error"):
-            mode = "clamp"
-        if mode == "clamp":
-            qx0, qy0 = qx, qy
-            qx = compensated_tuning_engine.clamp_q(qx)
-            qy = compensated_tuning_engine.clamp_q(qy)
-            if abs(qx0 - qx) > 1e-9:
-                warnings.append("clamped_qx")
-            if abs(qy0 - qy) > 1e-9:
-                warnings.append("clamped_qy")
-        elif mode == "error":
-            if not (0.0 <= qx <= 1.0):
-                return {"ok": False, "error": "qx out of range and extrapolation=error", "qx": qx}
-            if not (0.0 <= qy <= 1.0):
-                return {"ok": False, "error": "qy out of range and extrapolation=error", "qy": qy}
-
-        if italic_angle is None:
-            italic_angle = _coerce_numeric(getattr(base_master, "italicAngle", 0.0)) or 0.0
-        shear = compensated_tuning_engine.italic_shear(float(italic_angle))
-
-        paths_out = []
-        paths_r = list(getattr(layer_r, "paths", []) or [])
-        paths_b = list(getattr(layer_b, "paths", []) or [])
-        for pr, pb in zip(paths_r, paths_b):
-            nodes_r = list(getattr(pr, "nodes", []) or [])
-            nodes_b = list(getattr(pb, "nodes", []) or [])
-            nodes_out = []
-            for nr, nb in zip(nodes_r, nodes_b):
-                xr = _coerce_numeric(getattr(getattr(nr, "position", None), "x", None)) or 0.0
-                yr = _coerce_numeric(getattr(getattr(nr, "position", None), "y", None)) or 0.0
-                xb = _coerce_numeric(getattr(getattr(nb, "position", None), "x", None)) or 0.0
-                yb = _coerce_numeric(getattr(getattr(nb, "position", None), "y", None)) or 0.0
-                x, y = compensated_tuning_engine.transform_point(
-                    xr=xr,
-                    yr=yr,
-                    xb=xb,
-                    yb=yb,
-                    sx=sx_f,
-                    sy=sy_f,
-                    qx=qx,
-                    qy=qy,
-                    shear=shear,
-                    tx=float(translate_x),
-                    ty=float(translate_y),
-                )
-                x_out = compensated_tuning_engine.units(x, round_units=bool(round_units))
-                y_out = compensated_tuning_engine.units(y, round_units=bool(round_units))
-                nodes_out.append(
-                    {
-                        "x": x_out,
-                        "y": y_out,
-                        "type": getattr(nr, "type", "line"),
-                        "smooth": bool(getattr(nr, "smooth", False)),
-                    }
+                a = float(stroke_exponent_a)
+            a = compensated_tuning_engine.clamp(a, 0.0, 1.0)
+
+            b = None
+            if stem_ratio_b is not None:
+                b = float(stem_ratio_b)
+            elif (q_x is None or q_y is None) and (not same_master):
+                sm = stem_measure if isinstance(stem_measure, dict) else {}
+                stem_info = _stem_ratio_payload(
+                    font=font,
+                    base_master=base_master,
+                    ref_master=ref_master,
+                    reference_glyphs=sm.get("reference_glyphs"),
+                    samples=sm.get("samples", 9),
+                    band=sm.get("band", 0.2),
+                    min_width=sm.get("min_width", 5.0),
+                    max_width=sm.get("max_width"),
+                    include_components=bool(sm.get("include_components", True)),
+                    stem_source=sm.get("stem_source", "auto"),
+                    mismatch_tolerance=sm.get("mismatch_tolerance", 0.2),
                 )
+                if not stem_info.get("ok"):
+                    return {"ok": False, "error": "Unable to measure stem ratio b", "stem": stem_info}
+                b = float(stem_info.get("b"))
 
-            paths_out.append({"nodes": nodes_out, "closed": bool(getattr(pr, "closed", True))})
+            if italic_angle is None:
+                italic_angle = _coerce_numeric(getattr(base_master, "italicAngle", 0.0)) or 0.0
 
-        width_r = _coerce_numeric(getattr(layer_r, "width", None)) or 0.0
-        width_b = _coerce_numeric(getattr(layer_b, "width", None)) or 0.0
-        width_out = compensated_tuning_engine.interpolate_metric(mr=width_r, mb=width_b, s=sx_f, q=qx)
-        width_out = compensated_tuning_engine.units(width_out, round_units=bool(round_units))
+            try:
+                params, warnings = compensated_tuning_engine.resolve_tuning_params(
+                    sx=sx_f,
+                    sy=sy_f,
+                    a=a,
+                    b=b,
+                    q_x=q_x,
+                    q_y=q_y,
+                    same_master=same_master,
+                    extrapolation=extrapolation,
+                    italic_angle=float(italic_angle),
+                    translate_x=translate_x,
+                    translate_y=translate_y,
+                    round_units=round_units,
+                )
+            except compensated_tuning_engine.ExtrapolationError as exc:
+                return {"ok": False, "error": str(exc), "q{}".format(exc.axis): exc.value}
+            except ValueError as exc:
+                return {"ok": False, "error": str(exc)}
+            mode = compensated_tuning_engine.normalize_extrapolation(extrapolation)
+            qx = params["qx"]
+            qy = params["qy"]
+            shear = params["shear"]
+            for job in jobs:
+                job["params"] = params
+
+            for tuned in compensated_tuning_engine.iter_tuned_jobs(jobs, executor=executor):
+                glyph_name = tuned["glyphName"]
+                if not tuned.get("ok"):
+                    reviews[glyph_name] = {"ok": False, "error": tuned.get("error"), "details": tuned.get("details")}
+                    continue
+                reviews[glyph_name] = {
+                    "paths": tuned["paths"],
+                    "width": tuned["width"],
+                    "gmcp": {
+                        "ok": True,
+                        "glyphName": glyph_name,
+                        "baseMasterId": str(base_master_id),
+                        "refMasterId": str(ref_master_id),
+                        "inputs": {
+                            "sx": sx_f,
+                            "sy": sy_f,
+                            "keepStroke": keep_stroke,
+                            "strokeExponentA": a,
+                            "qX": q_x,
+                            "qY": q_y,
+                            "italicAngle": italic_angle,
+                            "translateX": translate_x,
+                            "translateY": translate_y,
+                            "extrapolation": mode,
+                            "roundUnits": bool(round_units),
+                        },
+                        "computed": {"b": b, "qX": qx, "qY": qy, "shear": shear, "width": tuned["width"]},
+                        "warnings": list(warnings),
+                        "stem": stem_info,
+                    },
+                }
 
-        out = {
-            "paths": paths_out,
-            "width": width_out,
-            "gmcp": {
-                "ok": True,
-                "glyphName": glyph_name,
-                "baseMasterId": str(base_master_id),
-                "refMasterId": str(ref_master_id),
-                "inputs": {
-                    "sx": sx_f,
-                    "sy": sy_f,
-                    "keepStroke": keep_stroke,
-                    "strokeExponentA": a,
-                    "qX": q_x,
-                    "qY": q_y,
-                    "italicAngle": italic_angle,
-                    "translateX": translate_x,
-                    "translateY": translate_y,
-                    "extrapolation": mode,
-                    "roundUnits": bool(round_units),
-                },
-                "computed": {"b": b, "qX": qx, "qY": qy, "shear": shear, "width": width_out},
-                "warnings": warnings,
-                "stem": stem_info,
-            },
+        return {
+            "ok": True,
+            "results": [(glyph_name, reviews[glyph_name]) for glyph_name in names],
+            "stem": stem_info,
         }
-        return out
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
 
+def _review_compensated_tuning_impl(
+    font_index: int = 0,
+    glyph_name: str = None,
+    base_master_id: str = None,
+    ref_master_id: str = None,
+    sx: float = 1.0,
+    sy: float = 1.0,
+    keep_stroke: float = 0.9,
+    stroke_exponent_a: float = None,
+    q_x: float = None,
+    q_y: float = None,
+    italic_angle: float = None,
+    translate_x: float = 0.0,
+    translate_y: float = 0.0,
+    extrapolation: str = "clamp",
+    round_units: bool = True,
+    stem_ratio_b: float = None,
+    stem_measure: dict = None,
+) -> str:
+    """Preview compensated tuning for one glyph (no mutation).
+
+    This computes tuned outlines for `glyph_name` by combining corresponding
+    nodes from `base_master_id` (R) and `ref_master_id` (B), using a
+    compensated interpolation model.
+
+    Safety:
+      - Read-only (no mutation, no auto-save).
+      - Refuses glyph layers that contain components (requires decomposed outlines).
+
+    Units:
+      - All geometric inputs/outputs are in font units.
+      - `sx`/`sy` are unitless scale factors.
+      - `q_x`/`q_y` are unitless compensation factors in the range [0..1] (may be clamped).
+
+    Args:
+      - extrapolation:
+          - "clamp" (default): clamp q to [0..1] and emit warnings
+          - "allow": allow q outside [0..1]
+          - "error": fail if q is outside [0..1]
+      - stem_ratio_b / stem_measure:
+          - If `q_x`/`q_y` are not provided (and masters differ), `b` may be measured automatically.
+
+    Returns:
+      JSON in `set_glyph_paths` format (`paths`, `width`) plus a `gmcp` block with
+      inputs, computed parameters, and warnings.
+    """
+    if not glyph_name:
+        _font, error = _resolve_font_payload(font_index)
+        return error or {"ok": False, "error": "glyph_name is required"}
+    batch = _review_compensated_tuning_batch_impl(
+        font_index=font_index,
+        glyph_names=[glyph_name],
+        base_master_id=base_master_id,
+        ref_master_id=ref_master_id,
+        sx=sx,
+        sy=sy,
+        keep_stroke=keep_stroke,
+        stroke_exponent_a=stroke_exponent_a,
+        q_x=q_x,
+        q_y=q_y,
+        italic_angle=italic_angle,
+        translate_x=translate_x,
+        translate_y=translate_y,
+        extrapolation=extrapolation,
+        round_units=round_units,
+        stem_ratio_b=stem_ratio_b,
+        stem_measure=stem_measure,
+    )
+    if not batch.get("ok"):
+        return batch
+    return batch["results"][0][1]
+
+
 def _master_weight_coord(font, master):
     # Prefer wght axis if present; fall back to weightValue.
     axes = []
@@ -565,11 +599,15 @@ def _apply_compensated_tuning_impl(
         error_count = 0
         backup_count = 0
 
+        # Destination checks first, then one batch review for every glyph
+        # that can be written.
+        targets = {}
         for name in names:
+            if name in targets:
+                continue
             glyph = font.glyphs[name]
             if not glyph:
-                results.append({"glyphName": name, "status": "error", "reason": "glyph_not_found"})
-                error_count += 1
+                targets[name] = {"glyphName": name, "status": "error", "reason": "glyph_not_found"}
                 continue
 
             try:
@@ -577,18 +615,20 @@ def _apply_compensated_tuning_impl(
             except Exception:
                 dest_layer = None
             if not dest_layer:
-                results.append({"glyphName": name, "status": "error", "reason": "dest_layer_missing", "outputMasterId": output_master_id})
-                error_count += 1
+                targets[name] = {"glyphName": name, "status": "error", "reason": "dest_layer_missing", "outputMasterId": output_master_id}
                 continue
 
             if _layer_has_components(dest_layer):
-                results.append({"glyphName": name, "status": "skipped", "reason": "dest_has_components"})
-                skipped_count += 1
+                targets[name] = {"glyphName": name, "status": "skipped", "reason": "dest_has_components"}
                 continue
+            targets[name] = (glyph, dest_layer)
 
-            review_data = _review_compensated_tuning_impl(
+        pending = [name for name in targets if isinstance(targets[name], tuple)]
+        reviews = {}
+        if pending:
+            batch = _review_compensated_tuning_batch_impl(
                 font_index=font_index,
-                glyph_name=name,
+                glyph_names=pending,
                 base_master_id=str(base_master_id),
                 ref_master_id=str(ref_master_id),
                 sx=sx,
@@ -605,6 +645,22 @@ def _apply_compensated_tuning_impl(
                 stem_ratio_b=b,
                 stem_measure=stem_measure,
             )
+            if isinstance(batch, dict) and batch.get("ok"):
+                reviews = dict(batch.get("results") or [])
+            else:
+                reviews = {str(name): batch for name in pending}
+
+        for name in names:
+            target = targets[name]
+            if isinstance(target, dict):
+                results.append(dict(target))
+                if target["status"] == "skipped":
+                    skipped_count += 1
+                else:
+                    error_count += 1
+                continue
+            glyph, dest_layer = target
+            review_data = reviews.get(str(name))
 
             if not isinstance(review_data, dict) or not review_data.get("gmcp", {}).get("ok"):
                 results.append({"glyphName": name, "status": "error", "reason": "review_failed", "details": review_data})
@@ -11,7 +11,6 @@ from tool_registration import glyphs_tool
 from mcp_tool_helpers import (
     _coerce_numeric,
     _font_resolution_error,
-    _glyph_unicode_char,
     _load_andre_fuchs_relevant_pairs,
     _open_tab_on_main_thread,
     _resolve_font_by_index,
@@ -24,6 +23,47 @@ import kerning_collision_engine
 import kerning_proof_engine
 
 
+_EDGE_PROFILE_CACHE = None
+
+
+def _edge_profile_cache():
+    """Return the process-wide edge-profile cache, created on first use."""
+
+    global _EDGE_PROFILE_CACHE
+    if _EDGE_PROFILE_CACHE is None:
+        _EDGE_PROFILE_CACHE = kerning_collision_engine.GlyphEdgeProfileCache()
+    return _EDGE_PROFILE_CACHE
+
+
+_PAIR_GAP_CACHE = None
+
+
+def _pair_gap_cache():
+    """Return the process-wide pair measurement cache, created on first use."""
+
+    global _PAIR_GAP_CACHE
+    if _PAIR_GAP_CACHE is None:
+        _PAIR_GAP_CACHE = kerning_collision_engine.PairGapCache()
+    return _PAIR_GAP_CACHE
+
+
+_DATASET_RESOLUTION_CACHE = None
+
+
+def _dataset_resolution_cache():
+    """Return the process-wide dataset char-pair -> glyph-pair cache, created on first use."""
+
+    global _DATASET_RESOLUTION_CACHE
+    if _DATASET_RESOLUTION_CACHE is None:
+        _DATASET_RESOLUTION_CACHE = kerning_collision_engine.DatasetPairResolutionCache()
+    return _DATASET_RESOLUTION_CACHE
+
+
+def _font_cache_key(font):
+    filepath = getattr(font, "filepath", None)
+    return str(filepath) if filepath else "memory:{}".format(id(font))
+
+
 def _resolve_font_payload(font_index, ok_key=None):
     font, fonts = _resolve_font_by_index(Glyphs, font_index)
     if not font:
@@ -161,58 +201,12 @@ async def generate_kerning_tab(
         if focus is not None and len(focus) == 0:
             focus = None
 
-        # Build lookups from the font.
-        unicode_to_glyphname = {}
-        unicode_to_glyphname_fallback = {}
-        glyphname_to_unicode = {}
-        left_group_rep = {}
-        right_group_rep = {}
-        glyph_left_group = {}
-        glyph_right_group = {}
-
-        for glyph in font.glyphs:
-            name = getattr(glyph, "name", None)
-            if not name:
-                continue
-
-            ch = _glyph_unicode_char(glyph)
-            if ch:
-                if name not in glyphname_to_unicode:
-                    glyphname_to_unicode[name] = ch
-
-                if getattr(glyph, "export", True):
-                    if ch not in unicode_to_glyphname:
-                        unicode_to_glyphname[ch] = name
-                else:
-                    if ch not in unicode_to_glyphname_fallback:
-                        unicode_to_glyphname_fallback[ch] = name
-
-            lgrp = getattr(glyph, "leftKerningGroup", None)
-            rgrp = getattr(glyph, "rightKerningGroup", None)
-            glyph_left_group[name] = lgrp
-            glyph_right_group[name] = rgrp
-
-            if lgrp and lgrp not in left_group_rep:
-                left_group_rep[lgrp] = name
-            if rgrp and rgrp not in right_group_rep:
-                right_group_rep[rgrp] = name
-
-        for ch, name in unicode_to_glyphname_fallback.items():
-            if ch not in unicode_to_glyphname:
-                unicode_to_glyphname[ch] = name
-
-        # Build explicit kerning set + numeric list for sorting.
-        explicit = set()
-        existing_numeric = []
-        kerning = font.kerning.get(master_id, {}) or {}
-        for left_key, right_dict in kerning.items():
-            if not right_dict:
-                continue
-            for right_key, value in right_dict.items():
-                explicit.add((str(left_key), str(right_key)))
-                v = _coerce_numeric(value)
-                if v is not None:
-                    existing_numeric.append((str(left_key), str(right_key), float(v)))
+        # Glyph lookups and explicit kerning (glyph and class keys), compiled
+        # once for the coverage checks and the audit.
+        glyph_maps = kerning_collision_engine.build_glyph_maps(font.glyphs)
+        unicode_to_glyphname = glyph_maps["unicodeToGlyphname"]
+        glyphname_to_unicode = glyph_maps["glyphnameToUnicode"]
+        kerning_index = kerning_collision_engine.KerningIndex.from_font(font, master_id, glyph_maps)
 
         ProofGlyph = kerning_proof_engine.ProofGlyph
 
@@ -256,33 +250,21 @@ async def generate_kerning_tab(
 
         missing_cap = max(int(missing_limit or 0), 0)
         if missing_cap > 0:
-            for left_char, right_char in dataset_pairs[:used_top_n]:
-                left_name = unicode_to_glyphname.get(left_char)
-                right_name = unicode_to_glyphname.get(right_char)
-                if not left_name or not right_name:
+            resolved = _dataset_resolution_cache().resolve(
+                dataset_pairs,
+                unicode_to_glyphname,
+                font_key=_font_cache_key(font),
+            )
+            for (left_char, right_char), names in zip(dataset_pairs[:used_top_n], resolved):
+                if names is None:
                     missing_skipped_no_glyph += 1
                     continue
+                left_name, right_name = names
 
                 if focus is not None and (left_name not in focus and right_name not in focus):
                     continue
 
-                left_group = glyph_left_group.get(left_name)
-                right_group = glyph_right_group.get(right_name)
-
-                candidates = [(left_name, right_name)]
-                if right_group:
-                    candidates.append((left_name, "@MMK_R_" + str(right_group)))
-                if left_group:
-                    candidates.append(("@MMK_L_" + str(left_group), right_name))
-                if left_group and right_group:
-                    candidates.append(("@MMK_L_" + str(left_group), "@MMK_R_" + str(right_group)))
-
-                covered = False
-                for cand in candidates:
-                    if cand in explicit:
-                        covered = True
-                        break
-                if covered:
+                if kerning_index.covers(left_name, right_name):
                     continue
 
                 missing_tokens.extend(_pair_tokens(left_name, left_char, right_name, right_char))
@@ -292,34 +274,14 @@ async def generate_kerning_tab(
 
         # 2) Existing extremes audit (tightest + widest).
         def _rep_for_key(key, is_left):
-            if key.startswith("@MMK_L_"):
-                group = key[len("@MMK_L_") :]
-                rep = left_group_rep.get(group)
-                if rep:
-                    return rep
-                try:
-                    if font.glyphs[group]:
-                        return group
-                except Exception:
-                    return None
-                return None
-
-            if key.startswith("@MMK_R_"):
-                group = key[len("@MMK_R_") :]
-                rep = right_group_rep.get(group)
-                if rep:
-                    return rep
-                try:
-                    if font.glyphs[group]:
-                        return group
-                except Exception:
-                    return None
-                return None
-
-            try:
-                return key if font.glyphs[key] else None
-            except Exception:
-                return None
+            return kerning_collision_engine.kerning_key_to_glyph_name(
+                key=key,
+                is_left_key=is_left,
+                name_set=glyph_maps["nameSet"],
+                id_to_name=glyph_maps["idToName"],
+                left_key_group_rep=glyph_maps["leftKeyGroupRep"],
+                right_key_group_rep=glyph_maps["rightKeyGroupRep"],
+            )
 
         def _unicode_for_name(name):
             uni = glyphname_to_unicode.get(name)
@@ -334,9 +296,8 @@ async def generate_kerning_tab(
         tight_included = 0
         wide_included = 0
 
-        audit_cap = max(int(audit_limit or 0), 0)
-        tightest = sorted(existing_numeric, key=lambda t: t[2])[:audit_cap]
-        widest = sorted(existing_numeric, key=lambda t: t[2], reverse=True)[:audit_cap]
+        # Bounded heaps: only audit_limit entries per side are kept.
+        tightest, widest = kerning_index.extremes(audit_limit)
 
         for left_key, right_key, _value in tightest:
             left_name = _rep_for_key(left_key, True)
@@ -445,8 +406,19 @@ def _kerning_bumper_analyze(
     target_gap,
     max_delta,
     explicit_pairs=None,
+    all_pairs=False,
+    class_screening=False,
+    glyph_maps=None,
+    kerning_index=None,
+    pair_kerning=None,
+    keep_profiles=False,
 ):
-    """Compute kerning collision/gap measurements + deterministic bumper suggestions (no mutation)."""
+    """Compute kerning collision/gap measurements + deterministic bumper suggestions (no mutation).
+
+    `glyph_maps`, `kerning_index` and `pair_kerning` let a multi-master sweep
+    share precomputed maps; `keep_profiles` adds the per-glyph edge profiles,
+    per-pair kerning values and per-pair class keys used for the measurement.
+    """
 
     warnings = []
 
@@ -495,7 +467,8 @@ def _kerning_bumper_analyze(
 
     focus = set(glyph_names or []) if glyph_names else None
 
-    glyph_maps = kerning_collision_engine.build_glyph_maps(getattr(font, "glyphs", []) or [])
+    if glyph_maps is None:
+        glyph_maps = kerning_collision_engine.build_glyph_maps(getattr(font, "glyphs", []) or [])
     unicode_to_glyphname = glyph_maps.get("unicodeToGlyphname") or {}
     glyphname_to_unicode = glyph_maps.get("glyphnameToUnicode") or {}
     name_set = glyph_maps.get("nameSet") or set()
@@ -503,7 +476,9 @@ def _kerning_bumper_analyze(
     left_key_group_rep = glyph_maps.get("leftKeyGroupRep") or {}
     right_key_group_rep = glyph_maps.get("rightKeyGroupRep") or {}
 
-    kerning_master = font.kerning.get(master_id, {}) or {}
+    # Compiled once per call: every pair resolves against the same index.
+    if kerning_index is None:
+        kerning_index = kerning_collision_engine.KerningIndex.from_font(font, master_id, glyph_maps)
 
     candidate_counts = {
         "pairsCandidate": 0,
@@ -532,19 +507,44 @@ def _kerning_bumper_analyze(
             pairs.append(pair)
 
         candidate_counts["pairsCandidate"] = len(pairs)
+    elif all_pairs:
+        if focus:
+            space = [name for name in (glyph_names or []) if name in name_set]
+        else:
+            space = []
+            for glyph in getattr(font, "glyphs", []) or []:
+                name = getattr(glyph, "name", None)
+                if name and name in glyphname_to_unicode and getattr(glyph, "export", True):
+                    space.append(name)
+        pairs, counts = kerning_collision_engine.build_all_glyph_pairs(
+            glyph_names=space,
+            pair_limit=int(pair_limit or 0),
+        )
+        candidate_counts["pairsCandidate"] = len(pairs)
+        if counts["pairsAllPairsSpace"] > len(pairs):
+            warnings.append(
+                "all_pairs space has {} pairs; measured the first {} (raise pair_limit to cover more).".format(
+                    counts["pairsAllPairsSpace"], len(pairs)
+                )
+            )
     else:
         pairs, counts = kerning_collision_engine.build_candidate_pairs(
             dataset_pairs=dataset_pairs or [],
             unicode_to_glyphname=unicode_to_glyphname,
             relevant_limit=int(relevant_limit or 0),
             include_existing=bool(include_existing),
-            kerning_master=kerning_master,
+            kerning_master=kerning_index.kerning if pair_kerning is None else pair_kerning,
             name_set=name_set,
             id_to_name=id_to_name,
             left_key_group_rep=left_key_group_rep,
             right_key_group_rep=right_key_group_rep,
             focus=focus,
             pair_limit=int(pair_limit or 0),
+            resolved_pairs=_dataset_resolution_cache().resolve(
+                dataset_pairs or [],
+                unicode_to_glyphname,
+                font_key=_font_cache_key(font),
+            ),
         )
         candidate_counts["pairsCandidate"] = len(pairs)
         candidate_counts["pairsSkippedNoGlyph"] += int(counts.get("pairsSkippedNoGlyph") or 0)
@@ -552,7 +552,42 @@ def _kerning_bumper_analyze(
     collisions = []
     safe_gaps = []
 
-    # Measure.
+    # Each glyph's edges are intersected once per master and grid; pairs then
+    # compare cached profiles instead of re-intersecting both outlines.
+    profile_cache = _edge_profile_cache()
+    stats_before = profile_cache.stats()
+    font_key = _font_cache_key(font)
+    profiles = {}
+    fingerprints = {}
+    left_index = {}
+    right_index = {}
+    left_profiles = []
+    right_profiles = []
+
+    def _profile(glyph_name, layer):
+        if glyph_name not in profiles:
+            fingerprints[glyph_name] = kerning_collision_engine.layer_outline_fingerprint(layer)
+            profiles[glyph_name] = profile_cache.profile(
+                layer,
+                glyph_name=glyph_name,
+                master_id=master_id,
+                step=dense_step_f,
+                include_components=True,
+                font_key=font_key,
+                fingerprint=fingerprints[glyph_name],
+            )
+        return profiles[glyph_name]
+
+    def _side_index(index, side_profiles, glyph_name):
+        if glyph_name not in index:
+            index[glyph_name] = len(side_profiles)
+            side_profiles.append(profiles[glyph_name])
+        return index[glyph_name]
+
+    # Resolve profiles and kerning first, then measure every pair in one batch.
+    jobs = []
+    job_indexes = []
+    job_kerning = []
     for left_name, right_name in pairs:
         left_glyph = font.glyphs[left_name] if left_name else None
         right_glyph = font.glyphs[right_name] if right_name else None
@@ -571,97 +606,151 @@ def _kerning_bumper_analyze(
             candidate_counts["pairsSkippedNoBounds"] += 1
             continue
 
-        lb = kerning_collision_engine.bounds_tuple(left_layer)
-        rb = kerning_collision_engine.bounds_tuple(right_layer)
-        if not lb or not rb:
+        left_profile = _profile(left_name, left_layer)
+        right_profile = _profile(right_name, right_layer)
+        if left_profile is None or right_profile is None:
             candidate_counts["pairsSkippedNoBounds"] += 1
             continue
 
-        overlap = kerning_collision_engine.overlap_y_range(lb, rb)
+        overlap = kerning_collision_engine.overlap_y_range(left_profile.bounds, right_profile.bounds)
         if not overlap:
             candidate_counts["pairsSkippedNoOverlap"] += 1
             continue
 
-        left_id = getattr(left_glyph, "id", None)
-        right_id = getattr(right_glyph, "id", None)
         left_group = getattr(left_glyph, "rightKerningGroup", None)
         right_group = getattr(right_glyph, "leftKerningGroup", None)
 
         left_class_key = "@MMK_L_" + str(left_group) if left_group else None
         right_class_key = "@MMK_R_" + str(right_group) if right_group else None
 
-        kerning_value, source = kerning_collision_engine.resolve_explicit_kerning_value(
-            kerning_master=kerning_master,
-            left_glyph_id=str(left_id) if left_id else None,
-            left_glyph_name=left_name,
-            left_class_key=left_class_key,
-            right_glyph_id=str(right_id) if right_id else None,
-            right_glyph_name=right_name,
-            right_class_key=right_class_key,
-        )
+        kerning_value, source = kerning_index.resolve(left_name, right_name)
 
-        # If available, prefer Glyphs' kerningForPair() as a sanity check / fallback.
-        try:
-            kv = font.kerningForPair(master_id, left_name, right_name)
-            kvf = _coerce_numeric(kv)
-            if kvf is not None:
-                kerning_value = float(kvf)
-        except Exception:
-            pass
-
-        measured = kerning_collision_engine.measure_pair_min_gap(
-            left_layer=left_layer,
-            right_layer=right_layer,
-            kerning_value=float(kerning_value),
-            scan_mode=scan_mode_norm,
-            scan_heights=scan_heights_norm,
-            dense_step=dense_step_f,
-            bands=bands_i,
-            include_components=True,
+        jobs.append((left_name, right_name, float(kerning_value), source, left_class_key, right_class_key))
+        job_indexes.append(
+            (
+                _side_index(left_index, left_profiles, left_name),
+                _side_index(right_index, right_profiles, right_name),
+            )
+        )
+        job_kerning.append(float(kerning_value))
+
+    # Optional class × class screening: member pairs are only measured when
+    # their class envelopes come within target_gap.
+    measure_order = list(range(len(jobs)))
+    class_screens = []
+    if class_screening:
+        measure_order, class_screens = kerning_collision_engine.screen_class_pairs(
+            left_profiles=left_profiles,
+            right_profiles=right_profiles,
+            pairs=job_indexes,
+            kerning_values=job_kerning,
+            left_classes=[job[4] for job in jobs],
+            right_classes=[job[5] for job in jobs],
             target_gap=target_gap_f,
+            bands=bands_i,
         )
-
+        candidate_counts["pairsSkippedByClassScreen"] = len(jobs) - len(measure_order)
+
+    # Reuse earlier results for pairs whose outlines, kerning and scan
+    # parameters are unchanged; only the rest go through the batch.
+    gap_cache = _pair_gap_cache()
+    scan_params = (scan_mode_norm, tuple(scan_heights_norm), bands_i, target_gap_f, dense_step_f)
+    measurements = [None] * len(measure_order)
+    reused = [False] * len(measure_order)
+    pending = []
+    pending_keys = []
+    for slot, job_index in enumerate(measure_order):
+        left_name, right_name, kerning_value = jobs[job_index][:3]
+        key = gap_cache.key(
+            font_key=font_key,
+            master_id=master_id,
+            left_name=left_name,
+            right_name=right_name,
+            left_fingerprint=fingerprints[left_name],
+            right_fingerprint=fingerprints[right_name],
+            kerning_value=kerning_value,
+            scan_params=scan_params,
+        )
+        found, cached = gap_cache.get(key)
+        if found:
+            measurements[slot] = cached
+            reused[slot] = True
+        else:
+            pending.append(slot)
+            pending_keys.append(key)
+
+    fresh = kerning_collision_engine.measure_profile_pairs(
+        left_profiles=left_profiles,
+        right_profiles=right_profiles,
+        pairs=[job_indexes[measure_order[slot]] for slot in pending],
+        kerning_values=[job_kerning[measure_order[slot]] for slot in pending],
+        scan_mode=scan_mode_norm,
+        scan_heights=scan_heights_norm,
+        bands=bands_i,
+        target_gap=target_gap_f,
+    )
+    for slot, key, measured in zip(pending, pending_keys, fresh):
+        measurements[slot] = measured
+        gap_cache.put(key, measured)
+    candidate_counts["pairsReused"] = len(measure_order) - len(pending)
+
+    member_min_gaps = {}
+    for slot, (job_index, measured) in enumerate(zip(measure_order, measurements)):
+        left_name, right_name, kerning_value, source = jobs[job_index][:4]
         if measured is None:
             candidate_counts["pairsSkippedNoBounds"] += 1
             continue
 
         candidate_counts["pairsMeasured"] += 1
-
-        # Bumper suggestion (integer kerning exception).
-        suggestion = kerning_collision_engine.compute_bumper_suggestion(
-            kerning_value=float(kerning_value),
-            measured_min_gap=float(measured.min_gap),
-            target_gap=float(target_gap_f),
-            max_delta=int(max_delta_i),
+        member_min_gaps[job_index] = float(measured.min_gap)
+
+        # Record with the bumper suggestion (integer kerning exception).
+        record = kerning_collision_engine.pair_gap_record(
+            left_name=left_name,
+            right_name=right_name,
+            kerning_value=kerning_value,
+            source=source,
+            measured=measured,
+            target_gap=target_gap_f,
+            max_delta=max_delta_i,
         )
-
-        record = {
-            "left": left_name,
-            "right": right_name,
-            "kerningValue": float(kerning_value),
-            "kerningSource": {"leftKey": source.left_key, "rightKey": source.right_key},
-            "minGap": float(measured.min_gap),
-            "worstY": float(measured.worst_y) if measured.worst_y is not None else None,
-            "bandMinGaps": list(measured.band_min_gaps or []),
-            "bumperDelta": float(suggestion.bumper_delta),
-            "recommendedException": int(suggestion.recommended_exception),
-            "refined": bool(measured.refined),
-            "sampleCount": int(measured.sample_count),
-        }
+        record["reused"] = reused[slot]
 
         if float(measured.min_gap) < float(target_gap_f):
             collisions.append(record)
         else:
-            safe_gaps.append(
-                {
-                    "left": left_name,
-                    "right": right_name,
-                    "kerningValue": float(kerning_value),
-                    "minGap": float(measured.min_gap),
-                }
-            )
+            safe = {key: record[key] for key in kerning_collision_engine.SAFE_GAP_KEYS}
+            safe["reused"] = reused[slot]
+            safe_gaps.append(safe)
+
+    class_pairs = []
+    for screen in class_screens:
+        gaps = [member_min_gaps[i] for i in screen.pair_indexes if i in member_min_gaps]
+        class_pairs.append(
+            {
+                "leftClass": screen.left_class,
+                "rightClass": screen.right_class,
+                "memberPairs": len(screen.pair_indexes),
+                "kerningFloor": float(screen.kerning_floor),
+                "envelopeMinGap": screen.lower_bound_gap,
+                "worstY": screen.worst_y,
+                "bandMinGaps": list(screen.band_min_gaps),
+                "drilled": bool(screen.drilled),
+                "membersMeasured": len(gaps),
+                "memberCollisions": sum(1 for g in gaps if g < target_gap_f),
+                "memberMinGap": min(gaps) if gaps else None,
+            }
+        )
 
-    return {
+    stats_after = profile_cache.stats()
+    edge_profiles = {
+        "glyphLayers": len(profiles),
+        "built": stats_after["misses"] - stats_before["misses"],
+        "reused": len(profiles) - (stats_after["misses"] - stats_before["misses"]),
+        "scanlines": stats_after["scanlines"] - stats_before["scanlines"],
+    }
+
+    out = {
         "warnings": warnings,
         "scanMode": scan_mode_norm,
         "scanHeights": scan_heights_norm,
@@ -674,9 +763,315 @@ def _kerning_bumper_analyze(
         "counts": candidate_counts,
         "collisions": collisions,
         "safeGaps": safe_gaps,
+        "edgeProfiles": edge_profiles,
+        "classPairs": class_pairs,
         "glyphnameToUnicode": glyphname_to_unicode,
         "unicodeToGlyphname": unicode_to_glyphname,
     }
+    if keep_profiles:
+        out["pairs"] = list(pairs)
+        out["profiles"] = profiles
+        out["pairKerning"] = {(job[0], job[1]): job[2] for job in jobs}
+        out["pairClasses"] = {(job[0], job[1]): (job[4], job[5]) for job in jobs}
+    return out
+
+
+def _class_screening_payload(class_pairs, cap):
+    collisions = sorted(
+        (r for r in class_pairs if r.get("memberCollisions")),
+        key=lambda r: float(r.get("memberMinGap") or 0.0),
+    )
+    return {
+        "classPairs": len(class_pairs),
+        "classPairsSkipped": sum(1 for r in class_pairs if not r.get("drilled")),
+        "classPairsDrilled": sum(1 for r in class_pairs if r.get("drilled")),
+        "classCollisions": collisions[:cap],
+    }
+
+
+def _design_location(obj):
+    """Axis coordinates of a master or instance (Glyphs 3 `axes`, else Glyphs 2 values)."""
+
+    try:
+        values = [float(v) for v in list(getattr(obj, "axes", None) or [])]
+    except Exception:
+        values = []
+    if values:
+        return values
+    out = []
+    for attr in ("weightValue", "widthValue", "customValue"):
+        v = _coerce_numeric(getattr(obj, attr, None))
+        if v is not None:
+            out.append(float(v))
+    return out
+
+
+def _kerning_bumper_sweep(
+    *,
+    font,
+    include_instances,
+    dataset_pairs,
+    relevant_limit,
+    include_existing,
+    pair_limit,
+    glyph_names,
+    min_gap,
+    scan_mode,
+    scan_heights,
+    dense_step,
+    bands,
+    all_pairs=False,
+    class_screening=False,
+):
+    """Measure one shared pair list at every master and, optionally, at instances between them.
+
+    Glyph maps, the candidate pair list and each master's kerning index are
+    built once; `counts` and `edgeProfiles` total every master. Instance
+    locations that lie on a master-to-master segment re-measure the masters'
+    pair list on the interpolated outlines (master nodes blended, then
+    flattened and swept) with linearly blended kerning, and go through the
+    same class screening as the masters. Because outlines move vertically
+    between masters, an instance can collide where neither master does.
+    Glyphs whose master layers are not interpolation-compatible are skipped
+    at instances.
+    """
+
+    warnings = []
+    masters = list(getattr(font, "masters", []) or [])
+    master_ids = [m.id for m in masters]
+    master_names = {m.id: str(getattr(m, "name", "") or m.id) for m in masters}
+
+    glyph_maps = kerning_collision_engine.build_glyph_maps(getattr(font, "glyphs", []) or [])
+    indexes = {mid: kerning_collision_engine.KerningIndex.from_font(font, mid, glyph_maps) for mid in master_ids}
+
+    # Existing-kerning candidates come from the union of every master's keys.
+    pair_kerning = {}
+    for index in indexes.values():
+        for left_key, right_key, value in index.items():
+            pair_kerning.setdefault(left_key, {})[right_key] = value
+
+    worst = {}
+
+    def _note(record, location, target_gap):
+        key = (record["left"], record["right"])
+        entry = worst.get(key)
+        if entry is None:
+            entry = worst[key] = {"record": None, "locationsChecked": 0, "collidingLocations": []}
+        entry["locationsChecked"] += 1
+        if float(record["minGap"]) < target_gap:
+            entry["collidingLocations"].append(location["name"])
+        if entry["record"] is None or float(record["minGap"]) < float(entry["record"]["minGap"]):
+            entry["record"] = dict(record, location=location)
+
+    pairs = None
+    base = None
+    analyses = {}
+    masters_out = []
+    counts = {}
+    edge_profiles = {}
+    for mid in master_ids:
+        analysis = _kerning_bumper_analyze(
+            font=font,
+            master_id=mid,
+            dataset_pairs=dataset_pairs,
+            relevant_limit=relevant_limit,
+            include_existing=include_existing,
+            pair_limit=pair_limit,
+            glyph_names=glyph_names,
+            min_gap=min_gap,
+            scan_mode=scan_mode,
+            scan_heights=scan_heights,
+            dense_step=dense_step,
+            bands=bands,
+            target_gap=min_gap,
+            max_delta=10**9,
+            explicit_pairs=pairs,
+            all_pairs=bool(all_pairs) and pairs is None,
+            class_screening=bool(class_screening),
+            glyph_maps=glyph_maps,
+            kerning_index=indexes[mid],
+            pair_kerning=pair_kerning,
+            keep_profiles=True,
+        )
+        if base is None:
+            base = analysis
+            pairs = analysis["pairs"]
+            warnings.extend(analysis.get("warnings") or [])
+        analyses[mid] = analysis
+        for totals, part in ((counts, analysis["counts"]), (edge_profiles, analysis["edgeProfiles"])):
+            for key, value in part.items():
+                totals[key] = totals.get(key, 0) + int(value or 0)
+
+        target_gap = float(analysis["targetGap"])
+        location = {"type": "master", "masterId": mid, "name": master_names[mid]}
+        for record in (analysis.get("collisions") or []) + (analysis.get("safeGaps") or []):
+            _note(record, location, target_gap)
+        masters_out.append(
+            {
+                "masterId": mid,
+                "name": master_names[mid],
+                "pairsMeasured": int(analysis["counts"].get("pairsMeasured") or 0),
+                "collisions": len(analysis.get("collisions") or []),
+            }
+        )
+
+    instances_out = []
+    if include_instances and base is not None:
+        master_locations = [_design_location(m) for m in masters]
+        target_gap = float(base["targetGap"])
+        skipped_off_segment = 0
+        for instance in list(getattr(font, "instances", []) or []):
+            name = str(getattr(instance, "name", "") or "")
+            segment = kerning_collision_engine.interpolation_segment(_design_location(instance), master_locations)
+            if segment is None:
+                skipped_off_segment += 1
+                continue
+            i, j, t = segment
+            if i == j:
+                continue  # Sits on a master that was already measured.
+
+            a, b = analyses[master_ids[i]], analyses[master_ids[j]]
+            interpolated = {}
+
+            def _interpolate(glyph_name):
+                if glyph_name not in interpolated:
+                    try:
+                        layers = font.glyphs[glyph_name].layers
+                        layer_a, layer_b = layers[master_ids[i]], layers[master_ids[j]]
+                    except Exception:
+                        layer_a = layer_b = None
+                    interpolated[glyph_name] = (
+                        kerning_collision_engine.interpolated_edge_profile(
+                            layer_a, layer_b, t, step=base["denseStep"], include_components=True
+                        )
+                        if layer_a is not None and layer_b is not None
+                        else None
+                    )
+                return interpolated[glyph_name]
+
+            left_index, right_index = {}, {}
+            left_profiles, right_profiles = [], []
+            job_pairs, job_indexes, job_kerning = [], [], []
+            job_classes = []
+            skipped_incompatible = 0
+            for pair in pairs:
+                if pair not in a["pairKerning"] or pair not in b["pairKerning"]:
+                    continue
+                left_profile = _interpolate(pair[0])
+                right_profile = _interpolate(pair[1])
+                if left_profile is None or right_profile is None:
+                    skipped_incompatible += 1
+                    continue
+                if not kerning_collision_engine.overlap_y_range(left_profile.bounds, right_profile.bounds):
+                    continue
+                if pair[0] not in left_index:
+                    left_index[pair[0]] = len(left_profiles)
+                    left_profiles.append(left_profile)
+                if pair[1] not in right_index:
+                    right_index[pair[1]] = len(right_profiles)
+                    right_profiles.append(right_profile)
+                ka, kb = a["pairKerning"][pair], b["pairKerning"][pair]
+                job_pairs.append(pair)
+                job_indexes.append((left_index[pair[0]], right_index[pair[1]]))
+                job_kerning.append(ka + (kb - ka) * t)
+                job_classes.append(a["pairClasses"][pair])
+
+            # Same class screening as the masters, on the instance envelopes.
+            measure_order = list(range(len(job_pairs)))
+            if class_screening:
+                measure_order, _screens = kerning_collision_engine.screen_class_pairs(
+                    left_profiles=left_profiles,
+                    right_profiles=right_profiles,
+                    pairs=job_indexes,
+                    kerning_values=job_kerning,
+                    left_classes=[classes[0] for classes in job_classes],
+                    right_classes=[classes[1] for classes in job_classes],
+                    target_gap=target_gap,
+                    bands=base["bands"],
+                )
+            skipped_by_screen = len(job_pairs) - len(measure_order)
+            job_pairs = [job_pairs[i] for i in measure_order]
+            job_indexes = [job_indexes[i] for i in measure_order]
+            job_kerning = [job_kerning[i] for i in measure_order]
+
+            measurements = kerning_collision_engine.measure_profile_pairs(
+                left_profiles=left_profiles,
+                right_profiles=right_profiles,
+                pairs=job_indexes,
+                kerning_values=job_kerning,
+                scan_mode=base["scanMode"],
+                scan_heights=base["scanHeights"],
+                bands=base["bands"],
+                target_gap=target_gap,
+            )
+
+            location = {
+                "type": "instance",
+                "name": name,
+                "masters": [master_ids[i], master_ids[j]],
+                "t": round(float(t), 4),
+            }
+            measured_count = 0
+            collision_count = 0
+            for pair, kerning_value, measured in zip(job_pairs, job_kerning, measurements):
+                if measured is None:
+                    continue
+                measured_count += 1
+                if float(measured.min_gap) < target_gap:
+                    collision_count += 1
+                suggestion = kerning_collision_engine.compute_bumper_suggestion(
+                    kerning_value=float(kerning_value),
+                    measured_min_gap=float(measured.min_gap),
+                    target_gap=target_gap,
+                    max_delta=10**9,
+                )
+                _note(
+                    {
+                        "left": pair[0],
+                        "right": pair[1],
+                        "kerningValue": float(kerning_value),
+                        "minGap": float(measured.min_gap),
+                        "worstY": float(measured.worst_y) if measured.worst_y is not None else None,
+                        "bandMinGaps": list(measured.band_min_gaps or []),
+                        "bumperDelta": float(suggestion.bumper_delta),
+                        "refined": bool(measured.refined),
+                        "sampleCount": int(measured.sample_count),
+                    },
+                    location,
+                    target_gap,
+                )
+            instance_out = dict(
+                location,
+                pairsMeasured=measured_count,
+                collisions=collision_count,
+                pairsSkippedIncompatible=skipped_incompatible,
+            )
+            if class_screening:
+                instance_out["pairsSkippedByClassScreen"] = skipped_by_screen
+            instances_out.append(instance_out)
+        if skipped_off_segment:
+            warnings.append(
+                "Skipped {} instance(s) that do not lie between two masters; blending needs a master-to-master segment.".format(
+                    skipped_off_segment
+                )
+            )
+
+    records = []
+    for entry in worst.values():
+        record = entry["record"]
+        record["locationsChecked"] = entry["locationsChecked"]
+        record["collidingLocations"] = entry["collidingLocations"]
+        records.append(record)
+
+    return {
+        "warnings": warnings,
+        "base": base,
+        "counts": counts,
+        "edgeProfiles": edge_profiles,
+        "masters": masters_out,
+        "instances": instances_out,
+        "records": records,
+    }
 
 
 @glyphs_tool()
@@ -696,6 +1091,10 @@ async def review_kerning_bumper(
     open_tab: bool = False,
     rendering: str = "hybrid",
     per_line: int = 12,
+    all_pairs: bool = False,
+    class_screening: bool = False,
+    sweep_masters: bool = False,
+    sweep_instances: bool = False,
 ) -> str:
     """Measure kerning collisions and propose conservative “bumper” exceptions.
 
@@ -714,7 +1113,41 @@ async def review_kerning_bumper(
       - `scan_heights` are normalized positions (0..1) within the pair’s vertical overlap band.
 
     Performance:
-      - Increase `pair_limit` and/or `dense_only` scans with care; this can get expensive on large fonts.
+      - Each glyph layer is intersected once per `dense_step` grid row and the
+        edge profile is cached by outline fingerprint; pairs reuse profiles.
+        `edgeProfiles` reports how many were built vs reused.
+      - Pair results are cached by both outline fingerprints, the effective
+        kerning value and the scan parameters, so a follow-up review after
+        edits only re-measures changed pairs. Records carry `reused`, and
+        `counts.pairsReused` totals them.
+      - All pairs are measured together in one batch; with NumPy available the
+        batch is broadcast over the shared scanline grid, so `pair_limit`
+        values in the 100k range stay interactive.
+      - `all_pairs=true` measures the full left × right product of
+        `glyph_names` (or of every exported encoded glyph) instead of the
+        dataset + existing-kerning list, capped at `pair_limit`.
+      - `class_screening=true` groups pairs by (left class, right class),
+        measures each group once from union class envelopes using its lowest
+        member kerning, and only measures member pairs when that bound falls
+        below `min_gap`. `classCollisions` then reports collisions per class
+        pair, matching how class kerning is edited.
+
+    Multi-master sweep:
+      - `sweep_masters=true` measures one shared pair list at every master
+        (glyph maps and pairs are built once; `master_id` is ignored). Each
+        result is the pair's worst location, with `location`,
+        `locationsChecked` and `collidingLocations`.
+      - `sweep_instances=true` also measures every instance that lies between
+        two masters on its interpolated outlines (master nodes blended before
+        intersecting) with linearly blended kerning, and the same
+        `class_screening` as the masters. Instances re-measure the masters'
+        pair list and can collide where neither master does, because shapes
+        also move vertically between masters. Glyphs whose masters are not
+        interpolation-compatible are counted in
+        `sweep.instances[].pairsSkippedIncompatible`. Brace layers are not
+        modelled. Instance records carry `bumperDelta` but no
+        `recommendedException`, because exceptions are stored per master.
+      - With a sweep, `counts` and `edgeProfiles` total every master.
 
     Notes (typography):
       - Recommendations are a collision guard, not an optical kerning engine.
@@ -737,29 +1170,58 @@ async def review_kerning_bumper(
                 )
             )
 
-        analysis = _kerning_bumper_analyze(
-            font=font,
-            master_id=master_id,
-            dataset_pairs=dataset_pairs,
-            relevant_limit=relevant_limit,
-            include_existing=include_existing,
-            pair_limit=pair_limit,
-            glyph_names=glyph_names,
-            min_gap=min_gap,
-            scan_mode=scan_mode,
-            scan_heights=scan_heights,
-            dense_step=dense_step,
-            bands=bands,
-            target_gap=min_gap,
-            max_delta=10**9,
-            explicit_pairs=None,
-        )
-
-        warnings.extend(analysis.get("warnings") or [])
+        sweep = None
+        if sweep_masters or sweep_instances:
+            sweep = _kerning_bumper_sweep(
+                font=font,
+                include_instances=bool(sweep_instances),
+                dataset_pairs=dataset_pairs,
+                relevant_limit=relevant_limit,
+                include_existing=include_existing,
+                pair_limit=pair_limit,
+                glyph_names=glyph_names,
+                min_gap=min_gap,
+                scan_mode=scan_mode,
+                scan_heights=scan_heights,
+                dense_step=dense_step,
+                bands=bands,
+                all_pairs=bool(all_pairs),
+                class_screening=bool(class_screening),
+            )
+            analysis = sweep["base"]
+            if analysis is None:
+                return _safe_json({"ok": False, "error": "Font has no masters"})
+            warnings.extend(sweep["warnings"])
+            target_gap = float(analysis["targetGap"])
+            collision_records = [r for r in sweep["records"] if float(r["minGap"]) < target_gap]
+            gap_records = [r for r in sweep["records"] if float(r["minGap"]) >= target_gap]
+        else:
+            analysis = _kerning_bumper_analyze(
+                font=font,
+                master_id=master_id,
+                dataset_pairs=dataset_pairs,
+                relevant_limit=relevant_limit,
+                include_existing=include_existing,
+                pair_limit=pair_limit,
+                glyph_names=glyph_names,
+                min_gap=min_gap,
+                scan_mode=scan_mode,
+                scan_heights=scan_heights,
+                dense_step=dense_step,
+                bands=bands,
+                target_gap=min_gap,
+                max_delta=10**9,
+                explicit_pairs=None,
+                all_pairs=bool(all_pairs),
+                class_screening=bool(class_screening),
+            )
+            warnings.extend(analysis.get("warnings") or [])
+            collision_records = analysis.get("collisions") or []
+            gap_records = analysis.get("safeGaps") or []
 
         # Sort + cap results.
-        collisions = sorted(analysis.get("collisions") or [], key=lambda r: float(r.get("minGap", 0.0)))
-        safe_gaps = sorted(analysis.get("safeGaps") or [], key=lambda r: float(r.get("minGap", 0.0)), reverse=True)
+        collisions = sorted(collision_records, key=lambda r: float(r.get("minGap", 0.0)))
+        safe_gaps = sorted(gap_records, key=lambda r: float(r.get("minGap", 0.0)), reverse=True)
 
         cap = max(int(result_limit or 0), 0) or 200
         collisions_out = collisions[:cap]
@@ -857,9 +1319,9 @@ async def review_kerning_bumper(
             {
                 "ok": True,
                 "fontIndex": font_index,
-                "masterId": master_id,
+                "masterId": None if sweep else master_id,
                 "dataset": {"id": dataset_meta.get("id") or "andre_fuchs_relevant_pairs", "usedTopN": analysis.get("usedTopN")},
-                "counts": analysis.get("counts"),
+                "counts": sweep["counts"] if sweep else analysis.get("counts"),
                 "params": {
                     "minGap": float(analysis.get("minGap")),
                     "scanMode": analysis.get("scanMode"),
@@ -868,6 +1330,9 @@ async def review_kerning_bumper(
                     "bands": int(analysis.get("bands")),
                 },
                 "results": {"collisions": collisions_out, "largestGaps": gaps_out},
+                "edgeProfiles": sweep["edgeProfiles"] if sweep else analysis.get("edgeProfiles"),
+                **({"classScreening": _class_screening_payload(analysis.get("classPairs") or [], cap)} if class_screening and not sweep else {}),
+                **({"sweep": {"masters": sweep["masters"], "instances": sweep["instances"], "pairsSwept": len(sweep["records"])}} if sweep else {}),
                 "openedTab": bool(opened_tab),
                 **({"text": text} if open_tab else {}),
                 "warnings": deduped,
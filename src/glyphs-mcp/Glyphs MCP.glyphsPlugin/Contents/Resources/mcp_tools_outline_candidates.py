@@ -874,8 +874,7 @@ def _comp_preview_impl(font_index, glyph_names, base_master_id, ref_master_id, o
     output_id = str(output_master_id or base_master_id or "")
     if not output_id or not base_master_id or not ref_master_id:
         raise ValueError("base_master_id, ref_master_id, and output_master_id are required")
-    entries = []
-    summaries = []
+    targets = []
     for name in glyph_names:
         glyph = _glyph_for_name(font, name)
         layer = _layer_for_id(glyph, output_id) if glyph else None
@@ -883,13 +882,20 @@ def _comp_preview_impl(font_index, glyph_names, base_master_id, ref_master_id, o
             raise ValueError("target_layer_not_found:{}".format(name))
         if list(_layer_components(layer)):
             raise ValueError("components_blocked:{}".format(name))
-        review = mcp_tools_compensated_tuning._review_compensated_tuning_impl(
-            font_index=font_index,
-            glyph_name=str(name),
-            base_master_id=str(base_master_id),
-            ref_master_id=str(ref_master_id),
-            **params
-        )
+        targets.append((name, glyph, layer))
+    # One batch review resolves b and the compensation factors once.
+    batch = mcp_tools_compensated_tuning._review_compensated_tuning_batch_impl(
+        font_index=font_index,
+        glyph_names=[str(name) for name in glyph_names],
+        base_master_id=str(base_master_id),
+        ref_master_id=str(ref_master_id),
+        **params
+    )
+    reviews = dict(batch.get("results") or []) if isinstance(batch, dict) else {}
+    entries = []
+    summaries = []
+    for name, glyph, layer in targets:
+        review = reviews.get(str(name))
         if not isinstance(review, dict) or not review.get("gmcp", {}).get("ok"):
             raise ValueError("compensated_tuning_review_failed:{}".format(name))
         source = _layer_snapshot(layer)
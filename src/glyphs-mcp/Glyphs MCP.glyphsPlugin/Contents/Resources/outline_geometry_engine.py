@@ -7,10 +7,20 @@ tested outside Glyphs and shared by JSON review and image rendering.
 
 from __future__ import annotations
 
+import heapq
 import math
 import statistics
+import threading
+from collections import OrderedDict
+from functools import partial
+from itertools import islice
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+try:  # Optional accelerator for batched cubic evaluation; pure Python is the fallback.
+    import numpy as np  # type: ignore[import-not-found]
+except Exception:  # pragma: no cover - depends on the selected Python runtime
+    np = None
+
 
 Point = Tuple[float, float]
 
@@ -22,6 +32,10 @@ MAX_SAMPLES_PER_CURVE = 257
 MAX_SAMPLE_DETAIL_SEGMENTS = 64
 MAX_ADAPTIVE_RECURSION = 16
 MAX_SELF_INTERSECTIONS = 8
+MAX_LAYER_INTERSECTIONS = 64
+CURVE_QUALITY_SCAN_CATEGORIES = ("spikes", "g1Discontinuities", "g2Discontinuities", "cusps", "selfIntersections")
+DEFAULT_SCAN_TOP_N = 25
+DEFAULT_SEGMENT_CACHE_BYTES = 32 * 1024 * 1024
 
 _EPSILON = 1.0e-12
 _PARALLEL_RELATIVE_EPSILON = 1.0e-9
@@ -115,6 +129,118 @@ def _grid_axis_values(value: float, grid_step: float) -> List[float]:
     return sorted(values)
 
 
+_SEGMENT_ENTRY_BYTES = 256
+_SEGMENT_ITEM_BYTES = {
+    "curvatureComb": 1200,
+    "arcLengthParameters": 32,
+    "curveEvents": 512,
+    "tunniGridCandidate": 2048,
+}
+
+
+def _estimated_bytes(kind: str, value: Any) -> int:
+    """Approximate an entry's size from its length and a per-kind item size."""
+    try:
+        count = len(value)
+    except TypeError:
+        count = 1
+    return _SEGMENT_ENTRY_BYTES + _SEGMENT_ITEM_BYTES.get(kind, 64) * count
+
+
+class SegmentAnalysisCache(object):
+    """Bounded, thread-safe LRU of per-segment analysis results.
+
+    Keys are (analysis kind, the segment's eight control coordinates, analysis
+    parameters), so identical cubics share one result across glyphs, masters,
+    tools, and Reporter redraws, and moving one node only changes the keys of
+    the segments that contain it. The budget counts estimated bytes because a
+    comb sample table is far larger than an arc-length table. Values are
+    stored as tuples and must not be mutated; callers rebuild the dicts they
+    hand out.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_SEGMENT_CACHE_BYTES) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(kind: str, points: Sequence[Point], params: Sequence[Any] = ()) -> Tuple[Any, ...]:
+        return (str(kind), tuple(float(value) for point in points for value in point), tuple(params))
+
+    def get(self, key: Tuple[Any, ...]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Tuple[Any, ...], value: Any) -> None:
+        size = _estimated_bytes(key[0], value)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _key, (_value, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+
+    def get_or_compute(self, kind: str, points: Sequence[Point], params: Sequence[Any], compute) -> Any:
+        """Return the stored value, computing and storing it on a miss.
+
+        Stored values are shared; callers must not mutate them.
+        """
+
+        key = self.key(kind, points, params)
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": int(self._bytes),
+                "maxBytes": int(self.max_bytes),
+                "hits": int(self.hits),
+                "misses": int(self.misses),
+                "evictions": int(self.evictions),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+_SEGMENT_ANALYSIS_CACHE: Optional[SegmentAnalysisCache] = None
+
+
+def segment_analysis_cache() -> SegmentAnalysisCache:
+    """Return the process-wide segment cache shared by review tools and the Reporter."""
+    global _SEGMENT_ANALYSIS_CACHE
+    if _SEGMENT_ANALYSIS_CACHE is None:
+        _SEGMENT_ANALYSIS_CACHE = SegmentAnalysisCache()
+    return _SEGMENT_ANALYSIS_CACHE
+
+
 def _tunni_metrics_for_points(
     p0: Point,
     p1: Point,
@@ -164,6 +290,117 @@ def _tunni_metrics_for_points(
     }
 
 
+def _grid_handle_candidates(
+    anchor: Point,
+    handle: Point,
+    ideal: Point,
+    *,
+    grid_step: float,
+    max_move: float,
+    min_handle_length: float,
+    max_tangent_deviation_deg: float,
+) -> List[Dict[str, Any]]:
+    """Grid points near `ideal` that keep this handle's tangent and length limits."""
+
+    original = _sub(handle, anchor)
+    candidates = []
+    for x in _grid_axis_values(ideal[0], grid_step):
+        for y in _grid_axis_values(ideal[1], grid_step):
+            point = (x, y)
+            tangent = _sub(point, anchor)
+            if _dot(tangent, original) <= 0.0 or _length(_sub(point, handle)) > max_move:
+                continue
+            angle = _angle_degrees(original, tangent)
+            length = _length(tangent)
+            if angle > max_tangent_deviation_deg or length < min_handle_length:
+                continue
+            candidates.append(
+                {
+                    "point": point,
+                    "tangent": tangent,
+                    "direction": _scale(tangent, 1.0 / length),
+                    "length": length,
+                    "angle": angle,
+                    "turn": math.atan2(_cross(original, tangent), _dot(original, tangent)),
+                }
+            )
+    return candidates
+
+
+def _half_turn_angle(value: float) -> float:
+    """Fold an angle in radians into ``(-pi/2, pi/2]``."""
+
+    while value > math.pi / 2.0:
+        value -= math.pi
+    while value <= -math.pi / 2.0:
+        value += math.pi
+    return value
+
+
+def _handle_groups(candidates: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Bisect turn-ordered handle candidates into a tree of bounding groups."""
+
+    group = {
+        "members": candidates,
+        "low": candidates[0],
+        "high": candidates[-1],
+        "minLength": min(item["length"] for item in candidates),
+        "maxLength": max(item["length"] for item in candidates),
+        "children": (),
+    }
+    if len(candidates) > 2:
+        middle = len(candidates) // 2
+        group["children"] = (_handle_groups(candidates[:middle]), _handle_groups(candidates[middle:]))
+    return group
+
+
+def _tunni_imbalance_lower_bound(
+    delta: Point,
+    first: Dict[str, Any],
+    parallel_turn: float,
+    group: Dict[str, Any],
+) -> float:
+    """Lower bound on the imbalance of `first` paired with any handle in `group`.
+
+    Handle ratios are the reciprocals of the Tunni intersection parameters
+    ``s`` (along the first handle) and ``e`` (along the second), so the
+    imbalance equals ``|s - e| / max(s, e)``. While the second tangent turns
+    through the group's range without becoming parallel to the first, the
+    distance along the first tangent is monotone and the distance along the
+    second is monotone on either side of the perpendicular, so both ranges
+    follow from the group's two extreme directions. Returns ``inf`` when no
+    pairing puts the Tunni point ahead of both on-curve points and ``0.0``
+    when the range cannot be bounded.
+    """
+
+    low = group["low"]["turn"]
+    high = group["high"]["turn"]
+    margin = 1.0e-9
+    if high - low >= math.pi / 2.0 or low - margin <= parallel_turn <= high + margin:
+        return 0.0
+    direction1 = first["direction"]
+    along_first = []
+    along_second = []
+    for extreme in (group["low"], group["high"]):
+        determinant = _cross(direction1, extreme["direction"])
+        along_first.append(_cross(delta, extreme["direction"]) / determinant)
+        along_second.append(_cross(delta, direction1) / determinant)
+    if max(along_first) <= 0.0 or along_second[0] <= 0.0:
+        return math.inf
+    second_min = min(along_second)
+    if low <= _half_turn_angle(parallel_turn + math.pi / 2.0) <= high:
+        second_min = abs(_cross(delta, direction1))
+    s_low = max(min(along_first), 0.0) / first["length"]
+    s_high = max(along_first) / first["length"]
+    e_low = second_min / group["maxLength"]
+    e_high = max(along_second) / group["minLength"]
+    if s_high < e_low:
+        return 1.0 - s_high / e_low
+    if e_high < s_low:
+        return 1.0 - e_high / s_low
+    return 0.0
+
+
 def _best_grid_tunni_candidate(
     p0: Point,
     p1: Point,
@@ -178,72 +415,106 @@ def _best_grid_tunni_candidate(
     min_handle_length: float,
     max_tangent_deviation_deg: float,
 ) -> Optional[Dict[str, Any]]:
-    original1 = _sub(p1, p0)
-    original2 = _sub(p2, p3)
+    """Return the on-grid handle pair with the smallest ranking key.
+
+    The key is (imbalance, worst tangent deviation, squared distance to the
+    ideal handles, coordinates). Each handle's grid neighbourhood is filtered
+    once for tangent and movement limits. For every first handle, groups of
+    second handles are skipped when their imbalance lower bound exceeds the
+    best pair so far, and single pairs are screened on their intersection
+    parameters before the full metrics are built.
+    """
+
     max_move = upm * 0.25
+    limits = {
+        "grid_step": grid_step,
+        "max_move": max_move,
+        "min_handle_length": min_handle_length,
+        "max_tangent_deviation_deg": max_tangent_deviation_deg,
+    }
+    firsts = _grid_handle_candidates(p0, p1, ideal1, **limits)
+    seconds = _grid_handle_candidates(p3, p2, ideal2, **limits)
+    if not firsts or not seconds:
+        return None
+    seconds.sort(key=lambda item: item["turn"])
+    root = _handle_groups(seconds)
+    base2 = _sub(p2, p3)
+    delta = _sub(p3, p0)
+    imbalance_limit = imbalance_threshold + 1.0e-12
+    slack = 1.0e-9
     best = None
     best_key = None
-    points1 = [
-        (x, y)
-        for x in _grid_axis_values(ideal1[0], grid_step)
-        for y in _grid_axis_values(ideal1[1], grid_step)
-    ]
-    points2 = [
-        (x, y)
-        for x in _grid_axis_values(ideal2[0], grid_step)
-        for y in _grid_axis_values(ideal2[1], grid_step)
-    ]
-    for candidate1 in points1:
-        tangent1 = _sub(candidate1, p0)
-        if _dot(tangent1, original1) <= 0.0 or _length(_sub(candidate1, p1)) > max_move:
-            continue
-        angle1 = _angle_degrees(original1, tangent1)
-        if angle1 > max_tangent_deviation_deg:
-            continue
-        for candidate2 in points2:
-            tangent2 = _sub(candidate2, p3)
-            if _dot(tangent2, original2) <= 0.0 or _length(_sub(candidate2, p2)) > max_move:
-                continue
-            angle2 = _angle_degrees(original2, tangent2)
-            if angle2 > max_tangent_deviation_deg:
-                continue
-            metrics = _tunni_metrics_for_points(
-                p0,
-                candidate1,
-                candidate2,
-                p3,
-                upm=upm,
-                min_handle_length=min_handle_length,
-            )
-            if metrics is None or metrics["relativeImbalance"] > imbalance_threshold + 1.0e-12:
-                continue
-            ideal_distance = (
-                (candidate1[0] - ideal1[0]) ** 2
-                + (candidate1[1] - ideal1[1]) ** 2
-                + (candidate2[0] - ideal2[0]) ** 2
-                + (candidate2[1] - ideal2[1]) ** 2
-            )
-            key = (
-                float(metrics["relativeImbalance"]),
-                max(float(angle1), float(angle2)),
-                float(ideal_distance),
-                float(candidate1[0]),
-                float(candidate1[1]),
-                float(candidate2[0]),
-                float(candidate2[1]),
-            )
-            if best_key is None or key < best_key:
-                best_key = key
-                best = {
-                    "handle1": candidate1,
-                    "handle2": candidate2,
-                    "metrics": metrics,
-                    "tangentDeviationDeg": {
-                        "handle1": float(angle1),
-                        "handle2": float(angle2),
-                        "maximum": max(float(angle1), float(angle2)),
-                    },
-                }
+
+    def consider(first: Dict[str, Any], second: Dict[str, Any]) -> None:
+        nonlocal best, best_key
+        ceiling = imbalance_limit if best_key is None else best_key[0]
+        v1 = first["tangent"]
+        v2 = second["tangent"]
+        determinant = _cross(v1, v2)
+        if abs(determinant) <= max(_PARALLEL_RELATIVE_EPSILON * first["length"] * second["length"], _EPSILON):
+            return
+        start_parameter = _cross(delta, v2) / determinant
+        end_parameter = _cross(delta, v1) / determinant
+        if start_parameter <= 0.0 or end_parameter <= 0.0:
+            return
+        if abs(start_parameter - end_parameter) / max(start_parameter, end_parameter) > ceiling + slack:
+            return
+        candidate1 = first["point"]
+        candidate2 = second["point"]
+        metrics = _tunni_metrics_for_points(
+            p0,
+            candidate1,
+            candidate2,
+            p3,
+            upm=upm,
+            min_handle_length=min_handle_length,
+        )
+        if metrics is None or metrics["relativeImbalance"] > ceiling:
+            return
+        angle1 = first["angle"]
+        angle2 = second["angle"]
+        ideal_distance = (
+            (candidate1[0] - ideal1[0]) ** 2
+            + (candidate1[1] - ideal1[1]) ** 2
+            + (candidate2[0] - ideal2[0]) ** 2
+            + (candidate2[1] - ideal2[1]) ** 2
+        )
+        key = (
+            float(metrics["relativeImbalance"]),
+            max(float(angle1), float(angle2)),
+            float(ideal_distance),
+            float(candidate1[0]),
+            float(candidate1[1]),
+            float(candidate2[0]),
+            float(candidate2[1]),
+        )
+        if best_key is None or key < best_key:
+            best_key = key
+            best = {
+                "handle1": candidate1,
+                "handle2": candidate2,
+                "metrics": metrics,
+                "tangentDeviationDeg": {
+                    "handle1": float(angle1),
+                    "handle2": float(angle2),
+                    "maximum": max(float(angle1), float(angle2)),
+                },
+            }
+
+    def search(first: Dict[str, Any], parallel_turn: float, group: Dict[str, Any]) -> None:
+        if not group["children"]:
+            for second in group["members"]:
+                consider(first, second)
+            return
+        ceiling = imbalance_limit if best_key is None else best_key[0]
+        if _tunni_imbalance_lower_bound(delta, first, parallel_turn, group) > ceiling + slack:
+            return
+        for child in group["children"]:
+            search(first, parallel_turn, child)
+
+    for first in firsts:
+        direction1 = first["direction"]
+        search(first, _half_turn_angle(math.atan2(_cross(base2, direction1), _dot(base2, direction1))), root)
     return best
 
 
@@ -492,19 +763,28 @@ def analyze_tunni_segment(
         result["proposed"] = dict(result["idealProposed"])
         result["grid"] = {"policy": "continuous", "onGrid": None}
     else:
-        candidate = _best_grid_tunni_candidate(
-            p0,
-            p1,
-            p2,
-            p3,
-            proposed1,
-            proposed2,
-            upm=upm_value,
-            grid_step=grid_value,
-            imbalance_threshold=imbalance_value,
-            min_handle_length=minimum_handle_value,
-            max_tangent_deviation_deg=float(angle_limit),
+        cached = segment_analysis_cache().get_or_compute(
+            "tunniGridCandidate",
+            (p0, p1, p2, p3),
+            (proposed1, proposed2, upm_value, grid_value, imbalance_value, minimum_handle_value, float(angle_limit)),
+            lambda: (
+                _best_grid_tunni_candidate(
+                    p0,
+                    p1,
+                    p2,
+                    p3,
+                    proposed1,
+                    proposed2,
+                    upm=upm_value,
+                    grid_step=grid_value,
+                    imbalance_threshold=imbalance_value,
+                    min_handle_length=minimum_handle_value,
+                    max_tangent_deviation_deg=float(angle_limit),
+                ),
+            ),
         )
+        # Read-only: every payload value below is rebuilt from the candidate.
+        candidate = cached[0]
         if candidate is None:
             result["grid"] = {
                 "policy": "font",
@@ -639,9 +919,152 @@ def cubic_sample(points: Sequence[Point], t: float) -> Dict[str, Any]:
     }
 
 
+def numpy_available() -> bool:
+    return np is not None
+
+
+def _sample_normal(sample: Dict[str, Any]) -> Optional[Point]:
+    speed = sample["speed"]
+    if sample["curvature"] is None or speed <= _EPSILON:
+        return None
+    derivative = sample["derivative"]
+    return (derivative[1] / speed, -derivative[0] / speed)
+
+
+def _cubic_kernel_arrays(controls: Any, parameters: Any) -> Dict[str, Any]:
+    """Evaluate `(N, 4, 2)` controls at `(N, S)` parameters with NumPy.
+
+    Positions and derivatives use the same operation order as `cubic_sample`.
+    """
+
+    t = np.clip(parameters, 0.0, 1.0)[:, :, None]
+    u = 1.0 - t
+    p0, p1, p2, p3 = (controls[:, index, None, :] for index in range(4))
+    point = u * u * u * p0 + 3.0 * u * u * t * p1 + 3.0 * u * t * t * p2 + t * t * t * p3
+    derivative = 3.0 * (u * u * (p1 - p0) + 2.0 * u * t * (p2 - p1) + t * t * (p3 - p2))
+    second = 6.0 * (u * (p2 - 2.0 * p1 + p0) + t * (p3 - 2.0 * p2 + p1))
+    speed = np.hypot(derivative[:, :, 0], derivative[:, :, 1])
+    cross = derivative[:, :, 0] * second[:, :, 1] - derivative[:, :, 1] * second[:, :, 0]
+    valid = speed > _EPSILON
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        curvature = np.where(valid, cross / np.where(valid, speed * speed * speed, 1.0), np.nan)
+        normal = derivative[:, :, ::-1] / np.where(valid, speed, 1.0)[:, :, None]
+    normal[:, :, 1] *= -1.0
+    return {
+        "t": t[:, :, 0],
+        "point": point,
+        "derivative": derivative,
+        "secondDerivative": second,
+        "speed": speed,
+        "curvature": curvature,
+        "normal": normal,
+    }
+
+
+def cubic_samples(
+    segments: Sequence[Sequence[Point]],
+    parameters: Sequence[Any],
+    *,
+    use_numpy: Optional[bool] = None,
+) -> List[List[Dict[str, Any]]]:
+    """Evaluate many cubics at once; one list of `cubic_sample` dicts per segment.
+
+    `segments` holds `(N, 4, 2)` control points. `parameters` is either one
+    sequence of ``t`` values shared by every segment or one sequence per
+    segment. Each sample also carries the unit comb ``normal`` (``None`` where
+    the tangent is degenerate). The NumPy kernel evaluates every sample in one
+    call; without NumPy (or with ``use_numpy=False``) `cubic_sample` runs per
+    sample.
+    """
+
+    segment_list = [tuple(segment) for segment in segments]
+    if len(parameters) and not isinstance(parameters[0], (int, float)):
+        rows = [[float(t) for t in row] for row in parameters]
+    else:
+        rows = [[float(t) for t in parameters]] * len(segment_list)
+    if len(rows) != len(segment_list):
+        raise ValueError("parameters must be shared or have one row per segment")
+    if not any(rows):
+        return [[] for _row in rows]
+    if use_numpy is None:
+        use_numpy = np is not None
+    if not use_numpy or np is None or not segment_list:
+        output = []
+        for points, row in zip(segment_list, rows):
+            samples = [cubic_sample(points, t) for t in row]
+            for sample in samples:
+                sample["normal"] = _sample_normal(sample)
+            output.append(samples)
+        return output
+    if len({len(row) for row in rows}) > 1:
+        return [cubic_samples([points], [row], use_numpy=True)[0] for points, row in zip(segment_list, rows)]
+
+    arrays = _cubic_kernel_arrays(
+        np.asarray(segment_list, dtype=np.float64).reshape(-1, 4, 2),
+        np.asarray(rows, dtype=np.float64).reshape(len(segment_list), -1),
+    )
+    columns = {key: value.tolist() for key, value in arrays.items()}
+    output = []
+    for index in range(len(segment_list)):
+        samples = []
+        for t, point, derivative, second, speed, curvature, normal in zip(
+            columns["t"][index],
+            columns["point"][index],
+            columns["derivative"][index],
+            columns["secondDerivative"][index],
+            columns["speed"][index],
+            columns["curvature"][index],
+            columns["normal"][index],
+        ):
+            degenerate = not math.isfinite(curvature)
+            samples.append(
+                {
+                    "t": t,
+                    "point": tuple(point),
+                    "derivative": tuple(derivative),
+                    "secondDerivative": tuple(second),
+                    "speed": speed,
+                    "curvature": None if degenerate else curvature,
+                    "normal": None if degenerate else tuple(normal),
+                }
+            )
+        output.append(samples)
+    return output
+
+
 def curvature_comb_samples(points: Sequence[Point], *, sample_count: int = DEFAULT_SAMPLES_PER_CURVE) -> List[Dict[str, Any]]:
+    return curvature_comb_samples_batch([points], sample_count=sample_count)[0]
+
+
+def curvature_comb_samples_batch(
+    segments: Sequence[Sequence[Point]],
+    *,
+    sample_count: int = DEFAULT_SAMPLES_PER_CURVE,
+    use_numpy: Optional[bool] = None,
+) -> List[List[Dict[str, Any]]]:
+    """Uniform-parameter comb samples for every segment in one kernel call.
+
+    Segments already in `segment_analysis_cache()` are not re-evaluated; the
+    misses share one kernel call.
+    """
+
     count = clamp_samples_per_curve(sample_count)
-    return [cubic_sample(points, index / float(count - 1)) for index in range(count)]
+    segment_list = [tuple(segment) for segment in segments]
+    vectorized = (np is not None) if use_numpy is None else bool(use_numpy) and np is not None
+    cache = segment_analysis_cache()
+    keys = [cache.key("curvatureComb", points, (count, vectorized)) for points in segment_list]
+    results = [cache.get(key) for key in keys]
+    missing = [index for index, samples in enumerate(results) if samples is None]
+    if missing:
+        computed = cubic_samples(
+            [segment_list[index] for index in missing],
+            [index / float(count - 1) for index in range(count)],
+            use_numpy=use_numpy,
+        )
+        for index, samples in zip(missing, computed):
+            results[index] = tuple(samples)
+            cache.put(keys[index], results[index])
+    return [[dict(sample) for sample in samples] for samples in results]
 
 
 def _quadratic_roots(a: float, b: float, c: float) -> List[float]:
@@ -746,12 +1169,30 @@ def cubic_arc_length(points: Sequence[Point], *, tolerance: float = 1.0e-7) -> f
 
 def _arc_length_parameters(points: Sequence[Point], sample_count: int) -> List[float]:
     count = clamp_samples_per_curve(sample_count)
+    table = segment_analysis_cache().get_or_compute(
+        "arcLengthParameters",
+        points,
+        (count, np is not None),
+        lambda: tuple(_compute_arc_length_parameters(points, count)),
+    )
+    return list(table)
+
+
+def _compute_arc_length_parameters(points: Sequence[Point], count: int) -> List[float]:
     dense_count = min(2049, max(129, (count - 1) * 8 + 1))
     dense_t = [index / float(dense_count - 1) for index in range(dense_count)]
-    dense_points = [cubic_sample(points, t)["point"] for t in dense_t]
-    cumulative = [0.0]
-    for index in range(1, dense_count):
-        cumulative.append(cumulative[-1] + _length(_sub(dense_points[index], dense_points[index - 1])))
+    if np is not None:
+        dense = _cubic_kernel_arrays(
+            np.asarray(points, dtype=np.float64).reshape(1, 4, 2),
+            np.asarray([dense_t], dtype=np.float64),
+        )["point"][0]
+        steps = np.diff(dense, axis=0)
+        cumulative = [0.0] + np.cumsum(np.hypot(steps[:, 0], steps[:, 1])).tolist()
+    else:
+        dense_points = [cubic_sample(points, t)["point"] for t in dense_t]
+        cumulative = [0.0]
+        for index in range(1, dense_count):
+            cumulative.append(cumulative[-1] + _length(_sub(dense_points[index], dense_points[index - 1])))
     total = cumulative[-1]
     if total <= _EPSILON:
         return [index / float(count - 1) for index in range(count)]
@@ -822,36 +1263,291 @@ def _line_intersection(a0: Point, a1: Point, b0: Point, b1: Point) -> Optional[T
     return t, u, _add(a0, _scale(r, t))
 
 
+def _sweep_overlapping_pairs(boxes: Sequence[Tuple[float, float, float, float]]) -> List[Tuple[int, int]]:
+    """Return index pairs `(i, j)`, `i < j`, whose `(x0, y0, x1, y1)` boxes overlap.
+
+    Boxes enter a sweep in `x0` order and leave the active set once the sweep
+    passes their `x1`, so only boxes sharing an x-interval are compared.
+    """
+
+    order = sorted(range(len(boxes)), key=lambda index: boxes[index][0])
+    active: List[int] = []
+    pairs: List[Tuple[int, int]] = []
+    for index in order:
+        x0, y0, _x1, y1 = boxes[index]
+        active = [other for other in active if boxes[other][2] >= x0]
+        for other in active:
+            if boxes[other][1] <= y1 and y0 <= boxes[other][3]:
+                pairs.append((other, index) if other < index else (index, other))
+        active.append(index)
+    pairs.sort()
+    return pairs
+
+
+def _polyline_boxes(points: Sequence[Point]) -> List[Tuple[float, float, float, float]]:
+    return [
+        (
+            min(points[index][0], points[index + 1][0]),
+            min(points[index][1], points[index + 1][1]),
+            max(points[index][0], points[index + 1][0]),
+            max(points[index][1], points[index + 1][1]),
+        )
+        for index in range(len(points) - 1)
+    ]
+
+
+class _GridDeduplicator:
+    """Reject values within `tolerance` (per axis) of one already accepted."""
+
+    def __init__(self, tolerance: float) -> None:
+        self.tolerance = float(tolerance)
+        self._cells: Dict[Tuple[Any, ...], List[Tuple[float, ...]]] = {}
+
+    def add(self, values: Tuple[float, ...], group: Tuple[Any, ...] = ()) -> bool:
+        cell = tuple(int(math.floor(value / self.tolerance)) for value in values)
+        for offsets in _neighbour_offsets(len(values)):
+            key = group + tuple(base + offset for base, offset in zip(cell, offsets))
+            for other in self._cells.get(key, ()):
+                if all(abs(value - previous) < self.tolerance for value, previous in zip(values, other)):
+                    return False
+        self._cells.setdefault(group + cell, []).append(values)
+        return True
+
+
+def _neighbour_offsets(dimensions: int) -> List[Tuple[int, ...]]:
+    offsets: List[Tuple[int, ...]] = [()]
+    for _ in range(dimensions):
+        offsets = [prefix + (step,) for prefix in offsets for step in (-1, 0, 1)]
+    return offsets
+
+
 def _self_intersections(points: Sequence[Point], upm: float) -> List[Dict[str, Any]]:
     flattened = _flatten_cubic(points, max(float(upm) * 1.0e-5, 1.0e-6))
     found: List[Dict[str, Any]] = []
+    seen = _GridDeduplicator(1.0e-4)
     segment_count = len(flattened) - 1
-    for first in range(segment_count):
-        for second in range(first + 2, segment_count):
-            if first == 0 and second == segment_count - 1:
-                continue
-            intersection = _line_intersection(
-                flattened[first][1], flattened[first + 1][1],
-                flattened[second][1], flattened[second + 1][1],
-            )
-            if intersection is None:
-                continue
-            local_first, local_second, point = intersection
-            t1 = flattened[first][0] + local_first * (flattened[first + 1][0] - flattened[first][0])
-            t2 = flattened[second][0] + local_second * (flattened[second + 1][0] - flattened[second][0])
-            if abs(t1 - t2) <= 1.0e-5:
-                continue
-            if any(abs(t1 - item["t1"]) < 1.0e-4 and abs(t2 - item["t2"]) < 1.0e-4 for item in found):
-                continue
-            found.append({"t1": float(t1), "t2": float(t2), "point": _point_payload(point)})
-            if len(found) >= MAX_SELF_INTERSECTIONS:
-                return found
+    for first, second in _sweep_overlapping_pairs(_polyline_boxes([point for _t, point in flattened])):
+        if second < first + 2 or (first == 0 and second == segment_count - 1):
+            continue
+        intersection = _line_intersection(
+            flattened[first][1], flattened[first + 1][1],
+            flattened[second][1], flattened[second + 1][1],
+        )
+        if intersection is None:
+            continue
+        local_first, local_second, point = intersection
+        t1 = flattened[first][0] + local_first * (flattened[first + 1][0] - flattened[first][0])
+        t2 = flattened[second][0] + local_second * (flattened[second + 1][0] - flattened[second][0])
+        if abs(t1 - t2) <= 1.0e-5:
+            continue
+        if not seen.add((t1, t2)):
+            continue
+        found.append({"t1": float(t1), "t2": float(t2), "point": _point_payload(point)})
+        if len(found) >= MAX_SELF_INTERSECTIONS:
+            return found
     return found
 
 
+def _intersection_side(
+    segment_id: int,
+    t: float,
+    segment_keys: Sequence[Tuple[int, int]],
+    segment_nodes: Sequence[Tuple[int, int]],
+    endpoint: float,
+) -> Tuple[Any, ...]:
+    path_index = segment_keys[segment_id][0]
+    if t <= endpoint:
+        return ("node", path_index, segment_nodes[segment_id][0])
+    if t >= 1.0 - endpoint:
+        return ("node", path_index, segment_nodes[segment_id][1])
+    return ("segment", segment_id)
+
+
+def _leaving_direction(polyline: Sequence[Point]) -> Optional[float]:
+    origin = polyline[0]
+    for point in polyline[1:]:
+        dx, dy = point[0] - origin[0], point[1] - origin[1]
+        if abs(dx) > _EPSILON or abs(dy) > _EPSILON:
+            return math.atan2(dy, dx)
+    return None
+
+
+def _crosses_at_node(directions_a: Sequence[float], directions_b: Sequence[float]) -> bool:
+    """Whether two contours meeting at a node pass through each other there.
+
+    Each side contributes the two directions leaving the node. The contours
+    cross when B's directions fall strictly on opposite sides of A's pair;
+    a shared direction is a touch, not a crossing.
+    """
+
+    if len(directions_a) != 2 or len(directions_b) != 2:
+        return False
+    start = directions_a[0]
+    sweep = (directions_a[1] - start) % (2.0 * math.pi)
+    sides = []
+    for angle in directions_b:
+        offset = (angle - start) % (2.0 * math.pi)
+        if min(offset, 2.0 * math.pi - offset) < 1.0e-9 or abs(offset - sweep) < 1.0e-9:
+            return False
+        sides.append(offset < sweep)
+    return sides[0] != sides[1]
+
+
+def layer_intersections(
+    paths: Sequence[Dict[str, Any]],
+    *,
+    upm: float,
+    max_results: int = MAX_LAYER_INTERSECTIONS,
+) -> Dict[str, Any]:
+    """Find crossings between different segments of all paths in a layer.
+
+    `paths` holds `{"nodes": [...], "closed": bool}` entries using the same
+    plain node dictionaries as `analyze_curve_quality_path`. Every line and
+    cubic segment is flattened, candidate edges are paired by a bounding-box
+    sweep, and hits are deduplicated through a grid hash. A crossing exactly at
+    an on-curve node is keyed by that node rather than by the two segments
+    meeting there, so it is reported once. Neighbouring segments that only
+    touch at their shared node are not reported, and when a hit lies on a node
+    of both contours it is reported only if they cross there rather than
+    touch; loops inside one cubic are `analyze_curve_events` self-intersections.
+    """
+
+    tolerance = max(float(upm) * 1.0e-5, 1.0e-6)
+    edges: List[Tuple[int, float, float]] = []
+    points: List[Point] = []
+    boxes: List[Tuple[float, float, float, float]] = []
+    segment_keys: List[Tuple[int, int]] = []
+    segment_nodes: List[Tuple[int, int]] = []
+    node_directions: Dict[Tuple[Any, ...], List[float]] = {}
+    for path_index, path in enumerate(paths):
+        for segment in _path_segments(path.get("nodes") or [], bool(path.get("closed", True))):
+            if segment["kind"] == "curve":
+                flattened = _flatten_cubic(segment["points"], tolerance)
+            else:
+                flattened = [(0.0, segment["points"][0]), (1.0, segment["points"][1])]
+            segment_id = len(segment_keys)
+            segment_keys.append((path_index, int(segment["segmentEndNodeIndex"])))
+            segment_nodes.append((int(segment["startNodeIndex"]), int(segment["endNodeIndex"])))
+            polyline = [point for _t, point in flattened]
+            for node_index, leaving in (
+                (segment_nodes[-1][0], _leaving_direction(polyline)),
+                (segment_nodes[-1][1], _leaving_direction(polyline[::-1])),
+            ):
+                if leaving is not None:
+                    node_directions.setdefault(("node", path_index, node_index), []).append(leaving)
+            for index, box in enumerate(_polyline_boxes(polyline)):
+                edges.append((segment_id, flattened[index][0], flattened[index + 1][0]))
+                points.append(polyline[index])
+                points.append(polyline[index + 1])
+                boxes.append(box)
+
+    limit = max(int(max_results), 0)
+    found: List[Dict[str, Any]] = []
+    seen = _GridDeduplicator(max(tolerance * 10.0, 1.0e-4))
+    truncated = False
+    endpoint = 1.0e-6
+    for first, second in _sweep_overlapping_pairs(boxes):
+        segment_a, a0, a1 = edges[first]
+        segment_b, b0, b1 = edges[second]
+        if segment_a == segment_b:
+            continue
+        intersection = _line_intersection(points[2 * first], points[2 * first + 1], points[2 * second], points[2 * second + 1])
+        if intersection is None:
+            continue
+        local_first, local_second, point = intersection
+        t1 = a0 + local_first * (a1 - a0)
+        t2 = b0 + local_second * (b1 - b0)
+        if segment_a > segment_b:
+            segment_a, segment_b, t1, t2 = segment_b, segment_a, t2, t1
+        side_a = _intersection_side(segment_a, t1, segment_keys, segment_nodes, endpoint)
+        side_b = _intersection_side(segment_b, t2, segment_keys, segment_nodes, endpoint)
+        if side_a[0] == "node" and side_b[0] == "node":
+            if side_a == side_b or not _crosses_at_node(
+                node_directions.get(side_a, ()), node_directions.get(side_b, ())
+            ):
+                continue
+        sides = (side_a, side_b) if side_a <= side_b else (side_b, side_a)
+        if not seen.add(point, sides):
+            continue
+        if len(found) >= limit:
+            truncated = True
+            break
+        path1, segment1 = segment_keys[segment_a]
+        path2, segment2 = segment_keys[segment_b]
+        found.append(
+            {
+                "pathIndex1": path1,
+                "segmentEndNodeIndex1": segment1,
+                "t1": float(t1),
+                "pathIndex2": path2,
+                "segmentEndNodeIndex2": segment2,
+                "t2": float(t2),
+                "point": _point_payload(point),
+            }
+        )
+    found.sort(key=lambda item: (item["pathIndex1"], item["segmentEndNodeIndex1"], item["t1"], item["pathIndex2"], item["segmentEndNodeIndex2"]))
+    return {
+        "intersections": found,
+        "count": len(found),
+        "truncated": truncated,
+        "segmentCount": len(segment_keys),
+        "edgeCount": len(edges),
+    }
+
+
+def _turn_rate(points: Sequence[Point], t: float) -> float:
+    sample = cubic_sample(points, t)
+    return _cross(sample["derivative"], sample["secondDerivative"]) / max(sample["speed"] ** 2, _EPSILON)
+
+
 def analyze_curve_events(points: Sequence[Point], *, upm: float) -> Dict[str, Any]:
     """Return bounded analytic/adaptive events for one finite cubic."""
 
+    frozen = segment_analysis_cache().get_or_compute(
+        "curveEvents",
+        points,
+        (float(upm),),
+        lambda: _freeze_curve_events(_compute_curve_events(points, upm=upm)),
+    )
+    return _thaw_curve_events(frozen)
+
+
+_CURVE_EVENT_LISTS = ("extrema", "inflections", "stationaryPoints", "cusps", "selfIntersections")
+
+
+def _freeze_curve_events(events: Dict[str, Any]) -> Tuple[Any, ...]:
+    lists = tuple(
+        tuple(
+            tuple((key, (value["x"], value["y"]) if key == "point" else value) for key, value in event.items())
+            for event in events[name]
+        )
+        for name in _CURVE_EVENT_LISTS
+    )
+    turn = events["turningAngle"]
+    return lists + (
+        events["arcLength"],
+        events["normalizedArcLength"],
+        turn["signedDegrees"],
+        turn["absoluteDegrees"],
+    )
+
+
+def _thaw_curve_events(frozen: Tuple[Any, ...]) -> Dict[str, Any]:
+    out: Dict[str, Any] = {
+        name: [
+            {key: _point_payload(value) if key == "point" else value for key, value in event}
+            for event in frozen[index]
+        ]
+        for index, name in enumerate(_CURVE_EVENT_LISTS)
+    }
+    arc_length, normalized, signed, absolute = frozen[len(_CURVE_EVENT_LISTS):]
+    out["arcLength"] = arc_length
+    out["normalizedArcLength"] = normalized
+    out["turningAngle"] = {"signedDegrees": signed, "absoluteDegrees": absolute}
+    return out
+
+
+def _compute_curve_events(points: Sequence[Point], *, upm: float) -> Dict[str, Any]:
     a, b, c, _d = _cubic_coefficients(points)
     extrema: List[Dict[str, Any]] = []
     for axis, coordinate in (("x", 0), ("y", 1)):
@@ -885,20 +1581,14 @@ def analyze_curve_events(points: Sequence[Point], *, upm: float) -> Dict[str, An
     length = cubic_arc_length(points)
     turn_tolerance = 1.0e-8
     signed_turn = _adaptive_integral(
-        lambda t: (
-            _cross(cubic_sample(points, t)["derivative"], cubic_sample(points, t)["secondDerivative"])
-            / max(cubic_sample(points, t)["speed"] ** 2, _EPSILON)
-        ),
+        lambda t: _turn_rate(points, t),
         0.0,
         1.0,
         turn_tolerance,
         MAX_ADAPTIVE_RECURSION,
     )
     absolute_turn = _adaptive_integral(
-        lambda t: abs(
-            _cross(cubic_sample(points, t)["derivative"], cubic_sample(points, t)["secondDerivative"])
-            / max(cubic_sample(points, t)["speed"] ** 2, _EPSILON)
-        ),
+        lambda t: abs(_turn_rate(points, t)),
         0.0,
         1.0,
         turn_tolerance,
@@ -956,7 +1646,7 @@ def analyze_curve_segment(
 
     if analysis_mode == "adaptive":
         sample_parameters = _arc_length_parameters(segment["points"], samples_per_curve)
-        samples = [cubic_sample(segment["points"], t) for t in sample_parameters]
+        samples = cubic_samples([segment["points"]], [sample_parameters])[0]
     else:
         samples = curvature_comb_samples(segment["points"], sample_count=samples_per_curve)
     valid = [float(sample["curvature"]) for sample in samples if sample.get("curvature") is not None]
@@ -1312,19 +2002,221 @@ def _curve_quality_rejection(
     }
 
 
+def curve_quality_findings(review: Dict[str, Any]) -> List[Tuple[str, float, Dict[str, Any]]]:
+    """Return `(category, score, finding)` triples from one path review.
+
+    Higher scores are worse. An infinite spike ratio scores `math.inf`.
+    """
+
+    findings: List[Tuple[str, float, Dict[str, Any]]] = []
+    for segment in review.get("segments") or []:
+        if not segment.get("ok"):
+            continue
+        segment_index = int(segment["segmentEndNodeIndex"])
+        for warning in segment.get("warnings") or []:
+            if warning.get("code") != "curvature_spike":
+                continue
+            infinite = bool(warning.get("ratioInfinite"))
+            score = math.inf if infinite else float(warning.get("ratio") or 0.0)
+            findings.append((
+                "spikes",
+                score,
+                {"segmentEndNodeIndex": segment_index, "ratio": None if infinite else score, "ratioInfinite": infinite},
+            ))
+        events = segment.get("events") or {}
+        cusps = events.get("cusps") or []
+        if cusps:
+            findings.append((
+                "cusps",
+                float(len(cusps)),
+                {"segmentEndNodeIndex": segment_index, "count": len(cusps), "t": [float(item["t"]) for item in cusps]},
+            ))
+        crossings = events.get("selfIntersections") or []
+        if crossings:
+            findings.append((
+                "selfIntersections",
+                float(len(crossings)),
+                {"segmentEndNodeIndex": segment_index, "count": len(crossings), "points": [item["point"] for item in crossings]},
+            ))
+    for join in review.get("joins") or []:
+        angle = join.get("g1AngleDegrees")
+        if join.get("declaredSmooth") and angle is not None and not join.get("g1Continuous", True):
+            findings.append(("g1Discontinuities", float(angle), {"nodeIndex": int(join["nodeIndex"]), "angleDegrees": float(angle)}))
+        for warning in join.get("warnings") or ([join["warning"]] if join.get("warning") else []):
+            if warning.get("code") == "curvature_discontinuity":
+                ratio = float(warning.get("ratio") or 0.0)
+                findings.append(("g2Discontinuities", ratio, {"nodeIndex": int(join["nodeIndex"]), "ratio": ratio}))
+    return findings
+
+
+class CurveQualityRanking:
+    """Keep the `top_n` worst findings per category in bounded min-heaps."""
+
+    def __init__(self, top_n: int = DEFAULT_SCAN_TOP_N) -> None:
+        self.top_n = max(int(top_n), 0)
+        self._heaps: Dict[str, List[Tuple[float, int, Dict[str, Any]]]] = {
+            category: [] for category in CURVE_QUALITY_SCAN_CATEGORIES
+        }
+        self.counts: Dict[str, int] = {category: 0 for category in CURVE_QUALITY_SCAN_CATEGORIES}
+        self._sequence = 0
+
+    def add(self, category: str, score: float, finding: Dict[str, Any]) -> None:
+        self.counts[category] += 1
+        self._sequence += 1
+        # Earlier findings win ties, so the ranking is stable for a fixed scan order.
+        item = (float(score), -self._sequence, finding)
+        heap = self._heaps[category]
+        if len(heap) < self.top_n:
+            heapq.heappush(heap, item)
+        elif self.top_n and item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+
+    def ranked(self) -> Dict[str, List[Dict[str, Any]]]:
+        return {
+            category: [dict(finding, rank=rank) for rank, (_score, _order, finding) in enumerate(sorted(heap, key=lambda entry: entry[:2], reverse=True), 1)]
+            for category, heap in self._heaps.items()
+        }
+
+
+def _scan_curve_quality_chunk(jobs: Sequence[Dict[str, Any]], options: Dict[str, Any]) -> List[Dict[str, Any]]:
+    results = []
+    for job in jobs:
+        review = analyze_curve_quality_path(job["nodes"], closed=bool(job.get("closed", True)), upm=job["upm"], **options)
+        results.append({
+            "ok": bool(review.get("ok")),
+            "reason": review.get("reason"),
+            "segmentCount": int(review["summary"]["analyzedSegmentCount"]),
+            "findings": curve_quality_findings(review) if review.get("ok") else [],
+        })
+    return results
+
+
+def scan_curve_quality(
+    jobs: Iterable[Dict[str, Any]],
+    *,
+    top_n: int = DEFAULT_SCAN_TOP_N,
+    samples_per_curve: int = DEFAULT_SAMPLES_PER_CURVE,
+    discontinuity_threshold: float = 0.25,
+    spike_ratio_threshold: float = 4.0,
+    analysis_mode: str = "adaptive",
+    executor: Any = None,
+    chunk_size: int = 32,
+) -> Dict[str, Any]:
+    """Rank curve-quality findings over many plain path snapshots.
+
+    Each job is `{"nodes", "closed", "upm", "target"}`; `target` is copied into
+    every finding. Only compact findings leave the workers, so with an
+    `executor` (for example a `ProcessPoolExecutor`) chunks of `chunk_size`
+    paths are analyzed in parallel while the ranking stays bounded.
+    """
+
+    options = {
+        "samples_per_curve": samples_per_curve,
+        "discontinuity_threshold": discontinuity_threshold,
+        "spike_ratio_threshold": spike_ratio_threshold,
+        "include_samples": False,
+        "analysis_mode": analysis_mode,
+    }
+    size = max(int(chunk_size or 0), 1)
+    iterator = iter(jobs)
+    chunks = iter(lambda: list(islice(iterator, size)), [])
+    work = partial(_scan_curve_quality_chunk, options=options)
+    ranking = CurveQualityRanking(top_n)
+    path_count = 0
+    segment_count = 0
+    rejected: Dict[str, int] = {}
+
+    def consume(chunk: List[Dict[str, Any]], results: List[Dict[str, Any]]) -> None:
+        nonlocal path_count, segment_count
+        for job, result in zip(chunk, results):
+            path_count += 1
+            segment_count += result["segmentCount"]
+            if not result["ok"]:
+                reason = str(result.get("reason") or "rejected")
+                rejected[reason] = rejected.get(reason, 0) + 1
+                continue
+            for category, score, finding in result["findings"]:
+                ranking.add(category, score, dict(job.get("target") or {}, score=None if math.isinf(score) else score, **finding))
+
+    if executor is None:
+        for chunk in chunks:
+            consume(chunk, work(chunk))
+    else:
+        pending = list(chunks)
+        for chunk, results in zip(pending, executor.map(work, pending)):
+            consume(chunk, results)
+    return {
+        "findings": ranking.ranked(),
+        "counts": dict(ranking.counts),
+        "pathCount": path_count,
+        "analyzedSegmentCount": segment_count,
+        "rejectedPaths": rejected,
+        "topN": ranking.top_n,
+    }
+
+
+def _analyze_tunni_chunk(jobs: Sequence[Dict[str, Any]], options: Dict[str, Any]) -> List[List[Dict[str, Any]]]:
+    return [
+        analyze_tunni_path(job["nodes"], closed=bool(job.get("closed", True)), upm=job["upm"], **options)
+        for job in jobs
+    ]
+
+
+def analyze_tunni_jobs(
+    jobs: Iterable[Dict[str, Any]],
+    *,
+    imbalance_threshold: float = 0.05,
+    min_handle_length: float = 1.0,
+    grid_step: Optional[float] = None,
+    executor: Any = None,
+    chunk_size: int = 32,
+) -> List[List[Dict[str, Any]]]:
+    """Tunni-review every cubic of many plain path snapshots.
+
+    Jobs use the `scan_curve_quality` shape; one segment list is returned per
+    job, in job order. With an `executor`, chunks of `chunk_size` paths are
+    analyzed in parallel.
+    """
+
+    options = {
+        "imbalance_threshold": imbalance_threshold,
+        "min_handle_length": min_handle_length,
+        "grid_step": grid_step,
+    }
+    size = max(int(chunk_size or 0), 1)
+    iterator = iter(jobs)
+    chunks = iter(lambda: list(islice(iterator, size)), [])
+    work = partial(_analyze_tunni_chunk, options=options)
+    results: List[List[Dict[str, Any]]] = []
+    for reviewed in (map(work, chunks) if executor is None else executor.map(work, list(chunks))):
+        results.extend(reviewed)
+    return results
+
+
 __all__ = [
     "CURVE_QUALITY_DATA_VERSION",
+    "CURVE_QUALITY_SCAN_CATEGORIES",
+    "CurveQualityRanking",
     "DEFAULT_SAMPLES_PER_CURVE",
+    "DEFAULT_SEGMENT_CACHE_BYTES",
     "GEOMETRY_DATA_VERSION",
     "MAX_SAMPLE_DETAIL_SEGMENTS",
+    "SegmentAnalysisCache",
     "analyze_curve_events",
     "analyze_curve_quality_path",
+    "analyze_tunni_jobs",
     "analyze_tunni_path",
     "analyze_tunni_segment",
     "clamp_samples_per_curve",
     "cubic_arc_length",
     "cubic_sample",
+    "cubic_samples",
     "cubic_segment_end_indices",
     "curvature_comb_samples",
+    "curvature_comb_samples_batch",
+    "curve_quality_findings",
     "extract_cubic_segment",
+    "layer_intersections",
+    "scan_curve_quality",
+    "segment_analysis_cache",
 ]
@@ -0,0 +1,132 @@
+"""Tests for the headless UFO spacing regression benchmark."""
+
+from __future__ import annotations
+
+import copy
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SCRIPTS = REPO_ROOT / "scripts"
+if str(SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS))
+
+HAS_DEFCON = importlib.util.find_spec("defcon") is not None
+
+
+def _rect(glyph, x0, y0, x1, y1):
+    pen = glyph.getPen()
+    pen.moveTo((x0, y0))
+    pen.lineTo((x0, y1))
+    pen.lineTo((x1, y1))
+    pen.lineTo((x1, y0))
+    pen.closePath()
+
+
+def _write_ufo(path: Path) -> Path:
+    from defcon import Font
+
+    font = Font()
+    font.info.unitsPerEm = 1000
+    font.info.xHeight = 500
+    font.info.capHeight = 700
+    for name, codepoint, width, box in (
+        ("H", 0x48, 600, (50, 0, 550, 700)),
+        ("n", 0x6E, 500, (60, 0, 440, 500)),
+        ("o", 0x6F, 520, (40, 0, 480, 500)),
+    ):
+        glyph = font.newGlyph(name)
+        glyph.unicodes = [codepoint]
+        glyph.width = width
+        _rect(glyph, *box)
+    glyph = font.newGlyph("Hcomp")
+    glyph.unicodes = [0x0126]
+    glyph.width = 620
+    glyph.getPen().addComponent("H", (1, 0, 0, 1, 20, 0))
+    font.save(str(path))
+    return path
+
+
+@unittest.skipUnless(HAS_DEFCON, "defcon is not installed")
+class BenchmarkSpacingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        import benchmark_spacing as bench
+
+        self.bench = bench
+        self.tmp = tempfile.TemporaryDirectory()
+        self.ufo = _write_ufo(Path(self.tmp.name) / "Regular.ufo")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_adapter_layers_report_shipped_sidebearings(self) -> None:
+        import benchmark_ufo_adapter as ufo_adapter
+
+        font = ufo_adapter.load_ufo(self.ufo, master_id="m", master_name="Regular")
+        layer = font.glyphs["Hcomp"].layers["m"]
+        self.assertEqual((layer.LSB, layer.RSB), (70.0, 50.0))
+
+    def test_report_counts_layers_reads_and_deviation(self) -> None:
+        result = self.bench.run([self.ufo], repeat=1)
+        master = result["masters"][0]
+        self.assertEqual(master["name"], "Regular")
+        self.assertEqual(master["layers"], 4)
+        self.assertEqual(master["statuses"], {"ok": 4})
+        # Adapter layers are read as plain nodes: one edge table per layer,
+        # no per-scanline intersection calls.
+        self.assertEqual(master["edgeTableBuildsPerLayer"], 1.0)
+        self.assertEqual(master["intersectionCallsPerLayer"], 0.0)
+        self.assertGreater(master["layersPerSecond"], 0)
+        self.assertGreater(master["peakMemoryBytes"], 0)
+        self.assertEqual(master["deviation"]["glyphs"], 4)
+        self.assertEqual(set(master["suggestions"]), {"H", "Hcomp", "n", "o"})
+        worst = master["largestDeviations"][0]
+        self.assertEqual(worst["deviation"], max(abs(value) for value in worst["delta"]))
+
+    def test_baseline_gate_flags_changed_suggestions_and_extra_calls(self) -> None:
+        report = self.bench.run([self.ufo], repeat=1)
+        same = self.bench.compare_to_baseline(report, copy.deepcopy(report), max_slowdown=-1)
+        self.assertTrue(same["passed"])
+        self.assertEqual(same["masters"][0]["suggestionsChanged"], 0)
+
+        baseline = copy.deepcopy(report)
+        entry = baseline["masters"][0]
+        entry["suggestions"]["n"] = [entry["suggestions"]["n"][0] + 3, entry["suggestions"]["n"][1]]
+        entry["intersectionCallsPerLayer"] = -1.0
+        gated = self.bench.compare_to_baseline(report, baseline, max_slowdown=-1)
+        self.assertFalse(gated["passed"])
+        self.assertEqual(
+            {failure["metric"] for failure in gated["failures"]},
+            {"suggestions", "intersectionCallsPerLayer"},
+        )
+        loose = self.bench.compare_to_baseline(
+            report,
+            baseline,
+            max_slowdown=-1,
+            suggestion_tolerance=3,
+        )
+        self.assertEqual(
+            [failure["metric"] for failure in loose["failures"]],
+            ["intersectionCallsPerLayer"],
+        )
+
+    def test_call_counter_restores_originals(self) -> None:
+        import benchmark_ufo_adapter as ufo_adapter
+        import scanline_engine
+
+        original = scanline_engine.EdgeTable.__dict__["from_layer"]
+        with self.bench.CallCounter().installed():
+            pass
+        self.assertIs(scanline_engine.EdgeTable.__dict__["from_layer"], original)
+        self.assertEqual(
+            ufo_adapter._Layer.__dict__["intersectionsBetweenPoints"].__name__,
+            "intersectionsBetweenPoints",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
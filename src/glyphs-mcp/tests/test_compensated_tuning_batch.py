@@ -0,0 +1,110 @@
+"""Tests for the headless compensated tuning batch script."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SCRIPTS = REPO_ROOT / "scripts"
+if str(SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS))
+
+HAS_DEFCON = importlib.util.find_spec("defcon") is not None
+
+
+def _polygon(glyph, points):
+    pen = glyph.getPen()
+    pen.moveTo(points[0])
+    for point in points[1:]:
+        pen.lineTo(point)
+    pen.closePath()
+
+
+def _write_ufo(path: Path, stem: int) -> Path:
+    from defcon import Font
+
+    font = Font()
+    font.info.unitsPerEm = 1000
+    font.info.xHeight = 500
+    font.info.capHeight = 700
+    for index in range(6):
+        glyph = font.newGlyph("bar{}".format(index))
+        glyph.width = 200 + stem + index
+        _polygon(glyph, [(50, 0), (50, 700 - index), (50 + stem, 700 - index), (50 + stem, 0)])
+    glyph = font.newGlyph("H")
+    glyph.width = 600
+    _polygon(glyph, [(50, 0), (50, 700), (50 + stem, 700), (50 + stem, 0)])
+    _polygon(glyph, [(550 - stem, 0), (550 - stem, 700), (550, 700), (550, 0)])
+    glyph = font.newGlyph("odd")
+    glyph.width = 300
+    if stem > 100:
+        _polygon(glyph, [(0, 0), (0, 100), (100, 100)])
+    else:
+        _polygon(glyph, [(0, 0), (0, 100), (100, 100), (100, 0)])
+    glyph = font.newGlyph("comp")
+    glyph.width = 600
+    glyph.getPen().addComponent("H", (1, 0, 0, 1, 0, 0))
+    font.save(str(path))
+    return path
+
+
+@unittest.skipUnless(HAS_DEFCON, "defcon is not installed")
+class CompensatedTuningBatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        import compensated_tuning_batch as batch
+
+        self.batch = batch
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.base = _write_ufo(root / "Regular.ufo", 80)
+        self.ref = _write_ufo(root / "Bold.ufo", 160)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_measures_b_and_skips_incompatible_glyphs(self) -> None:
+        result = self.batch.run(self.base, self.ref, sx=0.8, sy=0.8, workers=1)
+        self.assertAlmostEqual(result["stem"]["b"], 2.0)
+        self.assertEqual(
+            {(item["glyphName"], item["reason"]) for item in result["skipped"]},
+            {("odd", "incompatible"), ("comp", "components")},
+        )
+        names = [item["glyphName"] for item in result["glyphs"]]
+        self.assertEqual(sorted(names), sorted(["H"] + ["bar{}".format(i) for i in range(6)]))
+        self.assertTrue(all(item["ok"] for item in result["glyphs"]))
+
+    def test_process_pool_matches_serial_run(self) -> None:
+        serial = self.batch.run(self.base, self.ref, sx=0.8, sy=0.7, b=2.0, workers=1)
+        pooled = self.batch.run(
+            self.base,
+            self.ref,
+            sx=0.8,
+            sy=0.7,
+            b=2.0,
+            workers=2,
+            chunk_size=2,
+        )
+        self.assertEqual(serial["glyphs"], pooled["glyphs"])
+        self.assertEqual(pooled["workers"], 2)
+
+    def test_write_ufo_adds_suffixed_glyphs(self) -> None:
+        from defcon import Font
+
+        result = self.batch.run(self.base, self.ref, sx=0.8, sy=0.8, b=2.0, workers=1)
+        output = Path(self.tmp.name) / "Tuned.ufo"
+        self.batch.write_ufo(self.base, output, result["glyphs"], ".sc")
+        font = Font(str(output))
+        tuned = next(item for item in result["glyphs"] if item["glyphName"] == "H")
+        self.assertIn("H.sc", font)
+        self.assertEqual(font["H.sc"].width, tuned["width"])
+        self.assertEqual(len(font["H.sc"]), 2)
+        self.assertEqual(font["H"].width, 600)
+
+
+if __name__ == "__main__":
+    unittest.main()
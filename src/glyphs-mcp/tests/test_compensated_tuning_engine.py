@@ -40,6 +40,26 @@ class CompensatedTuningEngineTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             compensated_tuning_engine.compute_q(scale=0.9, b=1.0, a=0.0)
 
+    def test_resolve_tuning_params_clamps_and_reports_warnings(self) -> None:
+        params, warnings = compensated_tuning_engine.resolve_tuning_params(
+            sx=0.8, sy=1.0, a=0.0, b=1.7, q_y=1.4, italic_angle=0.0
+        )
+        self.assertAlmostEqual(params["qx"], 0.6428571428571429, places=9)
+        self.assertEqual(params["qy"], 1.0)
+        self.assertEqual(warnings, ["clamped_qy"])
+        self.assertEqual((params["shear"], params["tx"], params["round_units"]), (0.0, 0.0, True))
+
+        same, warnings = compensated_tuning_engine.resolve_tuning_params(sx=0.8, sy=0.8, a=0.0, same_master=True)
+        self.assertEqual((same["qx"], same["qy"]), (1.0, 1.0))
+        self.assertEqual(warnings, ["base_and_ref_same_using_geometric_qx", "base_and_ref_same_using_geometric_qy"])
+
+        with self.assertRaises(compensated_tuning_engine.ExtrapolationError) as raised:
+            compensated_tuning_engine.resolve_tuning_params(sx=0.8, sy=1.0, a=0.0, b=1.7, q_y=1.4, extrapolation="error")
+        self.assertEqual((raised.exception.axis, raised.exception.value), ("y", 1.4))
+        self.assertIsInstance(raised.exception, ValueError)
+        with self.assertRaises(ValueError):
+            compensated_tuning_engine.resolve_tuning_params(sx=0.8, sy=1.0, a=0.0)
+
     def test_black_runs_from_intersections_pairs(self) -> None:
         runs = compensated_tuning_engine.black_runs_from_intersections([10, 30, 50, 70])
         self.assertEqual(runs, [20.0, 20.0])
@@ -48,6 +68,18 @@ class CompensatedTuningEngineTests(unittest.TestCase):
         runs = compensated_tuning_engine.black_runs_from_intersections([10, 30, 50])
         self.assertEqual(runs, [20.0])
 
+    def test_black_runs_for_scanlines_keeps_scanline_order(self) -> None:
+        runs = compensated_tuning_engine.black_runs_for_scanlines([(10, 30, 50, 90), [], (5, 5, 7)])
+        self.assertEqual(runs, [[20.0, 40.0], [], []])
+
+    def test_stem_thickness_from_runs_matches_scanline_path(self) -> None:
+        scanlines = [[10, 30, 50, 75], [12, 33, 52, 70, 80], [0, 2, 10, 31]]
+        runs = compensated_tuning_engine.black_runs_for_scanlines(scanlines)
+        self.assertEqual(
+            compensated_tuning_engine.stem_thickness_from_runs(runs_per_scanline=runs, min_width=5.0),
+            compensated_tuning_engine.stem_thickness_from_scanlines(scanlines_xs=scanlines, min_width=5.0),
+        )
+
     def test_stem_thickness_from_scanlines_median_of_medians(self) -> None:
         scanlines = [
             [10, 30, 50, 70],  # runs 20,20 -> median 20
@@ -77,6 +109,122 @@ class CompensatedTuningEngineTests(unittest.TestCase):
         self.assertAlmostEqual(y, 200.0, places=9)
         self.assertAlmostEqual(x, 88.0, places=9)
 
+    def _transform_cases(self):
+        import random
+
+        rng = random.Random(18)
+        base = [(rng.uniform(-1200, 1200), rng.uniform(-400, 1200)) for _ in range(500)]
+        ref = [(x + rng.uniform(-90, 90), y + rng.uniform(-90, 90)) for x, y in base]
+        # Exact half-unit ties on both sides of zero, zeros, and large coordinates.
+        ties = [(0.5, -0.5), (-0.5, 0.5), (1.5, -2.5), (-1e6 - 0.5, 1e6 + 0.5), (0.0, -0.0)]
+        base += ties
+        ref += ties
+        params = [
+            {"sx": 1.0, "sy": 1.0, "qx": 1.0, "qy": 1.0},
+            {"sx": 0.8, "sy": 0.72, "qx": 0.64, "qy": 0.55, "shear": 0.2125565616700221},
+            {"sx": 0.87, "sy": 0.8, "qx": 1.3, "qy": -0.2, "shear": -0.1, "tx": 12.5, "ty": -3.5},
+        ]
+        return base, ref, params
+
+    def test_transform_points_matches_scalar_transform(self) -> None:
+        base, ref, params_list = self._transform_cases()
+        for params in params_list:
+            for round_units in (True, False):
+                expected = []
+                for (xr, yr), (xb, yb) in zip(base, ref):
+                    x, y = compensated_tuning_engine.transform_point(xr=xr, yr=yr, xb=xb, yb=yb, **params)
+                    expected.append((
+                        compensated_tuning_engine.units(x, round_units=round_units),
+                        compensated_tuning_engine.units(y, round_units=round_units),
+                    ))
+                with self.subTest(params=params, round_units=round_units):
+                    pure = compensated_tuning_engine.transform_points(base, ref, round_units=round_units, use_numpy=False, **params)
+                    self.assertEqual(pure, expected)
+
+    def test_numpy_transform_points_is_bit_identical(self) -> None:
+        if not compensated_tuning_engine.numpy_available():
+            self.skipTest("numpy is not installed")
+        base, ref, params_list = self._transform_cases()
+        for params in params_list:
+            for round_units in (True, False):
+                with self.subTest(params=params, round_units=round_units):
+                    pure = compensated_tuning_engine.transform_points(base, ref, round_units=round_units, use_numpy=False, **params)
+                    fast = compensated_tuning_engine.transform_points(base, ref, round_units=round_units, use_numpy=True, **params)
+                    self.assertEqual(pure, fast)
+                    for (px, py), (fx, fy) in zip(pure, fast):
+                        self.assertIs(type(fx), type(px))
+                        self.assertIs(type(fy), type(py))
+        self.assertEqual(compensated_tuning_engine.transform_points([], [], sx=1, sy=1, qx=1, qy=1, use_numpy=True), [])
+        with self.assertRaises(ValueError):
+            compensated_tuning_engine.transform_points([(0.0, 0.0)], [], sx=1, sy=1, qx=1, qy=1, use_numpy=True)
+
+    def test_numpy_rounding_matches_scalar_ties(self) -> None:
+        if not compensated_tuning_engine.numpy_available():
+            self.skipTest("numpy is not installed")
+        import numpy
+
+        values = [-2.5, -1.5, -0.5, -0.49999999999999994, -0.0, 0.0, 0.49999999999999994, 0.5, 1.5, 2.5, 4503599627370495.5]
+        self.assertEqual(
+            compensated_tuning_engine._round_half_away_from_zero_array(numpy.asarray(values)),
+            [compensated_tuning_engine.round_half_away_from_zero(value) for value in values],
+        )
+
+    def _snapshot(self, points, width, node_types=None):
+        node_types = node_types or ["line"] * len(points)
+        nodes = [[float(x), float(y), t, False] for (x, y), t in zip(points, node_types)]
+        return {"width": float(width), "paths": [{"closed": True, "nodes": nodes}]}
+
+    def test_snapshot_compatibility_reports_first_mismatch(self) -> None:
+        base = self._snapshot([(0, 0), (0, 100), (50, 100)], 100)
+        ok, info = compensated_tuning_engine.snapshot_compatibility(base, base)
+        self.assertTrue(ok)
+        self.assertIsNone(info)
+        ref = self._snapshot([(0, 0), (0, 120), (60, 120)], 120, ["line", "curve", "line"])
+        ok, info = compensated_tuning_engine.snapshot_compatibility(base, ref)
+        self.assertFalse(ok)
+        self.assertEqual(info, {"reason": "node_type_mismatch", "pathIndex": 0, "nodeIndex": 1, "typeBase": "line", "typeRef": "curve"})
+        self.assertNotEqual(
+            compensated_tuning_engine.outline_signature(base),
+            compensated_tuning_engine.outline_signature(ref),
+        )
+
+    def test_tune_snapshot_matches_point_transform(self) -> None:
+        base = self._snapshot([(100, 0), (100.5, 700), (180, 700)], 281)
+        ref = self._snapshot([(90, 0), (90, 700), (251, 700)], 343)
+        params = {"sx": 0.87, "sy": 0.8, "qx": 0.7, "qy": 0.6, "shear": 0.2, "tx": 3.0, "ty": -1.0}
+        tuned = compensated_tuning_engine.tune_snapshot(base, ref, **params)
+        for node, nr, nb in zip(tuned["paths"][0]["nodes"], base["paths"][0]["nodes"], ref["paths"][0]["nodes"]):
+            x, y = compensated_tuning_engine.transform_point(xr=nr[0], yr=nr[1], xb=nb[0], yb=nb[1], **params)
+            self.assertEqual((node["x"], node["y"]), (
+                compensated_tuning_engine.round_half_away_from_zero(x),
+                compensated_tuning_engine.round_half_away_from_zero(y),
+            ))
+        width = compensated_tuning_engine.interpolate_metric(mr=281, mb=343, s=0.87, q=0.7)
+        self.assertEqual(tuned["width"], compensated_tuning_engine.round_half_away_from_zero(width))
+        self.assertEqual(tuned, compensated_tuning_engine.tune_snapshot(base, ref, use_numpy=False, **params))
+
+    def test_iter_tuned_jobs_with_process_pool_keeps_order(self) -> None:
+        from concurrent.futures import ProcessPoolExecutor
+
+        params = {"sx": 0.9, "sy": 0.9, "qx": 0.8, "qy": 0.8}
+        jobs = [
+            {
+                "glyphName": "g{}".format(index),
+                "base": self._snapshot([(index, 0), (index, 100), (index + 50, 100)], 100 + index),
+                "ref": self._snapshot([(index, 0), (index, 100), (index + 80, 100)], 130 + index),
+                "params": params,
+            }
+            for index in range(7)
+        ]
+        jobs[3]["ref"] = self._snapshot([(0, 0), (0, 100)], 100)
+        serial = list(compensated_tuning_engine.iter_tuned_jobs(jobs))
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            pooled = list(compensated_tuning_engine.iter_tuned_jobs(jobs, executor=executor, chunk_size=2))
+        self.assertEqual(serial, pooled)
+        self.assertEqual([result["glyphName"] for result in pooled], ["g{}".format(i) for i in range(7)])
+        self.assertFalse(pooled[3]["ok"])
+        self.assertEqual(pooled[3]["details"]["reason"], "node_count_mismatch")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -61,8 +61,23 @@ def _font_resolution_error(font_index, fonts=None, ok_key=None):
     return payload
 
 
+def _resources_dir() -> Path:
+    return _module_path().parent
+
+
+def _node(x, y, node_type="line", smooth=False):
+    node = types.SimpleNamespace(position=types.SimpleNamespace(x=float(x), y=float(y)), type=node_type, smooth=smooth)
+    return node
+
+
+def _tuning_layer(points, width, node_types=None):
+    types_list = node_types or ["line"] * len(points)
+    nodes = [_node(x, y, t) for (x, y), t in zip(points, types_list)]
+    return types.SimpleNamespace(paths=[types.SimpleNamespace(nodes=nodes, closed=True)], components=[], width=width)
+
+
 class CompensatedTuningToolWrapperTests(unittest.TestCase):
-    def _load_module(self, font) -> types.ModuleType:
+    def _load_module(self, font, real_engine=False) -> types.ModuleType:
         glyphs_module = types.SimpleNamespace(
             Glyphs=types.SimpleNamespace(fonts=[font], font=font),
             GSNode=_FakeGSNode,
@@ -96,6 +111,9 @@ class CompensatedTuningToolWrapperTests(unittest.TestCase):
             iqr_ratio=lambda values: None,
             _median=lambda values: None,
         )
+        if real_engine:
+            sys.path.insert(0, str(_resources_dir()))
+            import compensated_tuning_engine as engine_module  # type: ignore
         module_name = "test_mcp_tools_compensated_tuning_module"
         spec = importlib.util.spec_from_file_location(module_name, _module_path())
         self.assertIsNotNone(spec)
@@ -132,11 +150,11 @@ class CompensatedTuningToolWrapperTests(unittest.TestCase):
 
         review_calls = []
 
-        def fake_review_impl(**kwargs):
+        def fake_batch_review_impl(**kwargs):
             review_calls.append(kwargs)
-            return {"paths": [], "width": 600, "gmcp": {"ok": True}}
+            return {"ok": True, "results": [("L", {"paths": [], "width": 600, "gmcp": {"ok": True}})]}
 
-        module._review_compensated_tuning_impl = fake_review_impl
+        module._review_compensated_tuning_batch_impl = fake_batch_review_impl
 
         result = module._apply_compensated_tuning_impl(
             font_index=0,
@@ -156,7 +174,79 @@ class CompensatedTuningToolWrapperTests(unittest.TestCase):
         self.assertTrue(result["dryRun"])
         self.assertEqual(result["summary"]["okCount"], 1)
         self.assertEqual(result["results"][0]["action"], "preview")
-        self.assertEqual(review_calls[0]["glyph_name"], "L")
+        self.assertEqual(review_calls[0]["glyph_names"], ["L"])
+
+    def test_batch_review_matches_single_glyph_reviews(self) -> None:
+        base_master = types.SimpleNamespace(id="r", italicAngle=0.0)
+        ref_master = types.SimpleNamespace(id="b", italicAngle=0.0)
+        square = [(100, 0), (100, 700), (180, 700), (180, 0)]
+        bold = [(90, 0), (90, 700), (250, 700), (250, 0)]
+        glyphs = {
+            "I": types.SimpleNamespace(layers={"r": _tuning_layer(square, 280), "b": _tuning_layer(bold, 340)}),
+            "l": types.SimpleNamespace(layers={"r": _tuning_layer(square, 281), "b": _tuning_layer(bold, 343)}),
+            "bad": types.SimpleNamespace(
+                layers={
+                    "r": _tuning_layer(square, 280),
+                    "b": _tuning_layer(bold, 340, ["line", "curve", "line", "line"]),
+                }
+            ),
+        }
+        font = types.SimpleNamespace(masters=[base_master, ref_master], glyphs=glyphs)
+        module = self._load_module(font, real_engine=True)
+        params = {"sx": 0.87, "sy": 0.8, "keep_stroke": 0.9, "stem_ratio_b": 2.0, "italic_angle": 11.0}
+
+        batch = module._review_compensated_tuning_batch_impl(
+            font_index=0,
+            glyph_names=["I", "bad", "missing", "l"],
+            base_master_id="r",
+            ref_master_id="b",
+            **params
+        )
+
+        self.assertTrue(batch["ok"])
+        self.assertEqual([name for name, _review in batch["results"]], ["I", "bad", "missing", "l"])
+        for name, review in batch["results"]:
+            single = module._review_compensated_tuning_impl(
+                font_index=0,
+                glyph_name=name,
+                base_master_id="r",
+                ref_master_id="b",
+                **params
+            )
+            self.assertEqual(review, single)
+        reviews = dict(batch["results"])
+        self.assertEqual(reviews["bad"]["details"]["reason"], "node_type_mismatch")
+        self.assertEqual(reviews["missing"]["error"], "Glyph not found")
+        self.assertTrue(reviews["I"]["gmcp"]["ok"])
+        self.assertEqual(len(reviews["l"]["paths"][0]["nodes"]), 4)
+
+    def test_batch_review_rejects_invalid_params_before_tuning(self) -> None:
+        base_master = types.SimpleNamespace(id="r", italicAngle=0.0)
+        ref_master = types.SimpleNamespace(id="b", italicAngle=0.0)
+        square = [(100, 0), (100, 700), (180, 700), (180, 0)]
+        bold = [(90, 0), (90, 700), (250, 700), (250, 0)]
+        glyphs = {"I": types.SimpleNamespace(layers={"r": _tuning_layer(square, 280), "b": _tuning_layer(bold, 340)})}
+        font = types.SimpleNamespace(masters=[base_master, ref_master], glyphs=glyphs)
+        module = self._load_module(font, real_engine=True)
+
+        extrapolated = module._review_compensated_tuning_batch_impl(
+            glyph_names=["I"],
+            base_master_id="r",
+            ref_master_id="b",
+            sx=0.8,
+            stem_ratio_b=1.7,
+            q_y=1.4,
+            extrapolation="error",
+        )
+        self.assertEqual(extrapolated, {"ok": False, "error": "qy out of range and extrapolation=error", "qy": 1.4})
+
+        # No compatible glyph is needed to reject a non-positive scale.
+        for names in (["I"], ["missing"]):
+            with self.subTest(names=names):
+                invalid = module._review_compensated_tuning_batch_impl(
+                    glyph_names=names, base_master_id="r", ref_master_id="b", sx=0.0
+                )
+                self.assertEqual(invalid, {"ok": False, "error": "sx and sy must be > 0"})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,71 @@
+"""Tests for the headless font-wide curve quality scan script."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SCRIPTS = REPO_ROOT / "scripts"
+if str(SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS))
+
+HAS_DEFCON = importlib.util.find_spec("defcon") is not None
+
+
+def _write_ufo(path: Path) -> Path:
+    from defcon import Font
+
+    font = Font()
+    font.info.unitsPerEm = 1000
+    for index in range(4):
+        glyph = font.newGlyph("loop{}".format(index))
+        glyph.width = 300
+        pen = glyph.getPen()
+        pen.moveTo((0, 0))
+        pen.curveTo((200, 200), (-100, 200), (100 + index, 0))
+        pen.closePath()
+    glyph = font.newGlyph("box")
+    glyph.width = 300
+    pen = glyph.getPen()
+    pen.moveTo((0, 0))
+    pen.lineTo((0, 100))
+    pen.lineTo((100, 100))
+    pen.closePath()
+    font.save(str(path))
+    return path
+
+
+@unittest.skipUnless(HAS_DEFCON, "defcon is not installed")
+class CurveQualityScanTests(unittest.TestCase):
+    def setUp(self) -> None:
+        import curve_quality_scan as scan
+
+        self.scan = scan
+        self.tmp = tempfile.TemporaryDirectory()
+        self.ufo = _write_ufo(Path(self.tmp.name) / "Regular.ufo")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_scan_ranks_self_intersections_across_the_font(self) -> None:
+        report = self.scan.run([self.ufo], top_n=2, workers=1)
+        self.assertEqual(report["pathCount"], 5)
+        self.assertEqual(report["counts"]["selfIntersections"], 4)
+        findings = report["findings"]["selfIntersections"]
+        self.assertEqual(len(findings), 2)
+        self.assertEqual({finding["source"] for finding in findings}, {"Regular.ufo"})
+
+    def test_process_pool_matches_serial_scan(self) -> None:
+        serial = self.scan.run([self.ufo], top_n=3, workers=1)
+        pooled = self.scan.run([self.ufo], top_n=3, workers=2, chunk_size=2)
+        self.assertEqual(serial["findings"], pooled["findings"])
+        self.assertEqual(serial["counts"], pooled["counts"])
+
+
+if __name__ == "__main__":
+    unittest.main()
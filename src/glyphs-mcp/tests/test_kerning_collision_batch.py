@@ -0,0 +1,182 @@
+"""Tests for the headless UFO kerning collision batch runner."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SCRIPTS = REPO_ROOT / "scripts"
+if str(SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS))
+
+HAS_DEFCON = importlib.util.find_spec("defcon") is not None
+
+
+def _rect(glyph, x0, y0, x1, y1):
+    pen = glyph.getPen()
+    pen.moveTo((x0, y0))
+    pen.lineTo((x0, y1))
+    pen.lineTo((x1, y1))
+    pen.lineTo((x1, y0))
+    pen.closePath()
+
+
+def _write_ufo(path: Path, *, kern: float, skip_export=()) -> Path:
+    from defcon import Font
+
+    font = Font()
+    font.info.unitsPerEm = 1000
+    glyph = font.newGlyph("H")
+    glyph.unicodes = [0x48]
+    glyph.width = 600
+    _rect(glyph, 50, 0, 550, 700)
+    glyph = font.newGlyph("O")
+    glyph.unicodes = [0x4F]
+    glyph.width = 600
+    pen = glyph.getPen()
+    pen.moveTo((300, 0))
+    pen.curveTo((450, 0), (550, 150), (550, 350))
+    pen.curveTo((550, 550), (450, 700), (300, 700))
+    pen.curveTo((150, 700), (50, 550), (50, 350))
+    pen.curveTo((50, 150), (150, 0), (300, 0))
+    pen.closePath()
+    glyph = font.newGlyph("Hcomp")
+    glyph.unicodes = [0x0126]
+    glyph.width = 620
+    glyph.getPen().addComponent("H", (1, 0, 0, 1, 20, 0))
+    font.groups["public.kern1.H"] = ["H", "Hcomp"]
+    font.groups["public.kern2.O"] = ["O"]
+    font.kerning[("public.kern1.H", "public.kern2.O")] = kern
+    if skip_export:
+        font.lib["public.skipExportGlyphs"] = list(skip_export)
+    font.save(str(path))
+    return path
+
+
+@unittest.skipUnless(HAS_DEFCON, "defcon is not installed")
+class BenchmarkUFOAdapterLayerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        import benchmark_ufo_adapter as ufo_adapter
+
+        self.tmp = tempfile.TemporaryDirectory()
+        path = _write_ufo(Path(self.tmp.name) / "Test.ufo", kern=-20)
+        self.font = ufo_adapter.load_ufo(path, master_id="m", master_name="Regular")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_intersections_include_line_ends_and_sorted_crossings(self) -> None:
+        layer = self.font.glyphs["O"].layers["m"]
+        points = layer.intersectionsBetweenPoints((0, 350), (700, 350))
+        self.assertEqual([p.x for p in points], [0.0, 50.0, 550.0, 700.0])
+        reverse = layer.intersectionsBetweenPoints((700, 350), (0, 350))
+        self.assertEqual([p.x for p in reverse], [700.0, 550.0, 50.0, 0.0])
+        self.assertEqual(len(layer.intersectionsBetweenPoints((0, 900), (700, 900))), 2)
+
+    def test_components_are_resolved_and_transformed(self) -> None:
+        layer = self.font.glyphs["Hcomp"].layers["m"]
+        self.assertEqual(layer.components[0].componentLayer, self.font.glyphs["H"].layers["m"])
+        points = layer.intersectionsBetweenPoints((0, 100), (700, 100))
+        self.assertEqual([p.x for p in points], [0.0, 70.0, 570.0, 700.0])
+        self.assertEqual(len(layer.intersectionsBetweenPoints((0, 100), (700, 100), components=False)), 2)
+        bounds = layer.bounds
+        self.assertEqual((bounds.origin.x, bounds.size.width), (70.0, 500.0))
+
+    def test_kerning_groups_use_glyphs_class_keys(self) -> None:
+        self.assertEqual(self.font.glyphs["H"].rightKerningGroup, "H")
+        self.assertEqual(self.font.glyphs["O"].leftKerningGroup, "O")
+        self.assertEqual(self.font.glyphs["O"].unicode, "004F")
+        self.assertEqual(self.font.kerning, {"m": {"@MMK_L_H": {"@MMK_R_O": -20.0}}})
+
+
+@unittest.skipUnless(HAS_DEFCON, "defcon is not installed")
+class KerningCollisionBatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        import kerning_collision_batch as batch
+
+        self.batch = batch
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.ufos = [
+            _write_ufo(root / "Regular.ufo", kern=-20),
+            _write_ufo(root / "Tight.ufo", kern=-150),
+        ]
+        self.pairs_file = root / "pairs.json"
+        self.pairs_file.write_text(
+            json.dumps([["H", "O"], ["Hcomp", "O"], ["O", "H"], ["H", "missing"]]),
+            encoding="utf-8",
+        )
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_records_match_analyzer_shape_and_class_kerning(self) -> None:
+        result = self.batch.run(self.ufos, pairs_file=self.pairs_file, workers=1)
+        regular, tight = result["masters"]
+        self.assertEqual(regular["masterId"], "Regular")
+        self.assertEqual(regular["counts"]["pairsCandidate"], 4)
+        self.assertEqual(regular["counts"]["pairsMeasured"], 3)
+        self.assertEqual(regular["counts"]["pairsSkippedNoGlyph"], 1)
+        self.assertEqual(regular["collisions"], [])
+
+        worst = tight["collisions"][0]
+        self.assertEqual(
+            set(worst),
+            {
+                "left",
+                "right",
+                "kerningValue",
+                "kerningSource",
+                "minGap",
+                "worstY",
+                "bandMinGaps",
+                "bumperDelta",
+                "recommendedException",
+                "refined",
+                "sampleCount",
+                "reused",
+            },
+        )
+        self.assertEqual((worst["left"], worst["right"]), ("H", "O"))
+        self.assertEqual(worst["kerningValue"], -150.0)
+        self.assertEqual(worst["kerningSource"], {"leftKey": "@MMK_L_H", "rightKey": "@MMK_R_O"})
+        self.assertAlmostEqual(worst["minGap"], -50.0, places=3)
+        self.assertEqual(
+            set(tight["safeGaps"][0]),
+            {"left", "right", "kerningValue", "minGap", "worstY", "reused"},
+        )
+        self.assertEqual(result["collisionCount"], 2)
+
+    def test_process_pool_matches_in_process_run(self) -> None:
+        serial = self.batch.run(self.ufos, pairs_file=self.pairs_file, workers=1)
+        pooled = self.batch.run(
+            self.ufos,
+            pairs_file=self.pairs_file,
+            workers=2,
+            chunk_size=1,
+        )
+        self.assertEqual(serial["masters"], pooled["masters"])
+        self.assertEqual(pooled["workers"], 2)
+
+    def test_all_pairs_space_uses_encoded_glyphs(self) -> None:
+        result = self.batch.run(self.ufos[:1], all_pairs=True, workers=1)
+        self.assertEqual(result["masters"][0]["counts"]["pairsCandidate"], 9)
+
+    def test_all_pairs_space_skips_non_exported_glyphs(self) -> None:
+        ufo = _write_ufo(
+            Path(self.tmp.name) / "Skip.ufo",
+            kern=-20,
+            skip_export=["Hcomp"],
+        )
+        result = self.batch.run([ufo], all_pairs=True, workers=1)
+        self.assertEqual(result["masters"][0]["counts"]["pairsCandidate"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import sys
+import types
 import unittest
 from pathlib import Path
+from unittest import mock
 
 
 def _resources_dir() -> Path:
@@ -77,6 +79,24 @@ class _FakeLayer:
         return [_Pt(float(p1[0])), _Pt(float(left)), _Pt(float(right)), _Pt(float(p2[0]))]
 
 
+class _CountingLayer(_FakeLayer):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.calls = 0
+
+    def intersectionsBetweenPoints(self, p1, p2, components=True):
+        self.calls += 1
+        return super().intersectionsBetweenPoints(p1, p2, components=components)
+
+
+def _layer_with_bounds(layer):
+    points = [(node.position.x, node.position.y) for shape in layer.shapes for node in shape.nodes]
+    xs = [x for x, _y in points]
+    ys = [y for _x, y in points]
+    layer.bounds = _Bounds(min(xs), max(xs), min(ys), max(ys))
+    return layer
+
+
 class _Mapping:
     def __init__(self, data) -> None:
         self._data = data
@@ -132,6 +152,77 @@ class KerningCollisionEngineTests(unittest.TestCase):
         self.assertEqual(src.left_key, "A")
         self.assertEqual(src.right_key, "V")
 
+    def test_kerning_index_matches_per_pair_resolution(self) -> None:
+        glyphs = [
+            types.SimpleNamespace(name="A", id="idA", leftKerningGroup="A", rightKerningGroup="A"),
+            types.SimpleNamespace(name="V", id="idV", leftKerningGroup="V", rightKerningGroup="V"),
+            types.SimpleNamespace(name="T", id="idT", leftKerningGroup="T", rightKerningGroup="T"),
+            types.SimpleNamespace(name="o", id="ido", leftKerningGroup="o", rightKerningGroup="o"),
+            types.SimpleNamespace(name="H", id="idH", leftKerningGroup=None, rightKerningGroup=None),
+        ]
+        kerning_master = _Mapping(
+            {
+                "@MMK_L_A": _Mapping({"@MMK_R_V": -100, "o": -20}),
+                "idA": _Mapping({"idV": -80}),
+                "T": _Mapping({"@MMK_R_o": -60, "H": "n/a"}),
+                "@MMK_L_T": _Mapping({"@MMK_R_o": -30, "@MMK_R_V": -40}),
+            }
+        )
+        maps = kerning_collision_engine.build_glyph_maps(glyphs)
+        index = kerning_collision_engine.KerningIndex(kerning_master, maps)
+
+        pairs = [(left.name, right.name) for left in glyphs for right in glyphs]
+        expected = []
+        for left in glyphs:
+            for right in glyphs:
+                expected.append(
+                    kerning_collision_engine.resolve_explicit_kerning_value(
+                        kerning_master=kerning_master,
+                        left_glyph_id=left.id,
+                        left_glyph_name=left.name,
+                        left_class_key="@MMK_L_" + left.rightKerningGroup if left.rightKerningGroup else None,
+                        right_glyph_id=right.id,
+                        right_glyph_name=right.name,
+                        right_class_key="@MMK_R_" + right.leftKerningGroup if right.leftKerningGroup else None,
+                    )
+                )
+
+        self.assertEqual(index.resolve_many(pairs), expected)
+        self.assertEqual(index.resolve("T", "o")[0], -60.0)
+        self.assertEqual(index.resolve("A", "o")[1].left_key, "@MMK_L_A")
+        # Non-numeric entries count as coverage but never as a value.
+        self.assertTrue(index.covers("T", "H"))
+        self.assertEqual(index.resolve("T", "H"), (0.0, kerning_collision_engine.KerningSource(None, None)))
+        self.assertFalse(index.covers("H", "A"))
+        self.assertEqual(len(index), 7)
+        self.assertEqual(len(index.numeric_items()), 6)
+
+    def test_kerning_index_extremes_match_full_sort_and_coverage_brute_force(self) -> None:
+        glyphs = [
+            types.SimpleNamespace(name=name, id=None, leftKerningGroup=group, rightKerningGroup=group)
+            for name, group in (("A", "A"), ("Aacute", "A"), ("V", "V"), ("o", "o"), ("x", None))
+        ]
+        kerning_master = {
+            "@MMK_L_A": {"@MMK_R_V": -60, "o": -20, "x": -20},
+            "Aacute": {"@MMK_R_o": 10, "V": -60},
+            "@MMK_L_V": {"@MMK_R_A": -60, "@MMK_R_o": 30},
+            "o": {"x": "n/a"},
+        }
+        index = kerning_collision_engine.KerningIndex(kerning_master, kerning_collision_engine.build_glyph_maps(glyphs))
+        items = index.numeric_items()
+
+        for limit in (0, 1, 3, 100):
+            tightest, widest = index.extremes(limit)
+            self.assertEqual(tightest, sorted(items, key=lambda t: t[2])[:limit])
+            self.assertEqual(widest, sorted(items, key=lambda t: t[2], reverse=True)[:limit])
+
+        for left in glyphs:
+            for right in glyphs:
+                brute = any(
+                    key in index._keys for key in index._candidates(left.name, right.name)
+                )
+                self.assertEqual(index.covers(left.name, right.name), brute, (left.name, right.name))
+
     def test_compute_bumper_suggestion_uses_ceil_for_safety(self) -> None:
         sug = kerning_collision_engine.compute_bumper_suggestion(
             kerning_value=-80.0,
@@ -183,6 +274,57 @@ class KerningCollisionEngineTests(unittest.TestCase):
         # y=50 is in band index floor(0.5*8)=4
         self.assertAlmostEqual(out.band_min_gaps[4], -8.0, places=5)
 
+    def test_measure_pair_keeps_open_paths_and_reuses_edge_tables(self) -> None:
+        import scanline_engine  # type: ignore
+
+        def _path(points, closed):
+            nodes = [
+                types.SimpleNamespace(position=types.SimpleNamespace(x=float(x), y=float(y)), type="line")
+                for x, y in points
+            ]
+            return types.SimpleNamespace(nodes=nodes, closed=closed)
+
+        bounds = _Bounds(0, 100, 0, 100)
+        square = [(0, 0), (0, 100), (100, 100), (100, 0)]
+        # The open stroke reaches x=120; Glyphs' intersections report it.
+        left_layer = _CountingLayer(width=100, bounds=bounds, left_fn=lambda y: 0.0, right_fn=lambda y: 120.0)
+        left_layer.shapes = [_path(square, True), _path([(100, 0), (120, 100)], False)]
+        right_layer = _CountingLayer(width=100, bounds=bounds, left_fn=lambda y: 0.0, right_fn=lambda y: 100.0)
+        right_layer.shapes = [_path(square, True)]
+
+        builds = []
+        original = scanline_engine.EdgeTable.__dict__["from_layer"]
+
+        def from_layer(cls, layer, **kwargs):
+            builds.append(layer)
+            return original.__func__(cls, layer, **kwargs)
+
+        scanline_engine.EdgeTable.from_layer = classmethod(from_layer)
+        try:
+            tables = {}
+            results = [
+                kerning_collision_engine.measure_pair_min_gap(
+                    left_layer=left_layer,
+                    right_layer=right_layer,
+                    kerning_value=0.0,
+                    scan_mode="heights_only",
+                    scan_heights=None,
+                    dense_step=10.0,
+                    bands=4,
+                    edge_tables=tables,
+                )
+                for _ in range(2)
+            ]
+        finally:
+            scanline_engine.EdgeTable.from_layer = original
+
+        for out in results:
+            assert out is not None
+            self.assertAlmostEqual(out.min_gap, -20.0, places=5)
+        self.assertGreater(left_layer.calls, 0)
+        self.assertEqual(right_layer.calls, 0)
+        self.assertEqual(builds, [left_layer, right_layer])
+
     def test_measure_edges_materializes_glyphs4_intersection_proxy(self) -> None:
         left, right = kerning_collision_engine._measure_edges_at_y(  # type: ignore[attr-defined]
             _ProxyIntersectionLayer(),
@@ -195,6 +337,416 @@ class KerningCollisionEngineTests(unittest.TestCase):
         self.assertEqual(left, 25.0)
         self.assertEqual(right, 75.0)
 
+    def _profile_layers(self):
+        bounds = _Bounds(-50, 650, 0, 100)
+        left_layer = _CountingLayer(
+            width=600,
+            bounds=bounds,
+            left_fn=lambda y: 100.0,
+            right_fn=lambda y: 500.0,
+        )
+        right_layer = _CountingLayer(
+            width=600,
+            bounds=bounds,
+            left_fn=lambda y: -20.0 if abs(y - 50.0) < 1e-9 else 0.0,
+            right_fn=lambda y: 200.0,
+        )
+        return left_layer, right_layer
+
+    def test_profile_pair_gap_matches_direct_measurement_on_aligned_grid(self) -> None:
+        left_layer, right_layer = self._profile_layers()
+        direct = kerning_collision_engine.measure_pair_min_gap(
+            left_layer=left_layer,
+            right_layer=right_layer,
+            kerning_value=-88.0,
+            scan_mode="two_pass",
+            scan_heights=None,
+            dense_step=10.0,
+            bands=8,
+            target_gap=5.0,
+        )
+        left_profile = kerning_collision_engine.build_glyph_edge_profile(left_layer, step=10.0)
+        right_profile = kerning_collision_engine.build_glyph_edge_profile(right_layer, step=10.0)
+        assert left_profile is not None and right_profile is not None
+        cached = kerning_collision_engine.measure_profile_pair_min_gap(
+            left_profile=left_profile,
+            right_profile=right_profile,
+            kerning_value=-88.0,
+            scan_mode="two_pass",
+            scan_heights=None,
+            bands=8,
+            target_gap=5.0,
+        )
+
+        assert direct is not None and cached is not None
+        self.assertTrue(cached.refined)
+        self.assertAlmostEqual(cached.min_gap, direct.min_gap, places=6)
+        self.assertEqual(cached.worst_y, direct.worst_y)
+        self.assertEqual(cached.band_min_gaps, direct.band_min_gaps)
+        self.assertEqual(cached.sample_count, direct.sample_count)
+        self.assertEqual(left_profile.first_row, 0)
+        self.assertEqual(left_profile.scanline_count, 11)
+
+    def test_edge_profile_cache_intersects_each_glyph_once_until_outline_changes(self) -> None:
+        left_layer, right_layer = self._profile_layers()
+        cache = kerning_collision_engine.GlyphEdgeProfileCache()
+
+        for _ in range(3):
+            cache.profile(left_layer, glyph_name="o", master_id="m1", step=10.0, font_key="f")
+            cache.profile(right_layer, glyph_name="v", master_id="m1", step=10.0, font_key="f")
+
+        self.assertEqual(left_layer.calls, 11)
+        self.assertEqual(right_layer.calls, 11)
+        self.assertEqual(cache.stats(), {"entries": 2, "hits": 4, "misses": 2, "scanlines": 22})
+
+        left_layer.width = 610.0
+        cache.profile(left_layer, glyph_name="o", master_id="m1", step=10.0, font_key="f")
+        self.assertEqual(left_layer.calls, 22)
+        self.assertEqual(cache.stats()["entries"], 2)
+
+        cache.profile(left_layer, glyph_name="o", master_id="m1", step=5.0, font_key="f")
+        self.assertEqual(cache.stats()["entries"], 3)
+
+    def test_profiles_measure_hairlines_and_exact_quick_heights(self) -> None:
+        hyphen = _FakeLayer(width=300, bounds=_Bounds(20, 280, 251, 254), left_fn=lambda y: 20.0, right_fn=lambda y: 280.0)
+        round_layer = _FakeLayer(
+            width=500,
+            bounds=_Bounds(0, 500, 0, 500),
+            left_fn=lambda y: 10.0 + y * 0.1,
+            right_fn=lambda y: 490.0 - abs(y - 250.0) * 0.2,
+        )
+        hyphen_profile = kerning_collision_engine.build_glyph_edge_profile(hyphen, step=10.0)
+        round_profile = kerning_collision_engine.build_glyph_edge_profile(round_layer, step=10.0)
+        assert hyphen_profile is not None and round_profile is not None
+        self.assertEqual((hyphen_profile.first_row, hyphen_profile.scanline_count), (25, 1))
+        self.assertEqual(hyphen_profile.right_edges, (280.0,))
+
+        engines = [False] + ([True] if kerning_collision_engine.numpy_available() else [])
+        for use_numpy in engines:
+            with self.subTest(use_numpy=use_numpy):
+                hairline, quick = kerning_collision_engine.measure_profile_pairs(
+                    left_profiles=[hyphen_profile, round_profile],
+                    right_profiles=[round_profile],
+                    pairs=[(0, 0), (1, 0)],
+                    kerning_values=[0.0, 0.0],
+                    scan_mode="heights_only",
+                    scan_heights=[0.33],
+                    bands=8,
+                    use_numpy=use_numpy,
+                )
+                assert hairline is not None and quick is not None
+                self.assertAlmostEqual(hairline.min_gap, 55.0)
+                self.assertAlmostEqual(hairline.worst_y, 251.99)
+                # 0.33 of the 0..500 overlap sits between the rows at 160 and 170.
+                self.assertAlmostEqual(quick.worst_y, 165.0)
+                self.assertAlmostEqual(quick.min_gap, 53.5)
+                self.assertEqual(quick.sample_count, 1)
+
+    def test_profile_pair_gap_rejects_mismatched_grids(self) -> None:
+        left_layer, right_layer = self._profile_layers()
+        left_profile = kerning_collision_engine.build_glyph_edge_profile(left_layer, step=10.0)
+        right_profile = kerning_collision_engine.build_glyph_edge_profile(right_layer, step=5.0)
+
+        with self.assertRaises(ValueError):
+            kerning_collision_engine.measure_profile_pair_min_gap(
+                left_profile=left_profile,
+                right_profile=right_profile,
+                kerning_value=0.0,
+                scan_mode="dense_only",
+                scan_heights=None,
+                bands=8,
+            )
+
+    def _random_profiles(self, count: int, seed: int):
+        import random
+
+        rng = random.Random(seed)
+        profiles = []
+        for _ in range(count):
+            first = rng.randint(-25, 5)
+            last = rng.randint(30, 80)
+            rows = last - first + 1
+            profiles.append(
+                kerning_collision_engine.GlyphEdgeProfile(
+                    step=10.0,
+                    first_row=first,
+                    left_edges=tuple(None if rng.random() < 0.1 else rng.uniform(0, 200) for _ in range(rows)),
+                    right_edges=tuple(None if rng.random() < 0.1 else rng.uniform(300, 600) for _ in range(rows)),
+                    bounds=(0.0, 600.0, first * 10.0 - rng.random() * 5, last * 10.0 + rng.random() * 5),
+                    width=rng.uniform(400, 700),
+                )
+            )
+        # One profile entirely above the others has no overlap with most pairs.
+        profiles.append(
+            kerning_collision_engine.GlyphEdgeProfile(
+                step=10.0,
+                first_row=90,
+                left_edges=(10.0, 10.0),
+                right_edges=(500.0, 500.0),
+                bounds=(0.0, 600.0, 900.0, 910.0),
+                width=600.0,
+            )
+        )
+        return profiles
+
+    def test_batch_measurement_matches_per_pair_results(self) -> None:
+        left = self._random_profiles(12, seed=3)
+        right = self._random_profiles(9, seed=5)
+        pairs = [(li, ri) for li in range(len(left)) for ri in range(len(right))]
+        kerning = [(-50.0, 0.0, -300.0, -500.0)[(li + ri) % 4] for li, ri in pairs]
+        engines = [False] + ([True] if kerning_collision_engine.numpy_available() else [])
+
+        for mode in ("two_pass", "dense_only", "heights_only"):
+            expected = [
+                kerning_collision_engine.measure_profile_pair_min_gap(
+                    left_profile=left[li],
+                    right_profile=right[ri],
+                    kerning_value=kv,
+                    scan_mode=mode,
+                    scan_heights=None,
+                    bands=8,
+                    target_gap=5.0,
+                )
+                for (li, ri), kv in zip(pairs, kerning)
+            ]
+            for use_numpy in engines:
+                with self.subTest(mode=mode, use_numpy=use_numpy):
+                    actual = kerning_collision_engine.measure_profile_pairs(
+                        left_profiles=left,
+                        right_profiles=right,
+                        pairs=pairs,
+                        kerning_values=kerning,
+                        scan_mode=mode,
+                        scan_heights=None,
+                        bands=8,
+                        target_gap=5.0,
+                        use_numpy=use_numpy,
+                        chunk_size=17,
+                    )
+                    self.assertEqual(actual, expected)
+            self.assertIn(None, expected)
+
+    def test_batch_measurement_skips_pairs_thinner_than_one_grid_step(self) -> None:
+        hyphen = kerning_collision_engine.GlyphEdgeProfile(
+            step=10.0,
+            first_row=26,
+            left_edges=(),
+            right_edges=(),
+            bounds=(0.0, 200.0, 251.0, 254.0),
+            width=250.0,
+        )
+        short = kerning_collision_engine.GlyphEdgeProfile(
+            step=10.0,
+            first_row=0,
+            left_edges=(20.0,) * 26,
+            right_edges=(480.0,) * 26,
+            bounds=(0.0, 500.0, 0.0, 252.0),
+            width=500.0,
+        )
+        engines = [False] + ([True] if kerning_collision_engine.numpy_available() else [])
+        cases = [([hyphen], [hyphen], [(0, 0)]), ([hyphen, short], [short, hyphen], [(0, 0), (0, 1), (1, 1)])]
+
+        for mode in ("two_pass", "heights_only", "dense_only"):
+            for left, right, pairs in cases:
+                for use_numpy in engines:
+                    with self.subTest(mode=mode, pairs=pairs, use_numpy=use_numpy):
+                        actual = kerning_collision_engine.measure_profile_pairs(
+                            left_profiles=left,
+                            right_profiles=right,
+                            pairs=pairs,
+                            kerning_values=[0.0] * len(pairs),
+                            scan_mode=mode,
+                            scan_heights=None,
+                            bands=8,
+                            use_numpy=use_numpy,
+                        )
+                        self.assertEqual(actual, [None] * len(pairs))
+
+    def test_all_glyph_pairs_are_ordered_deduped_and_capped(self) -> None:
+        pairs, counts = kerning_collision_engine.build_all_glyph_pairs(glyph_names=["A", "V", "A", "o"], pair_limit=5)
+
+        self.assertEqual(pairs, [("A", "A"), ("A", "V"), ("A", "o"), ("V", "A"), ("V", "V")])
+        self.assertEqual(counts, {"pairsCandidate": 5, "pairsAllPairsSpace": 9})
+
+    def test_pair_gap_cache_keys_on_fingerprints_kerning_and_scan_params(self) -> None:
+        cache = kerning_collision_engine.PairGapCache(max_entries=2)
+        params = ("two_pass", (0.5,), 8, 5.0, 10.0)
+
+        def key(kerning=-80.0, left_fp="a1", scan_params=params):
+            return cache.key(
+                font_key="f",
+                master_id="m1",
+                left_name="A",
+                right_name="V",
+                left_fingerprint=left_fp,
+                right_fingerprint="v1",
+                kerning_value=kerning,
+                scan_params=scan_params,
+            )
+
+        result = kerning_collision_engine.PairGapResult(20.0, 0.0, [20.0], 3, False)
+        cache.put(key(), result)
+        cache.put(key(kerning=-40.0), None)
+
+        self.assertEqual(cache.get(key()), (True, result))
+        # A cached None (no overlap) is still a hit.
+        self.assertEqual(cache.get(key(kerning=-40.0)), (True, None))
+        self.assertEqual(cache.get(key(left_fp="a2")), (False, None))
+        self.assertEqual(cache.get(key(scan_params=("dense_only",) + params[1:])), (False, None))
+        cache.put(key(left_fp="a2"), result)
+        self.assertEqual(cache.stats(), {"entries": 2, "hits": 2, "misses": 2})
+
+    def test_dataset_pair_resolution_is_cached_per_unicode_map(self) -> None:
+        dataset = [("A", "V"), ("T", "o"), ("A", "V"), ("L", "T")]
+        cmap = {"A": "A", "V": "V", "T": "T", "o": "o"}
+        cache = kerning_collision_engine.DatasetPairResolutionCache()
+
+        first = cache.resolve(dataset, cmap, font_key="f")
+        again = cache.resolve(dataset, dict(cmap), font_key="f")
+        self.assertEqual(first, (("A", "V"), ("T", "o"), ("A", "V"), None))
+        self.assertIs(again, first)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+        cmap["L"] = "L"
+        self.assertEqual(cache.resolve(dataset, cmap, font_key="f")[3], ("L", "T"))
+        self.assertEqual(cache.stats()["misses"], 2)
+
+        original = kerning_collision_engine.unicode_map_fingerprint
+        with mock.patch.object(kerning_collision_engine, "unicode_map_fingerprint", wraps=original) as fingerprint:
+            cache.resolve(dataset, cmap, font_key="f")
+            cache.resolve(dataset, cmap, font_key="f")
+            cache.resolve(dataset, dict(cmap), font_key="f")
+        self.assertEqual(fingerprint.call_count, 1)
+        self.assertEqual(cache.stats()["hits"], 4)
+
+        kwargs = dict(
+            dataset_pairs=dataset,
+            unicode_to_glyphname=cmap,
+            relevant_limit=3,
+            include_existing=False,
+            kerning_master={},
+            name_set=set(cmap.values()),
+            id_to_name={},
+            left_key_group_rep={},
+            right_key_group_rep={},
+        )
+        self.assertEqual(
+            kerning_collision_engine.build_candidate_pairs(**kwargs),
+            kerning_collision_engine.build_candidate_pairs(
+                resolved_pairs=cache.resolve(dataset, cmap, font_key="f"), **kwargs
+            ),
+        )
+
+    def _flat_profile(self, left: float, right: float, width: float = 600.0, top: int = 70):
+        rows = top + 1
+        return kerning_collision_engine.GlyphEdgeProfile(
+            step=10.0,
+            first_row=0,
+            left_edges=(float(left),) * rows,
+            right_edges=(float(right),) * rows,
+            bounds=(float(left), float(right), 0.0, top * 10.0),
+            width=float(width),
+        )
+
+    def test_interpolated_edge_profile_follows_the_instance_outline(self) -> None:
+        def _layer(points, width=600.0, kinds=None):
+            kinds = kinds or ["line"] * len(points)
+            nodes = [
+                types.SimpleNamespace(position=types.SimpleNamespace(x=float(x), y=float(y)), type=kind)
+                for (x, y), kind in zip(points, kinds)
+            ]
+            return types.SimpleNamespace(width=width, shapes=[types.SimpleNamespace(nodes=nodes, closed=True)])
+
+        # The right-pointing apex moves from y=100 (Light) to y=600 (Bold).
+        light = _layer([(0, 0), (500, 100), (0, 700)])
+        bold = _layer([(0, 0), (500, 600), (0, 700)], width=640.0)
+        masters = [
+            kerning_collision_engine.build_glyph_edge_profile(_layer_with_bounds(layer), step=10.0)
+            for layer in (light, bold)
+        ]
+
+        mid = kerning_collision_engine.interpolated_edge_profile(light, bold, 0.5, step=10.0)
+        assert mid is not None
+
+        self.assertEqual(mid.bounds, (0.0, 500.0, 0.0, 700.0))
+        self.assertEqual(mid.width, 620.0)
+        row = 35 - mid.first_row
+        self.assertAlmostEqual(mid.right_edges[row], 500.0)
+        # Both masters are about 208 units narrower at y=350, so no blend of
+        # their edges can reach the instance's apex.
+        for profile in masters:
+            assert profile is not None
+            self.assertLess(profile.right_edges[35 - profile.first_row], 300.0)
+
+        mismatched = _layer([(0, 0), (500, 600), (0, 700)], kinds=["line", "curve", "line"])
+        self.assertIsNone(kerning_collision_engine.interpolated_edge_profile(light, mismatched, 0.5, step=10.0))
+        self.assertIsNone(
+            kerning_collision_engine.interpolated_edge_profile(light, _layer([(0, 0), (500, 600)]), 0.5, step=10.0)
+        )
+
+    def test_interpolation_segment_places_instances_between_masters(self) -> None:
+        masters = [[100.0, 100.0], [900.0, 100.0], [100.0, 75.0]]
+        segment = kerning_collision_engine.interpolation_segment
+
+        self.assertEqual(segment([900.0, 100.0], masters), (1, 1, 0.0))
+        i, j, t = segment([400.0, 100.0], masters)
+        self.assertEqual((i, j), (0, 1))
+        self.assertAlmostEqual(t, 0.375)
+        self.assertEqual(segment([100.0, 90.0], masters)[:2], (0, 2))
+        # Interior of a 2-axis design: no single master-to-master segment.
+        self.assertIsNone(segment([400.0, 90.0], masters))
+
+    def test_class_envelope_bounds_every_member_gap(self) -> None:
+        members = [self._flat_profile(50, 540, width=600), self._flat_profile(40, 560, width=580)]
+        left_env = kerning_collision_engine.build_class_envelope(members, side="left")
+        right_env = kerning_collision_engine.build_class_envelope(members, side="right")
+        assert left_env is not None and right_env is not None
+
+        # Right edges relative to advance: 540-600=-60 and 560-580=-20 -> envelope keeps -20.
+        self.assertEqual(left_env.right_edges[0], -20.0)
+        self.assertEqual(right_env.left_edges[0], 40.0)
+        self.assertEqual(left_env.width, 0.0)
+
+    def test_screen_class_pairs_skips_safe_groups_and_drills_into_tight_ones(self) -> None:
+        lefts = [self._flat_profile(50, 540), self._flat_profile(50, 550)]
+        rights = [self._flat_profile(60, 500), self._flat_profile(80, 500)]
+        pairs = [(0, 0), (0, 1), (1, 0), (1, 1), (0, 0)]
+        kerning = [0.0, 0.0, 0.0, 0.0, -70.0]
+        left_classes = ["@MMK_L_H", "@MMK_L_H", "@MMK_L_H", "@MMK_L_H", None]
+        right_classes = ["@MMK_R_H", "@MMK_R_H", "@MMK_R_H", "@MMK_R_H", "@MMK_R_H"]
+
+        measure, screens = kerning_collision_engine.screen_class_pairs(
+            left_profiles=lefts,
+            right_profiles=rights,
+            pairs=pairs,
+            kerning_values=kerning,
+            left_classes=left_classes,
+            right_classes=right_classes,
+            target_gap=5.0,
+            bands=8,
+        )
+
+        # Envelope gap: 0 + 60 - (550 - 600) = 110 >= 5, so the class group is skipped.
+        self.assertEqual(measure, [4])
+        self.assertEqual(len(screens), 1)
+        self.assertFalse(screens[0].drilled)
+        self.assertEqual(screens[0].pair_indexes, (0, 1, 2, 3))
+        self.assertAlmostEqual(screens[0].lower_bound_gap, 110.0)
+
+        measure, screens = kerning_collision_engine.screen_class_pairs(
+            left_profiles=lefts,
+            right_profiles=rights,
+            pairs=pairs,
+            kerning_values=[0.0, -120.0, 0.0, 0.0, -70.0],
+            left_classes=left_classes,
+            right_classes=right_classes,
+            target_gap=5.0,
+            bands=8,
+        )
+        self.assertEqual(measure, [0, 1, 2, 3, 4])
+        self.assertTrue(screens[0].drilled)
+        self.assertEqual(screens[0].kerning_floor, -120.0)
+
 
 if __name__ == "__main__":
     unittest.main()
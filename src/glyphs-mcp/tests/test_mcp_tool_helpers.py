@@ -7,10 +7,13 @@ the normal unit test runner.
 from __future__ import annotations
 
 import json
+import os
 import sys
+import tempfile
 import types
 import unittest
 from pathlib import Path
+from unittest import mock
 
 
 def _resources_dir() -> Path:
@@ -1799,6 +1802,30 @@ class McpToolHelpersTests(unittest.TestCase):
 
         self.assertEqual(font.kerning["m1"]["@MMK_L_A"]["@MMK_R_V"], -80)
 
+    def test_andre_fuchs_dataset_is_cached_until_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "relevant_pairs.v1.json"
+            path.write_text(json.dumps({"id": "af", "pairs": [{"left": "A", "right": "V"}, {"left": "To", "right": "x"}]}))
+            with mock.patch.object(helpers, "_andre_fuchs_dataset_path", lambda: path):
+                meta, pairs, warnings = helpers._load_andre_fuchs_relevant_pairs()
+                warnings.append("caller-owned")
+                meta_again, pairs_again, warnings_again = helpers._load_andre_fuchs_relevant_pairs()
+
+                self.assertEqual(meta, {"id": "af", "pairCount": 1})
+                self.assertEqual(list(pairs), [("A", "V")])
+                self.assertIs(pairs_again, pairs)
+                self.assertNotIn("caller-owned", warnings_again)
+
+                path.write_text(json.dumps({"id": "af", "pairs": [{"left": "T", "right": "o"}, {"left": "L", "right": "T"}]}))
+                stat = path.stat()
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+                _meta, reloaded, _warnings = helpers._load_andre_fuchs_relevant_pairs()
+
+        self.assertIsNot(reloaded, pairs)
+        self.assertEqual(list(reloaded), [("T", "o"), ("L", "T")])
+        self.assertEqual(reloaded[1], ("L", "T"))
+        self.assertEqual(list(reloaded[:1]), [("T", "o")])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -168,6 +168,13 @@ def _two_cubic_nodes():
     ]
 
 
+class _GlyphCollection(dict):
+    """Index by name and iterate glyph objects, like GSFont.glyphs."""
+
+    def __iter__(self):
+        return iter(list(self.values()))
+
+
 def _positions(nodes):
     return [(node.position.x, node.position.y) for node in nodes]
 
@@ -1142,6 +1149,300 @@ class McpToolsCurveGeometryTests(unittest.TestCase):
         self.assertEqual(len(payload["segments"][0]["samples"]), 51)
         self.assertEqual(_positions(nodes), before)
 
+    def test_curve_quality_can_report_layer_intersections(self) -> None:
+        module, _font, _layer, _path, nodes = self._load_module()
+        before = _positions(nodes)
+        payload = json.loads(
+            asyncio.run(
+                module.review_curve_quality(
+                    glyph_name="A",
+                    master_id="m1",
+                    path_index=0,
+                    include_layer_intersections=True,
+                )
+            )
+        )
+
+        self.assertTrue(payload["ok"])
+        self.assertTrue(payload["params"]["includeLayerIntersections"])
+        self.assertEqual(payload["layerIntersections"]["intersections"], [])
+        self.assertGreater(payload["layerIntersections"]["segmentCount"], 0)
+        self.assertEqual(_positions(nodes), before)
+
+    def test_curve_quality_font_scan_ranks_findings_with_layer_links(self) -> None:
+        loop = [
+            _Node(0, 0, "line"),
+            _Node(200, 200, "offcurve"),
+            _Node(-100, 200, "offcurve"),
+            _Node(100, 0, "curve"),
+        ]
+        module, font, layer, _path, nodes = self._load_module(node_values=loop)
+        font.masters = [types.SimpleNamespace(id="m1")]
+        font.glyphs = _GlyphCollection(font.glyphs)
+        module._glyphs_show_layer_link_fields = lambda path, glyph_name=None, layer_id=None, label=None: {
+            "showUrl": "glyphsapp://show?glyph={}&layer={}".format(glyph_name, layer_id)
+        }
+        before = _positions(nodes)
+
+        payload = json.loads(asyncio.run(module.review_curve_quality(glyph_names="all", top_n=5)))
+
+        self.assertTrue(payload["ok"], payload)
+        self.assertEqual(payload["mode"], "font_scan")
+        self.assertEqual(payload["scope"]["pathCount"], 1)
+        self.assertEqual(payload["scope"]["masterIds"], ["m1"])
+        self.assertEqual(payload["scope"]["omittedComponentCount"], 1)
+        self.assertEqual(payload["counts"]["selfIntersections"], 1)
+        finding = payload["findings"]["selfIntersections"][0]
+        self.assertEqual((finding["glyphName"], finding["masterId"], finding["pathIndex"]), ("A", "m1", 0))
+        self.assertEqual(finding["segmentEndNodeIndex"], 3)
+        self.assertEqual(finding["showUrl"], "glyphsapp://show?glyph=A&layer=m1")
+        self.assertEqual(_positions(nodes), before)
+
+        explicit = json.loads(
+            asyncio.run(module.review_curve_quality(glyph_names=["A", "Missing"], master_id="m1", top_n=1))
+        )
+        self.assertEqual(explicit["scope"]["missingGlyphs"], ["Missing"])
+        self.assertEqual(explicit["counts"], payload["counts"])
+
+    def test_curve_quality_font_scan_enforces_path_and_total_budgets(self) -> None:
+        module, font, _layer, _path, _source_nodes = self._load_module()
+        font.masters = [types.SimpleNamespace(id="m1")]
+        oversized = [_Node(0, 0, "line")]
+        for index in range(module.MAX_REVIEW_SEGMENTS + 1):
+            oversized += [_Node(index, 10, "offcurve"), _Node(index + 1, 10, "offcurve"), _Node(index + 1, 0, "curve")]
+        font.glyphs["B"] = types.SimpleNamespace(name="B", layers={"m1": _Layer(_Path(oversized))})
+        font.glyphs["C"] = types.SimpleNamespace(name="C", layers={"m1": _Layer(_Path(_nodes()))})
+        font.glyphs = _GlyphCollection(font.glyphs)
+
+        payload = json.loads(asyncio.run(module.review_curve_quality(glyph_names="all")))
+
+        self.assertTrue(payload["ok"], payload)
+        scope = payload["scope"]
+        self.assertEqual(scope["rejectedPaths"], {"segment_limit_exceeded": 1})
+        self.assertEqual(scope["analyzedSegmentCount"], 2)
+        self.assertFalse(scope["truncated"])
+        self.assertEqual(scope["budget"]["queuedSegmentCount"], 2)
+
+        module.MAX_SCAN_SEGMENTS = 1
+        truncated = json.loads(asyncio.run(module.review_curve_quality(glyph_names="all")))
+        self.assertTrue(truncated["scope"]["truncated"])
+        self.assertEqual(truncated["scope"]["glyphCount"], 2)
+        self.assertEqual(truncated["scope"]["analyzedSegmentCount"], 1)
+        self.assertEqual(truncated["scope"]["budget"]["firstUnscannedGlyph"], "C")
+        self.assertEqual(truncated["scope"]["budget"]["unscannedGlyphCount"], 1)
+        self.assertIn("start_glyph='C'", truncated["notes"][1])
+
+        resumed = json.loads(asyncio.run(module.review_curve_quality(glyph_names="all", start_glyph="C")))
+        self.assertEqual(resumed["scope"]["glyphCount"], 1)
+        self.assertEqual(resumed["scope"]["budget"]["startGlyph"], "C")
+        self.assertFalse(resumed["scope"]["truncated"])
+        self.assertIsNone(resumed["scope"]["budget"]["overBudgetGlyph"])
+        self.assertEqual(resumed["scope"]["analyzedSegmentCount"], 1)
+
+    def test_curve_quality_font_scan_captures_an_oversized_first_glyph(self) -> None:
+        module, font, _layer, _path, _source_nodes = self._load_module()
+        font.masters = [types.SimpleNamespace(id="m1")]
+        font.glyphs["B"] = types.SimpleNamespace(name="B", layers={"m1": _Layer(_Path(_nodes()))})
+        font.glyphs = _GlyphCollection(font.glyphs)
+        module.MAX_SCAN_SEGMENTS = 0
+
+        first = json.loads(asyncio.run(module.review_curve_quality(glyph_names=["A", "B"])))
+        budget = first["scope"]["budget"]
+        self.assertEqual(first["scope"]["glyphCount"], 1)
+        self.assertEqual((budget["overBudgetGlyph"], budget["firstUnscannedGlyph"]), ("A", "B"))
+
+        second = json.loads(
+            asyncio.run(module.review_curve_quality(glyph_names=["A", "B"], start_glyph=budget["firstUnscannedGlyph"]))
+        )
+        self.assertEqual(second["scope"]["glyphCount"], 1)
+        self.assertFalse(second["scope"]["truncated"])
+        self.assertEqual(second["scope"]["budget"]["overBudgetGlyph"], "B")
+
+    def test_curve_quality_font_scan_rejects_mixed_or_invalid_scope(self) -> None:
+        module, font, _layer, _path, _nodes = self._load_module()
+        font.masters = [types.SimpleNamespace(id="m1")]
+        cases = [
+            {"glyph_names": ["A"], "glyph_name": "A"},
+            {"glyph_names": ["A"], "path_index": 0},
+            {"glyph_names": ["A"], "include_samples": True},
+            {"glyph_names": []},
+            {"glyph_names": ["A"], "top_n": 0},
+            {"glyph_names": ["A"], "master_ids": ["nope"]},
+            {"glyph_names": ["A"], "start_glyph": "Missing"},
+            {"glyph_names": ["A"], "start_glyph": ""},
+            {"glyph_name": "A", "path_index": 0, "start_glyph": "A"},
+        ]
+        for kwargs in cases:
+            with self.subTest(kwargs=kwargs):
+                payload = json.loads(asyncio.run(module.review_curve_quality(**kwargs)))
+                self.assertFalse(payload["ok"])
+
+    def _batch_font(self, **kwargs):
+        module, font, _layer, _path, nodes = self._load_module(**kwargs)
+        bold_nodes = [
+            _Node(0, 0, "line"),
+            _Node(25, 0, "offcurve"),
+            _Node(100, 50, "offcurve"),
+            _Node(100, 100, "curve", smooth=True),
+        ]
+        bold = _Layer(_Path(bold_nodes))
+        bold.associatedMasterId = bold.layerId = "m2"
+        font.glyphs["A"].layers["m2"] = bold
+        b_regular = _Layer(_Path([_Node(0, 0, "line"), _Node(100, 0, "line")]))
+        b_bold = _Layer(_Path(_nodes()))
+        b_bold.associatedMasterId = b_bold.layerId = "m2"
+        font.glyphs["B"] = types.SimpleNamespace(name="B", layers={"m1": b_regular, "m2": b_bold})
+        font.glyphs = _GlyphCollection(font.glyphs)
+        font.masters = [types.SimpleNamespace(id="m1"), types.SimpleNamespace(id="m2")]
+        undo = types.SimpleNamespace(began=0, ended=0, names=[])
+        undo.beginUndoGrouping = lambda: setattr(undo, "began", undo.began + 1)
+        undo.endUndoGrouping = lambda: setattr(undo, "ended", undo.ended + 1)
+        undo.setActionName_ = undo.names.append
+        font.parent = types.SimpleNamespace(undoManager=lambda: undo)
+        return module, font, nodes, bold_nodes, undo
+
+    def test_tunni_batch_review_plans_compatible_masters_together(self) -> None:
+        module, font, nodes, bold_nodes, _undo = self._batch_font()
+        before = (_positions(nodes), _positions(bold_nodes))
+
+        payload = json.loads(asyncio.run(module.review_tunni_geometry(glyph_names="all")))
+
+        self.assertTrue(payload["ok"], payload)
+        self.assertEqual(payload["mode"], "font_batch")
+        self.assertEqual(payload["scope"]["masterIds"], ["m1", "m2"])
+        self.assertEqual(payload["scope"]["pathCount"], 4)
+        self.assertEqual(payload["incompatibleGlyphs"][0]["glyphName"], "B")
+        self.assertEqual(payload["summary"]["reasonCounts"], {"incompatible_master_topology": 1})
+        self.assertEqual(
+            [(record["glyphName"], record["masterId"], record["segmentEndNodeIndex"]) for record in payload["planned"]],
+            [("A", "m1", 3), ("A", "m2", 3)],
+        )
+        self.assertEqual([layer["plannedSegmentCount"] for layer in payload["layers"]], [1, 1])
+        self.assertEqual((_positions(nodes), _positions(bold_nodes)), before)
+
+        bold_nodes[1]._position = _Point(50, 0)
+        bold_nodes[2]._position = _Point(100, 50)
+        partial = json.loads(asyncio.run(module.review_tunni_geometry(glyph_names=["A"])))
+        self.assertEqual(partial["planned"], [])
+        self.assertEqual(partial["summary"]["reasonCounts"]["not_eligible_in_every_master"], 1)
+
+    def test_tunni_batch_confirm_applies_every_layer_in_one_undo_group(self) -> None:
+        module, font, nodes, bold_nodes, undo = self._batch_font()
+        preview = json.loads(asyncio.run(module.apply_tunni_balance(glyph_names=["A", "B"], dry_run=True)))
+        self.assertTrue(preview["dryRun"])
+        self.assertEqual(preview["verification"]["changedNodeCount"], 0)
+        self.assertEqual(undo.began, 0)
+
+        payload = json.loads(asyncio.run(module.apply_tunni_balance(glyph_names=["A", "B"], confirm=True)))
+
+        self.assertTrue(payload["ok"], payload)
+        self.assertFalse(payload["dryRun"])
+        self.assertEqual(payload["summary"]["appliedLayerCount"], 2)
+        self.assertEqual(payload["verification"]["changedNodeCount"], 4)
+        self.assertEqual((undo.began, undo.ended, undo.names), (1, 1, ["Balance Tunni Handles"]))
+        self.assertEqual(payload["undoGroup"], {"available": True, "began": True, "ended": True})
+        for record, layer_nodes in zip(preview["planned"], (nodes, bold_nodes)):
+            for role, node_index in (("handle1", 1), ("handle2", 2)):
+                position = layer_nodes[node_index].position
+                self.assertEqual((position.x, position.y), (record["proposed"][role]["x"], record["proposed"][role]["y"]))
+        self.assertEqual([font.glyphs["A"].layers[key].begin_count for key in ("m1", "m2")], [1, 1])
+        self.assertEqual(font.glyphs["B"].layers["m2"].begin_count, 0)
+
+    def test_tunni_batch_confirm_refuses_layers_changed_after_analysis(self) -> None:
+        calls = {"count": 0}
+
+        def edit_between_hops(_layer, _path, nodes):
+            calls["count"] += 1
+            if calls["count"] == 2:
+                nodes[0]._position = _Point(1, 0)
+
+        module, _font, nodes, bold_nodes, undo = self._batch_font(before_main_thread=edit_between_hops)
+        before = _positions(bold_nodes)
+
+        payload = json.loads(asyncio.run(module.apply_tunni_balance(glyph_names="all", confirm=True)))
+
+        self.assertFalse(payload["ok"])
+        self.assertEqual(payload["errorCode"], "stale_target")
+        self.assertEqual(payload["failedLayer"], {"glyphName": "A", "masterId": "m1"})
+        self.assertEqual(payload["summary"]["appliedLayerCount"], 0)
+        self.assertEqual(_positions(bold_nodes), before)
+        self.assertEqual(undo.began, 0)
+
+    def test_tunni_batch_failure_rolls_back_layers_already_applied(self) -> None:
+        module, _font, nodes, bold_nodes, undo = self._batch_font()
+        before = (_positions(nodes), _positions(bold_nodes))
+        bold_nodes[1].raise_next_write = True
+
+        payload = json.loads(asyncio.run(module.apply_tunni_balance(glyph_names=["A"], confirm=True)))
+
+        self.assertFalse(payload["ok"])
+        self.assertEqual(payload["failedLayer"], {"glyphName": "A", "masterId": "m2"})
+        self.assertTrue(payload["rollback"]["succeeded"], payload["rollback"])
+        self.assertEqual(payload["rollback"]["rolledBackLayerCount"], 2)
+        self.assertEqual((_positions(nodes), _positions(bold_nodes)), before)
+        self.assertEqual((undo.began, undo.ended, undo.names), (1, 1, []))
+
+    def test_tunni_batch_confirm_stops_at_scan_budget(self) -> None:
+        module, font, _nodes, _bold_nodes, undo = self._batch_font()
+        b_before = _positions(font.glyphs["B"].layers["m2"].paths[0].nodes)
+        module.MAX_SCAN_SEGMENTS = 2
+
+        payload = json.loads(asyncio.run(module.apply_tunni_balance(glyph_names="all", confirm=True)))
+
+        self.assertTrue(payload["ok"], payload)
+        self.assertTrue(payload["scope"]["truncated"])
+        self.assertEqual(payload["scope"]["glyphCount"], 1)
+        self.assertEqual(payload["scope"]["budget"]["firstUnscannedGlyph"], "B")
+        self.assertEqual(payload["scope"]["budget"]["queuedSegmentCount"], 2)
+        self.assertIn("start_glyph='B'", payload["notes"][1])
+        self.assertEqual(payload["summary"]["appliedLayerCount"], 2)
+        self.assertEqual(_positions(font.glyphs["B"].layers["m2"].paths[0].nodes), b_before)
+        self.assertEqual(undo.began, 1)
+
+        resumed = json.loads(
+            asyncio.run(
+                module.apply_tunni_balance(
+                    glyph_names="all", start_glyph=payload["scope"]["budget"]["firstUnscannedGlyph"], dry_run=True
+                )
+            )
+        )
+        self.assertTrue(resumed["ok"], resumed)
+        self.assertFalse(resumed["scope"]["truncated"])
+        self.assertEqual(resumed["scope"]["glyphCount"], 1)
+        self.assertEqual([glyph["glyphName"] for glyph in resumed["incompatibleGlyphs"]], ["B"])
+        self.assertEqual(undo.began, 1)
+
+        # A first glyph over budget on its own is still batched whole.
+        module.MAX_SCAN_SEGMENTS = 1
+        oversized_first = json.loads(asyncio.run(module.review_tunni_geometry(glyph_names="all")))
+        budget = oversized_first["scope"]["budget"]
+        self.assertEqual((budget["overBudgetGlyph"], budget["firstUnscannedGlyph"]), ("A", "B"))
+        self.assertEqual(oversized_first["scope"]["glyphCount"], 1)
+
+        module.MAX_REVIEW_SEGMENTS = 0
+        oversized = json.loads(asyncio.run(module.review_tunni_geometry(glyph_names=["A"])))
+        self.assertEqual(oversized["scope"]["rejectedPaths"], {"segment_limit_exceeded": 2})
+        self.assertEqual(oversized["summary"]["reviewedSegmentCount"], 0)
+        self.assertEqual(oversized["planned"], [])
+
+    def test_tunni_batch_rejects_mixed_scope(self) -> None:
+        module, _font, _nodes, _bold_nodes, _undo = self._batch_font()
+        cases = [
+            (module.review_tunni_geometry, {"glyph_names": ["A"], "glyph_name": "A"}),
+            (module.review_tunni_geometry, {"glyph_names": ["A"], "segment_end_node_indices": [3]}),
+            (module.apply_tunni_balance, {"glyph_names": ["A"], "path_index": 0, "dry_run": True}),
+            (module.apply_tunni_balance, {"glyph_names": [], "dry_run": True}),
+            (module.apply_tunni_balance, {"glyph_names": ["A"], "master_ids": ["nope"], "dry_run": True}),
+            (module.review_tunni_geometry, {"glyph_names": ["A"], "master_id": "m1", "master_ids": ["m2"]}),
+            (module.apply_tunni_balance, {"glyph_names": ["A"], "master_id": "m1", "master_ids": ["m1"], "dry_run": True}),
+            (module.review_tunni_geometry, {"glyph_names": ["A"], "start_glyph": "B"}),
+            (module.apply_tunni_balance, {"glyph_name": "A", "segment_end_node_indices": [3], "start_glyph": "A", "dry_run": True}),
+        ]
+        for tool, kwargs in cases:
+            with self.subTest(tool=tool.__name__, kwargs=kwargs):
+                payload = json.loads(asyncio.run(tool(**kwargs)))
+                self.assertFalse(payload["ok"])
+
     def test_curve_quality_public_samples_match_exact_parabola(self) -> None:
         parabola_nodes = [
             _Node(0.0, 0.0, "line"),
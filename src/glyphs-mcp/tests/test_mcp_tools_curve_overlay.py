@@ -43,6 +43,7 @@ class _Reporter:
         return {
             "lastDraw": dict(self.last_draw),
             "lastError": None,
+            "segmentCache": {"entries": 4, "hits": 12, "misses": 4},
         }
 
 
@@ -132,6 +133,7 @@ class McpToolsCurveOverlayTests(unittest.TestCase):
         self.assertTrue(payload["available"])
         self.assertTrue(payload["enabled"])
         self.assertEqual(payload["lastDraw"]["glyphName"], "a")
+        self.assertEqual(payload["segmentCache"]["hits"], 12)
         self.assertFalse(payload["fontChanged"])
         self.assertFalse(payload["fontSaved"])
         self.assertEqual(dispatch["value"], 1)
@@ -22,6 +22,16 @@ def _module_path() -> Path:
     )
 
 
+def _load_kerning_engine():
+    sys.path.insert(0, str(_module_path().parent))
+    try:
+        import kerning_collision_engine  # type: ignore
+
+        return kerning_collision_engine
+    finally:
+        sys.path.pop(0)
+
+
 class _FakeMCP:
     def tool(self, *args, **kwargs):
         def decorator(fn):
@@ -263,6 +273,7 @@ class McpToolsFontTests(unittest.TestCase):
                 "mcp_runtime": types.SimpleNamespace(mcp=_FakeMCP()),
                 "tool_registration": types.SimpleNamespace(glyphs_tool=lambda *_args, **_kwargs: (lambda fn: fn)),
                 "mcp_tool_helpers": helpers_module,
+                "kerning_collision_engine": _load_kerning_engine(),
             },
         ):
             sys.modules.pop(module_name, None)
@@ -542,6 +553,129 @@ class McpToolsFontTests(unittest.TestCase):
         self.assertIn({"left": "A", "right": "V", "value": -80}, default_payload["kerningPairs"])
         self.assertEqual(explicit_payload["masterId"], "italic")
         self.assertEqual(explicit_payload["kerningPairs"], [{"left": "A", "right": "T", "value": -40}])
+        self.assertNotIn("resolvedPairs", default_payload)
+
+    def test_get_font_kerning_resolves_effective_pairs_through_classes(self) -> None:
+        font = _font()
+        font.glyphs = [
+            _glyph("A", unicode="0041"),
+            _glyph("V", unicode="0056"),
+            _glyph("T", unicode="0054"),
+            _glyph("o", unicode="006F"),
+            _glyph("H", unicode="0048"),
+        ]
+        module = self._load_module(font)
+
+        payload = json.loads(
+            asyncio.run(module.get_font_kerning(0, pairs=[["A", "V"], ["T", "o"], ["H", "o"], ["bad"]]))
+        )
+
+        self.assertEqual(payload["pairCount"], 2)
+        self.assertEqual(
+            payload["resolvedPairs"],
+            [
+                {"left": "A", "right": "V", "value": -80.0, "leftKey": "A", "rightKey": "V"},
+                {"left": "T", "right": "o", "value": -30.0, "leftKey": "@MMK_L_T", "rightKey": "@MMK_R_o"},
+                {"left": "H", "right": "o", "value": 0.0, "leftKey": None, "rightKey": None},
+            ],
+        )
+
+    def test_get_font_kerning_pages_filters_and_expands_classes(self) -> None:
+        font = _font()
+        font.glyphs = [
+            _glyph("T", right_kerning_group="T"),
+            _glyph("Tcaron", right_kerning_group="T"),
+            _glyph("o", left_kerning_group="o"),
+            _glyph("oacute", left_kerning_group="o"),
+            _glyph("A"),
+            _glyph("V"),
+        ]
+        font.kerning["roman"]["Tcaron"] = {"oacute": -10}
+        module = self._load_module(font)
+
+        def _call(**kwargs):
+            return json.loads(asyncio.run(module.get_font_kerning(0, **kwargs)))
+
+        first = _call(limit=2)
+        self.assertEqual(first["pairCount"], 2)
+        self.assertTrue(first["nextCursor"].startswith("2:"))
+        last = _call(limit=2, cursor=first["nextCursor"])
+        self.assertEqual(last["kerningPairs"], [{"left": "Tcaron", "right": "oacute", "value": -10}])
+        self.assertIsNone(last["nextCursor"])
+        self.assertNotIn("nextCursor", _call())
+        self.assertIn("error", _call(cursor="bad"))
+
+        # A glyph filter also matches its class entries; a class key only itself.
+        by_glyph = _call(left="Tcaron")
+        self.assertEqual(
+            [(p["left"], p["right"]) for p in by_glyph["kerningPairs"]],
+            [("@MMK_L_T", "@MMK_R_o"), ("Tcaron", "oacute")],
+        )
+        self.assertEqual(_call(left="@MMK_L_T")["pairCount"], 1)
+
+        effective = _call(effective=True, left="@MMK_L_T")
+        self.assertEqual(
+            [(p["left"], p["right"], p["value"], p["leftKey"]) for p in effective["kerningPairs"]],
+            [
+                ("T", "o", -30.0, "@MMK_L_T"),
+                ("T", "oacute", -30.0, "@MMK_L_T"),
+                ("Tcaron", "o", -30.0, "@MMK_L_T"),
+                ("Tcaron", "oacute", -10.0, "Tcaron"),
+            ],
+        )
+        paged = _call(effective=True, right="oacute", limit=1, cursor="1")
+        self.assertEqual(paged["kerningPairs"][0]["left"], "Tcaron")
+        self.assertIsNone(paged["nextCursor"])
+
+    def test_get_font_kerning_pages_reuse_the_compiled_listing(self) -> None:
+        font = _font()
+        font.glyphs = [_glyph("A"), _glyph("V"), _glyph("T"), _glyph("o")]
+        font.kerning["roman"].update({"V": {"A": -20}, "T": {"o": -50}})
+        module = self._load_module(font)
+        module._kerning_listing_cache().clear()
+
+        def _page(cursor=None):
+            return json.loads(asyncio.run(module.get_font_kerning(0, limit=2, cursor=cursor)))
+
+        fingerprint = module.kerning_collision_engine.kerning_fingerprint
+        with mock.patch.object(
+            module.kerning_collision_engine, "kerning_fingerprint", wraps=fingerprint
+        ) as fingerprints:
+            first = _page()
+            listing = next(iter(module._kerning_listing_cache()._entries.values()))[1]
+            self.assertEqual(listing.produced_count, 3)
+            second = _page(first["nextCursor"])
+        self.assertEqual(fingerprints.call_count, 1)
+        self.assertEqual(module._kerning_listing_cache().stats()["hits"], 1)
+        self.assertEqual(second["pairCount"], 2)
+        self.assertIsNone(second["nextCursor"])
+
+        # A cursor pages through the listing it started; a new first page
+        # sees edits made in between.
+        font.kerning["roman"]["T"]["o"] = -55
+        pinned = _page(first["nextCursor"])
+        self.assertEqual(pinned["kerningPairs"], second["kerningPairs"])
+        fresh = _page()
+        self.assertEqual(module._kerning_listing_cache().stats()["misses"], 2)
+        listed = fresh["kerningPairs"] + _page(fresh["nextCursor"])["kerningPairs"]
+        self.assertIn({"left": "T", "right": "o", "value": -55}, listed)
+
+    def test_get_font_kerning_all_masters_uses_columnar_values(self) -> None:
+        font = _font()
+        font.glyphs = [_glyph("A"), _glyph("V"), _glyph("T"), _glyph("o")]
+        font.kerning["italic"] = {"A": {"V": -60}, "V": {"A": -20}}
+        module = self._load_module(font)
+
+        raw = json.loads(asyncio.run(module.get_font_kerning(0, all_masters=True)))
+        self.assertEqual(raw["masterIds"], ["roman", "italic"])
+        columns = raw["kerningColumns"]
+        self.assertEqual(columns["left"], ["A", "@MMK_L_T", "V"])
+        self.assertEqual(columns["right"], ["V", "@MMK_R_o", "A"])
+        self.assertEqual(columns["values"], {"roman": [-80, -30, None], "italic": [-60, None, -20]})
+
+        effective = json.loads(asyncio.run(module.get_font_kerning(0, all_masters=True, effective=True, left="T")))
+        self.assertEqual(effective["kerningColumns"]["left"], ["T"])
+        self.assertEqual(effective["kerningColumns"]["values"], {"roman": [-30.0], "italic": [0.0]})
 
 
 if __name__ == "__main__":
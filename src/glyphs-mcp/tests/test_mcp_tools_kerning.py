@@ -58,6 +58,14 @@ class _FakeGlyph:
         self.rightKerningGroup = right_group
         self.layers = {}
 
+    @property
+    def unicode(self) -> str | None:
+        return "{:04X}".format(ord(self.char)) if self.char else None
+
+    @unicode.setter
+    def unicode(self, value: str | None) -> None:
+        self.char = chr(int(value, 16)) if value else None
+
 
 class _ProofGlyph:
     def __init__(self, name: str, char: str | None) -> None:
@@ -82,8 +90,55 @@ def _font_resolution_error(font_index, fonts=None, ok_key=None):
     return payload
 
 
+def _resources_dir() -> Path:
+    return _module_path().parent
+
+
+class _Pt:
+    def __init__(self, x: float) -> None:
+        self.x = float(x)
+
+
+class _ScanLayer:
+    """Layer stub with rectangular bounds and constant scanline edges."""
+
+    def __init__(self, width: float, left: float, right: float, top: float = 700.0) -> None:
+        self.width = float(width)
+        self.bounds = types.SimpleNamespace(
+            origin=types.SimpleNamespace(x=float(left), y=0.0),
+            size=types.SimpleNamespace(width=float(right - left), height=float(top)),
+        )
+        self._left = float(left)
+        self._right = float(right)
+        self.calls = 0
+
+    def intersectionsBetweenPoints(self, p1, p2, components=True):  # noqa: ARG002 - API parity
+        self.calls += 1
+        return [_Pt(p1[0]), _Pt(self._left), _Pt(self._right), _Pt(p2[0])]
+
+
+class _OutlineLayer(_ScanLayer):
+    """Scan layer whose rectangle is also readable as one closed path."""
+
+    def __init__(self, width: float, left: float, right: float, top: float = 700.0) -> None:
+        super().__init__(width, left, right, top)
+        corners = [(left, 0.0), (right, 0.0), (right, top), (left, top)]
+        nodes = [types.SimpleNamespace(position=(float(x), float(y)), type="line") for x, y in corners]
+        self.paths = [types.SimpleNamespace(closed=True, nodes=nodes)]
+
+
+def _load_real_engine():
+    sys.path.insert(0, str(_resources_dir()))
+    try:
+        import kerning_collision_engine  # type: ignore
+
+        return kerning_collision_engine
+    finally:
+        sys.path.pop(0)
+
+
 class McpToolsKerningTests(unittest.TestCase):
-    def _load_module(self):
+    def _load_module(self, engine=None):
         glyphs = [
             _FakeGlyph("A", "A"),
             _FakeGlyph("V", "V"),
@@ -121,7 +176,7 @@ class McpToolsKerningTests(unittest.TestCase):
             sys.modules,
             {
                 "GlyphsApp": glyphs_module,
-                "kerning_collision_engine": types.SimpleNamespace(),
+                "kerning_collision_engine": engine or types.SimpleNamespace(),
                 "kerning_proof_engine": proof_module,
                 "mcp_runtime": types.SimpleNamespace(mcp=_FakeMCP()),
                 "tool_registration": types.SimpleNamespace(glyphs_tool=lambda *_args, **_kwargs: (lambda fn: fn)),
@@ -134,7 +189,7 @@ class McpToolsKerningTests(unittest.TestCase):
         return module, font
 
     def test_generate_kerning_tab_handles_numeric_kerning_values(self) -> None:
-        module, _font = self._load_module()
+        module, _font = self._load_module(engine=_load_real_engine())
 
         payload = json.loads(
             asyncio.run(
@@ -157,6 +212,20 @@ class McpToolsKerningTests(unittest.TestCase):
         self.assertEqual(payload["counts"]["existingWideIncluded"], 1)
         self.assertEqual(payload["text"], "proof")
 
+    def test_generate_kerning_tab_treats_class_kerning_as_covered(self) -> None:
+        module, font = self._load_module(engine=_load_real_engine())
+        font.glyphs["A"].rightKerningGroup = "A"
+        font.glyphs["V"].leftKerningGroup = "V"
+
+        def _missing_count():
+            payload = json.loads(asyncio.run(module.generate_kerning_tab(font_index=0, master_id="m1")))
+            return payload["counts"]["missingRelevantIncluded"]
+
+        font.kerning = {"m1": {"@MMK_L_A": {"@MMK_R_V": -60}}}
+        self.assertEqual(_missing_count(), 0)
+        font.kerning = {"m1": {"@MMK_L_V": {"@MMK_R_A": -60}}}
+        self.assertEqual(_missing_count(), 1)
+
     def test_set_kerning_pair_sets_and_removes_pair(self) -> None:
         module, font = self._load_module()
 
@@ -303,6 +372,237 @@ class McpToolsKerningTests(unittest.TestCase):
         self.assertEqual(applied, [(font, "m1", [("A", "V", -80)])])
         self.assertEqual(payload["warnings"], ["scan warning"])
 
+    def test_review_kerning_bumper_reuses_cached_edge_profiles(self) -> None:
+        module, font = self._load_module(engine=_load_real_engine())
+        for glyph in font.glyphs:
+            glyph.id = "id" + glyph.name
+            glyph.unicode = "{:04X}".format(ord(glyph.name))
+            glyph.layers = {"m1": _ScanLayer(600, 50, 550)}
+
+        first = json.loads(asyncio.run(module.review_kerning_bumper(font_index=0, master_id="m1", min_gap=40)))
+        second = json.loads(asyncio.run(module.review_kerning_bumper(font_index=0, master_id="m1", min_gap=40)))
+
+        self.assertTrue(first["ok"])
+        collision = first["results"]["collisions"][0]
+        self.assertEqual((collision["left"], collision["right"]), ("A", "V"))
+        self.assertAlmostEqual(collision["minGap"], 20.0)
+        self.assertEqual(collision["recommendedException"], -60)
+        self.assertEqual(first["edgeProfiles"]["built"], 2)
+        self.assertEqual(first["edgeProfiles"]["scanlines"], 142)
+        self.assertEqual(second["edgeProfiles"]["built"], 0)
+        self.assertEqual(second["edgeProfiles"]["reused"], 2)
+        self.assertEqual(font.glyphs["A"].layers["m1"].calls, 71)
+        self.assertFalse(first["results"]["collisions"][0]["reused"])
+        self.assertTrue(second["results"]["collisions"][0]["reused"])
+        self.assertEqual(
+            [dict(r, reused=None) for r in second["results"]["collisions"]],
+            [dict(r, reused=None) for r in first["results"]["collisions"]],
+        )
+
+    def test_review_kerning_bumper_remeasures_only_changed_pairs(self) -> None:
+        module, font = self._load_module(engine=_load_real_engine())
+        for glyph in font.glyphs:
+            glyph.id = "id" + glyph.name
+            glyph.unicode = "{:04X}".format(ord(glyph.name))
+            glyph.layers = {"m1": _ScanLayer(600, 50, 550)}
+        font.kerning = {"m1": {"A": {"V": -80}, "H": {"O": -10}}}
+
+        def _review():
+            payload = json.loads(
+                asyncio.run(
+                    module.review_kerning_bumper(
+                        font_index=0,
+                        master_id="m1",
+                        glyph_names=["A", "V", "H", "O"],
+                        all_pairs=True,
+                        min_gap=40,
+                    )
+                )
+            )
+            records = payload["results"]["collisions"] + payload["results"]["largestGaps"]
+            return payload, {(r["left"], r["right"]): r for r in records}
+
+        first, _records = _review()
+        self.assertEqual(first["counts"]["pairsReused"], 0)
+
+        font.kerning["m1"]["A"]["V"] = -40
+        font.glyphs["O"].layers["m1"] = _ScanLayer(600, 60, 540)
+        second, records = _review()
+
+        # A/V changed kerning; every pair involving O changed outline.
+        changed = {pair for pair in records if pair == ("A", "V") or "O" in pair}
+        self.assertEqual(second["counts"]["pairsMeasured"], 16)
+        self.assertEqual(second["counts"]["pairsReused"], 16 - len(changed))
+        for pair, record in records.items():
+            self.assertEqual(record["reused"], pair not in changed, pair)
+        self.assertAlmostEqual(records[("A", "V")]["minGap"], 60.0)
+
+    def test_review_kerning_bumper_all_pairs_measures_glyph_product(self) -> None:
+        module, font = self._load_module(engine=_load_real_engine())
+        for glyph in font.glyphs:
+            glyph.id = "id" + glyph.name
+            glyph.unicode = "{:04X}".format(ord(glyph.name))
+            glyph.layers = {"m1": _ScanLayer(600, 50, 550)}
+
+        payload = json.loads(
+            asyncio.run(
+                module.review_kerning_bumper(
+                    font_index=0,
+                    master_id="m1",
+                    glyph_names=["A", "V", "H"],
+                    all_pairs=True,
+                    pair_limit=8,
+                    min_gap=200,
+                )
+            )
+        )
+
+        self.assertTrue(payload["ok"])
+        self.assertEqual(payload["counts"]["pairsCandidate"], 8)
+        self.assertEqual(payload["counts"]["pairsMeasured"], 8)
+        self.assertEqual(payload["edgeProfiles"]["built"], 3)
+        self.assertTrue(any("all_pairs space has 9 pairs" in w for w in payload["warnings"]))
+
+    def test_review_kerning_bumper_sweeps_masters_and_interpolated_instances(self) -> None:
+        module, font = self._load_module(engine=_load_real_engine())
+        font.masters = [
+            types.SimpleNamespace(id="m1", name="Light", axes=[100]),
+            types.SimpleNamespace(id="m2", name="Bold", axes=[900]),
+        ]
+        font.instances = [
+            types.SimpleNamespace(name="Regular", axes=[400]),
+            types.SimpleNamespace(name="Black", axes=[1000]),
+        ]
+        font.kerning = {"m1": {"A": {"V": -80}}, "m2": {"A": {"V": -10}}}
+        for glyph in font.glyphs:
+            glyph.id = "id" + glyph.name
+            glyph.unicode = "{:04X}".format(ord(glyph.name))
+            glyph.layers = {"m1": _OutlineLayer(600, 50, 550), "m2": _OutlineLayer(600, 10, 590)}
+
+        payload = json.loads(
+            asyncio.run(module.review_kerning_bumper(font_index=0, min_gap=18, sweep_instances=True))
+        )
+
+        self.assertTrue(payload["ok"])
+        self.assertIsNone(payload["masterId"])
+        self.assertEqual([m["masterId"] for m in payload["sweep"]["masters"]], ["m1", "m2"])
+        self.assertEqual(payload["sweep"]["instances"][0]["name"], "Regular")
+        self.assertEqual(payload["sweep"]["instances"][0]["masters"], ["m1", "m2"])
+        self.assertAlmostEqual(payload["sweep"]["instances"][0]["t"], 0.375)
+        self.assertEqual(payload["sweep"]["instances"][0]["pairsSkippedIncompatible"], 0)
+        self.assertTrue(any("Skipped 1 instance" in w for w in payload["warnings"]))
+
+        collision = payload["results"]["collisions"][0]
+        self.assertEqual((collision["left"], collision["right"]), ("A", "V"))
+        self.assertEqual(collision["location"]["masterId"], "m2")
+        self.assertAlmostEqual(collision["minGap"], 10.0)
+        self.assertEqual(collision["locationsChecked"], 3)
+        self.assertEqual(collision["collidingLocations"], ["Bold", "Regular"])
+        # A and V are read from their outlines at both masters; instances add no profiles.
+        self.assertEqual(payload["edgeProfiles"]["glyphLayers"], 4)
+        self.assertTrue(all(glyph.layers[m].calls == 0 for glyph in font.glyphs for m in ("m1", "m2")))
+
+        # A glyph whose masters do not interpolate is skipped at the instance.
+        font.glyphs["V"].layers["m2"].paths[0].nodes[-1].type = "curve"
+        skipped = json.loads(
+            asyncio.run(module.review_kerning_bumper(font_index=0, min_gap=18, sweep_instances=True))
+        )
+        self.assertGreater(skipped["sweep"]["instances"][0]["pairsSkippedIncompatible"], 0)
+        self.assertNotIn("Regular", skipped["results"]["collisions"][0]["collidingLocations"])
+
+    def test_review_kerning_bumper_class_screening_reports_class_pairs(self) -> None:
+        module, font = self._load_module(engine=_load_real_engine())
+        for glyph in font.glyphs:
+            glyph.id = "id" + glyph.name
+            glyph.unicode = "{:04X}".format(ord(glyph.name))
+            glyph.leftKerningGroup = "round" if glyph.name in ("O", "V") else None
+            glyph.rightKerningGroup = "straight" if glyph.name in ("A", "H") else None
+            glyph.layers = {"m1": _ScanLayer(600, 50, 550)}
+        font.kerning = {"m1": {"@MMK_L_straight": {"@MMK_R_round": -20}, "A": {"V": -80}}}
+
+        payload = json.loads(
+            asyncio.run(
+                module.review_kerning_bumper(
+                    font_index=0,
+                    master_id="m1",
+                    glyph_names=["A", "H", "O", "V"],
+                    all_pairs=True,
+                    class_screening=True,
+                    min_gap=50,
+                )
+            )
+        )
+
+        self.assertTrue(payload["ok"])
+        screening = payload["classScreening"]
+        self.assertEqual(screening["classPairs"], 1)
+        self.assertEqual(screening["classPairsDrilled"], 1)
+        class_collision = screening["classCollisions"][0]
+        self.assertEqual((class_collision["leftClass"], class_collision["rightClass"]), ("@MMK_L_straight", "@MMK_R_round"))
+        self.assertEqual(class_collision["memberPairs"], 4)
+        self.assertEqual(class_collision["kerningFloor"], -80.0)
+        self.assertEqual(class_collision["memberCollisions"], 1)
+        self.assertAlmostEqual(class_collision["memberMinGap"], 20.0)
+
+        relaxed = json.loads(
+            asyncio.run(
+                module.review_kerning_bumper(
+                    font_index=0,
+                    master_id="m1",
+                    glyph_names=["A", "H", "O", "V"],
+                    all_pairs=True,
+                    class_screening=True,
+                    min_gap=10,
+                )
+            )
+        )
+        self.assertEqual(relaxed["classScreening"]["classPairsSkipped"], 1)
+        self.assertEqual(relaxed["counts"]["pairsSkippedByClassScreen"], 4)
+        self.assertEqual(relaxed["counts"]["pairsMeasured"], 12)
+
+    def test_review_kerning_bumper_sweep_totals_masters_and_screens_instances(self) -> None:
+        module, font = self._load_module(engine=_load_real_engine())
+        font.masters = [
+            types.SimpleNamespace(id="m1", name="Light", axes=[100]),
+            types.SimpleNamespace(id="m2", name="Bold", axes=[900]),
+        ]
+        font.instances = [types.SimpleNamespace(name="Regular", axes=[400])]
+        font.kerning = {
+            "m1": {"@MMK_L_straight": {"@MMK_R_round": -20}},
+            "m2": {"@MMK_L_straight": {"@MMK_R_round": -20}},
+        }
+        for glyph in font.glyphs:
+            glyph.id = "id" + glyph.name
+            glyph.unicode = "{:04X}".format(ord(glyph.name))
+            glyph.leftKerningGroup = "round" if glyph.name in ("O", "V") else None
+            glyph.rightKerningGroup = "straight" if glyph.name in ("A", "H") else None
+            glyph.layers = {"m1": _OutlineLayer(600, 50, 550), "m2": _OutlineLayer(600, 10, 590)}
+
+        payload = json.loads(
+            asyncio.run(
+                module.review_kerning_bumper(
+                    font_index=0,
+                    glyph_names=["A", "H", "O", "V"],
+                    all_pairs=True,
+                    class_screening=True,
+                    sweep_instances=True,
+                    min_gap=10,
+                )
+            )
+        )
+
+        self.assertTrue(payload["ok"])
+        # Class pairs clear min_gap at Light (80) and the interpolated Regular (50),
+        # but not at Bold (0).
+        self.assertEqual(payload["counts"]["pairsCandidate"], 32)
+        self.assertEqual(payload["counts"]["pairsSkippedByClassScreen"], 4)
+        self.assertEqual(payload["counts"]["pairsMeasured"], 28)
+        self.assertEqual(payload["edgeProfiles"]["glyphLayers"], 8)
+        self.assertEqual(payload["edgeProfiles"]["built"], 8)
+        instance = payload["sweep"]["instances"][0]
+        self.assertEqual(instance["pairsSkippedByClassScreen"], 4)
+        self.assertEqual(instance["pairsMeasured"], 12)
+
 
 if __name__ == "__main__":
     unittest.main()
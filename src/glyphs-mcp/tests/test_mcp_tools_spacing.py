@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import importlib.util
 import inspect
 import json
@@ -45,6 +46,41 @@ def _resolve_font_by_index(glyphs, font_index):
     return fonts[index], fonts
 
 
+class _GeometryLayer:
+    """Rectangle-edged layer the real spacing engine can measure."""
+
+    def __init__(self, width, lsb=40.0, height=700.0) -> None:
+        self.width = float(width)
+        self.leftSideBearing = float(lsb)
+        self.rightSideBearing = float(width) - float(lsb) - 400.0
+        self.bounds = types.SimpleNamespace(
+            origin=types.SimpleNamespace(x=float(lsb), y=0.0),
+            size=types.SimpleNamespace(width=400.0, height=float(height)),
+        )
+        self.paths = [object()]
+        self.components = []
+        self.guides = []
+        self.isAligned = False
+        self.leftMetricsKey = ""
+        self.rightMetricsKey = ""
+        self.widthMetricsKey = ""
+
+    def intersectionsBetweenPoints(self, p1, p2, components=True):  # noqa: ARG002 - API parity
+        y = float(p1[1])
+        if y < 0 or y > self.bounds.size.height:
+            return []
+        left = self.bounds.origin.x
+        points = (p1[0], left, left + self.bounds.size.width, p2[0])
+        return [types.SimpleNamespace(x=float(x)) for x in points]
+
+
+class _GlyphMap(dict):
+    """Name-indexed glyph collection that iterates glyphs, like GSFont.glyphs."""
+
+    def __iter__(self):
+        return iter(list(self.values()))
+
+
 def _font_resolution_error(font_index, fonts=None, ok_key=None):
     payload = {"error": "Font index out of range", "fontIndex": font_index, "availableFontCount": len(fonts or [])}
     if ok_key == "ok":
@@ -148,8 +184,26 @@ class McpToolsSpacingTests(unittest.TestCase):
                 "warnings": [],
             },
             clamp_suggestion=lambda current, suggested, clamp: (dict(suggested), []),
+            SpacingBatch=lambda font_obj: types.SimpleNamespace(stats=lambda: {"entries": 0, "hits": 0, "misses": 0}),
+            SpacingResultCache=lambda: types.SimpleNamespace(stats=lambda: {"entries": 0, "hits": 0, "misses": 0}),
         )
 
+        def iter_master_suggestions(*, glyphs, masters, master_params, result_cache=None, font_key=None, graph=None, recompute=None, **kwargs):
+            for master_obj in masters:
+                params = master_params(master_obj)
+                yield master_obj, [
+                    spacing_engine.compute_suggestion_for_layer(
+                        glyph=glyph_obj,
+                        layer=glyph_obj.layers[master_obj.id],
+                        master=master_obj,
+                        master_params=params,
+                        **kwargs,
+                    )
+                    for glyph_obj in glyphs
+                ]
+
+        spacing_engine.iter_master_suggestions = iter_master_suggestions
+
         module_name = "glyphs_mcp_test_mcp_tools_spacing"
         spec = importlib.util.spec_from_file_location(module_name, _module_path())
         self.assertIsNotNone(spec)
@@ -169,6 +223,106 @@ class McpToolsSpacingTests(unittest.TestCase):
             spec.loader.exec_module(module)
         return module, layer, font, master
 
+    def _load_module_with_engine(self, font):
+        resources = str(_module_path().parent)
+        if resources not in sys.path:
+            sys.path.insert(0, resources)
+        import spacing_engine  # type: ignore
+
+        glyphs_module = types.SimpleNamespace(Glyphs=types.SimpleNamespace(fonts=[font], font=font), GSGuide=type("GSGuide", (), {}))
+        helpers_module = types.SimpleNamespace(
+            _custom_parameter=lambda obj, key, default=None: getattr(obj, "customParameters", {}).get(key, default),
+            _font_resolution_error=_font_resolution_error,
+            _get_left_sidebearing=lambda layer_obj: layer_obj.leftSideBearing,
+            _get_right_sidebearing=lambda layer_obj: layer_obj.rightSideBearing,
+            _is_active_font=lambda glyphs, font_obj: getattr(glyphs, "font", None) is font_obj,
+            _resolve_font_by_index=_resolve_font_by_index,
+            _safe_json=lambda payload: json.dumps(payload),
+            _set_layer_metrics=lambda *args, **kwargs: True,
+            _set_sidebearing=lambda *args, **kwargs: True,
+            _spacing_selected_glyph_names_for_font=lambda font_obj: [],
+        )
+        module_name = "glyphs_mcp_test_mcp_tools_spacing_engine"
+        spec = importlib.util.spec_from_file_location(module_name, _module_path())
+        self.assertIsNotNone(spec)
+        module = importlib.util.module_from_spec(spec)
+        with mock.patch.dict(
+            sys.modules,
+            {
+                "GlyphsApp": glyphs_module,
+                "mcp_runtime": types.SimpleNamespace(mcp=_FakeMCP()),
+                "tool_registration": types.SimpleNamespace(glyphs_tool=lambda *_args, **_kwargs: (lambda fn: fn)),
+                "mcp_tool_helpers": helpers_module,
+                "spacing_engine": spacing_engine,
+            },
+        ):
+            sys.modules.pop(module_name, None)
+            assert spec.loader is not None
+            spec.loader.exec_module(module)
+        return module
+
+    def test_affected_by_recomputes_figures_after_a_figure_width_edit(self) -> None:
+        glyphs = _GlyphMap()
+        letters = ("H", "A", "B", "E")
+        for name in letters + ("zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"):
+            glyphs[name] = types.SimpleNamespace(
+                name=name,
+                script="latin",
+                category="Letter" if name in letters else "Number",
+                subCategory="Uppercase" if name in letters else "Decimal Digit",
+                unicode="",
+                glyphInfo=None,
+                leftMetricsKey="",
+                rightMetricsKey="",
+                widthMetricsKey="",
+                layers={"m1": _GeometryLayer(600.0)},
+            )
+        master = types.SimpleNamespace(id="m1", name="Master 1", xHeight=500, italicAngle=0.0, customParameters={})
+        font = types.SimpleNamespace(
+            glyphs=glyphs,
+            masters=[master],
+            upm=1000,
+            familyName="Synthetic",
+            filepath=None,
+            customParameters={},
+        )
+        module = self._load_module_with_engine(font)
+
+        def _review(**kwargs):
+            payload = json.loads(asyncio.run(module.review_spacing(font_index=0, master_id="m1", **kwargs)))
+            self.assertTrue(payload["ok"], payload)
+            return payload, {r["glyphName"]: r for r in payload["results"]}
+
+        everything = list(glyphs.keys())
+        plain, _results = _review(glyph_names=everything)
+        self.assertNotIn("resultCache", plain["summary"])
+        _first, first = _review(glyph_names=everything, affected_by=["H"])
+        self.assertEqual(first["five"]["tabularAssessment"]["preservedWidth"], 600)
+
+        glyphs["two"].layers["m1"] = _GeometryLayer(640.0)
+        incremental, second = _review(glyph_names=everything, affected_by=["two"])
+        _fresh, fresh = _review(glyph_names=everything)
+
+        self.assertIn("five", incremental["summary"]["incremental"]["affected"])
+        self.assertNotIn("H", incremental["summary"]["incremental"]["affected"])
+        self.assertFalse(second["five"]["reused"])
+        self.assertTrue(second["H"]["reused"])
+        for name in ("two", "five"):
+            self.assertEqual(second[name]["tabularAssessment"], fresh[name]["tabularAssessment"])
+            self.assertEqual(second[name]["proposed"], fresh[name]["proposed"])
+        self.assertNotEqual(second["five"]["tabularAssessment"], first["five"]["tabularAssessment"])
+
+        # Without glyph_names only the edited glyph and its dependents are reviewed.
+        glyphs["two"].layers["m1"] = _GeometryLayer(600.0)
+        compute = module.spacing_engine.compute_suggestion_for_layer
+        with mock.patch.object(module.spacing_engine, "compute_suggestion_for_layer", wraps=compute) as computed:
+            scoped, third = _review(affected_by=["two"])
+        figures = [name for name in everything if name not in letters]
+        self.assertEqual(sorted(third), sorted(figures))
+        self.assertEqual(computed.call_count, len(figures))
+        self.assertEqual(scoped["summary"]["incremental"]["recomputed"], len(figures))
+        self.assertEqual(scoped["summary"]["glyphCount"], len(figures))
+
     def test_apply_spacing_confirm_uses_sidebearing_helpers(self) -> None:
         module, layer, _font, _master = self._load_module()
 
@@ -400,6 +554,51 @@ class McpToolsSpacingTests(unittest.TestCase):
         self.assertFalse(payload["ok"])
         self.assertIn("Invalid scope", payload["error"])
 
+    def test_set_spacing_params_fit_writes_best_values_per_master(self) -> None:
+        module, _layer, font, master = self._load_module()
+        seen = {}
+
+        class _Fit:
+            def __init__(self, **kwargs):
+                seen.update(kwargs)
+
+            def search(self, **kwargs):
+                seen["grid"] = kwargs
+                return {
+                    "masterId": "m1",
+                    "best": {"area": 430.0, "depth": 12.0, "over": 1.0, "meanAbsError": 0.5},
+                    "top": [],
+                }
+
+        module.spacing_engine.SpacingParamFit = _Fit
+        module.spacing_engine.SpacingBatch = lambda font_obj: None
+        module.spacing_engine.fit_grid_values = lambda spec, field: [float(v) for v in (spec or [1, 2])]
+        module.spacing_engine.MAX_FIT_COMBINATIONS = 100
+        # GSFont.glyphs returns None for unknown names.
+        font.glyphs = collections.defaultdict(lambda: None, font.glyphs)
+
+        payload = json.loads(
+            asyncio.run(module.set_spacing_params(font_index=0, fit={"glyphNames": ["A", "missing"], "area": [400, 430]}))
+        )
+
+        self.assertTrue(payload["ok"])
+        self.assertEqual(payload["scopeApplied"], "all_masters")
+        self.assertEqual(payload["missingGlyphs"], ["missing"])
+        self.assertEqual([glyph.name for glyph in seen["glyphs"]], ["A"])
+        self.assertEqual(seen["grid"]["areas"], [400.0, 430.0])
+        self.assertEqual(payload["fit"][0]["best"]["area"], 430.0)
+        self.assertEqual(master.customParameters, {"a": 430.0, "d": 12.0, "o": 1.0})
+        self.assertEqual(font.customParameters, {})
+
+        for kwargs, message in (
+            ({"scope": "font", "fit": {}}, "per-master"),
+            ({"params": {"area": 400}, "fit": {}}, "either params or fit"),
+            ({"fit": {"area": list(range(200))}}, "combinations"),
+        ):
+            payload = json.loads(asyncio.run(module.set_spacing_params(font_index=0, **kwargs)))
+            self.assertFalse(payload["ok"])
+            self.assertIn(message, payload["error"])
+
     def test_set_spacing_guides_dry_run_reports_without_mutating(self) -> None:
         module, layer, _font, _master = self._load_module()
 
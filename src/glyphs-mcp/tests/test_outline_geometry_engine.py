@@ -63,6 +63,68 @@ def _split_cubic(points, t):
     return (points[0], q0, r0, split), (split, r1, q2, points[3])
 
 
+def _exhaustive_grid_tunni_candidate(
+    engine,
+    p0,
+    p1,
+    p2,
+    p3,
+    ideal1,
+    ideal2,
+    *,
+    upm,
+    grid_step,
+    imbalance_threshold,
+    min_handle_length,
+    max_tangent_deviation_deg,
+):
+    """Reference Cartesian-product search the pruned engine search must match."""
+    original1 = engine._sub(p1, p0)
+    original2 = engine._sub(p2, p3)
+    max_move = upm * 0.25
+    best = None
+    best_key = None
+    axes1 = (engine._grid_axis_values(ideal1[0], grid_step), engine._grid_axis_values(ideal1[1], grid_step))
+    axes2 = (engine._grid_axis_values(ideal2[0], grid_step), engine._grid_axis_values(ideal2[1], grid_step))
+    points1 = [(x, y) for x in axes1[0] for y in axes1[1]]
+    points2 = [(x, y) for x in axes2[0] for y in axes2[1]]
+    for candidate1 in points1:
+        tangent1 = engine._sub(candidate1, p0)
+        if engine._dot(tangent1, original1) <= 0.0 or engine._length(engine._sub(candidate1, p1)) > max_move:
+            continue
+        angle1 = engine._angle_degrees(original1, tangent1)
+        if angle1 > max_tangent_deviation_deg:
+            continue
+        for candidate2 in points2:
+            tangent2 = engine._sub(candidate2, p3)
+            if engine._dot(tangent2, original2) <= 0.0 or engine._length(engine._sub(candidate2, p2)) > max_move:
+                continue
+            angle2 = engine._angle_degrees(original2, tangent2)
+            if angle2 > max_tangent_deviation_deg:
+                continue
+            metrics = engine._tunni_metrics_for_points(
+                p0, candidate1, candidate2, p3, upm=upm, min_handle_length=min_handle_length
+            )
+            if metrics is None or metrics["relativeImbalance"] > imbalance_threshold + 1.0e-12:
+                continue
+            ideal_distance = (
+                (candidate1[0] - ideal1[0]) ** 2
+                + (candidate1[1] - ideal1[1]) ** 2
+                + (candidate2[0] - ideal2[0]) ** 2
+                + (candidate2[1] - ideal2[1]) ** 2
+            )
+            key = (metrics["relativeImbalance"], max(angle1, angle2), ideal_distance) + candidate1 + candidate2
+            if best_key is None or key < best_key:
+                best_key = key
+                best = {
+                    "handle1": candidate1,
+                    "handle2": candidate2,
+                    "metrics": metrics,
+                    "tangentDeviationDeg": {"handle1": angle1, "handle2": angle2, "maximum": max(angle1, angle2)},
+                }
+    return best
+
+
 class OutlineGeometryEngineTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
@@ -191,6 +253,47 @@ class OutlineGeometryEngineTests(unittest.TestCase):
         self.assertEqual(result["reason"], "no_safe_grid_candidate")
         self.assertFalse(result["grid"]["onGrid"])
 
+    def test_pruned_grid_search_matches_exhaustive_search(self) -> None:
+        import random
+
+        rng = random.Random(24)
+        found = 0
+        evaluations = {"pruned": 0, "exhaustive": 0}
+        original_metrics = self.engine._tunni_metrics_for_points
+        for _index in range(160):
+            p0 = (rng.uniform(-50, 50), rng.uniform(-50, 50))
+            p3 = (p0[0] + rng.uniform(150, 600), p0[1] + rng.uniform(-300, 300))
+            p1 = (p0[0] + rng.uniform(10, 200), p0[1] + rng.uniform(-120, 220))
+            p2 = (p3[0] + rng.uniform(-200, -10), p3[1] + rng.uniform(-120, 220))
+            current = original_metrics(p0, p1, p2, p3, upm=1000.0, min_handle_length=0.0)
+            if current is None:
+                continue
+            # Balanced handles at the mean ratio, as `analyze_tunni_segment` proposes.
+            tunni = current["tunniPoint"]
+            ratio = sum(current["ratios"]) / 2.0
+            ideal1 = (p0[0] + (tunni[0] - p0[0]) * ratio, p0[1] + (tunni[1] - p0[1]) * ratio)
+            ideal2 = (p3[0] + (tunni[0] - p3[0]) * ratio, p3[1] + (tunni[1] - p3[1]) * ratio)
+            options = {
+                "upm": rng.choice([1000.0, 2048.0]),
+                "grid_step": rng.choice([0.5, 1.0, 2.0, 5.0, 10.0]),
+                "imbalance_threshold": rng.choice([0.02, 0.1, 0.3, 1.0]),
+                "min_handle_length": rng.choice([0.0, 5.0]),
+                "max_tangent_deviation_deg": rng.choice([0.25, 3.0, 15.0, 60.0]),
+            }
+            results = {}
+            for name, search in (
+                ("pruned", self.engine._best_grid_tunni_candidate),
+                ("exhaustive", lambda *args, **kwargs: _exhaustive_grid_tunni_candidate(self.engine, *args, **kwargs)),
+            ):
+                with mock.patch.object(self.engine, "_tunni_metrics_for_points", wraps=original_metrics) as metrics:
+                    results[name] = search(p0, p1, p2, p3, ideal1, ideal2, **options)
+                evaluations[name] += metrics.call_count
+            with self.subTest(points=(p0, p1, p2, p3), options=options):
+                self.assertEqual(results["pruned"], results["exhaustive"])
+            found += results["exhaustive"] is not None
+        self.assertGreater(found, 30)
+        self.assertLess(evaluations["pruned"], evaluations["exhaustive"] / 2)
+
     def test_continuous_policy_remains_explicit_and_fractional(self) -> None:
         nodes = _cubic_nodes((0, 0), (20, 0), (100, 60), (100, 100))
         result = self.engine.analyze_tunni_segment(nodes, 3, closed=False, upm=1000, grid_step=None)
@@ -770,6 +873,348 @@ class OutlineGeometryEngineTests(unittest.TestCase):
             places=6,
         )
 
+    def _brute_force_self_intersections(self, points, upm):
+        engine = self.engine
+        flattened = engine._flatten_cubic(points, max(float(upm) * 1.0e-5, 1.0e-6))
+        found = []
+        segment_count = len(flattened) - 1
+        for first in range(segment_count):
+            for second in range(first + 2, segment_count):
+                if first == 0 and second == segment_count - 1:
+                    continue
+                intersection = engine._line_intersection(
+                    flattened[first][1], flattened[first + 1][1],
+                    flattened[second][1], flattened[second + 1][1],
+                )
+                if intersection is None:
+                    continue
+                local_first, local_second, point = intersection
+                t1 = flattened[first][0] + local_first * (flattened[first + 1][0] - flattened[first][0])
+                t2 = flattened[second][0] + local_second * (flattened[second + 1][0] - flattened[second][0])
+                if abs(t1 - t2) <= 1.0e-5:
+                    continue
+                if any(abs(t1 - item["t1"]) < 1.0e-4 and abs(t2 - item["t2"]) < 1.0e-4 for item in found):
+                    continue
+                found.append({"t1": float(t1), "t2": float(t2), "point": engine._point_payload(point)})
+                if len(found) >= engine.MAX_SELF_INTERSECTIONS:
+                    return found
+        return found
+
+    def test_swept_self_intersections_match_brute_force(self) -> None:
+        import random
+
+        rng = random.Random(20)
+        cubics = [((0.0, 0.0), (200.0, 200.0), (-100.0, 200.0), (100.0, 0.0))]
+        cubics += [
+            tuple((rng.uniform(-300, 300), rng.uniform(-300, 300)) for _ in range(4))
+            for _ in range(60)
+        ]
+        loops = 0
+        for points in cubics:
+            with self.subTest(points=points):
+                expected = self._brute_force_self_intersections(points, 1000)
+                self.assertEqual(self.engine._self_intersections(points, 1000), expected)
+                loops += bool(expected)
+        self.assertGreater(loops, 1)
+
+    def test_layer_intersections_report_crossing_contours_only(self) -> None:
+        def rectangle(x0, y0, x1, y1):
+            return {"closed": True, "nodes": [_node(x0, y0, "line"), _node(x0, y1, "line"), _node(x1, y1, "line"), _node(x1, y0, "line")]}
+
+        alone = self.engine.layer_intersections([rectangle(0, 0, 100, 100)], upm=1000)
+        self.assertEqual(alone["intersections"], [])
+        self.assertFalse(alone["truncated"])
+        # Touching contours share an edge but do not cross.
+        touching = self.engine.layer_intersections([rectangle(0, 0, 100, 100), rectangle(100, 0, 200, 100)], upm=1000)
+        self.assertEqual(touching["count"], 0)
+
+        overlap = self.engine.layer_intersections([rectangle(0, 0, 100, 100), rectangle(50, 50, 150, 150)], upm=1000)
+        self.assertEqual(overlap["count"], 2)
+        points = sorted((item["point"]["x"], item["point"]["y"]) for item in overlap["intersections"])
+        self.assertEqual(points, [(50.0, 100.0), (100.0, 50.0)])
+        for item in overlap["intersections"]:
+            self.assertEqual((item["pathIndex1"], item["pathIndex2"]), (0, 1))
+
+        circle_nodes = [
+            _node(100, 0, "curve", smooth=True), _node(155, 0, "offcurve"), _node(200, 45, "offcurve"),
+            _node(200, 100, "curve", smooth=True), _node(200, 155, "offcurve"), _node(155, 200, "offcurve"),
+            _node(100, 200, "curve", smooth=True), _node(45, 200, "offcurve"), _node(0, 155, "offcurve"),
+            _node(0, 100, "curve", smooth=True), _node(0, 45, "offcurve"), _node(45, 0, "offcurve"),
+        ]
+        circle = {"closed": True, "nodes": circle_nodes}
+        bar = rectangle(-50, 90, 250, 110)
+        crossing = self.engine.layer_intersections([circle, bar], upm=1000)
+        self.assertEqual(crossing["count"], 4)
+        self.assertTrue(all(item["pathIndex1"] == 0 and item["pathIndex2"] == 1 for item in crossing["intersections"]))
+        limited = self.engine.layer_intersections([circle, bar], upm=1000, max_results=3)
+        self.assertEqual(limited["count"], 3)
+        self.assertTrue(limited["truncated"])
+
+    def test_layer_intersections_report_crossing_at_a_node_once(self) -> None:
+        notched = {
+            "closed": True,
+            "nodes": [
+                _node(0, 0, "line"), _node(0, 100, "line"), _node(100, 100, "line"),
+                _node(100, 50, "line"), _node(100, 0, "line"),
+            ],
+        }
+        bar = {"closed": True, "nodes": [_node(50, 50, "line"), _node(50, 60, "line"), _node(150, 60, "line"), _node(150, 50, "line")]}
+
+        found = self.engine.layer_intersections([notched, bar], upm=1000)
+
+        self.assertEqual(found["count"], 2)
+        points = sorted((item["point"]["x"], item["point"]["y"]) for item in found["intersections"])
+        self.assertEqual(points, [(100.0, 50.0), (100.0, 60.0)])
+
+        # Both contours have a node on each crossing.
+        first = {
+            "closed": True,
+            "nodes": [
+                _node(0, 0, "line"), _node(0, 100, "line"), _node(50, 100, "line"),
+                _node(100, 100, "line"), _node(100, 50, "line"), _node(100, 0, "line"),
+            ],
+        }
+        second = {
+            "closed": True,
+            "nodes": [
+                _node(50, 50, "line"), _node(50, 100, "line"), _node(50, 150, "line"),
+                _node(150, 150, "line"), _node(150, 50, "line"), _node(100, 50, "line"),
+            ],
+        }
+        both = self.engine.layer_intersections([first, second], upm=1000)
+        self.assertEqual(both["count"], 2)
+        points = sorted((item["point"]["x"], item["point"]["y"]) for item in both["intersections"])
+        self.assertEqual(points, [(50.0, 100.0), (100.0, 50.0)])
+
+        stroke = {"closed": False, "nodes": [_node(0, 0, "line"), _node(50, 50, "line"), _node(100, 100, "line")]}
+        cross = {"closed": False, "nodes": [_node(0, 100, "line"), _node(50, 50, "line"), _node(100, 0, "line")]}
+        x_shape = self.engine.layer_intersections([stroke, cross], upm=1000)
+        self.assertEqual(x_shape["count"], 1)
+        self.assertEqual(x_shape["intersections"][0]["point"], {"x": 50.0, "y": 50.0})
+        # A path that turns back at the node only touches the other contour.
+        bounce = {"closed": False, "nodes": [_node(0, 100, "line"), _node(50, 50, "line"), _node(0, 0, "line")]}
+        self.assertEqual(self.engine.layer_intersections([stroke, bounce], upm=1000)["count"], 0)
+
+    def _kernel_cases(self):
+        import random
+
+        rng = random.Random(21)
+        segments = [
+            ((0.0, 0.0), (0.0, 0.0), (100.0, 0.0), (100.0, 100.0)),
+            ((0.0, 0.0), (100.0, 0.0), (-100.0, 0.0), (0.0, 0.0)),
+            ((0.0, 0.0), (200.0, 200.0), (-100.0, 200.0), (100.0, 0.0)),
+        ]
+        segments += [
+            tuple((rng.uniform(-500, 500), rng.uniform(-500, 500)) for _ in range(4))
+            for _ in range(40)
+        ]
+        return segments
+
+    def _assert_samples_match(self, expected, actual):
+        self.assertEqual(len(expected), len(actual))
+        for want, got in zip(expected, actual):
+            for key in ("t", "point", "derivative", "secondDerivative"):
+                self.assertEqual(got[key], want[key])
+            self.assertAlmostEqual(got["speed"], want["speed"], delta=1.0e-12 * max(want["speed"], 1.0))
+            if want["curvature"] is None:
+                self.assertIsNone(got["curvature"])
+                self.assertIsNone(got["normal"])
+                continue
+            self.assertAlmostEqual(got["curvature"], want["curvature"], delta=1.0e-12 * max(abs(want["curvature"]), 1.0e-9))
+            for value, reference in zip(got["normal"], want["normal"]):
+                self.assertAlmostEqual(value, reference, places=12)
+
+    def test_cubic_samples_scalar_path_matches_cubic_sample(self) -> None:
+        segments = self._kernel_cases()
+        parameters = [index / 50.0 for index in range(51)] + [-0.25, 1.5]
+        batched = self.engine.cubic_samples(segments, parameters, use_numpy=False)
+        for points, samples in zip(segments, batched):
+            for t, sample in zip(parameters, samples):
+                expected = self.engine.cubic_sample(points, t)
+                self.assertEqual({key: sample[key] for key in expected}, expected)
+        self.assertIsNone(batched[0][0]["normal"])
+        derivative = batched[2][10]["derivative"]
+        speed = batched[2][10]["speed"]
+        self.assertEqual(batched[2][10]["normal"], (derivative[1] / speed, -derivative[0] / speed))
+
+    def test_numpy_cubic_kernel_matches_scalar_path(self) -> None:
+        if not self.engine.numpy_available():
+            self.skipTest("numpy is not installed")
+        segments = self._kernel_cases()
+        shared = [index / 50.0 for index in range(51)] + [-0.25, 1.5]
+        scalar = self.engine.cubic_samples(segments, shared, use_numpy=False)
+        vector = self.engine.cubic_samples(segments, shared, use_numpy=True)
+        for expected, actual in zip(scalar, vector):
+            self._assert_samples_match(expected, actual)
+
+        ragged = [[0.0, 0.5, 1.0], [0.25], [index / 7.0 for index in range(8)]]
+        scalar = self.engine.cubic_samples(segments[:3], ragged, use_numpy=False)
+        vector = self.engine.cubic_samples(segments[:3], ragged, use_numpy=True)
+        self.assertEqual([len(row) for row in vector], [3, 1, 8])
+        for expected, actual in zip(scalar, vector):
+            self._assert_samples_match(expected, actual)
+        self.assertEqual(self.engine.cubic_samples(segments[:2], [], use_numpy=True), [[], []])
+        with self.assertRaises(ValueError):
+            self.engine.cubic_samples(segments[:2], [[0.0]], use_numpy=True)
+
+    def test_numpy_arc_length_parameters_match_scalar_path(self) -> None:
+        if not self.engine.numpy_available():
+            self.skipTest("numpy is not installed")
+        for points in self._kernel_cases():
+            vector = self.engine._arc_length_parameters(points, 51)
+            with mock.patch.object(self.engine, "np", None):
+                scalar = self.engine._arc_length_parameters(points, 51)
+            self.assertEqual(len(vector), len(scalar))
+            for got, want in zip(vector, scalar):
+                self.assertAlmostEqual(got, want, places=9)
+
+    def test_curvature_comb_batch_matches_single_segment_combs(self) -> None:
+        segments = self._kernel_cases()[:5]
+        batched = self.engine.curvature_comb_samples_batch(segments, sample_count=9)
+        for points, samples in zip(segments, batched):
+            self.assertEqual(samples, self.engine.curvature_comb_samples(points, sample_count=9))
+            self.assertEqual([sample["t"] for sample in samples], [index / 8.0 for index in range(9)])
+
+    def _closed_cubic_ring(self, shift=(0.0, 0.0)):
+        corners = [(0.0, 0.0), (400.0, 0.0), (400.0, 400.0), (0.0, 400.0)]
+        corners[1] = (corners[1][0] + shift[0], corners[1][1] + shift[1])
+        segments = []
+        for index, start in enumerate(corners):
+            end = corners[(index + 1) % 4]
+            segments.append((
+                start,
+                (start[0] + (end[0] - start[0]) / 3.0 + 20.0, start[1] + (end[1] - start[1]) / 3.0 - 20.0),
+                (start[0] + (end[0] - start[0]) * 2.0 / 3.0, start[1] + (end[1] - start[1]) * 2.0 / 3.0 + 15.0),
+                end,
+            ))
+        return segments
+
+    def test_segment_cache_counts_hits_and_returns_private_copies(self) -> None:
+        cache = self.engine.segment_analysis_cache()
+        cache.clear()
+        points = ((0.0, 0.0), (200.0, 200.0), (-100.0, 200.0), (100.0, 0.0))
+        first = self.engine.analyze_curve_events(points, upm=1000)
+        before = cache.stats()
+        first["selfIntersections"].clear()
+        first["turningAngle"]["signedDegrees"] = 0.0
+        second = self.engine.analyze_curve_events(points, upm=1000)
+        after = cache.stats()
+        self.assertEqual(after["hits"] - before["hits"], 1)
+        self.assertEqual(after["misses"], before["misses"])
+        self.assertEqual(second, self.engine._compute_curve_events(points, upm=1000))
+        self.assertEqual(len(second["selfIntersections"]), 1)
+        self.engine.analyze_curve_events(points, upm=2000)
+        self.assertGreater(cache.stats()["misses"], after["misses"])
+
+        samples = self.engine.curvature_comb_samples(points, sample_count=9)
+        samples[0]["curvature"] = 123.0
+        self.assertNotEqual(self.engine.curvature_comb_samples(points, sample_count=9)[0]["curvature"], 123.0)
+
+    def test_segment_cache_evicts_least_recent_entries_to_byte_budget(self) -> None:
+        points = ((0.0, 0.0), (1.0, 1.0), (2.0, 1.0), (3.0, 0.0))
+        value = tuple(float(index) for index in range(32))
+        size = self.engine._estimated_bytes("table", value)
+        cache = self.engine.SegmentAnalysisCache(max_bytes=size * 2)
+        for index in range(3):
+            cache.put(cache.key("table", points, (index,)), value)
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["bytes"], stats["evictions"]), (2, size * 2, 1))
+        self.assertIsNone(cache.get(cache.key("table", points, (0,))))
+        self.assertEqual(cache.get(cache.key("table", points, (2,))), value)
+
+        cache.put(cache.key("huge", points), tuple(range(1000)))
+        self.assertIsNone(cache.get(cache.key("huge", points)))
+        self.assertEqual(cache.stats()["entries"], 2)
+
+    def test_moving_one_node_reanalyzes_only_adjacent_segments(self) -> None:
+        cache = self.engine.segment_analysis_cache()
+        cache.clear()
+        original = self._closed_cubic_ring()
+        self.engine.curvature_comb_samples_batch(original, sample_count=9)
+        before = cache.stats()
+        edited = self._closed_cubic_ring(shift=(12.0, -7.0))
+        combs = self.engine.curvature_comb_samples_batch(edited, sample_count=9)
+        after = cache.stats()
+        self.assertEqual(after["misses"] - before["misses"], 2)
+        self.assertEqual(after["hits"] - before["hits"], 2)
+        self.assertEqual(after["entries"], 6)
+        for points, samples in zip(edited, combs):
+            self.assertEqual(samples, self.engine.cubic_samples([points], [index / 8.0 for index in range(9)])[0])
+
+    def _scan_jobs(self):
+        loop = _cubic_nodes((0, 0), (200, 200), (-100, 200), (100, 0))
+        cusp = _cubic_nodes((0, 0), (100, 0), (-100, 0), (0, 0))
+        kinked = [
+            _node(0, 0, "line"),
+            _node(100, 0, "line", smooth=True),
+            _node(140, 30, "offcurve"),
+            _node(200, 40, "offcurve"),
+            _node(200, 100, "curve"),
+        ]
+        # Tangent-continuous, but curvature jumps from the line into the curve.
+        g2_break = [dict(node) for node in kinked]
+        g2_break[2]["y"] = 0.0
+        jobs = []
+        for index, nodes in enumerate([loop, cusp, kinked, g2_break] * 2):
+            jobs.append({
+                "nodes": nodes,
+                "closed": False,
+                "upm": 1000,
+                "target": {"glyphName": "g{}".format(index), "masterId": "m1", "pathIndex": 0},
+            })
+        return jobs
+
+    def test_curve_quality_scan_ranks_bounded_findings(self) -> None:
+        jobs = self._scan_jobs()
+        report = self.engine.scan_curve_quality(jobs, top_n=2)
+        self.assertEqual(report["pathCount"], 8)
+        self.assertEqual(set(report["findings"]), set(self.engine.CURVE_QUALITY_SCAN_CATEGORIES))
+        self.assertEqual(report["counts"]["selfIntersections"], 2)
+        self.assertEqual(report["counts"]["cusps"], 2)
+        self.assertEqual(report["counts"]["g1Discontinuities"], 2)
+        self.assertEqual(report["counts"]["g2Discontinuities"], 2)
+        for category, findings in report["findings"].items():
+            self.assertLessEqual(len(findings), 2)
+            self.assertEqual([finding["rank"] for finding in findings], list(range(1, len(findings) + 1)))
+            scores = [math.inf if finding["score"] is None else finding["score"] for finding in findings]
+            self.assertEqual(scores, sorted(scores, reverse=True))
+        # Equal scores keep scan order.
+        self.assertEqual([item["glyphName"] for item in report["findings"]["cusps"]], ["g1", "g5"])
+        kink = report["findings"]["g1Discontinuities"][0]
+        self.assertEqual((kink["nodeIndex"], kink["pathIndex"]), (1, 0))
+        self.assertAlmostEqual(kink["angleDegrees"], math.degrees(math.atan2(30, 40)), places=6)
+        json.dumps(report, allow_nan=False)
+
+    def test_curve_quality_scan_with_executor_matches_serial_scan(self) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        jobs = self._scan_jobs()
+        serial = self.engine.scan_curve_quality(jobs, top_n=4)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pooled = self.engine.scan_curve_quality(jobs, top_n=4, executor=executor, chunk_size=2)
+        self.assertEqual(serial, pooled)
+
+    def test_analyze_tunni_jobs_matches_per_path_review(self) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        jobs = [
+            {"nodes": _cubic_nodes((0, 0), (20 + index, 0), (100, 60), (100, 100)), "closed": False, "upm": 1000}
+            for index in range(5)
+        ]
+        options = {"imbalance_threshold": 0.05, "min_handle_length": 1.0, "grid_step": 1.0}
+        expected = [self.engine.analyze_tunni_path(job["nodes"], closed=False, upm=1000, **options) for job in jobs]
+        self.assertEqual(self.engine.analyze_tunni_jobs(jobs, **options), expected)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(self.engine.analyze_tunni_jobs(jobs, executor=executor, chunk_size=2, **options), expected)
+
+    def test_curve_quality_ranking_keeps_worst_items(self) -> None:
+        ranking = self.engine.CurveQualityRanking(top_n=3)
+        for index, score in enumerate([1.0, 5.0, 3.0, math.inf, 2.0, 5.0]):
+            ranking.add("spikes", score, {"id": index})
+        ranked = ranking.ranked()["spikes"]
+        self.assertEqual([item["id"] for item in ranked], [3, 1, 5])
+        self.assertEqual(ranking.counts["spikes"], 6)
+
     def test_engine_has_no_glyphs_or_objc_imports(self) -> None:
         text = _module_path().read_text(encoding="utf-8")
         self.assertNotIn("import GlyphsApp", text)
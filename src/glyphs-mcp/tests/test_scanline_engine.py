@@ -0,0 +1,142 @@
+"""Tests for scanline_engine edge tables."""
+
+from __future__ import annotations
+
+import math
+import sys
+import types
+import unittest
+from pathlib import Path
+
+
+def _resources_dir() -> Path:
+    return (
+        Path(__file__).resolve().parent.parent
+        / "Glyphs MCP.glyphsPlugin"
+        / "Contents"
+        / "Resources"
+    )
+
+
+def _node(x, y, node_type):
+    return types.SimpleNamespace(position=types.SimpleNamespace(x=float(x), y=float(y)), type=node_type)
+
+
+def _path(nodes, closed=True):
+    return types.SimpleNamespace(nodes=[_node(*n) for n in nodes], closed=closed)
+
+
+def _rect(x0, y0, x1, y1):
+    return _path([(x0, y0, "line"), (x0, y1, "line"), (x1, y1, "line"), (x1, y0, "line")])
+
+
+def _circle(cx, cy, r):
+    k = 0.5522847498 * r
+    return _path(
+        [
+            (cx + k, cy - r, "offcurve"),
+            (cx + r, cy - k, "offcurve"),
+            (cx + r, cy, "curve"),
+            (cx + r, cy + k, "offcurve"),
+            (cx + k, cy + r, "offcurve"),
+            (cx, cy + r, "curve"),
+            (cx - k, cy + r, "offcurve"),
+            (cx - r, cy + k, "offcurve"),
+            (cx - r, cy, "curve"),
+            (cx - r, cy - k, "offcurve"),
+            (cx - k, cy - r, "offcurve"),
+            (cx, cy - r, "curve"),
+        ]
+    )
+
+
+class ScanlineEngineTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        sys.path.insert(0, str(_resources_dir()))
+        global scanline_engine  # noqa: PLW0603 - simple test import
+        import scanline_engine as scanline_engine  # type: ignore
+
+    def test_rectangle_crossings_are_half_open_and_sorted(self) -> None:
+        layer = types.SimpleNamespace(shapes=[_rect(10, 0, 90, 100), _rect(120, 0, 140, 50)])
+        table = scanline_engine.EdgeTable.from_layer(layer)
+
+        self.assertEqual(table.crossings(20), [10.0, 90.0, 120.0, 140.0])
+        self.assertEqual(table.crossings(0), [10.0, 90.0, 120.0, 140.0])
+        self.assertEqual(table.crossings(50), [10.0, 90.0])
+        self.assertEqual(table.crossings(100), [])
+
+        vertical = scanline_engine.EdgeTable.from_layer(layer, vertical=True)
+        self.assertEqual(vertical.crossings(130), [0.0, 50.0])
+
+    def test_sweep_matches_single_queries_in_any_order(self) -> None:
+        layer = types.SimpleNamespace(paths=[_circle(300, 350, 250), _rect(250, 300, 350, 400)], components=[])
+        table = scanline_engine.EdgeTable.from_layer(layer)
+        ys = [700.0, 120.0, 350.0, -5.0, 599.0, 101.0, 350.0]
+
+        self.assertEqual(table.sweep(ys), [table.crossings(y) for y in ys])
+
+    def test_curves_are_flattened_within_tolerance(self) -> None:
+        r = 500.0
+        k = 0.5522847498 * r
+        layer = types.SimpleNamespace(shapes=[_circle(0, 0, r)])
+        table = scanline_engine.EdgeTable.from_layer(layer)
+
+        def _exact_right(y):
+            # Upper-right segment (r, 0) -> (0, r); y(t) is monotonic.
+            lo, hi = 0.0, 1.0
+            for _ in range(60):
+                t = (lo + hi) / 2.0
+                u = 1.0 - t
+                if 3 * u * u * t * k + 3 * u * t * t * r + t ** 3 * r < y:
+                    lo = t
+                else:
+                    hi = t
+            u = 1.0 - lo
+            return u ** 3 * r + 3 * u * u * lo * r + 3 * u * lo * lo * k
+
+        for y in (0.0, 123.0, 300.0, 400.0):
+            left, right = scanline_engine.outer_edges(table.crossings(y))
+            self.assertAlmostEqual(right, _exact_right(y), delta=0.1)
+            self.assertAlmostEqual(left, -right, delta=1e-6)
+
+    def test_components_are_decomposed_with_their_transform(self) -> None:
+        base = types.SimpleNamespace(shapes=[_rect(0, 0, 100, 100)])
+        component = types.SimpleNamespace(componentName="base", componentLayer=base, transform=(1, 0, 0, 1, 200, 10))
+        layer = types.SimpleNamespace(shapes=[_rect(0, 0, 50, 50), component])
+
+        self.assertEqual(
+            scanline_engine.EdgeTable.from_layer(layer).crossings(20),
+            [0.0, 50.0, 200.0, 300.0],
+        )
+        self.assertEqual(
+            scanline_engine.EdgeTable.from_layer(layer, include_components=False).crossings(20),
+            [0.0, 50.0],
+        )
+
+    def test_quadratic_and_open_paths(self) -> None:
+        # All-offcurve TrueType contour.
+        quad = _path([(0, 0, "offcurve"), (100, 0, "offcurve"), (100, 100, "offcurve"), (0, 100, "offcurve")])
+        open_path = _path([(0, 0, "line"), (500, 500, "line")], closed=False)
+        table = scanline_engine.EdgeTable.from_layer(types.SimpleNamespace(shapes=[quad]))
+
+        # An open stroke sends the whole layer back to Glyphs' intersections.
+        self.assertEqual(scanline_engine.flatten_path(open_path), [])
+        self.assertIsNone(scanline_engine.EdgeTable.from_layer(types.SimpleNamespace(shapes=[quad, open_path])))
+
+        # Implied on-curve points sit at the control-edge midpoints.
+        self.assertEqual(table.crossings(50), [0.0, 100.0])
+        left, right = scanline_engine.outer_edges(table.crossings(25))
+        self.assertAlmostEqual(left, 50.0 * (1.0 - math.sqrt(0.5)) ** 2, delta=0.05)
+        self.assertAlmostEqual(right, 100.0 - left, delta=1e-6)
+
+    def test_unreadable_geometry_returns_none_for_fallback(self) -> None:
+        self.assertIsNone(scanline_engine.EdgeTable.from_layer(object()))
+        self.assertIsNone(scanline_engine.EdgeTable.from_layer(types.SimpleNamespace(paths=[object()])))
+        self.assertIsNone(scanline_engine.EdgeTable.from_layer(types.SimpleNamespace(shapes=[])))
+        unresolved = types.SimpleNamespace(componentName="a", componentLayer=None, transform=(1, 0, 0, 1, 0, 0))
+        self.assertIsNone(scanline_engine.EdgeTable.from_layer(types.SimpleNamespace(shapes=[unresolved])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -318,6 +318,43 @@ class SpacingEngineTests(unittest.TestCase):
         self.assertLessEqual(out[1] - out[0], 50.0)
         self.assertLessEqual(out[2] - out[1], 50.0)
 
+    def test_edge_views_match_separate_full_and_zone_measurements(self) -> None:
+        layer = _GeometryLayer(600, 700, lambda y: (40.0 + y / 10.0, 560.0 - y / 20.0))
+        views = spacing_engine.measure_layer_edge_views(
+            layer,
+            full_range=(0.0, 700.0),
+            zone_range=(-7.5, 512.5),
+            step=10.0,
+            include_components=True,
+        )
+        full = spacing_engine.measure_layer_edges(layer, 0.0, 700.0, step=10.0, include_components=True)
+        zone = spacing_engine.measure_layer_edges(layer, -7.5, 512.5, step=10.0, include_components=True)
+        self.assertEqual(views, (full, zone))
+
+    def test_numpy_area_model_matches_pure_python(self) -> None:
+        if not spacing_engine.numpy_available():
+            self.skipTest("NumPy is not installed")
+        import random
+
+        rng = random.Random(7)
+        ys = [float(i) * 7.5 for i in range(90)]
+        zone_left = [None if rng.random() < 0.1 else rng.uniform(0.0, 120.0) for _ in ys]
+        zone_right = [None if rng.random() < 0.1 else rng.uniform(380.0, 500.0) for _ in ys]
+        kwargs = {"l_extreme": 5.0, "r_extreme": 495.0, "depth_units": 75.0, "step": 7.5}
+
+        pure = spacing_engine._zone_areas(ys, zone_left, zone_right, use_numpy=False, **kwargs)
+        fast = spacing_engine._zone_areas(ys, zone_left, zone_right, use_numpy=True, **kwargs)
+
+        self.assertEqual((fast.clamped_left, fast.clamped_right), (pure.clamped_left, pure.clamped_right))
+        self.assertAlmostEqual(fast.area_left, pure.area_left, places=6)
+        self.assertAlmostEqual(fast.area_right, pure.area_right, places=6)
+        for got, want in zip(fast.left_xs + fast.right_xs, pure.left_xs + pure.right_xs):
+            self.assertAlmostEqual(got, want, places=9)
+
+        deslanted = spacing_engine._deslant_xs(zone_left, ys, x_height=500.0, italic_angle=11.0, use_numpy=True)
+        expected = spacing_engine._deslant_xs(zone_left, ys, x_height=500.0, italic_angle=11.0, use_numpy=False)
+        self.assertEqual(deslanted, expected)
+
     def test_measure_edges_materializes_glyphs4_intersection_proxy(self) -> None:
         left, right = spacing_engine._measure_edges_at_y(  # type: ignore[attr-defined]
             _ProxyIntersectionLayer(),
@@ -330,6 +367,237 @@ class SpacingEngineTests(unittest.TestCase):
         self.assertEqual(left, 10.0)
         self.assertEqual(right, 90.0)
 
+    def test_batch_review_matches_per_layer_results_and_reads_references_once(self) -> None:
+        reads = []
+
+        class _CountingLayer(_GeometryLayer):
+            @property
+            def bounds(self):
+                reads.append(self)
+                return self._bounds
+
+            @bounds.setter
+            def bounds(self, value):
+                self._bounds = value
+
+        h = _FakeGlyph("H", category="Letter")
+        glyphs = [self._glyph_with_layer(name) for name in ("A", "B", "E", "missing.layer")]
+        masters = [_FakeMaster("m1"), _FakeMaster("m2", italic_angle=8)]
+        for glyph in glyphs[:3]:
+            glyph.layers["m2"] = glyph.layers["m1"]
+        for master in masters:
+            h.layers[master.id] = _CountingLayer(600, 700, lambda _y: (40.0, 560.0))
+        glyphs[3].layers = {}
+        font = _FakeFont(glyphs + [h])
+        defaults = dict(spacing_engine.DEFAULTS)
+        defaults.update({"tabularMode": "auto", "skipAutoAligned": False})
+        params = lambda master: {"xHeight": 500, "italicAngle": master.italicAngle, "frequency": 10}
+
+        batch = spacing_engine.SpacingBatch(font)
+        streamed = list(
+            spacing_engine.iter_master_suggestions(
+                font=font,
+                glyphs=glyphs,
+                masters=masters,
+                rules=[],
+                defaults=defaults,
+                master_params=params,
+                batch=batch,
+            )
+        )
+
+        self.assertEqual([master.id for master, _results in streamed], ["m1", "m2"])
+        self.assertEqual([len(results) for _master, results in streamed], [4, 4])
+        self.assertEqual(len(reads), 2)
+        self.assertGreater(batch.stats()["hits"], 0)
+        for master, results in streamed:
+            self.assertEqual(results[3]["reason"], "layer_missing")
+            for glyph, batched in zip(glyphs[:3], results):
+                single = spacing_engine.compute_suggestion_for_layer(
+                    font=font,
+                    glyph=glyph,
+                    layer=glyph.layers[master.id],
+                    master=master,
+                    rules=[],
+                    defaults=defaults,
+                    master_params=params(master),
+                )
+                self.assertEqual(batched["status"], "ok")
+                self.assertEqual(batched, single)
+
+    def test_param_fit_recovers_parameters_that_produced_current_spacing(self) -> None:
+        import math
+
+        h = self._glyph_with_layer("H", width=640, edge_fn=lambda _y: (60.0, 580.0))
+        o = self._glyph_with_layer(
+            "O",
+            width=700,
+            edge_fn=lambda y: (40.0 + 0.002 * (y - 350.0) ** 2, 660.0 - 0.002 * (y - 350.0) ** 2),
+        )
+        v = self._glyph_with_layer(
+            "V", width=680, edge_fn=lambda y: (20.0 + 200.0 * (1 - y / 700.0), 660.0 - 200.0 * (1 - y / 700.0))
+        )
+        glyphs = [h, o, v]
+        font = _FakeFont(glyphs)
+        master = _FakeMaster()
+        defaults = dict(spacing_engine.DEFAULTS)
+        defaults.update({"tabularMode": False, "skipAutoAligned": False})
+        params = {"xHeight": 500, "italicAngle": 0, "area": 420.0, "depth": 12.0, "over": 2.0, "frequency": 10}
+        for glyph in glyphs:
+            result = spacing_engine.compute_suggestion_for_layer(
+                font=font,
+                glyph=glyph,
+                layer=glyph.layers["m1"],
+                master=master,
+                rules=[],
+                defaults=defaults,
+                master_params=params,
+            )
+            glyph.layers["m1"].leftSideBearing = float(result["proposed"]["lsb"])
+            glyph.layers["m1"].rightSideBearing = float(result["proposed"]["rsb"])
+
+        fit = spacing_engine.SpacingParamFit(
+            font=font,
+            glyphs=glyphs + [_FakeGlyph("acutecomb", category="Mark")],
+            master=master,
+            master_params=dict(params, area=300.0, depth=20.0, over=0.0),
+            defaults=defaults,
+            overs=[0.0, 2.0, 4.0],
+        )
+        report = fit.search(
+            areas=spacing_engine.fit_grid_values({"min": 300, "max": 500, "step": 20}, "area"),
+            depths=spacing_engine.fit_grid_values([8, 12, 16], "depth"),
+            overs=[0.0, 2.0, 4.0],
+        )
+
+        self.assertEqual(report["glyphCount"], 3)
+        self.assertEqual(report["skipped"], [{"glyphName": "acutecomb", "reason": "layer_missing"}])
+        self.assertEqual(report["evaluated"], 11 * 3 * 3)
+        self.assertEqual(report["best"]["meanAbsError"], 0.0)
+        self.assertEqual(fit.evaluate(420.0, 12.0, 2.0)["maxAbsError"], 0.0)
+        self.assertGreater(report["current"]["meanAbsError"], 0.0)
+        self.assertTrue(math.isclose(report["best"]["area"], 420.0, abs_tol=20.0))
+        for entry in report["glyphs"]:
+            self.assertEqual(entry["fitted"], entry["current"])
+
+    def test_param_fit_keeps_tabular_glyphs_and_unkeyed_sides(self) -> None:
+        h = self._glyph_with_layer("H", sub_category="Uppercase")
+        o = self._glyph_with_layer("o", sub_category="Lowercase", height=500)
+        zero = self._glyph_with_layer("zero", category="Number", sub_category="Decimal Digit")
+        aligned = self._glyph_with_layer("Aacute", sub_category="Uppercase")
+        aligned.layers["m1"].isAligned = True
+        keyed = self._glyph_with_layer("n", sub_category="Lowercase", height=500, lsb=90)
+        keyed.leftMetricsKey = "=H"
+        both = self._glyph_with_layer("m", sub_category="Lowercase", height=500)
+        both.leftMetricsKey = both.rightMetricsKey = "=n"
+        font = _FakeFont([h, o, zero, aligned, keyed, both], fixed_pitch=True)
+        defaults = dict(spacing_engine.DEFAULTS)
+        defaults.update({"tabularMode": "auto", "skipAutoAligned": True, "respectMetricsKeys": True})
+        master_params = {"xHeight": 500, "italicAngle": 0, "area": 400.0, "depth": 15.0, "over": 0.0, "frequency": 10}
+
+        fit = spacing_engine.SpacingParamFit(
+            font=font,
+            glyphs=[h, o, zero, aligned, keyed, both],
+            master=_FakeMaster(),
+            master_params=master_params,
+            defaults=defaults,
+            overs=[0.0],
+        )
+
+        # Every glyph of the fixed-pitch font is tabular, and still fitted.
+        self.assertEqual([sample["glyphName"] for sample in fit.samples], ["H", "o", "zero", "n"])
+        self.assertEqual(
+            fit.skipped,
+            [
+                {"glyphName": "Aacute", "reason": "auto_aligned_components"},
+                {"glyphName": "m", "reason": "metrics_keys"},
+            ],
+        )
+        self.assertEqual(fit.samples[3]["sides"], (False, True))
+        scored = fit.evaluate(400.0, 15.0, 0.0)
+        self.assertIsNotNone(scored)
+        report = fit.search(areas=[400.0], depths=[15.0], overs=[0.0])
+        self.assertIsNone(report["glyphs"][3]["fitted"]["lsb"])
+        self.assertIsNotNone(report["glyphs"][3]["fitted"]["rsb"])
+
+        # The keyed left side (lsb 90) is not part of the error.
+        without_n = spacing_engine.SpacingParamFit(
+            font=font,
+            glyphs=[h, o, zero],
+            master=_FakeMaster(),
+            master_params=master_params,
+            defaults=defaults,
+            overs=[0.0],
+        )
+        baseline = without_n.evaluate(400.0, 15.0, 0.0)
+        n_fit = report["glyphs"][3]["fitted"]["rsb"] - 40
+        self.assertAlmostEqual(scored["meanAbsError"], (baseline["meanAbsError"] * 6 + abs(n_fit)) / 7)
+        with self.assertRaisesRegex(ValueError, "over=3.0 was not measured"):
+            fit.evaluate(400.0, 15.0, 3.0)
+
+    def test_metrics_key_glyph_names(self) -> None:
+        self.assertEqual(spacing_engine.metrics_key_glyph_names("=n"), ["n"])
+        self.assertEqual(spacing_engine.metrics_key_glyph_names("=|o+10"), ["o"])
+        self.assertEqual(spacing_engine.metrics_key_glyph_names("==H*1.5"), ["H"])
+        self.assertEqual(spacing_engine.metrics_key_glyph_names("=a-cy-20"), ["a-cy"])
+        self.assertEqual(spacing_engine.metrics_key_glyph_names("40"), [])
+
+    def test_dependency_graph_recomputes_only_affected_glyphs(self) -> None:
+        h = self._glyph_with_layer("H", sub_category="Uppercase")
+        x = self._glyph_with_layer("x", sub_category="Lowercase", height=500)
+        a = self._glyph_with_layer("A", sub_category="Uppercase")
+        n = self._glyph_with_layer("n", sub_category="Lowercase", height=500)
+        a_alt = self._glyph_with_layer("A.alt", sub_category="Uppercase")
+        a_alt.rightMetricsKey = "=|A"
+        glyphs = [a_alt, a, n, h, x]
+        font = _FakeFont(glyphs)
+        masters = [_FakeMaster()]
+        defaults = dict(spacing_engine.DEFAULTS)
+        defaults.update({"tabularMode": False, "skipAutoAligned": False, "respectMetricsKeys": False})
+        graph = spacing_engine.SpacingDependencyGraph.build(
+            font=font, glyphs=glyphs, masters=masters, rules=[], defaults=defaults
+        )
+
+        self.assertEqual(graph.dependencies("A.alt"), ["A", "H"])
+        self.assertEqual(graph.dependencies("n"), ["x"])
+        self.assertEqual(graph.affected_by(["H"]), ["H", "A", "A.alt"])
+        self.assertEqual(graph.affected_by(["x"]), ["x", "n"])
+
+        cache = spacing_engine.SpacingResultCache()
+
+        def _review(recompute=None):
+            (_master, results), = spacing_engine.iter_master_suggestions(
+                font=font,
+                glyphs=glyphs,
+                masters=masters,
+                rules=[],
+                defaults=defaults,
+                master_params=lambda _m: {"xHeight": 500, "italicAngle": 0, "frequency": 10},
+                result_cache=cache,
+                font_key="synthetic",
+                recompute=recompute,
+            )
+            return {r["glyphName"]: r for r in results}
+
+        first = _review()
+        self.assertNotIn("reused", first["A"])
+
+        h.layers["m1"].bounds = _Bounds(0, -10, 600, 720)
+        second = _review(recompute=set(graph.affected_by(["H"])))
+        self.assertEqual(
+            {name: r["reused"] for name, r in second.items()},
+            {"A.alt": False, "A": False, "n": True, "H": False, "x": True},
+        )
+        self.assertEqual(second["n"]["proposed"], first["n"]["proposed"])
+        self.assertNotEqual(second["A"]["reference"]["yMax"], first["A"]["reference"]["yMax"])
+
+        # An edit the caller did not report still invalidates through the digest.
+        x.layers["m1"].leftSideBearing = 12.0
+        third = _review(recompute=set())
+        self.assertFalse(third["x"]["reused"])
+        self.assertFalse(third["n"]["reused"])
+        self.assertTrue(third["A"]["reused"])
+
     def test_auto_reference_classifies_uppercase_without_subcategory(self) -> None:
         a = self._glyph_with_layer("A")
         h = self._glyph_with_layer("H")
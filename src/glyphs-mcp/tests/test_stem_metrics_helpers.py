@@ -0,0 +1,172 @@
+"""Tests for batched stem estimation in stem_metrics_helpers."""
+
+from __future__ import annotations
+
+import sys
+import types
+import unittest
+from pathlib import Path
+
+
+def _resources_dir() -> Path:
+    return (
+        Path(__file__).resolve().parent.parent
+        / "Glyphs MCP.glyphsPlugin"
+        / "Contents"
+        / "Resources"
+    )
+
+
+def _node(x, y):
+    return types.SimpleNamespace(position=types.SimpleNamespace(x=float(x), y=float(y)), type="line")
+
+
+def _rect(x0, y0, x1, y1):
+    nodes = [_node(x0, y0), _node(x0, y1), _node(x1, y1), _node(x1, y0)]
+    return types.SimpleNamespace(nodes=nodes, closed=True)
+
+
+def _bounds(x0, y0, x1, y1):
+    return types.SimpleNamespace(
+        origin=types.SimpleNamespace(x=float(x0), y=float(y0)),
+        size=types.SimpleNamespace(width=float(x1 - x0), height=float(y1 - y0)),
+    )
+
+
+def _h_layer(stem, bar):
+    """An H with vertical stems `stem` wide and a crossbar `bar` high."""
+    return types.SimpleNamespace(
+        width=600.0,
+        shapes=[
+            _rect(50, 0, 50 + stem, 700),
+            _rect(550 - stem, 0, 550, 700),
+            _rect(50 + stem, 325, 550 - stem, 325 + bar),
+        ],
+        bounds=_bounds(50, 0, 550, 700),
+    )
+
+
+class _Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class _IntersectionOnlyLayer:
+    """Geometry only reachable through `intersectionsBetweenPoints`."""
+
+    bounds = _bounds(0, 0, 100, 700)
+
+    def __init__(self):
+        self.calls = 0
+
+    def intersectionsBetweenPoints(self, start, end, components=True):
+        self.calls += 1
+        y = start[1]
+        return [_Point(start[0], y), _Point(10, y), _Point(70, y), _Point(end[0], y)]
+
+
+def _font(layers_by_master):
+    masters = [
+        types.SimpleNamespace(id=master_id, name=master_id, capHeight=700, xHeight=500)
+        for master_id in layers_by_master
+    ]
+    glyph = types.SimpleNamespace(layers=dict(layers_by_master))
+    return types.SimpleNamespace(upm=1000, masters=masters, glyphs={"H": glyph})
+
+
+class StemMetricsHelpersTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        sys.path.insert(0, str(_resources_dir()))
+        global stem_metrics_helpers  # noqa: PLW0603 - simple test import
+        import stem_metrics_helpers as stem_metrics_helpers  # type: ignore
+
+    def test_font_estimate_matches_per_master_estimates(self) -> None:
+        font = _font({"regular": _h_layer(80, 60), "bold": _h_layer(150, 110)})
+        batched = stem_metrics_helpers.estimate_font_stems(
+            font=font,
+            masters=font.masters,
+            reference_glyphs=["H"],
+        )
+        self.assertEqual(batched["regular"]["vertical"]["value"], 80.0)
+        self.assertEqual(batched["bold"]["vertical"]["value"], 150.0)
+        self.assertEqual(batched["regular"]["horizontal"]["value"], 60.0)
+        self.assertEqual(batched["bold"]["horizontal"]["value"], 110.0)
+        for master in font.masters:
+            for orientation in ("vertical", "horizontal"):
+                single = stem_metrics_helpers.estimate_master_stem(
+                    font=font,
+                    master=master,
+                    orientation=orientation,
+                    reference_glyphs=["H"],
+                )
+                self.assertEqual(batched[master.id][orientation], single)
+
+    def test_run_cache_is_keyed_by_geometry(self) -> None:
+        cache = stem_metrics_helpers.StemRunCache()
+        font = _font({"regular": _h_layer(80, 60), "copy": _h_layer(80, 60)})
+        first = stem_metrics_helpers.estimate_font_stems(
+            font=font,
+            masters=font.masters,
+            orientations=["vertical"],
+            reference_glyphs=["H"],
+            cache=cache,
+        )
+        # The second master has identical geometry, so it reuses the runs.
+        self.assertEqual(cache.stats(), {"entries": 1, "hits": 1, "misses": 1})
+        self.assertEqual(first["regular"], first["copy"])
+
+        font.glyphs["H"].layers["copy"] = _h_layer(90, 60)
+        second = stem_metrics_helpers.estimate_font_stems(
+            font=font,
+            masters=font.masters,
+            orientations=["vertical"],
+            reference_glyphs=["H"],
+            cache=cache,
+        )
+        self.assertEqual(second["copy"]["vertical"]["value"], 90.0)
+        self.assertEqual(cache.stats(), {"entries": 2, "hits": 2, "misses": 2})
+
+    def test_intersection_fallback_is_measured_but_not_cached(self) -> None:
+        cache = stem_metrics_helpers.StemRunCache()
+        layer = _IntersectionOnlyLayer()
+        font = _font({"regular": layer})
+        for _ in range(2):
+            estimate = stem_metrics_helpers.estimate_master_stem(
+                font=font,
+                master=font.masters[0],
+                orientation="vertical",
+                reference_glyphs=["H"],
+                samples=3,
+                cache=cache,
+            )
+            self.assertEqual(estimate["value"], 60.0)
+            self.assertEqual(estimate["sampleCount"], 3)
+        self.assertEqual(layer.calls, 6)
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_stem_ratio_payload_measures_both_masters_in_one_pass(self) -> None:
+        font = _font({"regular": _h_layer(80, 60), "bold": _h_layer(160, 110)})
+        font.stems = []
+        payload = stem_metrics_helpers.stem_ratio_payload(
+            font=font,
+            base_master=font.masters[0],
+            ref_master=font.masters[1],
+            reference_glyphs=["H"],
+            samples=9,
+            band=0.2,
+            min_width=5.0,
+            max_width=None,
+            include_components=True,
+            stem_source="intersections",
+            mismatch_tolerance=0.1,
+            cache=stem_metrics_helpers.StemRunCache(),
+        )
+        self.assertTrue(payload["ok"])
+        self.assertEqual((payload["stemBase"], payload["stemRef"]), (80.0, 160.0))
+        self.assertAlmostEqual(payload["b"], 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()